@@ -0,0 +1,6 @@
+"""Benchmarks for the hackathon bot library.
+
+Run a benchmark from the repository root, for example::
+
+    python -m benchmarks.bench_memory
+"""
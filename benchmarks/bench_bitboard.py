@@ -0,0 +1,94 @@
+"""Measures whole-map operations on nested lists and on bitboards.
+
+The flood fill of the tiles reachable from the agent and the line of
+fire in the four directions are computed with loops over a `wall_map`
+list of lists, as done by the bots, and with the bitboard operations.
+
+Usage::
+
+    python -m benchmarks.bench_bitboard [--dimension 24] [--number 200]
+"""
+
+import argparse
+import timeit
+from collections import deque
+
+import humps
+
+from hackathon_bot.bitboard import BitboardGeometry, MapBitboards
+from hackathon_bot.enums import Direction
+from hackathon_bot.models import GameStateModel
+from hackathon_bot.payloads import GameStatePayload
+
+from .fixtures import AGENT_ID, game_state_payload
+
+_STEPS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+
+def _lists(wall_map, start) -> int:
+    dimension = len(wall_map)
+    seen = [[False] * dimension for _ in range(dimension)]
+    seen[start[1]][start[0]] = True
+    queue = deque([start])
+    while queue:
+        x, y = queue.popleft()
+        for dx, dy in _STEPS:
+            nx, ny = x + dx, y + dy
+            if (
+                0 <= nx < dimension
+                and 0 <= ny < dimension
+                and not wall_map[ny][nx]
+                and not seen[ny][nx]
+            ):
+                seen[ny][nx] = True
+                queue.append((nx, ny))
+
+    fire = 0
+    for dx, dy in _STEPS:
+        x, y = start[0] + dx, start[1] + dy
+        while 0 <= x < dimension and 0 <= y < dimension and not wall_map[y][x]:
+            fire += 1
+            x, y = x + dx, y + dy
+
+    return sum(map(sum, seen)) + fire
+
+
+def _bitboards(geometry: BitboardGeometry, walls: int, start) -> int:
+    origin = geometry.bit(*start)
+    filled = geometry.flood_fill(origin, ~walls)
+    fire = 0
+    for direction in Direction:
+        fire |= geometry.ray(origin, direction, walls)
+    return filled.bit_count() + fire.bit_count()
+
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dimension", type=int, default=24)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    payload = GameStatePayload.from_json(
+        humps.decamelize(game_state_payload(args.dimension))
+    )
+    map_ = GameStateModel.from_payload(payload, AGENT_ID).map
+    start = map_.index.my_position
+    layers = MapBitboards.from_map(map_)
+    wall_map = layers.geometry.to_grid(layers.walls)
+
+    assert _lists(wall_map, start) == _bitboards(layers.geometry, layers.walls, start)
+
+    print(f"Flood fill and line of fire, {args.dimension}x{args.dimension} map")
+    runs = (
+        ("lists", lambda: _lists(wall_map, start)),
+        ("bitboards", lambda: _bitboards(layers.geometry, layers.walls, start)),
+    )
+    for name, run in runs:
+        elapsed = min(timeit.repeat(run, number=args.number, repeat=3))
+        print(f"  {name}: {elapsed / args.number * 1e3:7.3f} ms per run")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Compares computing a distance field with loading it from the cache.
+
+The distance field holds the number of moves between every pair
+of tiles of the fixture map, computed with a breadth-first search
+from every free tile. It is stored in a temporary cache directory
+and loaded back with a new :class:`PrecomputationCache`, as in
+the next match on the same map.
+
+Usage::
+
+    python -m benchmarks.bench_cache [--dimension 24] [--repeat 5]
+"""
+
+import argparse
+import tempfile
+import timeit
+from array import array
+from collections import deque
+
+import humps
+
+from hackathon_bot.bitboard import MapBitboards
+from hackathon_bot.cache import PrecomputationCache, map_key
+from hackathon_bot.models import GameStateModel
+from hackathon_bot.payloads import GameStatePayload
+
+from .fixtures import AGENT_ID, game_state_payload
+
+
+def _distance_field(walls) -> array:
+    # The distances indexed as source * size + target, 0xFFFF if unreachable.
+    height = len(walls)
+    width = len(walls[0])
+    size = width * height
+    neighbors = [
+        [
+            ny * width + nx
+            for nx, ny in ((x, y - 1), (x + 1, y), (x, y + 1), (x - 1, y))
+            if 0 <= nx < width and 0 <= ny < height and not walls[ny][nx]
+        ]
+        for y in range(height)
+        for x in range(width)
+    ]
+    field = array("H", [0xFFFF]) * (size * size)
+    for source in range(size):
+        if walls[source // width][source % width]:
+            continue
+        offset = source * size
+        field[offset + source] = 0
+        queue = deque([source])
+        while queue:
+            tile = queue.popleft()
+            distance = field[offset + tile] + 1
+            for following in neighbors[tile]:
+                if field[offset + following] == 0xFFFF:
+                    field[offset + following] = distance
+                    queue.append(following)
+    return field
+
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dimension", type=int, default=24)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    payload = GameStatePayload.from_json(
+        humps.decamelize(game_state_payload(args.dimension))
+    )
+    map_ = GameStateModel.from_payload(payload, AGENT_ID).map
+    layers = MapBitboards.from_map(map_)
+    walls = layers.geometry.to_grid(layers.walls)
+    key = map_key(0, args.dimension, walls)
+    size = args.dimension * args.dimension
+
+    compute = min(
+        timeit.repeat(lambda: _distance_field(walls), number=1, repeat=args.repeat)
+    )
+    field = _distance_field(walls)
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = min(
+            timeit.repeat(
+                lambda: PrecomputationCache(directory).store(key, "distances", field),
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+
+        def load():
+            table = PrecomputationCache(directory).get_or_compute(
+                key, "distances", lambda: _distance_field(walls)
+            )
+            # One lookup, which reads a page of the mapped file.
+            return table[size // 2 * size + size // 3]
+
+        loaded = min(timeit.repeat(load, number=1, repeat=args.repeat))
+        table = PrecomputationCache(directory).load(key, "distances")
+        assert table == memoryview(field)
+        del table
+
+    print(f"Distance field, {args.dimension}x{args.dimension} map, ", end="")
+    print(f"{len(field) * field.itemsize / 1024:.0f} KiB")
+    print(f"  compute: {compute * 1e3:.2f} ms")
+    print(f"  store: {store * 1e3:.2f} ms once per map")
+    print(f"  load from the cache: {loaded * 1e3:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
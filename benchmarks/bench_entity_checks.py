@@ -0,0 +1,85 @@
+"""Measures the cost of entity type checks in a full map scan.
+
+Every entity of every tile is checked with `isinstance` against the
+runtime checkable protocols and with the predicates based on the
+`kind` tag of the models.
+
+Usage::
+
+    python -m benchmarks.bench_entity_checks [--dimension 24] [--number 200]
+"""
+
+import argparse
+import timeit
+
+import humps
+
+from hackathon_bot.models import GameStateModel
+from hackathon_bot.payloads import GameStatePayload
+from hackathon_bot.predicates import is_bullet, is_mine, is_tank, is_wall
+from hackathon_bot.protocols import Bullet, Mine, PlayerTank, Wall
+
+from .fixtures import AGENT_ID, game_state_payload
+
+
+def _scan_isinstance(tiles) -> int:
+    found = 0
+    for row in tiles:
+        for tile in row:
+            for entity in tile.entities:
+                if isinstance(entity, Wall):
+                    found += 1
+                elif isinstance(entity, PlayerTank):
+                    found += 2
+                elif isinstance(entity, Bullet):
+                    found += 3
+                elif isinstance(entity, Mine):
+                    found += 4
+    return found
+
+
+def _scan_predicates(tiles) -> int:
+    found = 0
+    for row in tiles:
+        for tile in row:
+            for entity in tile.entities:
+                if is_wall(entity):
+                    found += 1
+                elif is_tank(entity):
+                    found += 2
+                elif is_bullet(entity):
+                    found += 3
+                elif is_mine(entity):
+                    found += 4
+    return found
+
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dimension", type=int, default=24)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    payload = GameStatePayload.from_json(
+        humps.decamelize(game_state_payload(args.dimension))
+    )
+    tiles = GameStateModel.from_payload(payload, AGENT_ID).map.tiles
+    checks = sum(len(tile.entities) for row in tiles for tile in row)
+
+    assert _scan_isinstance(tiles) == _scan_predicates(tiles)
+
+    print(f"Full map {args.dimension}x{args.dimension} ({checks} entities)")
+    scans = (("isinstance", _scan_isinstance), ("predicates", _scan_predicates))
+    for name, scan in scans:
+        elapsed = min(timeit.repeat(lambda: scan(tiles), number=args.number, repeat=3))
+        per_scan = elapsed / args.number
+        print(
+            f"  {name}: {per_scan * 1e3:7.3f} ms per scan, "
+            f"{per_scan / checks * 1e9:6.0f} ns per entity"
+        )
+
+
+if __name__ == "__main__":
+    main()
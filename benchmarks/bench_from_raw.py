@@ -0,0 +1,142 @@
+"""Measures the cost of the ``from_raw`` model constructors.
+
+Each constructor is compared with the previous implementation, which
+converted the raw payload with ``dataclasses.asdict`` and rebuilt
+the model with keyword arguments.
+
+Usage::
+
+    python -m benchmarks.bench_from_raw [--number 100000]
+"""
+
+import argparse
+import timeit
+from dataclasses import asdict
+
+import humps
+
+from hackathon_bot.enums import BulletType, Direction, ItemType, Orientation, ZoneStatus
+from hackathon_bot.models import (
+    BulletModel,
+    ItemModel,
+    LaserModel,
+    MineModel,
+    NeutralZoneModel,
+    PlayerModel,
+    TankModel,
+    TurretModel,
+    ZoneModel,
+)
+from hackathon_bot.payloads import (
+    RawBullet,
+    RawItem,
+    RawLaser,
+    RawMine,
+    RawPlayer,
+    RawTank,
+    RawTurret,
+    RawZone,
+)
+
+
+def _asdict_player(raw):
+    data = asdict(raw)
+    data["ticks_to_regenerate"] = data.pop("ticks_to_regen", None)
+    return PlayerModel(**data)
+
+
+def _asdict_turret(raw):
+    data = asdict(raw)
+    data["direction"] = Direction(data["direction"])
+    data["ticks_to_regenerate_bullet"] = data.pop("ticks_to_regen_bullet", None)
+    return TurretModel(**data)
+
+
+def _asdict_tank(raw):
+    data = asdict(raw)
+    data["direction"] = Direction(data["direction"])
+    data["turret"] = _asdict_turret(raw.turret)
+    if raw.secondary_item is not None:
+        data["secondary_item"] = ItemType(data["secondary_item"])
+    return TankModel(**data)
+
+
+def _asdict_bullet(raw):
+    data = asdict(raw)
+    data["direction"] = Direction(data["direction"])
+    data["type"] = BulletType.BASIC
+    return BulletModel(**data)
+
+
+def _asdict_laser(raw):
+    data = asdict(raw)
+    data["orientation"] = Orientation(data["orientation"])
+    return LaserModel(**data)
+
+
+def _asdict_mine(raw):
+    return MineModel(**asdict(raw))
+
+
+def _asdict_item(raw):
+    return ItemModel(**asdict(raw))
+
+
+def _asdict_zone(raw):
+    data = asdict(raw)
+    data["status"] = ZoneStatus(humps.decamelize(data["status"]).upper())
+    return NeutralZoneModel(**data)
+
+
+CASES = (
+    (
+        "PlayerModel",
+        RawPlayer("id", "player", 4278190335, 23, None, 1, None, False),
+        PlayerModel.from_raw,
+        _asdict_player,
+    ),
+    (
+        "TurretModel",
+        RawTurret(1, 3, None),
+        TurretModel.from_raw,
+        _asdict_turret,
+    ),
+    (
+        "TankModel",
+        RawTank("id", 1, RawTurret(1, 3, None), 100, None),
+        TankModel.from_raw,
+        _asdict_tank,
+    ),
+    ("BulletModel", RawBullet(1, 2, 1, 0), BulletModel.from_raw, _asdict_bullet),
+    ("LaserModel", RawLaser(1, 0), LaserModel.from_raw, _asdict_laser),
+    ("MineModel", RawMine(1, None), MineModel.from_raw, _asdict_mine),
+    ("ItemModel", RawItem(2), ItemModel.from_raw, _asdict_item),
+    (
+        "ZoneModel",
+        RawZone(0, 0, 4, 4, 65, "neutral"),
+        ZoneModel.from_raw,
+        _asdict_zone,
+    ),
+)
+
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'constructor':<12} {'asdict':>10} {'direct':>10} {'speedup':>8}")
+    for name, raw, current, legacy in CASES:
+        before = min(timeit.repeat(lambda: legacy(raw), number=args.number, repeat=3))
+        after = min(timeit.repeat(lambda: current(raw), number=args.number, repeat=3))
+        before_ns = before / args.number * 1e9
+        after_ns = after / args.number * 1e9
+        print(
+            f"{name:<12} {before_ns:8.0f}ns {after_ns:8.0f}ns {before / after:7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Compares full-map searches with hierarchical pathfinding.
+
+For random starts and goals on the fixture map, a breadth-first search
+over the whole wall grid (as in `search` of the bots) is compared with
+:class:`HierarchicalPathfinder`. Every query is preceded by a move of
+the dynamic obstacles by one tile, as the tanks move every tick,
+so the cost of recomputing the touched clusters is included.
+
+Usage::
+
+    python -m benchmarks.bench_hierarchical [--dimension 48] [--pairs 300]
+"""
+
+import argparse
+import random
+import time
+from collections import deque
+
+import humps
+
+from hackathon_bot.bitboard import MapBitboards
+from hackathon_bot.hierarchical import HierarchicalPathfinder
+from hackathon_bot.models import GameStateModel
+from hackathon_bot.payloads import GameStatePayload
+
+from .fixtures import AGENT_ID, game_state_payload
+
+_STEPS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+
+def _bfs(walls, obstacles, start, goal) -> list[tuple[int, int]] | None:
+    dimension = len(walls)
+    parents = {start: None}
+    queue = deque([start])
+    while queue:
+        tile = queue.popleft()
+        if tile == goal:
+            path = []
+            while parents[tile] is not None:
+                path.append(tile)
+                tile = parents[tile]
+            return path[::-1]
+        for dx, dy in _STEPS:
+            x, y = tile[0] + dx, tile[1] + dy
+            if (
+                0 <= x < dimension
+                and 0 <= y < dimension
+                and not walls[y][x]
+                and ((x, y) not in obstacles or (x, y) == goal)
+                and (x, y) not in parents
+            ):
+                parents[(x, y)] = tile
+                queue.append((x, y))
+    return None
+
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dimension", type=int, default=48)
+    parser.add_argument("--pairs", type=int, default=300)
+    parser.add_argument("--cluster-size", type=int, default=8)
+    args = parser.parse_args()
+
+    payload = GameStatePayload.from_json(
+        humps.decamelize(game_state_payload(args.dimension))
+    )
+    map_ = GameStateModel.from_payload(payload, AGENT_ID).map
+    layers = MapBitboards.from_map(map_)
+    walls = layers.geometry.to_grid(layers.walls)
+    free = list(layers.geometry.to_positions(layers.geometry.full & ~layers.walls))
+
+    start = time.perf_counter()
+    pathfinder = HierarchicalPathfinder(walls, args.cluster_size)
+    build = time.perf_counter() - start
+
+    rng = random.Random(0)
+    free_set = set(free)
+    obstacles = rng.sample(free, 6)
+    ticks = []
+    for _ in range(args.pairs):
+        # Every obstacle moves to a neighbouring tile, like a tank.
+        obstacles = [
+            rng.choice(
+                [(x + dx, y + dy) for dx, dy in _STEPS if (x + dx, y + dy) in free_set]
+                or [(x, y)]
+            )
+            for x, y in obstacles
+        ]
+        ticks.append((frozenset(obstacles), *rng.sample(free, 2)))
+
+    start = time.perf_counter()
+    full = [_bfs(walls, obstacles, s, g) for obstacles, s, g in ticks]
+    full_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    hierarchical = []
+    for obstacles, s, g in ticks:
+        pathfinder.update_obstacles(obstacles)
+        hierarchical.append(pathfinder.find_path(s, g))
+    hierarchical_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _, s, g in ticks:
+        pathfinder.find_path(s, g)
+    query_time = time.perf_counter() - start
+
+    found = [(a, b) for a, b in zip(full, hierarchical) if a is not None]
+    assert all(b is not None for _, b in found)
+    optimal = sum(len(a) for a, _ in found)
+    length = sum(len(b) for _, b in found)
+
+    print(
+        f"Pathfinding, {args.dimension}x{args.dimension} map, "
+        f"{args.cluster_size}x{args.cluster_size} clusters, {args.pairs} queries"
+    )
+    print(f"  abstraction: {build * 1e3:.2f} ms once per map")
+    print(f"  full BFS: {full_time / args.pairs * 1e3:.3f} ms per query")
+    print(
+        f"  HPA* with obstacle update: "
+        f"{hierarchical_time / args.pairs * 1e3:.3f} ms per query"
+    )
+    print(f"  HPA* query alone: {query_time / args.pairs * 1e3:.3f} ms per query")
+    print(f"  path length: {(length / optimal - 1) * 100:.1f}% above the shortest")
+
+
+if __name__ == "__main__":
+    main()
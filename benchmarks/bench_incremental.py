@@ -0,0 +1,155 @@
+"""Compares replanning from scratch with incremental replanning.
+
+The agent heads for a goal from the far side of the fixture map.
+Every other tick the agent moves by one tile along its path,
+every few ticks a mine appears on a random tile and every
+`--goal-interval` ticks the goal moves to a neighbouring tile.
+Each tick the path is found with a new breadth-first search
+and with :class:`IncrementalPathfinder`, which repairs its last search.
+
+Usage::
+
+    python -m benchmarks.bench_incremental [--dimension 24] [--ticks 200]
+"""
+
+import argparse
+import random
+import time
+from collections import deque
+
+import humps
+
+from hackathon_bot.bitboard import MapBitboards
+from hackathon_bot.incremental import IncrementalPathfinder
+from hackathon_bot.models import GameStateModel
+from hackathon_bot.payloads import GameStatePayload
+
+from .fixtures import AGENT_ID, game_state_payload
+
+_STEPS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+
+def _bfs(walls, obstacles, start, goal) -> list[tuple[int, int]] | None:
+    dimension = len(walls)
+    parents = {start: None}
+    queue = deque([start])
+    while queue:
+        tile = queue.popleft()
+        if tile == goal:
+            path = []
+            while parents[tile] is not None:
+                path.append(tile)
+                tile = parents[tile]
+            return path[::-1]
+        for dx, dy in _STEPS:
+            x, y = tile[0] + dx, tile[1] + dy
+            if (
+                0 <= x < dimension
+                and 0 <= y < dimension
+                and not walls[y][x]
+                and ((x, y) not in obstacles or (x, y) == goal)
+                and (x, y) not in parents
+            ):
+                parents[(x, y)] = tile
+                queue.append((x, y))
+    return None
+
+
+def _ticks(free, count, goal_interval, rng):
+    # The obstacles and the goal of each tick; the start follows the path.
+    free_set = set(free)
+    mines = []
+    goal = rng.choice(free)
+    ticks = []
+    for tick in range(count):
+        if tick % 5 == 0:
+            mines.append(rng.choice(free))
+        if tick % goal_interval == goal_interval - 1:
+            x, y = goal
+            goal = rng.choice(
+                [(x + dx, y + dy) for dx, dy in _STEPS if (x + dx, y + dy) in free_set]
+                or [goal]
+            )
+        ticks.append((frozenset(mines[-8:]), goal))
+    return ticks
+
+
+def _run(find_path, ticks, start) -> tuple[list[float], list[int]]:
+    lengths = []
+    times = []
+    for tick, (obstacles, goal) in enumerate(ticks):
+        begin = time.perf_counter()
+        path = find_path(obstacles, start, goal)
+        times.append(time.perf_counter() - begin)
+        lengths.append(-1 if path is None else len(path))
+        # The tank needs about two ticks per tile with the rotations.
+        if path and tick % 2 == 0:
+            start = path[0]
+    return times, lengths
+
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dimension", type=int, default=24)
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument("--goal-interval", type=int, default=10)
+    args = parser.parse_args()
+
+    payload = GameStatePayload.from_json(
+        humps.decamelize(game_state_payload(args.dimension))
+    )
+    map_ = GameStateModel.from_payload(payload, AGENT_ID).map
+    layers = MapBitboards.from_map(map_)
+    walls = layers.geometry.to_grid(layers.walls)
+    free = list(layers.geometry.to_positions(layers.geometry.full & ~layers.walls))
+
+    rng = random.Random(0)
+    ticks = _ticks(free, args.ticks, args.goal_interval, rng)
+    # The start as far from the first goal as possible.
+    distances = {}
+    for tile in free:
+        path = _bfs(walls, frozenset(), ticks[0][1], tile)
+        if path is not None:
+            distances[tile] = len(path)
+    start = max(distances, key=distances.get)
+
+    def scratch(obstacles, position, goal):
+        return _bfs(walls, obstacles, position, goal)
+
+    pathfinder = IncrementalPathfinder(walls)
+    expanded = []
+
+    def incremental(obstacles, position, goal):
+        pathfinder.update_obstacles(obstacles)
+        path = pathfinder.find_path(position, [goal])
+        expanded.append(pathfinder.expanded)
+        return path
+
+    scratch_times, scratch_lengths = _run(scratch, ticks, start)
+    incremental_times, incremental_lengths = _run(incremental, ticks, start)
+    assert scratch_lengths == incremental_lengths
+
+    moved = [
+        tick for tick in range(1, len(ticks)) if ticks[tick][1] != ticks[tick - 1][1]
+    ]
+    kept = [tick for tick in range(1, len(ticks)) if tick not in moved]
+
+    def mean(values, ticks_):
+        return sum(values[tick] for tick in ticks_) / max(len(ticks_), 1)
+
+    print(f"Replanning, {args.dimension}x{args.dimension} map, {args.ticks} ticks")
+    print(f"  first search: BFS {scratch_times[0] * 1e3:.3f} ms, ", end="")
+    print(f"incremental {incremental_times[0] * 1e3:.3f} ms, {expanded[0]} expanded")
+    for name, ticks_ in (("start or mines changed", kept), ("goal moved", moved)):
+        print(
+            f"  {name} ({len(ticks_)} ticks): "
+            f"BFS {mean(scratch_times, ticks_) * 1e3:.3f} ms, "
+            f"incremental {mean(incremental_times, ticks_) * 1e3:.3f} ms, "
+            f"{mean(expanded, ticks_):.1f} expanded"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Measures the parsing of a full map into raw tile objects.
+
+The current dispatch table is compared with the previous lookup,
+which pascalized the object type and searched the module globals
+for every object on every tile.
+
+Usage::
+
+    python -m benchmarks.bench_map_parsing [--dimension 24] [--number 50]
+"""
+
+import argparse
+import copy
+import timeit
+
+import humps
+
+from hackathon_bot import payloads
+from hackathon_bot.payloads import RawMap, RawTileEntity, RawTileObject
+
+from .fixtures import game_state_payload
+
+
+def _legacy_tile_object(json_data: dict) -> RawTileObject:
+    obj_type = json_data.pop("type")
+
+    payload_class_name = f"Raw{humps.pascalize(obj_type)}"
+    payload_class = vars(payloads).get(payload_class_name)
+
+    if payload_class is None or not issubclass(payload_class, RawTileEntity):
+        raise ValueError(f"Unknown tile object class: {payload_class_name}")
+
+    entity = payload_class.from_json(json_data.get("payload", {}))
+
+    return RawTileObject(obj_type, entity)
+
+
+def _legacy_tiles(tiles: list) -> tuple:
+    return tuple(
+        tuple(tuple(_legacy_tile_object(obj) for obj in tile) for tile in row)
+        for row in tiles
+    )
+
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dimension", type=int, default=24)
+    parser.add_argument("--number", type=int, default=50)
+    args = parser.parse_args()
+
+    raw_map = humps.decamelize(game_state_payload(args.dimension)["map"])
+    copies = [copy.deepcopy(raw_map) for _ in range(2 * args.number)]
+
+    before = timeit.timeit(
+        lambda: _legacy_tiles(copies.pop()["tiles"]), number=args.number
+    )
+    after = timeit.timeit(lambda: RawMap.from_json(copies.pop()), number=args.number)
+
+    before_ms = before / args.number * 1e3
+    after_ms = after / args.number * 1e3
+    print(f"Full map {args.dimension}x{args.dimension}")
+    print(f"  pascalize + globals: {before_ms:7.3f} ms")
+    print(f"  dispatch table:      {after_ms:7.3f} ms ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Measures the memory allocated for a game state built from a full map.
+
+The retained size is the memory still referenced by the game state model
+after it has been created; the peak size also includes the temporary
+objects created while building it.
+
+Usage::
+
+    python -m benchmarks.bench_memory [--dimension 24]
+"""
+
+import argparse
+import copy
+import gc
+import tracemalloc
+
+import humps
+
+from hackathon_bot.models import GameStateModel
+from hackathon_bot.payloads import GameStatePayload
+
+from .fixtures import AGENT_ID, game_state_payload
+
+
+def measure(payload: dict, lazy: bool) -> tuple[int, int, int]:
+    """Returns the retained bytes, retained blocks and peak bytes of a game state."""
+
+    raw = GameStatePayload.from_json(copy.deepcopy(payload), lazy)
+    gc.collect()
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    game_state = GameStateModel.from_payload(raw, AGENT_ID, lazy)
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    retained = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    del game_state
+    return retained, blocks, peak
+
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dimension", type=int, default=24)
+    args = parser.parse_args()
+
+    payload = humps.decamelize(game_state_payload(args.dimension))
+
+    print(f"Full map {args.dimension}x{args.dimension}")
+    for lazy in (False, True):
+        retained, blocks, peak = measure(payload, lazy)
+        mode = "lazy " if lazy else "eager"
+        print(
+            f"  {mode}: retained {retained / 1024:8.1f} KiB in {blocks:6d} blocks, "
+            f"peak {peak / 1024:8.1f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Measures one tick update of the enemy occupancy grids.
+
+Usage::
+
+    python -m benchmarks.bench_occupancy [--dimension 24] [--number 2000]
+"""
+
+import argparse
+import timeit
+
+import humps
+
+from hackathon_bot.models import GameStateModel
+from hackathon_bot.occupancy import OccupancyGrid, OccupancyTracker
+from hackathon_bot.payloads import GameStatePayload
+
+from .fixtures import AGENT_ID, game_state_payload
+
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dimension", type=int, default=24)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    payload = GameStatePayload.from_json(
+        humps.decamelize(game_state_payload(args.dimension))
+    )
+    game_state = GameStateModel.from_payload(payload, AGENT_ID)
+    visibility = game_state.map.visibility
+    walls = OccupancyTracker.wall_grid(game_state.index.walls, args.dimension)
+    visible = OccupancyTracker.visibility_grid(visibility)
+    grid = OccupancyGrid(walls)
+
+    runs = (
+        ("visibility grid", lambda: OccupancyTracker.visibility_grid(visibility)),
+        ("hidden enemy update", lambda: grid.update(visible, None)),
+    )
+    print(f"Occupancy grid, {args.dimension}x{args.dimension} map")
+    for name, run in runs:
+        elapsed = min(timeit.repeat(run, number=args.number, repeat=3))
+        print(f"  {name}: {elapsed / args.number * 1e6:7.1f} us per call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Compares the ways of sending the packets from the worker thread.
+
+The worker thread sends `--packets` packets (actions with a payload),
+one every `--interval` milliseconds, or all at once with
+`--interval 0`. Each packet is sent either with its own coroutine
+through :func:`asyncio.run_coroutine_threadsafe`, as the bot used to do,
+or queued for the single writer task of :class:`HackathonBot`.
+The time spent in the worker thread and the latency from
+the call to the websocket write are reported.
+
+Usage::
+
+    python -m benchmarks.bench_outbound [--packets 2000] [--interval 0]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import threading
+import time
+
+from hackathon_bot.actions import Movement
+from hackathon_bot.enums import MovementDirection
+from hackathon_bot.hackathon_bot import HackathonBot
+
+
+class _Bot(HackathonBot):
+    def on_lobby_data_received(self, lobby_data): ...
+
+    def next_move(self, game_state): ...
+
+    def on_game_ended(self, game_result): ...
+
+    def on_warning_received(self, warning, message): ...
+
+
+class _Socket:
+    def __init__(self) -> None:
+        self.written = []
+
+    async def send(self, message: str) -> None:
+        self.written.append((time.perf_counter(), message))
+
+
+async def _run(queued: bool, packets: int, interval: float):
+    bot = _Bot()
+    loop = bot._loop = asyncio.get_running_loop()  # pylint: disable=protected-access
+    websocket = _Socket()
+    writer = asyncio.create_task(
+        bot._write_packets(websocket)  # pylint: disable=protected-access
+    )
+    action = Movement(MovementDirection.FORWARD)
+    calls = []
+    caller = []
+
+    def worker() -> None:
+        for number in range(packets):
+            payload = action.to_payload(str(number))
+            begin = time.perf_counter()
+            if queued:
+                bot._enqueue_packet(  # pylint: disable=protected-access
+                    websocket, action.packet_type, payload
+                )
+            else:
+                asyncio.run_coroutine_threadsafe(
+                    bot._send_packet(  # pylint: disable=protected-access
+                        websocket, action.packet_type, payload
+                    ),
+                    loop,
+                )
+            end = time.perf_counter()
+            calls.append(begin)
+            caller.append(end - begin)
+            if interval:
+                time.sleep(interval)
+
+    thread = threading.Thread(target=worker)
+    begin = time.perf_counter()
+    thread.start()
+    while len(websocket.written) < packets:
+        await asyncio.sleep(0.0005)
+    total = time.perf_counter() - begin
+    thread.join()
+    writer.cancel()
+
+    # The ids of the game states give the order of the packets.
+    order = [
+        int(json.loads(message)["payload"]["gameStateId"])
+        for _, message in websocket.written
+    ]
+    latencies = [
+        written - calls[number]
+        for (written, _), number in zip(websocket.written, order)
+    ]
+    return total, caller, sorted(latencies), order == sorted(order)
+
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--packets", type=int, default=2000)
+    parser.add_argument("--interval", type=float, default=0)
+    args = parser.parse_args()
+
+    print(f"Outbound packets, {args.packets} packets, {args.interval:g} ms apart")
+    for name, queued in (("run_coroutine_threadsafe", False), ("queue", True)):
+        total, caller, latencies, ordered = asyncio.run(
+            _run(queued, args.packets, args.interval / 1e3)
+        )
+        print(
+            f"  {name}: {total * 1e3:.1f} ms in total, "
+            f"{statistics.mean(caller) * 1e6:.1f} us per call, "
+            f"latency median {statistics.median(latencies) * 1e3:.3f} ms, "
+            f"p95 {latencies[int(len(latencies) * 0.95)] * 1e3:.3f} ms, "
+            f"{'in order' if ordered else 'out of order'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
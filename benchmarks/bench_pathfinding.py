@@ -0,0 +1,117 @@
+"""Compares tile paths with orientation-aware paths.
+
+For random starts and goals on the fixture map, the ticks needed to
+follow the shortest tile path (rotating the tank before every turn,
+as `move_towards` does) are compared with the ticks of the path over
+`(x, y, direction)` states. The cost of the cached reverse search
+is measured as well.
+
+Usage::
+
+    python -m benchmarks.bench_pathfinding [--dimension 24] [--pairs 300]
+"""
+
+import argparse
+import random
+import time
+from collections import deque
+
+import humps
+
+from hackathon_bot.bitboard import MapBitboards
+from hackathon_bot.models import GameStateModel
+from hackathon_bot.pathfinding import OrientedPathfinder
+from hackathon_bot.payloads import GameStatePayload
+
+from .fixtures import AGENT_ID, game_state_payload
+
+_STEPS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+
+def _tile_path(walls, start, goal) -> list[tuple[int, int]] | None:
+    dimension = len(walls)
+    parents = {start: None}
+    queue = deque([start])
+    while queue:
+        tile = queue.popleft()
+        if tile == goal:
+            path = []
+            while tile is not None:
+                path.append(tile)
+                tile = parents[tile]
+            return path[::-1]
+        for dx, dy in _STEPS:
+            x, y = tile[0] + dx, tile[1] + dy
+            if (
+                0 <= x < dimension
+                and 0 <= y < dimension
+                and not walls[y][x]
+                and (x, y) not in parents
+            ):
+                parents[(x, y)] = tile
+                queue.append((x, y))
+    return None
+
+
+def _tile_path_ticks(path, direction) -> int:
+    ticks = 0
+    for (x, y), (nx, ny) in zip(path, path[1:]):
+        wanted = _STEPS.index((nx - x, ny - y))
+        if wanted != direction and wanted != (direction + 2) % 4:
+            ticks += 1
+            direction = wanted
+        ticks += 1
+    return ticks
+
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dimension", type=int, default=24)
+    parser.add_argument("--pairs", type=int, default=300)
+    args = parser.parse_args()
+
+    payload = GameStatePayload.from_json(
+        humps.decamelize(game_state_payload(args.dimension))
+    )
+    map_ = GameStateModel.from_payload(payload, AGENT_ID).map
+    layers = MapBitboards.from_map(map_)
+    walls = layers.geometry.to_grid(layers.walls)
+    free = list(layers.geometry.to_positions(layers.geometry.full & ~layers.walls))
+
+    start = time.perf_counter()
+    pathfinder = OrientedPathfinder(walls)
+    tables = time.perf_counter() - start
+
+    rng = random.Random(0)
+    tile_ticks = state_ticks = reverse = lookups = 0.0
+    for _ in range(args.pairs):
+        (sx, sy), goal = rng.sample(free, 2)
+        direction = rng.randrange(4)
+        path = _tile_path(walls, (sx, sy), goal)
+        if path is None:
+            continue
+
+        start = time.perf_counter()
+        pathfinder.distances_to([goal])
+        reverse += time.perf_counter() - start
+        start = time.perf_counter()
+        actions = pathfinder.path_to((sx, sy, direction), [goal])
+        lookups += time.perf_counter() - start
+
+        tile_ticks += _tile_path_ticks(path, direction)
+        state_ticks += len(actions)
+
+    print(f"Pathfinding, {args.dimension}x{args.dimension} map, {args.pairs} pairs")
+    print(f"  transition tables: {tables * 1e3:.2f} ms once per map")
+    print(f"  reverse search: {reverse / args.pairs * 1e3:.3f} ms per new goal set")
+    print(f"  cached path: {lookups / args.pairs * 1e3:.3f} ms per path")
+    print(
+        f"  ticks: tile paths {tile_ticks:.0f}, oriented paths {state_ticks:.0f} "
+        f"({(1 - state_ticks / tile_ticks) * 100:.1f}% fewer)"
+    )
+
+
+if __name__ == "__main__":
+    main()
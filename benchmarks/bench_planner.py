@@ -0,0 +1,57 @@
+"""Measures the search effort of the planner for several tick budgets.
+
+Each budget plans five consecutive ticks, applying the chosen action
+to the forward model, so the reused tree grows between the ticks.
+
+Usage::
+
+    python -m benchmarks.bench_planner [--dimension 24]
+"""
+
+import argparse
+import time
+
+import humps
+
+from hackathon_bot.models import GameStateModel
+from hackathon_bot.payloads import GameStatePayload
+from hackathon_bot.planner import MCTSPlanner
+from hackathon_bot.simulation import TankSimulation
+
+from .fixtures import AGENT_ID, game_state_payload
+
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dimension", type=int, default=24)
+    args = parser.parse_args()
+
+    payload = GameStatePayload.from_json(
+        humps.decamelize(game_state_payload(args.dimension))
+    )
+    game_state = GameStateModel.from_payload(payload, AGENT_ID)
+
+    print(f"MCTS planner, {args.dimension}x{args.dimension} map, 5 ticks")
+    for budget in (0.005, 0.02, 0.05):
+        simulation = TankSimulation.from_game_state(game_state)
+        planner = MCTSPlanner(budget, seed=0)
+        iterations = reused = 0
+        overrun = 0.0
+        for _ in range(5):
+            start = time.perf_counter()
+            action = planner.plan(simulation)
+            overrun = max(overrun, time.perf_counter() - start - budget)
+            iterations += planner.iterations
+            reused += planner.reused
+            simulation.step(action)
+        print(
+            f"  budget {budget * 1e3:4.0f} ms: {iterations / 5:7.0f} iterations "
+            f"per tick, {reused}/5 trees reused, "
+            f"max overrun {overrun * 1e3:.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
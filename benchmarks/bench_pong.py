@@ -0,0 +1,134 @@
+"""Measures the PONG latency while a game state is being decoded.
+
+Every tick the server sends a GAME_STATE packet and, right after it,
+a PING packet. The latency is the time from the arrival of both packets
+to the PONG being written to the websocket. Two receive paths are
+compared:
+
+- inline: the game state is decoded on the event loop before the next
+  packet is read, as `_handle_messages` used to do,
+- worker: only the packet type is read on the event loop and the game
+  state is decoded in the worker thread.
+
+Usage::
+
+    python -m benchmarks.bench_pong [--dimension 24] [--switch-interval 0.005]
+
+In the worker path the event loop waits for the GIL held by the decoding
+thread, which the interpreter hands over every `--switch-interval`
+seconds (see :func:`sys.setswitchinterval`), so the PONG latency
+is bounded by it instead of by the decoding time.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import humps
+
+from hackathon_bot.actions import Pass
+from hackathon_bot.enums import PacketType
+from hackathon_bot.hackathon_bot import HackathonBot
+from hackathon_bot.models import GameStateModel
+from hackathon_bot.payloads import GameStatePayload
+
+from .fixtures import AGENT_ID, game_state_message
+
+
+class _Bot(HackathonBot):
+    def on_lobby_data_received(self, lobby_data): ...
+
+    def next_move(self, game_state):
+        return Pass()
+
+    def on_game_ended(self, game_result): ...
+
+    def on_warning_received(self, warning, message): ...
+
+
+class _Socket:
+    def __init__(self) -> None:
+        self.pong = None
+        self.moves = 0
+
+    async def send(self, message: str) -> None:
+        packet_type = json.loads(message)["type"]
+        if packet_type == PacketType.PONG:
+            self.pong = time.perf_counter()
+        else:
+            self.moves += 1
+
+
+def _handle_inline(bot: _Bot, websocket: _Socket, message: str) -> None:
+    # The previous receive path of the game states.
+    data = humps.decamelize(json.loads(message))
+    payload = GameStatePayload.from_json(data["payload"])
+    game_state = GameStateModel.from_payload(payload, AGENT_ID)
+    bot._is_processing = True  # pylint: disable=protected-access
+    threading.Thread(
+        target=bot._make_next_move,  # pylint: disable=protected-access
+        args=(websocket, game_state, 0),
+    ).start()
+
+
+async def _run(inline: bool, state: str, ticks: int) -> list[float]:
+    bot = _Bot()
+    bot._loop = asyncio.get_running_loop()  # pylint: disable=protected-access
+    bot._lobby_data = SimpleNamespace(player_id=AGENT_ID)
+    websocket = _Socket()
+    ping = json.dumps({"type": int(PacketType.PING)})
+    writer = asyncio.create_task(
+        bot._write_packets(websocket)  # pylint: disable=protected-access
+    )
+
+    latencies = []
+    for tick in range(ticks):
+        websocket.pong = None
+        arrival = time.perf_counter()
+        if inline:
+            _handle_inline(bot, websocket, state)
+        else:
+            bot._handle_messages(websocket, state)  # pylint: disable=protected-access
+        bot._handle_messages(websocket, ping)  # pylint: disable=protected-access
+
+        # The next tick starts after the move of this one is sent.
+        while websocket.pong is None or websocket.moves <= tick:
+            await asyncio.sleep(0.0005)
+        latencies.append(websocket.pong - arrival)
+    writer.cancel()
+    return latencies
+
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dimension", type=int, default=24)
+    parser.add_argument("--ticks", type=int, default=100)
+    parser.add_argument("--switch-interval", type=float, default=None)
+    args = parser.parse_args()
+
+    if args.switch_interval is not None:
+        sys.setswitchinterval(args.switch_interval)
+
+    state = game_state_message(args.dimension)
+    print(
+        f"PONG latency, {args.dimension}x{args.dimension} map, "
+        f"{len(state) / 1024:.0f} KiB game state, {args.ticks} ticks, "
+        f"switch interval {sys.getswitchinterval() * 1e3:g} ms"
+    )
+    for name, inline in (("inline", True), ("worker", False)):
+        latencies = sorted(asyncio.run(_run(inline, state, args.ticks)))
+        print(
+            f"  {name}: median {statistics.median(latencies) * 1e3:.3f} ms, "
+            f"p95 {latencies[int(len(latencies) * 0.95)] * 1e3:.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
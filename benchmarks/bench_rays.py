@@ -0,0 +1,138 @@
+"""Measures the line-of-fire search of the bots with and without ray tables.
+
+`go_to_direct_line` searches the tile nearest to the agent with a clear
+shot at a target. The criterion of the search scanned the entities of the tiles between
+every visited tile and the target for walls; with a :class:`RayTable`
+the tiles with a clear shot are looked up once and the criterion
+is a set membership test.
+
+Usage::
+
+    python -m benchmarks.bench_rays [--dimension 24] [--targets 200]
+"""
+
+import argparse
+import random
+import time
+from collections import deque
+
+import humps
+
+from hackathon_bot.bitboard import MapBitboards
+from hackathon_bot.models import GameStateModel
+from hackathon_bot.payloads import GameStatePayload
+from hackathon_bot.predicates import is_wall
+from hackathon_bot.rays import RayTable
+
+from .fixtures import AGENT_ID, game_state_payload
+
+_STEPS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+
+def _search(walls, start, criterion) -> tuple[int, int] | None:
+    dimension = len(walls)
+    seen = {start}
+    queue = deque([start])
+    while queue:
+        tile = queue.popleft()
+        if criterion(tile):
+            return tile
+        for dx, dy in _STEPS:
+            x, y = tile[0] + dx, tile[1] + dy
+            if (
+                0 <= x < dimension
+                and 0 <= y < dimension
+                and not walls[y][x]
+                and (x, y) not in seen
+            ):
+                seen.add((x, y))
+                queue.append((x, y))
+    return None
+
+
+def _scanning_criterion(tiles, target):
+    def is_direct_to(pos):
+        if pos[0] == target[0]:
+            low, high = sorted((pos[1], target[1]))
+            return not any(
+                is_wall(entity)
+                for y in range(low + 1, high)
+                for entity in tiles[y][pos[0]].entities
+            )
+        if pos[1] == target[1]:
+            low, high = sorted((pos[0], target[0]))
+            return not any(
+                is_wall(entity)
+                for x in range(low + 1, high)
+                for entity in tiles[pos[1]][x].entities
+            )
+        return False
+
+    return is_direct_to
+
+
+def _table_criterion(rays, target):
+    tiles = {(x, y) for x, y, _ in rays.shooting_positions(*target)}
+    tiles.add(target)
+    return tiles.__contains__
+
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dimension", type=int, default=24)
+    parser.add_argument("--targets", type=int, default=200)
+    args = parser.parse_args()
+
+    payload = GameStatePayload.from_json(
+        humps.decamelize(game_state_payload(args.dimension))
+    )
+    map_ = GameStateModel.from_payload(payload, AGENT_ID).map
+    layers = MapBitboards.from_map(map_)
+    walls = layers.geometry.to_grid(layers.walls)
+    free = list(layers.geometry.to_positions(layers.geometry.full & ~layers.walls))
+
+    start = time.perf_counter()
+    rays = RayTable(walls)
+    tables = time.perf_counter() - start
+
+    rng = random.Random(0)
+    pairs = [rng.sample(free, 2) for _ in range(args.targets)]
+
+    start = time.perf_counter()
+    scanned = [_search(walls, s, _scanning_criterion(map_.tiles, t)) for s, t in pairs]
+    scanning = time.perf_counter() - start
+
+    start = time.perf_counter()
+    looked_up = [_search(walls, s, _table_criterion(rays, t)) for s, t in pairs]
+    lookups = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _, target in pairs:
+        criterion = _scanning_criterion(map_.tiles, target)
+        for tile in free:
+            criterion(tile)
+    scanning_all = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _, target in pairs:
+        criterion = _table_criterion(rays, target)
+        for tile in free:
+            criterion(tile)
+    lookups_all = time.perf_counter() - start
+
+    assert scanned == looked_up
+    print(f"Line-of-fire search, {args.dimension}x{args.dimension} map")
+    print(f"  ray tables: {tables * 1e3:.2f} ms once per map")
+    print(f"  scanning criterion: {scanning / args.targets * 1e3:.3f} ms per search")
+    print(f"  ray table criterion: {lookups / args.targets * 1e3:.3f} ms per search")
+    print(
+        f"  criterion on every free tile: scanning "
+        f"{scanning_all / args.targets * 1e3:.3f} ms, "
+        f"ray table {lookups_all / args.targets * 1e3:.3f} ms per target"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Compares per-process tables with tables shared between processes.
+
+`--processes` bot processes start on the same fixture map and each
+needs its all-pairs distance field, as the bots started by `run.sh`.
+Each process either computes its own copy or uses :class:`SharedTables`,
+where the first process publishes the table and the others attach
+to it. The time to get the table and the private memory added by it
+(from `/proc/self/smaps_rollup`, on Linux) are reported per process.
+
+Usage::
+
+    python -m benchmarks.bench_shared [--dimension 24] [--processes 3]
+"""
+
+import argparse
+import multiprocessing
+import time
+import uuid
+
+import humps
+
+from hackathon_bot.bitboard import MapBitboards
+from hackathon_bot.models import GameStateModel
+from hackathon_bot.payloads import GameStatePayload
+from hackathon_bot.shared import SharedTables
+
+from .bench_cache import _distance_field
+from .fixtures import AGENT_ID, game_state_payload
+
+
+def _private_bytes() -> int:
+    try:
+        with open("/proc/self/smaps_rollup", encoding="ascii") as file:
+            return sum(
+                int(line.split()[1]) * 1024
+                for line in file
+                if line.startswith(("Private_Clean:", "Private_Dirty:"))
+            )
+    except OSError:
+        return 0
+
+
+def _walls(dimension: int):
+    payload = GameStatePayload.from_json(
+        humps.decamelize(game_state_payload(dimension))
+    )
+    layers = MapBitboards.from_map(GameStateModel.from_payload(payload, AGENT_ID).map)
+    return layers.geometry.to_grid(layers.walls)
+
+
+def _bot(dimension: int, key: str | None, start, results) -> None:
+    walls = _walls(dimension)
+    start.wait()
+    before = _private_bytes()
+    begin = time.perf_counter()
+    if key is None:
+        table = _distance_field(walls)
+    else:
+        table = SharedTables().get_or_compute(
+            key, "distances", lambda: _distance_field(walls)
+        )
+    elapsed = time.perf_counter() - begin
+    # Every tile pair is read once, as a bot would over a match.
+    sum(table)
+    results.put((elapsed, _private_bytes() - before))
+
+
+def _run(dimension: int, processes: int, key: str | None):
+    context = multiprocessing.get_context("spawn")
+    start = context.Barrier(processes)
+    results = context.Queue()
+    bots = [
+        context.Process(target=_bot, args=(dimension, key, start, results))
+        for _ in range(processes)
+    ]
+    for bot in bots:
+        bot.start()
+    measured = sorted(results.get() for _ in bots)
+    for bot in bots:
+        bot.join()
+    return measured
+
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dimension", type=int, default=24)
+    parser.add_argument("--processes", type=int, default=3)
+    args = parser.parse_args()
+
+    key = uuid.uuid4().hex
+    try:
+        private = _run(args.dimension, args.processes, None)
+        shared = _run(args.dimension, args.processes, key)
+    finally:
+        SharedTables().unlink(key, "distances")
+
+    size = args.dimension**2
+    print(
+        f"Distance field, {args.dimension}x{args.dimension} map, "
+        f"{size * size * 2 / 1024:.0f} KiB, {args.processes} processes"
+    )
+    for name, measured in (("private", private), ("shared", shared)):
+        times = ", ".join(f"{elapsed * 1e3:.2f}" for elapsed, _ in measured)
+        memory = sum(added for _, added in measured) / 1024
+        print(f"  {name}: {times} ms per process, {memory:.0f} KiB private in total")
+
+
+if __name__ == "__main__":
+    main()
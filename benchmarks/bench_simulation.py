@@ -0,0 +1,59 @@
+"""Measures the node expansion rate of the tank forward model.
+
+A depth-first search applies every legal action with `push`
+and undoes it with `pop`, which is how a planner uses the model.
+
+Usage::
+
+    python -m benchmarks.bench_simulation [--dimension 24] [--depth 4]
+"""
+
+import argparse
+import time
+
+import humps
+
+from hackathon_bot.models import GameStateModel
+from hackathon_bot.payloads import GameStatePayload
+from hackathon_bot.simulation import TankSimulation
+
+from .fixtures import AGENT_ID, game_state_payload
+
+
+def _expand(simulation: TankSimulation, depth: int) -> int:
+    if depth == 0 or simulation.is_dead:
+        return 1
+    nodes = 1
+    for action in simulation.legal_actions():
+        simulation.push(action)
+        nodes += _expand(simulation, depth - 1)
+        simulation.pop()
+    return nodes
+
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dimension", type=int, default=24)
+    parser.add_argument("--depth", type=int, default=4)
+    args = parser.parse_args()
+
+    payload = GameStatePayload.from_json(
+        humps.decamelize(game_state_payload(args.dimension))
+    )
+    game_state = GameStateModel.from_payload(payload, AGENT_ID)
+    simulation = TankSimulation.from_game_state(game_state)
+
+    start = time.perf_counter()
+    nodes = _expand(simulation, args.depth)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"Forward model, depth {args.depth}, {len(simulation.bullets)} bullets: "
+        f"{nodes} nodes in {elapsed * 1e3:.1f} ms, {nodes / elapsed:,.0f} nodes/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Compares the zone races with a search per tank and with territory maps.
+
+Four tanks walk randomly on the fixture map. Each tick `--moving`
+of them, chosen at random, move by one tile; the positions of the
+enemies out of sight are the last known ones, so usually few move.
+Each tick the tank reaching each zone first is found with
+a breadth-first search per tank and with :class:`TerritoryMap`,
+which relabels only the territories of the moved tanks.
+
+Usage::
+
+    python -m benchmarks.bench_territory [--dimension 24] [--moving 1]
+"""
+
+import argparse
+import random
+import time
+from collections import deque
+
+import humps
+
+from hackathon_bot.bitboard import MapBitboards
+from hackathon_bot.models import GameStateModel
+from hackathon_bot.payloads import GameStatePayload
+from hackathon_bot.territory import TerritoryMap
+
+from .fixtures import AGENT_ID, game_state_payload
+
+_STEPS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+
+def _bfs(walls, start) -> dict[tuple[int, int], int]:
+    dimension = len(walls)
+    distances = {start: 0}
+    queue = deque([start])
+    while queue:
+        x, y = queue.popleft()
+        for dx, dy in _STEPS:
+            nx, ny = x + dx, y + dy
+            if (
+                0 <= nx < dimension
+                and 0 <= ny < dimension
+                and not walls[ny][nx]
+                and (nx, ny) not in distances
+            ):
+                distances[(nx, ny)] = distances[(x, y)] + 1
+                queue.append((nx, ny))
+    return distances
+
+
+def _races_by_search(walls, sources, zones):
+    searches = [(key, _bfs(walls, position)) for key, position in sources.items()]
+    races = []
+    for tiles in zones:
+        best = (None, None)
+        for key, distances in searches:
+            distance = min(
+                (distances[tile] for tile in tiles if tile in distances), default=None
+            )
+            if distance is not None and (best[1] is None or distance < best[1]):
+                best = (key, distance)
+        races.append(best)
+    return races
+
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dimension", type=int, default=24)
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument("--moving", type=int, default=1)
+    args = parser.parse_args()
+
+    game_state = GameStateModel.from_payload(
+        GameStatePayload.from_json(
+            humps.decamelize(game_state_payload(args.dimension))
+        ),
+        AGENT_ID,
+    )
+    layers = MapBitboards.from_map(game_state.map)
+    walls = layers.geometry.to_grid(layers.walls)
+    free = set(layers.geometry.to_positions(layers.geometry.full & ~layers.walls))
+    zones = [
+        [
+            (zone.x + dx, zone.y + dy)
+            for dx in range(zone.width)
+            for dy in range(zone.height)
+        ]
+        for zone in game_state.map.zones
+    ]
+
+    rng = random.Random(0)
+    index = game_state.index
+    sources = {AGENT_ID: index.my_position, **index.enemy_positions}
+    ticks = []
+    for _ in range(args.ticks):
+        sources = dict(sources)
+        for key in rng.sample(list(sources), min(args.moving, len(sources))):
+            x, y = sources[key]
+            steps = [(x + dx, y + dy) for dx, dy in _STEPS if (x + dx, y + dy) in free]
+            sources[key] = rng.choice(steps or [(x, y)])
+        ticks.append(sources)
+
+    begin = time.perf_counter()
+    expected = [_races_by_search(walls, sources, zones) for sources in ticks]
+    search = (time.perf_counter() - begin) / len(ticks)
+
+    territory = TerritoryMap(walls)
+    begin = time.perf_counter()
+    territory.update(ticks[0])
+    first = time.perf_counter() - begin
+
+    relabeled = []
+    begin = time.perf_counter()
+    races = [[territory.race(tiles) for tiles in zones]]
+    for sources in ticks[1:]:
+        territory.update(sources)
+        relabeled.append(territory.relabeled)
+        races.append([territory.race(tiles) for tiles in zones])
+    incremental = (time.perf_counter() - begin - first) / (len(ticks) - 1)
+
+    # The ties may be broken differently, so only the distances are compared.
+    assert [[d for _, d in r] for r in races] == [[d for _, d in r] for r in expected]
+
+    print(
+        f"Zone races, {args.dimension}x{args.dimension} map, "
+        f"{len(sources)} tanks ({args.moving} moving), "
+        f"{len(zones)} zones, {args.ticks} ticks"
+    )
+    print(f"  search per tank: {search * 1e3:.3f} ms per tick")
+    print(f"  territory map: first {first * 1e3:.3f} ms, ", end="")
+    print(
+        f"then {incremental * 1e3:.3f} ms per tick, "
+        f"{sum(relabeled) / len(relabeled):.1f} of {len(free)} tiles relabeled"
+    )
+
+
+if __name__ == "__main__":
+    main()
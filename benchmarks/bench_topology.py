@@ -0,0 +1,95 @@
+"""Measures the map topology analysis and its lookups.
+
+The analysis runs once per map, so its cost is compared with the
+interval between two game states. The lookup replacing the per-tick
+corridor check of `bot6_1.py` (an `isinstance` scan of the entities
+of the tiles around the tank) is measured as well, and so is loading
+the topology of a map seen before from the precomputation cache.
+
+Usage::
+
+    python -m benchmarks.bench_topology [--dimension 24] [--number 2000]
+"""
+
+import argparse
+import tempfile
+import timeit
+
+import humps
+
+from hackathon_bot.bitboard import MapBitboards
+from hackathon_bot.cache import PrecomputationCache
+from hackathon_bot.models import GameStateModel
+from hackathon_bot.payloads import GameStatePayload
+from hackathon_bot.predicates import is_wall
+from hackathon_bot.topology import MapTopology
+
+from .fixtures import AGENT_ID, game_state_payload
+
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dimension", type=int, default=24)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    payload = GameStatePayload.from_json(
+        humps.decamelize(game_state_payload(args.dimension))
+    )
+    map_ = GameStateModel.from_payload(payload, AGENT_ID).map
+    layers = MapBitboards.from_map(map_)
+    walls = layers.geometry.to_grid(layers.walls)
+    free = list(layers.geometry.to_positions(layers.geometry.full & ~layers.walls))
+    inner = [
+        (x, y)
+        for x, y in free
+        if 0 < x < args.dimension - 1 and 0 < y < args.dimension - 1
+    ]
+
+    analysis = min(
+        timeit.repeat(lambda: MapTopology.from_walls(walls), number=1, repeat=5)
+    )
+    topology = MapTopology.from_walls(walls)
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = PrecomputationCache(directory)
+        cache.store("map", "topology", topology.to_table())
+        load = min(
+            timeit.repeat(
+                lambda: MapTopology.from_table(cache.load("map", "topology")),
+                number=1,
+                repeat=5,
+            )
+        )
+
+    def scans():
+        for x, y in inner:
+            for tile in ((x - 1, y + 1), (x + 1, y + 1)):
+                if all(is_wall(e) for e in map_.tiles[tile[1]][tile[0]].entities):
+                    break
+
+    def lookups():
+        for x, y in inner:
+            topology.is_corridor(x, y + 1)
+
+    scan = timeit.timeit(scans, number=args.number // 10) / (args.number // 10)
+    lookup = timeit.timeit(lookups, number=args.number // 10) / (args.number // 10)
+
+    print(f"Map topology, {args.dimension}x{args.dimension} map")
+    print(f"  analysis: {analysis * 1e3:.2f} ms once per map")
+    print(f"  cached load: {load * 1e3:.2f} ms")
+    print(
+        f"  corridor check: scan {scan / len(inner) * 1e6:.3f} us, "
+        f"lookup {lookup / len(inner) * 1e6:.3f} us per tile"
+    )
+    print(
+        f"  {sum(topology.articulation_points)} chokepoints, "
+        f"{len(topology.corridor_lengths)} corridors, "
+        f"deepest dead end {max(topology.dead_end_depths)}"
+    )
+
+
+if __name__ == "__main__":
+    main()
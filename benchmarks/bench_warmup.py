@@ -0,0 +1,66 @@
+"""Measures the first tick with and without the warm-up.
+
+The bot needs the all-pairs distance field of the fixture map.
+Without the warm-up, it is computed in the first `next_move`;
+with :class:`WarmUp`, it is submitted when the lobby data arrives
+and the first `next_move` only collects it. The lobby data comes
+`--gap` milliseconds before the first game state, the time the
+server takes to start the game.
+
+Usage::
+
+    python -m benchmarks.bench_warmup [--dimension 24] [--gap 200]
+"""
+
+import argparse
+import time
+
+import humps
+
+from hackathon_bot.bitboard import MapBitboards
+from hackathon_bot.models import GameStateModel
+from hackathon_bot.payloads import GameStatePayload
+from hackathon_bot.warmup import WarmUp
+
+from .bench_cache import _distance_field
+from .fixtures import AGENT_ID, game_state_payload
+
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dimension", type=int, default=24)
+    parser.add_argument("--gap", type=float, default=200)
+    args = parser.parse_args()
+
+    payload = GameStatePayload.from_json(
+        humps.decamelize(game_state_payload(args.dimension))
+    )
+    layers = MapBitboards.from_map(GameStateModel.from_payload(payload, AGENT_ID).map)
+    walls = layers.geometry.to_grid(layers.walls)
+
+    # Without the warm-up.
+    time.sleep(args.gap / 1e3)
+    begin = time.perf_counter()
+    _distance_field(walls)
+    cold = time.perf_counter() - begin
+
+    # With the warm-up, started with the lobby data.
+    warm_up = WarmUp()
+    warm_up.submit("distances", _distance_field, walls)
+    time.sleep(args.gap / 1e3)
+    begin = time.perf_counter()
+    warm_up.result("distances")
+    warm = time.perf_counter() - begin
+
+    print(
+        f"First tick, {args.dimension}x{args.dimension} map, "
+        f"{args.gap:.0f} ms between the lobby data and the first game state"
+    )
+    print(f"  computed in next_move: {cold * 1e3:.2f} ms")
+    print(f"  warmed up: {warm * 1e3:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Synthetic game state fixtures used by the benchmarks.
+
+The generated packets follow the format sent by the server
+(camel case keys, tiles indexed by ``[x][y]``) so that the whole
+decoding path of the library can be measured.
+"""
+
+import json
+import random
+
+from hackathon_bot.enums import PacketType
+
+AGENT_ID = "7ed26efb-135d-4cd7-8bc7-c867a0b36d77"
+ENEMY_IDS = (
+    "e149e7a5-c849-4765-81be-c4538db33ecd",
+    "1af32fb5-1cbd-4164-8a13-bc67ab3e5623",
+    "5c0b4e2a-37d1-4f4e-9c2e-0d7b8f6a1e90",
+)
+
+
+def _tank(owner_id: str, rng: random.Random, agent: bool) -> dict:
+    turret = {"direction": rng.randrange(4)}
+    payload = {"ownerId": owner_id, "direction": rng.randrange(4), "turret": turret}
+    if agent:
+        turret["bulletCount"] = 3
+        turret["ticksToRegenBullet"] = None
+        payload["health"] = 100
+        payload["secondaryItem"] = None
+    return {"type": "tank", "payload": payload}
+
+
+def game_state_payload(dimension: int = 24, seed: int = 0) -> dict:
+    """Returns a GAME_STATE payload as received from the server.
+
+    About a quarter of the tiles are walls. The map contains four tanks,
+    a few bullets, lasers, mines and items, and four zones.
+    """
+
+    rng = random.Random(seed)
+    tiles = [[[] for _ in range(dimension)] for _ in range(dimension)]
+
+    free = []
+    for x in range(dimension):
+        for y in range(dimension):
+            if rng.random() < 0.25:
+                tiles[x][y].append({"type": "wall"})
+            else:
+                free.append((x, y))
+    rng.shuffle(free)
+
+    for i, owner_id in enumerate((AGENT_ID,) + ENEMY_IDS):
+        x, y = free.pop()
+        tiles[x][y].append(_tank(owner_id, rng, agent=i == 0))
+
+    next_id = 1
+    for _ in range(dimension // 2):
+        x, y = free.pop()
+        payload = {
+            "id": next_id,
+            "speed": 2,
+            "direction": rng.randrange(4),
+            "type": rng.randrange(2),
+        }
+        tiles[x][y].append({"type": "bullet", "payload": payload})
+        next_id += 1
+    for _ in range(dimension // 4):
+        x, y = free.pop()
+        payload = {"id": next_id, "orientation": rng.randrange(2)}
+        tiles[x][y].append({"type": "laser", "payload": payload})
+        next_id += 1
+    for _ in range(dimension // 4):
+        x, y = free.pop()
+        payload = {"id": next_id, "explosionRemainingTicks": None}
+        tiles[x][y].append({"type": "mine", "payload": payload})
+        next_id += 1
+    for _ in range(dimension // 2):
+        x, y = free.pop()
+        payload = {"type": rng.randrange(1, 5)}
+        tiles[x][y].append({"type": "item", "payload": payload})
+
+    far = dimension - 6
+    zones = []
+    for index, (zx, zy) in enumerate(((2, 2), (far, 2), (2, far), (far, far))):
+        zones.append(
+            {
+                "x": zx,
+                "y": zy,
+                "width": 4,
+                "height": 4,
+                "index": 65 + index,
+                "status": {"type": "neutral"},
+            }
+        )
+
+    visibility = [
+        "".join("1" if rng.random() < 0.3 else "0" for _ in range(dimension))
+        for _ in range(dimension)
+    ]
+
+    players = [
+        {
+            "id": AGENT_ID,
+            "nickname": "agent",
+            "color": 4278190335,
+            "ping": 3,
+            "score": 12,
+            "ticksToRegen": None,
+            "isUsingRadar": False,
+        }
+    ] + [
+        {"id": owner_id, "nickname": f"enemy{i}", "color": 4294901760, "ping": 5}
+        for i, owner_id in enumerate(ENEMY_IDS)
+    ]
+
+    return {
+        "id": "0a0432fa-7fb1-42b9-8e85-7a1a085083a7",
+        "tick": 123,
+        "players": players,
+        "map": {"tiles": tiles, "zones": zones, "visibility": visibility},
+    }
+
+
+def game_state_message(dimension: int = 24, seed: int = 0) -> str:
+    """Returns a GAME_STATE packet as a websocket message."""
+    return json.dumps(
+        {"type": int(PacketType.GAME_STATE), "payload": game_state_payload(dimension, seed)}
+    )
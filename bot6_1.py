@@ -9,6 +9,9 @@ import random
 from typing import Optional, Tuple, List, Dict
 from collections import defaultdict
 from hackathon_bot import *
+from hackathon_bot.cache import PrecomputationCache, map_key
+from hackathon_bot.rays import RayTable
+from hackathon_bot.topology import MapTopology, analyze_async
 from dataclasses import dataclass
 from copy import deepcopy
 import math
@@ -71,7 +74,7 @@ def adjacent(tiles: tuple[tuple[Tile]], pos: Pos, visited: dict[Pos, Pos]) -> tu
     cross = (p for p in cross if p not in visited)
     cross = (p for p in cross if p.x>=0 and p.x<len(tiles[0]) and p.y>=0 and p.y<len(tiles))
     cross_tiles = ((p,tiles[p.y][p.x]) for p in cross) # tuple of (pos,tile) because tile is dumb
-    adj = [x[0] for x in cross_tiles if not any(isinstance(y, Wall) or isinstance(y, Mine) or isinstance(y,Laser) for y in x[1].entities)]
+    adj = [x[0] for x in cross_tiles if not any(is_obstacle_or_hazard(y) for y in x[1].entities)]
     return adj
 
 def heur_select_next(stack:list[Pos]):
@@ -141,8 +144,13 @@ class ExampleBot(HackathonBot):
         self.init = False
         self.mines: List[Pos] = []
         self.dimension = None
+        self.seed = None
+        self.cache = PrecomputationCache()
         self.visibility_cache = defaultdict()
         self.wall_map: List[List[bool]] = []
+        self.rays: RayTable = None
+        self.topology: MapTopology = None
+        self.topology_future = None
         self.last_pos: Pos = None
 
         self.dangerous_zone = None
@@ -167,22 +175,19 @@ class ExampleBot(HackathonBot):
     
     def find_stuff(self, game_state: GameState):
         self.enemies = defaultdict()
-
-        for y,row in enumerate(game_state.map.tiles):
-            for x,tile in enumerate(row):
-                for ent in tile.entities:
-                    if isinstance(ent, PlayerTank):
-                        if ent.owner_id==game_state.my_agent.id:
-                            self.my_pos=Pos(x,y)
-                            self.my_tank = ent
-                        else:
-                            self.enemies[ent.owner_id] = EnemyData(ent.turret.direction, ent.direction, Pos(x, y), True)
-                    elif isinstance(ent, Bullet):
-                        self.bullets[ent.id] = BulletData(ent, Pos(x, y))
-                    elif isinstance(ent, Mine):
-                        self.mines.append(Pos(x, y))
-                    # elif isinstance(ent, Item):
-                    #    self.knownItems[Pos(x, y)] = ItemData(ent.type, game_state.tick)
+        index = game_state.index
+
+        if index.my_tank is not None:
+            self.my_pos = Pos(*index.my_position)
+            self.my_tank = index.my_tank
+        for owner_id, ent in index.enemy_tanks.items():
+            self.enemies[owner_id] = EnemyData(ent.turret.direction, ent.direction, Pos(*index.enemy_positions[owner_id]), True)
+        for x, y in index.bullets:
+            for ent in game_state.map.tiles[y][x].entities:
+                if is_bullet(ent):
+                    self.bullets[ent.id] = BulletData(ent, Pos(x, y))
+        for x, y in index.mines:
+            self.mines.append(Pos(x, y))
 
     def calculate(self):
         rotations = [Direction.UP, Direction.RIGHT, Direction.DOWN, Direction.LEFT]
@@ -292,8 +297,12 @@ class ExampleBot(HackathonBot):
         for y, line in enumerate(map.tiles):
             for x, tile in enumerate(line):
                 for entity in tile.entities:
-                    if isinstance(entity, Wall):
+                    if is_wall(entity):
                         self.wall_map[y][x] = True
+        self.rays = RayTable(self.wall_map)
+        # the topology of a seen map is loaded from the disk cache
+        key = map_key(self.seed, self.dimension, self.wall_map)
+        self.topology_future = analyze_async(self.wall_map, cache=self.cache, key=key)
         # self.fog_of_war_manager = FogOfWarManager(self.wall_map)
         self.init = True
 
@@ -536,30 +545,12 @@ class ExampleBot(HackathonBot):
 
     @action
     def go_to_direct_line(self, game_state: GameState, target: Pos):
+        shooting_tiles = {Pos(x, y) for x, y, _ in self.rays.shooting_positions(target.x, target.y)}
+        shooting_tiles.add(target)
+
         def is_direct_to(pos: Pos):
-            x_axis = pos.x==target.x
-            y_axis = pos.y==target.y
-            if x_axis:
-                # look if everything between player and target is free
-                if pos.y<target.y:
-                    r = range(pos.y+1,target.y)
-                else:
-                    r = range(target.y+1,pos.y)
-                for yi in r:
-                    if any(isinstance(ent,Wall) for ent in game_state.map.tiles[yi][pos.x].entities):
-                        return False
-                return True
-            elif y_axis:
-                if pos.x<target.x:
-                    r = range(pos.x+1,target.x)
-                else:
-                    r = range(target.x+1, pos.x)
-                for xi in r:
-                    if any(isinstance(ent,Wall) for ent in game_state.map.tiles[pos.y][xi].entities):
-                        return False
-                return True
-            return False
-        
+            return pos in shooting_tiles
+
         return self.search(game_state, is_direct_to)
     
     @action
@@ -619,19 +610,31 @@ class ExampleBot(HackathonBot):
 
     def is_corridor_behind(self, game_state: GameState):
         if self.my_tank.direction==Direction.UP:
-            check = [Pos(self.my_pos.x-1,self.my_pos.y+1),Pos(self.my_pos.x+1,self.my_pos.y+1)]
+            behind = Pos(self.my_pos.x,self.my_pos.y+1)
         elif self.my_tank.direction==Direction.DOWN:
-            check = [Pos(self.my_pos.x-1,self.my_pos.y-1),Pos(self.my_pos.x+1,self.my_pos.y-1)]
+            behind = Pos(self.my_pos.x,self.my_pos.y-1)
         elif self.my_tank.direction==Direction.LEFT:
-            check = [Pos(self.my_pos.x+1,self.my_pos.y-1),Pos(self.my_pos.x+1,self.my_pos.y+1)]
+            behind = Pos(self.my_pos.x+1,self.my_pos.y)
         else:
-            check = [Pos(self.my_pos.x-1,self.my_pos.y-1),Pos(self.my_pos.x-1,self.my_pos.y+1)]
-        
-        #@TODO: replace with fast wall check
-        for tile in check:
-            if all(isinstance(x,Wall) for x in game_state.map.tiles[tile.y][tile.x].entities):
-                return True
-        return False
+            behind = Pos(self.my_pos.x-1,self.my_pos.y)
+        if not (0 <= behind.x < self.dimension and 0 <= behind.y < self.dimension):
+            return False
+
+        if self.topology is None and self.topology_future.done():
+            self.topology = self.topology_future.result()
+        if self.topology is not None:
+            return self.topology.is_corridor(behind.x, behind.y)
+
+        # until the topology is analyzed, the same check from the walls:
+        # a free tile with one or two free neighbours
+        if self.wall_map[behind.y][behind.x]:
+            return False
+        free = 0
+        for dx, dy in ((0,-1),(1,0),(0,1),(-1,0)):
+            x, y = behind.x+dx, behind.y+dy
+            if 0 <= x < self.dimension and 0 <= y < self.dimension and not self.wall_map[y][x]:
+                free += 1
+        return 1 <= free <= 2
 # --- actions end
 
     def get_good_visibility_spot(self) -> Pos:
@@ -699,6 +702,7 @@ class ExampleBot(HackathonBot):
     def on_lobby_data_received(self, lobby_data: LobbyData) -> None:
         print(f"Lobby data received: {lobby_data}")
         self.dimension = lobby_data.server_settings.grid_dimension
+        self.seed = lobby_data.server_settings.seed
 
     def next_move(self, game_state: GameState) -> ResponseAction:
         if not self.init:
@@ -1,4 +1,5 @@
 from hackathon_bot import *
+from hackathon_bot.belief import BeliefTracker
 from dataclasses import dataclass
 import math
 
@@ -9,12 +10,6 @@ class Pos:
     y: int
 
 
-@dataclass
-class ItemData:
-    type: ItemType
-    tick: int
-
-
 class MyBot(HackathonBot):
     def __init__(self) -> None:
         super().__init__()
@@ -24,7 +19,7 @@ class MyBot(HackathonBot):
         self.direction: Direction = None
         self.turretDirection: Direction = None
         self.dimension = None
-        self.knownItems: dict[Pos|ItemData] = {}
+        self.beliefs: BeliefTracker = None
 
     def analize_map(self, map: Map):
         self.wallmap = [[False for _ in range(self.dimension)] for _ in range(self.dimension)]
@@ -119,27 +114,15 @@ class MyBot(HackathonBot):
                 self.turretDirection = entity.turret.direction
                 break
 
-    def update_items_list(self, tiles: list[list[Tile]], visible_tiles: list[Pos], tick: int):
-        for pos in visible_tiles:
-            tile = tiles[pos.y][pos.x]
-            for entity in tile.entities:
-                if isinstance(entity, Item):
-                    self.knownItems[pos] = ItemData(entity.type, tick)
-        for pos, item in self.knownItems.items():
-            item: ItemData
-            if tick - item.tick > 100:
-                self.knownItems.pop(pos)
-                    
-
     def on_lobby_data_received(self, lobby_data: LobbyData) -> None:
         self.dimension = lobby_data.server_settings.grid_dimension
-        pass
+        self.beliefs = BeliefTracker(self.dimension, item_expiry=100)
 
     def next_move(self, game_state: GameState) -> ResponseAction:
         if not self.init:
             self.analize_map(game_state.map)
         self.update_diretion(game_state.map.tiles[self.pos.y][self.pos.x])
-        self.update_items_list(game_state.map.tiles, self.get_tiles_to_see(), game_state.tick)
+        self.beliefs.update(game_state)
         if game_state.tick % 10 == 0:
             tiles_to_see = self.get_tiles_to_see()
             print([(pos.x, pos.y) for pos in tiles_to_see])
@@ -63,14 +63,23 @@ class ExampleBot(HackathonBot):
             for tile in row:
                 entity = tile.entities[0] if tile.entities else None
 
-                if isinstance(entity, Wall):
+                if entity is None:
+                    if tile.zone:
+                        index = chr(tile.zone.index)
+                        index = index.upper() if tile.is_visible else index.lower()
+                        print(index, end=end)
+                    elif tile.is_visible:
+                        print(".", end=end)
+                    else:
+                        print(" ", end=end)
+                elif is_wall(entity):
                     print("#", end=end)
-                elif isinstance(entity, Laser):
+                elif is_laser(entity):
                     if entity.orientation is Orientation.HORIZONTAL:
                         print("|", end=end)
                     elif entity.orientation is Orientation.VERTICAL:
                         print("-", end=end)
-                elif isinstance(entity, DoubleBullet):
+                elif is_double_bullet(entity):
                     if entity.direction == Direction.UP:
                         print("⇈", end=end)
                     elif entity.direction == Direction.RIGHT:
@@ -79,7 +88,7 @@ class ExampleBot(HackathonBot):
                         print("⇊", end=end)
                     elif entity.direction == Direction.LEFT:
                         print("⇇", end=end)
-                elif isinstance(entity, Bullet):
+                elif is_bullet(entity):
                     if entity.direction is Direction.UP:
                         print("↑", end=end)
                     elif entity.direction is Direction.RIGHT:
@@ -88,13 +97,13 @@ class ExampleBot(HackathonBot):
                         print("↓", end=end)
                     elif entity.direction is Direction.LEFT:
                         print("←", end=end)
-                elif isinstance(entity, AgentTank):
+                elif is_agent_tank(entity):
                     print("A", end=end)
-                elif isinstance(entity, PlayerTank):
+                elif is_tank(entity):
                     print("P", end=end)
-                elif isinstance(entity, Mine):
+                elif is_mine(entity):
                     print("x" if entity.exploded else "X", end=end)
-                elif isinstance(entity, Item):
+                elif is_item(entity):
                     match (entity.type):
                         case SecondaryItemType.DOUBLE_BULLET:
                             print("D", end=end)
@@ -104,14 +113,6 @@ class ExampleBot(HackathonBot):
                             print("M", end=end)
                         case SecondaryItemType.RADAR:
                             print("R", end=end)
-                elif tile.zone:
-                    index = chr(tile.zone.index)
-                    index = index.upper() if tile.is_visible else index.lower()
-                    print(index, end=end)
-                elif tile.is_visible:
-                    print(".", end=end)
-                else:
-                    print(" ", end=end)
             print()
 
 
@@ -3,6 +3,13 @@ MonoTanks API Wrapper
 ---------------------
 
 A wrapper for the HackArena 2.0 - MonoTanks game.
+
+The package exports the core API: the bot, the actions, the enums,
+the protocols and the entity predicates. The optional tools (for example,
+the pathfinders and the map analyses) are imported from their modules,
+so a bot loads only the tools it uses::
+
+    from hackathon_bot.bitboard import MapBitboards
 """
 
 __title__ = "HackArena2.0-MonoTanks-Python"
@@ -14,4 +21,5 @@ __version__ = "1.0.0"
 from .actions import *
 from .enums import *
 from .hackathon_bot import HackathonBot
+from .predicates import *
 from .protocols import *
@@ -0,0 +1,294 @@
+"""This module contains the belief tracker for the fog of war.
+
+The tracker remembers what your agent has seen on the map:
+when each tile was seen for the last time, the entities on it,
+the last known positions of the enemy tanks and the items.
+It is updated with every game state and only the visible tiles
+are processed, so the update does not rescan the whole map.
+
+Examples
+--------
+
+::
+
+    from hackathon_bot.belief import BeliefTracker
+
+    class MyBot(HackathonBot):
+
+        def on_lobby_data_received(self, lobby_data: LobbyData) -> None:
+            dimension = lobby_data.server_settings.grid_dimension
+            self.beliefs = BeliefTracker(dimension, item_expiry=100)
+
+        def next_move(self, game_state: GameState) -> ResponseAction:
+            self.beliefs.update(game_state)
+            x, y = game_state.index.my_position
+            laser = self.beliefs.nearest_item(x, y, ItemType.LASER)
+            ...
+
+Classes
+-------
+EnemyMemory
+    Represents the last known state of an enemy tank.
+ItemMemory
+    Represents the last known item on a tile.
+BeliefTracker
+    Represents the memory of the map hidden by the fog of war.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .enums import ItemType
+from .predicates import is_item
+
+if TYPE_CHECKING:
+    from .enums import Direction
+    from .protocols import GameState, TileEntity
+
+
+__all__ = (
+    "EnemyMemory",
+    "ItemMemory",
+    "BeliefTracker",
+)
+
+
+@dataclass(slots=True, frozen=True)
+class EnemyMemory:
+    """Represents the last known state of an enemy tank.
+
+    Attributes
+    ----------
+    owner_id: :class:`str`
+        The identifier of the owner of the tank.
+    position: tuple[:class:`int`, :class:`int`]
+        The last known `(x, y)` position of the tank.
+    direction: :class:`Direction`
+        The last known direction of the tank.
+    turret_direction: :class:`Direction`
+        The last known direction of the turret.
+    tick: :class:`int`
+        The tick in which the tank was seen for the last time.
+    """
+
+    owner_id: str
+    position: tuple[int, int]
+    direction: Direction
+    turret_direction: Direction
+    tick: int
+
+
+@dataclass(slots=True, frozen=True)
+class ItemMemory:
+    """Represents the last known item on a tile.
+
+    Attributes
+    ----------
+    position: tuple[:class:`int`, :class:`int`]
+        The `(x, y)` position of the item.
+    type: :class:`ItemType`
+        The type of the item.
+    tick: :class:`int`
+        The tick in which the item was seen for the last time.
+    """
+
+    position: tuple[int, int]
+    type: ItemType
+    tick: int
+
+
+class BeliefTracker:
+    """Represents the memory of the map hidden by the fog of war.
+
+    Parameters
+    ----------
+    dimension: :class:`int`
+        The dimension of the map.
+    item_expiry: :class:`int` | `None`
+        The number of ticks after which an item that has not been
+        seen is forgotten. If `None`, the items are never forgotten.
+    enemy_expiry: :class:`int` | `None`
+        The number of ticks after which an enemy tank that has not been
+        seen is forgotten. If `None`, the enemies are never forgotten.
+
+    Attributes
+    ----------
+    tick: :class:`int` | `None`
+        The tick of the last update.
+    enemies: dict[:class:`str`, :class:`EnemyMemory`]
+        The remembered enemy tanks by their owner identifiers.
+    items: dict[tuple[:class:`int`, :class:`int`], :class:`ItemMemory`]
+        The remembered items by their positions.
+    """
+
+    __slots__ = (
+        "dimension",
+        "item_expiry",
+        "enemy_expiry",
+        "tick",
+        "enemies",
+        "items",
+        "_last_seen",
+        "_entities",
+    )
+
+    def __init__(
+        self,
+        dimension: int,
+        item_expiry: int | None = 100,
+        enemy_expiry: int | None = 20,
+    ) -> None:
+        self.dimension = dimension
+        self.item_expiry = item_expiry
+        self.enemy_expiry = enemy_expiry
+        self.tick: int | None = None
+        self.enemies: dict[str, EnemyMemory] = {}
+        self.items: dict[tuple[int, int], ItemMemory] = {}
+        self._last_seen = [-1] * (dimension * dimension)
+        self._entities: dict[tuple[int, int], tuple[TileEntity, ...]] = {}
+
+    def update(self, game_state: GameState) -> None:
+        """Updates the memory with the tiles visible in the game state.
+
+        Only the visible tiles are processed, the remembered
+        enemies and items are then checked for expiry.
+        An enemy remembered on a tile that is visible
+        without it is forgotten at once.
+        """
+
+        tick = game_state.tick
+        tiles = game_state.map.tiles
+        last_seen = self._last_seen
+        remembered = self._entities
+        items = self.items
+        dimension = self.dimension
+
+        for y, row in enumerate(game_state.map.visibility):
+            offset = y * dimension
+            x = row.find("1")
+            while x != -1:
+                last_seen[offset + x] = tick
+                position = (x, y)
+                entities = tiles[y][x].entities
+
+                if entities:
+                    remembered[position] = entities
+                    item = next((e for e in entities if is_item(e)), None)
+                else:
+                    remembered.pop(position, None)
+                    item = None
+
+                if item is not None:
+                    item_type = item.type
+                    if item_type == ItemType.UNKNOWN and position in items:
+                        # The type is hidden by a tank or a mine on the tile.
+                        item_type = items[position].type
+                    items[position] = ItemMemory(position, item_type, tick)
+                else:
+                    items.pop(position, None)
+
+                x = row.find("1", x + 1)
+
+        index = game_state.index
+        enemy_tanks = index.enemy_tanks
+        enemies = self.enemies
+        for owner_id, enemy in list(enemies.items()):
+            x, y = enemy.position
+            if owner_id not in enemy_tanks and last_seen[y * dimension + x] == tick:
+                # The tank has left its last known tile.
+                del enemies[owner_id]
+
+        for owner_id, tank in enemy_tanks.items():
+            enemies[owner_id] = EnemyMemory(
+                owner_id,
+                index.enemy_positions[owner_id],
+                tank.direction,
+                tank.turret.direction,
+                tick,
+            )
+
+        for player in game_state.players:
+            if player.is_dead:
+                self.enemies.pop(player.id, None)
+
+        self.tick = tick
+        self._forget(tick)
+
+    def _forget(self, tick: int) -> None:
+        if self.item_expiry is not None:
+            expired = [
+                position
+                for position, item in self.items.items()
+                if tick - item.tick > self.item_expiry
+            ]
+            for position in expired:
+                del self.items[position]
+
+        if self.enemy_expiry is not None:
+            expired = [
+                owner_id
+                for owner_id, enemy in self.enemies.items()
+                if tick - enemy.tick > self.enemy_expiry
+            ]
+            for owner_id in expired:
+                del self.enemies[owner_id]
+
+    def last_seen(self, x: int, y: int) -> int | None:
+        """Returns the tick in which the tile was seen for the last time.
+
+        Returns `None` if the tile has never been seen.
+        """
+
+        tick = self._last_seen[y * self.dimension + x]
+        return None if tick == -1 else tick
+
+    def age(self, x: int, y: int) -> int | None:
+        """Returns the number of ticks since the tile was seen.
+
+        Returns `None` if the tile has never been seen.
+        """
+
+        tick = self.last_seen(x, y)
+        return None if tick is None else self.tick - tick
+
+    def known_entities(self, x: int, y: int) -> tuple[TileEntity, ...]:
+        """Returns the entities seen on the tile for the last time."""
+        return self._entities.get((x, y), ())
+
+    def nearest_item(
+        self,
+        x: int,
+        y: int,
+        item_type: ItemType | None = None,
+    ) -> ItemMemory | None:
+        """Returns the remembered item nearest to the position.
+
+        The distance is the Manhattan distance.
+
+        Parameters
+        ----------
+        x: :class:`int`
+            The x-coordinate of the position.
+        y: :class:`int`
+            The y-coordinate of the position.
+        item_type: :class:`ItemType` | `None`
+            The type of the item. If `None`, items of any type are considered.
+
+        Returns
+        -------
+        ItemMemory | None
+            The nearest item or `None` if no such item is remembered.
+        """
+
+        best = None
+        best_distance = None
+        for item in self.items.values():
+            if item_type is not None and item.type != item_type:
+                continue
+            distance = abs(item.position[0] - x) + abs(item.position[1] - y)
+            if best_distance is None or distance < best_distance:
+                best = item
+                best_distance = distance
+        return best
@@ -0,0 +1,318 @@
+"""This module contains the bitboard representation of the map.
+
+A bitboard packs one layer of the map (e.g. the walls) into a single
+Python integer, where the bit `y * width + x` is set if the tile at
+`(x, y)` belongs to the layer. Whole-map operations like shifting
+a layer in a direction, growing it by one tile or intersecting it
+with another layer become a few integer operations instead of
+nested loops over all tiles.
+
+Examples
+--------
+
+::
+
+    from hackathon_bot.bitboard import MapBitboards
+
+    layers = MapBitboards.from_map(game_state.map)
+    geometry = layers.geometry
+    x, y = game_state.index.my_position
+
+    # The tiles in the line of fire of a tank turret facing right.
+    fire = geometry.ray(geometry.bit(x, y), Direction.RIGHT, layers.walls)
+
+    # The tiles reachable from the tank without passing through walls.
+    reachable = geometry.flood_fill(geometry.bit(x, y), ~layers.walls)
+
+    if fire & layers.occupied:
+        # There is a tank in the line of fire.
+
+Classes
+-------
+BitboardGeometry
+    Represents the geometry of the bitboards of a map.
+MapBitboards
+    Represents the layers of a map as bitboards.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, Iterator, Sequence
+
+from .enums import Direction
+
+if TYPE_CHECKING:
+    from .models import MapModel
+
+
+__all__ = (
+    "BitboardGeometry",
+    "MapBitboards",
+)
+
+
+@dataclass(slots=True, frozen=True)
+class BitboardGeometry:
+    """Represents the geometry of the bitboards of a map.
+
+    The geometry holds the masks used to keep the shifted bitboards
+    inside the map and provides the operations on the bitboards.
+    Bits outside of the map are never set in the results.
+
+    Attributes
+    ----------
+    width: :class:`int`
+        The width of the map.
+    height: :class:`int`
+        The height of the map.
+    full: :class:`int`
+        The bitboard with all tiles of the map set.
+    not_first_column: :class:`int`
+        The bitboard with all tiles set except the column `x = 0`.
+    not_last_column: :class:`int`
+        The bitboard with all tiles set except the column `x = width - 1`.
+    """
+
+    width: int
+    height: int
+    full: int
+    not_first_column: int
+    not_last_column: int
+
+    @classmethod
+    def create(cls, width: int, height: int | None = None) -> BitboardGeometry:
+        """Creates the geometry of a map.
+
+        If `height` is `None`, the map is a square.
+        """
+
+        if height is None:
+            height = width
+
+        first_column = 0
+        for y in range(height):
+            first_column |= 1 << (y * width)
+        last_column = first_column << (width - 1)
+        full = (1 << (width * height)) - 1
+
+        return cls(
+            width,
+            height,
+            full,
+            full & ~first_column,
+            full & ~last_column,
+        )
+
+    def bit(self, x: int, y: int) -> int:
+        """Returns the bitboard with only the tile at `(x, y)` set."""
+        return 1 << (y * self.width + x)
+
+    def contains(self, board: int, x: int, y: int) -> bool:
+        """Whether the tile at `(x, y)` is set in the bitboard."""
+        return bool(board >> (y * self.width + x) & 1)
+
+    def from_positions(self, positions: Iterable[tuple[int, int]]) -> int:
+        """Creates a bitboard from the `(x, y)` positions."""
+
+        board = 0
+        width = self.width
+        for x, y in positions:
+            board |= 1 << (y * width + x)
+        return board
+
+    def from_grid(self, grid: Sequence[Sequence[bool]]) -> int:
+        """Creates a bitboard from a 2D grid indexed as `grid[y][x]`."""
+
+        board = 0
+        width = self.width
+        for y, row in enumerate(grid):
+            offset = y * width
+            for x, value in enumerate(row):
+                if value:
+                    board |= 1 << (offset + x)
+        return board
+
+    def from_rows(self, rows: Sequence[str], char: str = "1") -> int:
+        """Creates a bitboard from rows of characters indexed as `rows[y][x]`.
+
+        The tiles with the `char` character are set,
+        e.g. the visible tiles of the map visibility.
+        """
+
+        board = 0
+        width = self.width
+        for y, row in enumerate(rows):
+            bits = "".join("1" if c == char else "0" for c in reversed(row))
+            board |= int(bits, 2) << (y * width)
+        return board
+
+    def to_positions(self, board: int) -> Iterator[tuple[int, int]]:
+        """Yields the `(x, y)` positions of the tiles set in the bitboard."""
+
+        width = self.width
+        while board:
+            low = board & -board
+            index = low.bit_length() - 1
+            yield index % width, index // width
+            board ^= low
+
+    def to_grid(self, board: int) -> list[list[bool]]:
+        """Returns the bitboard as a 2D grid indexed as `grid[y][x]`."""
+
+        width = self.width
+        return [
+            [bool(board >> (y * width + x) & 1) for x in range(width)]
+            for y in range(self.height)
+        ]
+
+    def shift(self, board: int, direction: Direction) -> int:
+        """Moves all tiles of the bitboard one tile in the direction.
+
+        The tiles moved outside of the map are dropped.
+        """
+
+        if direction == Direction.UP:
+            return board >> self.width
+        if direction == Direction.DOWN:
+            return (board << self.width) & self.full
+        if direction == Direction.LEFT:
+            return (board & self.not_first_column) >> 1
+        if direction == Direction.RIGHT:
+            return (board & self.not_last_column) << 1
+
+        raise ValueError(f"Unknown direction: {direction}")
+
+    def dilate(self, board: int) -> int:
+        """Grows the bitboard by one tile in the four directions."""
+
+        return (
+            board
+            | board >> self.width
+            | (board << self.width) & self.full
+            | (board & self.not_first_column) >> 1
+            | (board & self.not_last_column) << 1
+        )
+
+    def ray(
+        self,
+        origins: int,
+        direction: Direction,
+        blockers: int,
+        include_blockers: bool = False,
+    ) -> int:
+        """Returns the tiles reached by rays cast from the origins.
+
+        Each ray starts at the tile next to its origin and stops before
+        the first blocker, or at the first blocker if `include_blockers`
+        is `True`. The origins themselves are not included.
+
+        Parameters
+        ----------
+        origins: :class:`int`
+            The bitboard of the ray origins.
+        direction: :class:`Direction`
+            The direction of the rays.
+        blockers: :class:`int`
+            The bitboard of the tiles stopping the rays, e.g. the walls.
+        include_blockers: :class:`bool`
+            Whether to include the first blocker of each ray.
+        """
+
+        empty = self.full & ~blockers
+        ray = 0
+        front = self.shift(origins, direction)
+        hits = front & blockers
+        front &= empty
+        while front:
+            ray |= front
+            front = self.shift(front, direction)
+            hits |= front & blockers
+            front &= empty & ~ray
+
+        return ray | hits if include_blockers else ray
+
+    def flood_fill(self, seeds: int, passable: int) -> int:
+        """Returns the tiles connected to the seeds through passable tiles.
+
+        The seeds are included only if they are passable.
+        """
+
+        passable &= self.full
+        filled = seeds & passable
+        while True:
+            grown = self.dilate(filled) & passable
+            if grown == filled:
+                return filled
+            filled = grown
+
+    def distances(self, seeds: int, passable: int) -> list[int]:
+        """Returns the breadth-first layers of the flood fill from the seeds.
+
+        The `n`-th bitboard contains the tiles at the distance
+        of exactly `n` moves from the nearest seed.
+        """
+
+        passable &= self.full
+        layer = seeds & passable
+        seen = layer
+        layers = []
+        while layer:
+            layers.append(layer)
+            layer = self.dilate(layer) & passable & ~seen
+            seen |= layer
+        return layers
+
+
+@dataclass(slots=True, frozen=True)
+class MapBitboards:
+    """Represents the layers of a map as bitboards.
+
+    Attributes
+    ----------
+    geometry: :class:`BitboardGeometry`
+        The geometry of the bitboards.
+    walls: :class:`int`
+        The tiles with a wall.
+    visible: :class:`int`
+        The tiles visible by your agent.
+    danger: :class:`int`
+        The visible tiles with a bullet, a laser or a mine.
+    occupied: :class:`int`
+        The visible tiles with a tank.
+    """
+
+    geometry: BitboardGeometry
+    walls: int
+    visible: int
+    danger: int
+    occupied: int
+
+    @classmethod
+    def from_map(
+        cls, map_: MapModel, geometry: BitboardGeometry | None = None
+    ) -> MapBitboards:
+        """Creates the bitboards from a map.
+
+        The layers are created from the entity index of the map,
+        so the tiles are not scanned again.
+        The geometry can be passed to reuse it between the ticks.
+        """
+
+        if geometry is None:
+            geometry = BitboardGeometry.create(len(map_.tiles[0]), len(map_.tiles))
+
+        index = map_.index
+        occupied = geometry.from_positions(index.enemy_positions.values())
+        if index.my_position is not None:
+            occupied |= geometry.bit(*index.my_position)
+
+        return cls(
+            geometry,
+            geometry.from_positions(index.walls),
+            geometry.from_rows(map_.visibility),
+            geometry.from_positions(index.bullets)
+            | geometry.from_positions(index.lasers)
+            | geometry.from_positions(index.mines),
+            occupied,
+        )
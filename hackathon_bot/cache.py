@@ -0,0 +1,357 @@
+"""This module contains the on-disk cache of the map precomputations.
+
+The map of a game is generated from the seed of the server settings,
+so the same seed and grid dimension give the same walls in every match.
+The tables computed from the walls (distance fields, visibility
+or topology tables) can be stored on disk once and loaded in the
+next matches instead of being computed again at every start.
+
+The tables are keyed by a hash of the seed, the grid dimension and the
+wall grid, so a changed map generator never returns stale tables.
+They are stored as flat arrays of numbers and loaded with memory
+mapping, so loading a table reads only the pages that are used.
+The total size of the cache is bounded, the least recently
+used tables are removed first.
+
+Examples
+--------
+
+::
+
+    from hackathon_bot.cache import PrecomputationCache, map_key
+
+    class MyBot(HackathonBot):
+
+        def on_lobby_data_received(self, lobby_data: LobbyData) -> None:
+            self.seed = lobby_data.server_settings.seed
+            self.cache = PrecomputationCache()
+
+        def next_move(self, game_state: GameState) -> ResponseAction:
+            if self.distances is None:
+                walls = ...  # The wall grid, indexed as walls[y][x].
+                key = map_key(self.seed, len(walls), walls)
+                self.distances = self.cache.get_or_compute(
+                    key, "distances", lambda: compute_distances(walls)
+                )
+
+Classes
+-------
+PrecomputationCache
+    Represents a directory of precomputed map tables.
+
+Functions
+---------
+map_key
+    Returns the cache key of a map.
+table_typecode
+    Returns the array typecode of a table.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from typing import Callable, Sequence
+
+from .memo import CacheStats
+
+__all__ = (
+    "PrecomputationCache",
+    "map_key",
+    "table_typecode",
+)
+
+# The header: the magic, the typecode and the item size of the table,
+# and the number of items. It is 16 bytes long to align the items.
+_HEADER = struct.Struct("<4scB2xQ")
+_MAGIC = b"HBT1"
+_SUFFIX = ".table"
+
+_Table = array | bytes | bytearray | memoryview
+
+# The typecodes of each kind of numbers, to find one of the same size.
+_KINDS = ("bhilq", "BHILQ", "fd")
+_NATIVE_ORDER = "<" if sys.byteorder == "little" else ">"
+
+
+def table_typecode(table: _Table) -> str:
+    """Returns the array typecode of a table.
+
+    Parameters
+    ----------
+    table: :class:`array.array` | :class:`bytes` | :class:`memoryview`
+        The flat table. A memory view may have a struct format,
+        e.g. of a numpy or ctypes array, which is converted
+        to the typecode of the numbers of the same kind and size.
+        The bytes are unsigned bytes.
+
+    Returns
+    -------
+    :class:`str`
+        The typecode, e.g. `"i"`.
+
+    Raises
+    ------
+    ValueError
+        If the memory view is not of numbers in the native byte order.
+    """
+
+    if isinstance(table, array):
+        return table.typecode
+    if not isinstance(table, memoryview):
+        return "B"
+
+    code = table.format
+    if code[:1] in "@=<>!":
+        order, code = code[0], code[1:]
+        if order in "<>!" and order.replace("!", ">") != _NATIVE_ORDER:
+            raise ValueError(f"the byte order of {table.format!r} is not native")
+    if code == "?":
+        code = "B"
+
+    for kind in _KINDS:
+        if code in kind:
+            for typecode in kind:
+                if array(typecode).itemsize == table.itemsize:
+                    return typecode
+    raise ValueError(f"unsupported table format {table.format!r}")
+
+
+def map_key(seed: int, dimension: int, walls: Sequence[Sequence[bool]]) -> str:
+    """Returns the cache key of a map.
+
+    Parameters
+    ----------
+    seed: :class:`int`
+        The seed of the server settings.
+    dimension: :class:`int`
+        The grid dimension of the server settings.
+    walls: Sequence[Sequence[:class:`bool`]]
+        The wall grid indexed as `walls[y][x]`.
+
+    Returns
+    -------
+    :class:`str`
+        The hexadecimal SHA-1 hash of the seed, the dimension and the walls.
+    """
+
+    digest = hashlib.sha1()
+    digest.update(struct.pack("<qq", seed, dimension))
+    for row in walls:
+        digest.update(bytes(bool(wall) for wall in row))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+class PrecomputationCache:
+    """Represents a directory of precomputed map tables.
+
+    Parameters
+    ----------
+    directory: :class:`str` | `None`
+        The directory of the tables, created if it does not exist.
+        If `None`, `~/.cache/hackathon_bot` is used.
+    max_bytes: :class:`int`
+        The maximum total size of the tables.
+
+    Attributes
+    ----------
+    stats: :class:`CacheStats`
+        The statistics of the lookups.
+    """
+
+    __slots__ = ("directory", "max_bytes", "stats")
+
+    def __init__(self, directory: str | None = None, max_bytes: int = 64 << 20) -> None:
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be positive")
+
+        if directory is None:
+            directory = os.path.join(os.path.expanduser("~"), ".cache", "hackathon_bot")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+
+    def _path(self, key: str, name: str) -> str:
+        return os.path.join(self.directory, f"{key}.{name}{_SUFFIX}")
+
+    def load(self, key: str, name: str) -> memoryview | None:
+        """Returns the stored table, `None` if it is not stored.
+
+        The table is a read-only memory view of the mapped file,
+        cast to the typecode of the stored array.
+        A damaged table is removed and treated as missing.
+        """
+
+        path = self._path(key, name)
+        try:
+            with open(path, "rb") as file:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # ValueError is raised for empty files.
+            self.stats.misses += 1
+            return None
+
+        view = memoryview(mapped)
+        try:
+            magic, typecode, itemsize, count = _HEADER.unpack_from(view)
+            typecode = typecode.decode()
+            if (
+                magic != _MAGIC
+                or array(typecode).itemsize != itemsize
+                or len(view) != _HEADER.size + count * itemsize
+            ):
+                raise ValueError("damaged table")
+            table = view[_HEADER.size :].cast(typecode)
+        except (struct.error, ValueError, UnicodeDecodeError):
+            view.release()
+            mapped.close()
+            self._remove(path)
+            self.stats.misses += 1
+            return None
+
+        try:
+            # The modification time orders the tables for the eviction.
+            os.utime(path)
+        except OSError:
+            pass
+        self.stats.hits += 1
+        return table
+
+    def store(self, key: str, name: str, table: _Table) -> None:
+        """Stores the table and evicts the least recently used tables
+        if the cache is too large.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The key of the map, see :func:`map_key`.
+        name: :class:`str`
+            The name of the table, e.g. `"distances"`.
+        table: :class:`array.array` | :class:`bytes` | :class:`memoryview`
+            The flat table. The typecode of an array or a memory view
+            (e.g. of a numpy array) is kept, the bytes are stored
+            as unsigned bytes.
+
+        Raises
+        ------
+        ValueError
+            If the memory view is not of numbers in the native byte order.
+        """
+
+        typecode = table_typecode(table)
+        itemsize = array(typecode).itemsize
+        data = memoryview(table).cast("B")
+        header = _HEADER.pack(
+            _MAGIC, typecode.encode(), itemsize, len(data) // itemsize
+        )
+
+        # The table is written to a temporary file and renamed,
+        # so other processes never load a partly written table.
+        # The temporary file has its own unique name, as other
+        # threads or processes may store the same table at once.
+        path = self._path(key, name)
+        descriptor, temporary = tempfile.mkstemp(
+            ".tmp", f"{key}.{name}.", self.directory
+        )
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(header)
+                file.write(data)
+            os.replace(temporary, path)
+        except BaseException:
+            self._remove(temporary)
+            raise
+        self.evict(keep=path)
+
+    def get_or_compute(
+        self,
+        key: str,
+        name: str,
+        compute: Callable[[], _Table],
+    ) -> memoryview:
+        """Returns the stored table or computes and stores it.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The key of the map, see :func:`map_key`.
+        name: :class:`str`
+            The name of the table, e.g. `"distances"`.
+        compute: Callable[[], :class:`array.array` | :class:`bytes`]
+            The function computing the table.
+
+        Returns
+        -------
+        :class:`memoryview`
+            The read-only table, cast to its typecode.
+        """
+
+        table = self.load(key, name)
+        if table is not None:
+            return table
+
+        computed = compute()
+        try:
+            self.store(key, name, computed)
+        except OSError:
+            # A full or read-only disk only disables the cache.
+            pass
+        return memoryview(computed).toreadonly()
+
+    def _remove(self, path: str) -> bool:
+        try:
+            os.remove(path)
+        except OSError:
+            return False
+        return True
+
+    def size(self) -> int:
+        """Returns the total size of the stored tables in bytes."""
+
+        total = 0
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(_SUFFIX):
+                total += entry.stat().st_size
+        return total
+
+    def evict(self, keep: str | None = None) -> None:
+        """Removes the least recently used tables
+        until the cache fits in its size limit.
+
+        Parameters
+        ----------
+        keep: :class:`str` | `None`
+            The path of a table that is never removed,
+            e.g. the one just stored.
+        """
+
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(_SUFFIX):
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, entry.path, stat.st_size))
+                total += stat.st_size
+
+        entries.sort()
+        for _, path, size in entries:
+            if total <= self.max_bytes:
+                break
+            if path != keep and self._remove(path):
+                total -= size
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Removes all stored tables and resets the statistics."""
+
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(_SUFFIX):
+                self._remove(entry.path)
+        self.stats = CacheStats()
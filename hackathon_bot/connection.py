@@ -0,0 +1,177 @@
+"""This module contains the connection health helpers.
+
+The helpers are used by the hackathon bot to reconnect to the server
+after the connection has been lost, to track the round-trip time
+of the websocket connection and the latency of the outbound packets.
+
+Classes
+-------
+ExponentialBackoff
+    Represents a jittered exponential backoff policy.
+RoundTripStats
+    Represents the round-trip time statistics of the connection.
+SendStats
+    Represents the statistics of the outbound packets.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class ExponentialBackoff:
+    """Represents a jittered exponential backoff policy.
+
+    The n-th delay is drawn uniformly from the upper half of
+    `min(max_delay, base_delay * factor ** n)`, so that several bots
+    disconnected at the same time do not reconnect in lockstep.
+
+    Attributes
+    ----------
+    base_delay: :class:`float`
+        The delay before the first retry in seconds.
+    max_delay: :class:`float`
+        The upper bound of a single delay in seconds.
+    factor: :class:`float`
+        The growth factor of the delay.
+    max_attempts: :class:`int` | `None`
+        The number of retries after which the policy is exhausted.
+        If `None`, the policy is never exhausted.
+    attempt: :class:`int`
+        The number of retries made since the last reset.
+    """
+
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+    factor: float = 2.0
+    max_attempts: int | None = 10
+    attempt: int = 0
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether no more retries are allowed."""
+        return self.max_attempts is not None and self.attempt >= self.max_attempts
+
+    def next_delay(self) -> float | None:
+        """Returns the delay before the next retry.
+
+        Returns
+        -------
+        float | None
+            The delay in seconds or `None` if the policy is exhausted.
+        """
+
+        if self.exhausted:
+            return None
+
+        delay = min(self.max_delay, self.base_delay * self.factor**self.attempt)
+        self.attempt += 1
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def reset(self) -> None:
+        """Resets the policy after a successful connection."""
+        self.attempt = 0
+
+
+@dataclass(slots=True)
+class RoundTripStats:  # pylint: disable=too-many-instance-attributes
+    """Represents the round-trip time statistics of the connection.
+
+    The smoothed round-trip time and its variation are computed
+    the same way as the TCP retransmission timer (RFC 6298).
+
+    Attributes
+    ----------
+    last: :class:`float` | `None`
+        The last measured round-trip time in seconds.
+    smoothed: :class:`float` | `None`
+        The smoothed round-trip time in seconds.
+    variation: :class:`float` | `None`
+        The round-trip time variation in seconds.
+    minimum: :class:`float` | `None`
+        The lowest measured round-trip time in seconds.
+    maximum: :class:`float` | `None`
+        The highest measured round-trip time in seconds.
+    samples: :class:`int`
+        The number of measurements.
+    timeouts: :class:`int`
+        The number of pings that were not answered in time.
+    reconnects: :class:`int`
+        The number of successful reconnections.
+    """
+
+    last: float | None = None
+    smoothed: float | None = None
+    variation: float | None = None
+    minimum: float | None = None
+    maximum: float | None = None
+    samples: int = 0
+    timeouts: int = 0
+    reconnects: int = 0
+    _alpha: float = field(default=1 / 8, repr=False)
+    _beta: float = field(default=1 / 4, repr=False)
+
+    def add(self, rtt: float) -> None:
+        """Adds a round-trip time measurement in seconds."""
+
+        if self.smoothed is None:
+            self.smoothed = rtt
+            self.variation = rtt / 2
+            self.minimum = rtt
+            self.maximum = rtt
+        else:
+            self.variation += self._beta * (abs(self.smoothed - rtt) - self.variation)
+            self.smoothed += self._alpha * (rtt - self.smoothed)
+            self.minimum = min(self.minimum, rtt)
+            self.maximum = max(self.maximum, rtt)
+
+        self.last = rtt
+        self.samples += 1
+
+
+@dataclass(slots=True)
+class SendStats:
+    """Represents the statistics of the outbound packets.
+
+    The latency of a packet is the time from queuing it
+    to writing it to the websocket.
+
+    Attributes
+    ----------
+    last: :class:`float` | `None`
+        The last latency in seconds.
+    total: :class:`float`
+        The sum of the latencies in seconds.
+    maximum: :class:`float` | `None`
+        The highest latency in seconds.
+    sent: :class:`int`
+        The number of packets written to the websocket.
+    dropped: :class:`int`
+        The number of packets dropped, because their connection
+        or the event loop was closed.
+    max_pending: :class:`int`
+        The highest number of packets waiting in the queue.
+    """
+
+    last: float | None = None
+    total: float = 0.0
+    maximum: float | None = None
+    sent: int = 0
+    dropped: int = 0
+    max_pending: int = 0
+
+    @property
+    def mean(self) -> float | None:
+        """The mean latency in seconds."""
+        return self.total / self.sent if self.sent else None
+
+    def add(self, latency: float) -> None:
+        """Adds the latency of a sent packet in seconds."""
+
+        if self.maximum is None or latency > self.maximum:
+            self.maximum = latency
+        self.last = latency
+        self.total += latency
+        self.sent += 1
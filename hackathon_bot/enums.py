@@ -18,6 +18,10 @@ Ability
     Represents an ability.
 ZoneStatus
     Represents the status of a zone.
+EntityKind
+    Represents the kind of a tile entity.
+ActionCode
+    Represents a simulated action of a tank.
 PacketType
     Represents the type of a packet.
 WarningType
@@ -35,6 +39,8 @@ __all__ = (
     "ItemType",
     "Ability",
     "ZoneStatus",
+    "EntityKind",
+    "ActionCode",
     "PacketType",
     "WarningType",
 )
@@ -215,6 +221,79 @@ class ZoneStatus(str, Enum):
     BEING_RETAKEN = "BEING_RETAKEN"
 
 
+class EntityKind(IntEnum):
+    """Represents the kind of a tile entity.
+
+    Every tile entity model has a `kind` class attribute,
+    which is much cheaper to check than `isinstance` with a protocol.
+
+    Attributes
+    ----------
+    TANK: :class:`int`
+        Represents a tank of another player.
+    AGENT_TANK: :class:`int`
+        Represents the tank of your agent.
+    WALL: :class:`int`
+        Represents a wall.
+    BULLET: :class:`int`
+        Represents a basic bullet.
+    DOUBLE_BULLET: :class:`int`
+        Represents a double bullet.
+    LASER: :class:`int`
+        Represents a laser.
+    MINE: :class:`int`
+        Represents a mine.
+    ITEM: :class:`int`
+        Represents an item.
+    """
+
+    TANK = 1
+    AGENT_TANK = 2
+    WALL = 3
+    BULLET = 4
+    DOUBLE_BULLET = 5
+    LASER = 6
+    MINE = 7
+    ITEM = 8
+
+
+class ActionCode(IntEnum):
+    """Represents a simulated action of a tank.
+
+    The codes are used by the forward model of the simulation
+    module instead of the response actions, as they are cheaper
+    to store and compare during a search.
+
+    Attributes
+    ----------
+    PASS: :class:`int`
+        Represents passing the tick.
+    FORWARD: :class:`int`
+        Represents moving forward.
+    BACKWARD: :class:`int`
+        Represents moving backward.
+    TANK_LEFT: :class:`int`
+        Represents rotating the tank left.
+    TANK_RIGHT: :class:`int`
+        Represents rotating the tank right.
+    TURRET_LEFT: :class:`int`
+        Represents rotating the turret left.
+    TURRET_RIGHT: :class:`int`
+        Represents rotating the turret right.
+    FIRE_BULLET: :class:`int`
+        Represents firing a bullet.
+    """
+
+    PASS = 0
+    FORWARD = 1
+    BACKWARD = 2
+    TANK_LEFT = 3
+    TANK_RIGHT = 4
+    TURRET_LEFT = 5
+    TURRET_RIGHT = 6
+    FIRE_BULLET = 7
+
+
 class PacketType(IntEnum):
     """Represents the type of a packet.
 
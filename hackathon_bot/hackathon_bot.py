@@ -38,9 +38,12 @@ Then, create an instance of the bot and run it using the `run` method.
 
 import asyncio
 import json
+import re
 import threading
+import time
 import traceback
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import asdict
 from typing import final
 
@@ -50,6 +53,7 @@ from websockets import WebSocketClientProtocol as WebSocket
 
 from . import argparser
 from .actions import Pass, ResponseAction
+from .connection import ExponentialBackoff, RoundTripStats, SendStats
 from .enums import PacketType, WarningType
 from .models import GameStateModel, GameResultModel, LobbyDataModel
 from .payloads import (
@@ -60,9 +64,34 @@ from .payloads import (
     Payload,
 )
 from .protocols import GameState, GameResult, LobbyData
+from .warmup import WarmUp
 
 __all__ = ("HackathonBot",)
 
+# The server sends the packet type first, so it can be read
+# without decoding the whole packet.
+_PACKET_TYPE_PATTERN = re.compile(rb'\s*\{\s*"type"\s*:\s*(\d+)\s*[,}]')
+
+
+def _peek_packet_type(message: websockets.Data) -> int | None:
+    # Returns the packet type, None if it is not the first key.
+    if isinstance(message, str):
+        message = message[:64].encode()
+    match = _PACKET_TYPE_PATTERN.match(message, 0, 64)
+    return int(match.group(1)) if match else None
+
+
+# The replies to the resume requests, after which a reconnect has succeeded.
+_RESUMED_PACKETS = frozenset(
+    (
+        PacketType.LOBBY_DATA,
+        PacketType.GAME_NOT_STARTED,
+        PacketType.GAME_STARTING,
+        PacketType.GAME_STARTED,
+        PacketType.GAME_IN_PROGRESS,
+    )
+)
+
 
 class HackathonBot(ABC):
     """Represents the hackathon bot.
@@ -118,11 +147,63 @@ class HackathonBot(ABC):
                 print("The game is starting.")
                 print("We are ready to go!")
                 # See method documentation for more information
+
+    If the connection is lost with an error, the bot reconnects
+    with a jittered exponential backoff and resumes the game.
+    The bot instance is kept, so everything cached in its attributes
+    (for example, wall maps or visibility tables) survives the reconnect.
+    The reconnect policy and the connection health checks
+    can be tuned with class attributes:
+
+    ::
+
+        class MyBot(HackathonBot):
+
+            reconnect_attempts = 20  # None to retry forever
+            reconnect_max_delay = 4.0
+            health_check_interval = 2.0  # None to disable
+
+    The health checks replace the keepalive pings of the websockets
+    library, which are used only when the health checks are disabled.
+
+    The outbound packets are written by a single task in the order
+    they were queued, and their latency from queuing to the websocket
+    is tracked in :attr:`send_stats`.
+
+    If the bot reads only a few tiles per tick, the game state can be
+    created lazily. The tile entities are then created (and their keys
+    converted to snake case) on the first access to `tile.entities`,
+    so untouched tiles are never parsed. The JSON decoding of the whole
+    message and a lazy tile per non-empty tile are still created, which
+    costs about a third of the eager decoding of a 24x24 map:
+
+    ::
+
+        class MyBot(HackathonBot):
+
+            lazy_game_state = True
+
+    The heavy precomputations can run in the background between
+    the lobby data and the first game state, see :meth:`on_warm_up`.
     """
 
+    lazy_game_state: bool = False
+    reconnect_attempts: int | None = 10
+    reconnect_base_delay: float = 0.5
+    reconnect_max_delay: float = 8.0
+    health_check_interval: float | None = 5.0
+    health_check_timeout: float = 5.0
+
     _lobby_data: LobbyDataModel = None
     _is_processing: bool = False
+    _generation: int = 0
     _loop: asyncio.AbstractEventLoop
+    _connection_stats: RoundTripStats = None
+    _send_stats: SendStats = None
+    _outbound: deque = None
+    _outbound_ready: asyncio.Event = None
+    _warm_up: WarmUp = None
+    _warm_up_key: tuple[int, int] | None = None
 
     def _get_server_url(self, args: argparser.Arguments) -> str:
         url = f"ws://{args.host}:{args.port}/?nickname={args.nickname}&playerType=hackathonBot"
@@ -249,6 +330,118 @@ class HackathonBot(ABC):
 
         print("The game is starting...")
 
+    def on_warm_up(self, lobby_data: LobbyData, warm_up: WarmUp) -> None:
+        """Called to start the background precomputations of the game.
+
+        This method can be overridden to submit the precomputations
+        depending only on the server settings (for example, on the seed
+        and the grid dimension) as soon as the lobby data is received.
+        They run in the background while the game is starting,
+        and :meth:`next_move` can check whether they are ready
+        or wait for them with a timeout.
+
+        The method is called once per seed and grid dimension,
+        the tasks of the previous settings are cancelled.
+        It runs on the event loop, so it should only submit the tasks.
+
+        By default, this method does nothing.
+
+        Parameters
+        ----------
+        lobby_data: :class:`LobbyData`
+            The lobby data received from the server.
+        warm_up: :class:`WarmUp`
+            The warm-up of the bot, also available as :attr:`warm_up`.
+
+        Examples
+        --------
+
+        ::
+
+            from hackathon_bot.memo import ZobristHasher
+            from hackathon_bot.warmup import WarmUp
+
+            class MyBot(HackathonBot):
+
+                def on_warm_up(self, lobby_data: LobbyData, warm_up: WarmUp) -> None:
+                    settings = lobby_data.server_settings
+                    warm_up.submit(
+                        "zobrist",
+                        ZobristHasher,
+                        settings.grid_dimension,
+                        settings.grid_dimension,
+                        seed=settings.seed,
+                    )
+
+                def next_move(self, game_state: GameState) -> ResponseAction:
+                    hasher = self.warm_up.result("zobrist", timeout=0.01, default=None)
+                    if hasher is None:
+                        # Not ready yet, play without it in this tick.
+        """
+
+    @property
+    def warm_up(self) -> WarmUp:
+        """The background tasks started in :meth:`on_warm_up`."""
+
+        if self._warm_up is None:
+            self._warm_up = WarmUp()
+        return self._warm_up
+
+    @final
+    def _start_warm_up(self, lobby_data: LobbyDataModel) -> None:
+        settings = lobby_data.server_settings
+        key = (settings.seed, settings.grid_dimension)
+        if key == self._warm_up_key:
+            return
+
+        self._warm_up_key = key
+        self.warm_up.cancel()
+        self.on_warm_up(lobby_data, self.warm_up)
+
+    def on_reconnected(self) -> None:
+        """Called when the connection has been restored after being lost.
+
+        This method can be overridden to perform any action after
+        reconnecting to the server. The game is resumed automatically
+        by requesting the game status and the lobby data again.
+
+        By default, this method prints a message that the bot has reconnected.
+        """
+
+        print("Reconnected to the server.")
+
+    @property
+    def connection_stats(self) -> RoundTripStats:
+        """The round-trip time statistics of the websocket connection.
+
+        The statistics are updated by the health checks
+        and are kept across reconnects.
+        """
+
+        if self._connection_stats is None:
+            self._connection_stats = RoundTripStats()
+        return self._connection_stats
+
+    @property
+    def send_stats(self) -> SendStats:
+        """The latency statistics of the outbound packets.
+
+        The statistics are kept across reconnects.
+        """
+
+        if self._send_stats is None:
+            self._send_stats = SendStats()
+        return self._send_stats
+
+    @staticmethod
+    def _serialize_packet(packet_type: PacketType, payload: Payload | None) -> str:
+        packet = {"type": packet_type.value}
+
+        if payload:
+            packet["payload"] = humps.camelize(asdict(payload))
+
+        return json.dumps(packet)
+
     @final
     async def _send_packet(
         self,
@@ -256,30 +449,83 @@ class HackathonBot(ABC):
         packet_type: PacketType,
         payload: Payload | None = None,
     ):
-        packet = {"type": packet_type.value}
+        await websocket.send(self._serialize_packet(packet_type, payload))
 
-        if payload:
-            packet["payload"] = humps.camelize(asdict(payload))
-
-        await websocket.send(json.dumps(packet))
+    @final
+    def _enqueue_packet(
+        self,
+        websocket: WebSocket,
+        packet_type: PacketType,
+        payload: Payload | None = None,
+    ) -> None:
+        # Can be called from any thread. The packet is serialized
+        # in the calling thread and handed over to the event loop,
+        # which keeps the order of the calls.
+        message = self._serialize_packet(packet_type, payload)
+        try:
+            self._loop.call_soon_threadsafe(
+                self._push_packet, websocket, message, time.perf_counter()
+            )
+        except RuntimeError:
+            # The event loop is closed, e.g. a worker finished
+            # after the bot stopped, so the packet is never sent.
+            self.send_stats.dropped += 1
 
     @final
-    def _handle_ping_packet(self, websocket: WebSocket) -> None:
-        asyncio.run_coroutine_threadsafe(
-            self._send_packet(websocket, PacketType.PONG),
-            self._loop,
-        )
+    def _push_packet(self, websocket: WebSocket, message: str, queued: float) -> None:
+        if self._outbound is None:
+            self._outbound = deque()
+        self._outbound.append((websocket, message, queued))
+
+        stats = self.send_stats
+        stats.max_pending = max(stats.max_pending, len(self._outbound))
+        if self._outbound_ready is not None:
+            self._outbound_ready.set()
 
     @final
-    def _handle_next_move(
-        self, websocket: WebSocket, game_state: GameStateModel
-    ) -> None:
-        if self._is_processing:
-            print("Skipping next game state due to ongoing processing!")
+    async def _write_packets(self, websocket: WebSocket) -> None:
+        # The only task writing to the websocket, so the packets
+        # are sent in the order they were queued. The packets queued
+        # since the last wake-up are sent one by one without waking
+        # up again in between.
+        if self._outbound is None:
+            self._outbound = deque()
+        outbound = self._outbound
+        ready = self._outbound_ready = asyncio.Event()
+        stats = self.send_stats
+
+        try:
+            while True:
+                while outbound:
+                    target, message, queued = outbound.popleft()
+                    if target is not websocket:
+                        # Queued for a connection that has been closed.
+                        stats.dropped += 1
+                        continue
+                    try:
+                        await websocket.send(message)
+                    except websockets.exceptions.ConnectionClosed:
+                        # The packet being sent is lost with the connection.
+                        stats.dropped += 1
+                        raise
+                    stats.add(time.perf_counter() - queued)
+                ready.clear()
+                await ready.wait()
+        except websockets.exceptions.ConnectionClosed:
             return
+        finally:
+            if self._outbound_ready is ready:
+                self._outbound_ready = None
 
-        self._is_processing = True
+    @final
+    def _handle_ping_packet(self, websocket: WebSocket) -> None:
+        self._enqueue_packet(websocket, PacketType.PONG)
 
+    @final
+    def _make_next_move(
+        self, websocket: WebSocket, game_state: GameStateModel, generation: int
+    ) -> None:
+        # The _is_processing flag is set by _start_game_state and reset here.
         try:
             response_action = self.next_move(game_state)
         except KeyboardInterrupt as e:
@@ -289,43 +535,93 @@ class HackathonBot(ABC):
            print(traceback.format_exc())
            return
         finally:
-            self._is_processing = False
+            self._finish_processing(generation)
 
         if response_action is None:
             response_action = Pass()
 
         payload = response_action.to_payload(game_state.id)
-        asyncio.run_coroutine_threadsafe(
-            self._send_packet(websocket, response_action.packet_type, payload),
-            self._loop,
-        )
+        self._enqueue_packet(websocket, response_action.packet_type, payload)
+
+    @final
+    def _start_game_state(self, websocket: WebSocket, message: websockets.Data) -> None:
+        # A game state arriving during the processing of the previous one
+        # is skipped before it is decoded.
+        if self._is_processing:
+            print("Skipping next game state due to ongoing processing!")
+            return
+
+        self._is_processing = True
+        threading.Thread(
+            target=self._handle_game_state,
+            args=(websocket, message, self._generation),
+        ).start()
+
+    @final
+    def _finish_processing(self, generation: int) -> None:
+        # A worker of a lost connection may finish while a worker of
+        # the new one is running, so it leaves the flag to that worker.
+        if generation == self._generation:
+            self._is_processing = False
+
+    @final
+    def _handle_game_state(
+        self, websocket: WebSocket, message: websockets.Data, generation: int
+    ) -> None:
+        # Runs in the worker thread, so the event loop is free to answer
+        # the control packets while the game state is decoded.
+        # The _is_processing flag is set by the event loop.
+        try:
+            data = json.loads(message)
+            lazy = self.lazy_game_state
+            if lazy:
+                # The keys of the tiles are converted only when
+                # the entities of a tile are created.
+                raw_map = data["payload"]["map"]
+                tiles = raw_map.pop("tiles")
+                data = humps.decamelize(data)
+                data["payload"]["map"]["tiles"] = tiles
+            else:
+                data = humps.decamelize(data)
+            payload = GameStatePayload.from_json(data["payload"], lazy)
+            player_id = self._lobby_data.player_id
+            game_state = GameStateModel.from_payload(payload, player_id, lazy)
+        except Exception as e:  # pylint: disable=broad-except
+            print(f"An error occurred during game state decoding: {e}")
+            print(traceback.format_exc())
+            self._finish_processing(generation)
+            return
+
+        self._make_next_move(websocket, game_state, generation)
 
     @final
     def _send_ready_to_receive_game_state(self, websocket: WebSocket) -> None:
-        asyncio.run_coroutine_threadsafe(
-            self._send_packet(websocket, PacketType.READY_TO_RECEIVE_GAME_STATE),
-            self._loop,
-        )
+        self._enqueue_packet(websocket, PacketType.READY_TO_RECEIVE_GAME_STATE)
 
     @final
     def send_lobby_data_request(self, websocket: WebSocket) -> None:
         """Sends a lobby data request to the server."""
-        asyncio.run_coroutine_threadsafe(
-            self._send_packet(websocket, PacketType.LOBBY_DATA_REQUEST),
-            self._loop,
-        )
+        self._enqueue_packet(websocket, PacketType.LOBBY_DATA_REQUEST)
 
     @final
     def _send_game_status_request(self, websocket: WebSocket) -> None:
-        asyncio.run_coroutine_threadsafe(
-            self._send_packet(websocket, PacketType.GAME_STATUS_REQUEST),
-            self._loop,
-        )
+        self._enqueue_packet(websocket, PacketType.GAME_STATUS_REQUEST)
 
     @final
     def _handle_messages(  # pylint: disable=too-many-return-statements, too-many-branches
         self, websocket: WebSocket, message: websockets.Data
     ) -> None:
+        # The frequent packets are handled before decoding the message.
+        packet_number = _peek_packet_type(message)
+
+        if packet_number == PacketType.PING:
+            self._handle_ping_packet(websocket)
+            return
+
+        if packet_number == PacketType.GAME_STATE:
+            self._start_game_state(websocket, message)
+            return
+
         data = humps.decamelize(json.loads(message))
 
         packet_number = data["type"]
@@ -345,12 +641,7 @@ class HackathonBot(ABC):
             return
 
         if packet_type == PacketType.GAME_STATE:
-            payload = GameStatePayload.from_json(data["payload"])
-            player_id = self._lobby_data.player_id
-            game_state = GameStateModel.from_payload(payload, player_id)
-            threading.Thread(
-                target=self._handle_next_move, args=(websocket, game_state)
-            ).start()
+            self._start_game_state(websocket, message)
             return
 
         if packet_type == PacketType.LOBBY_DATA:
@@ -358,6 +649,7 @@ class HackathonBot(ABC):
             lobby_data = LobbyDataModel.from_payload(payload)
             self._lobby_data = lobby_data
             self.on_lobby_data_received(lobby_data)
+            self._start_warm_up(lobby_data)
             return
 
         if packet_type & 0xF0 == PacketType.WARNING_GROUP:
@@ -398,29 +690,108 @@ class HackathonBot(ABC):
             self._send_ready_to_receive_game_state(websocket)
             return
 
+    @final
+    async def _monitor_connection(self, websocket: WebSocket) -> None:
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+
+            start = time.perf_counter()
+            try:
+                pong_waiter = await websocket.ping()
+                await asyncio.wait_for(pong_waiter, self.health_check_timeout)
+            except websockets.exceptions.ConnectionClosed:
+                # The receiving task handles the closed connection.
+                return
+            except asyncio.TimeoutError:
+                self.connection_stats.timeouts += 1
+                print("The server did not respond to the ping, reconnecting...")
+                await websocket.close(1011, "ping timeout")
+                return
+
+            self.connection_stats.add(time.perf_counter() - start)
+
+    @final
+    async def _receive_messages(
+        self, websocket: WebSocket, backoff: ExponentialBackoff
+    ) -> None:
+        resumed = False
+        while True:
+            try:
+                message = await websocket.recv()
+                # A connection accepted and then rejected (for example,
+                # for a taken nickname) still counts as a failed attempt.
+                if not resumed and _peek_packet_type(message) in _RESUMED_PACKETS:
+                    backoff.reset()
+                    resumed = True
+                self._handle_messages(websocket, message)
+            except websockets.exceptions.ConnectionClosed:
+                raise
+            except Exception as e:  # pylint: disable=broad-except
+                print(f"An error occurred: {e}")  # pragma: no cover
+                print(traceback.format_exc())  # pragma: no cover
+
     @final
     async def _start_loop(self, server_url: str) -> None:
         self._loop = asyncio.get_event_loop()
-        async with websockets.connect(server_url) as websocket:
-            while True:
-                try:
-                    message = await websocket.recv()
-                    self._handle_messages(websocket, message)
-                except websockets.exceptions.ConnectionClosedOK as e:
-                    print(
-                        "Connection closed by the server"
-                        f"{': ' + e.rcvd.reason if e.rcvd and e.rcvd.reason else '.'}",
-                    )
-                    break
-                except websockets.exceptions.ConnectionClosedError as e:
-                    print(
-                        "Connection closed with an "
-                        f"{'error: ' + e.rcvd.reason if e.rcvd and e.rcvd.reason else 'unknown error.'}",
-                    )
-                    break
-                except Exception as e:  # pylint: disable=broad-except
-                    print(f"An error occurred: {e}")  # pragma: no cover
-                    print(traceback.format_exc())  # pragma: no cover
+        backoff = ExponentialBackoff(
+            base_delay=self.reconnect_base_delay,
+            max_delay=self.reconnect_max_delay,
+            max_attempts=self.reconnect_attempts,
+        )
+        reconnecting = False
+        # The health checks replace the keepalive pings of the websockets
+        # library, so only one of them pings the server.
+        ping_interval = None if self.health_check_interval is not None else 20
+
+        while True:
+            try:
+                async with websockets.connect(
+                    server_url, ping_interval=ping_interval
+                ) as websocket:
+                    self._generation += 1
+                    if reconnecting:
+                        # A worker cut off by the lost connection answers
+                        # the old websocket, so it must not make the bot
+                        # skip the game states of the new one.
+                        self._is_processing = False
+                        self.connection_stats.reconnects += 1
+                        self.on_reconnected()
+
+                    writer = asyncio.create_task(self._write_packets(websocket))
+                    monitor = None
+                    if self.health_check_interval is not None:
+                        monitor = asyncio.create_task(
+                            self._monitor_connection(websocket)
+                        )
+
+                    try:
+                        await self._receive_messages(websocket, backoff)
+                    finally:
+                        writer.cancel()
+                        if monitor is not None:
+                            monitor.cancel()
+            except websockets.exceptions.ConnectionClosedOK as e:
+                print(
+                    "Connection closed by the server"
+                    f"{': ' + e.rcvd.reason if e.rcvd and e.rcvd.reason else '.'}",
+                )
+                return
+            except websockets.exceptions.ConnectionClosedError as e:
+                print(
+                    "Connection closed with an "
+                    f"{'error: ' + e.rcvd.reason if e.rcvd and e.rcvd.reason else 'unknown error.'}",
+                )
+            except (OSError, websockets.exceptions.InvalidHandshake) as e:
+                print(f"Could not connect to the server: {e}")
+
+            delay = backoff.next_delay()
+            if delay is None:
+                print("Giving up on reconnecting to the server.")
+                return
+
+            print(f"Reconnecting in {delay:.2f}s (attempt {backoff.attempt})...")
+            reconnecting = True
+            await asyncio.sleep(delay)
 
     @final
     def run(self) -> None:
@@ -0,0 +1,471 @@
+"""This module contains the hierarchical pathfinding (HPA*).
+
+A breadth-first search over the whole map visits most of the tiles
+for every long route. The hierarchical pathfinder splits the map into
+square clusters and precomputes, once per map, the entrances between
+neighbouring clusters and the distances between the entrances inside
+each cluster. A query searches this small abstract graph and then
+refines each abstract edge with a search limited to one cluster.
+
+The walls never change, but mines, lasers and tanks block the tiles
+for some time. When the dynamic obstacles change, only the entrances
+and the distances of the clusters with changed tiles are recomputed.
+
+The paths are nearly, but not always exactly, the shortest ones,
+as the routes are forced through the entrances.
+
+Examples
+--------
+
+::
+
+    from hackathon_bot.hierarchical import HierarchicalPathfinder
+
+    class MyBot(HackathonBot):
+
+        def next_move(self, game_state: GameState) -> ResponseAction:
+            if self.pathfinder is None:
+                walls = ...  # The wall grid, indexed as walls[y][x].
+                self.pathfinder = HierarchicalPathfinder(walls)
+
+            index = game_state.index
+            self.pathfinder.update_obstacles(
+                index.mines + index.lasers + list(index.enemy_positions.values())
+            )
+            path = self.pathfinder.find_path(index.my_position, target)
+            if path:
+                next_tile = path[0]
+                ...
+
+Classes
+-------
+HierarchicalPathfinder
+    Represents a pathfinder over the clusters of the map.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections import deque
+from typing import Iterable, Sequence
+
+__all__ = ("HierarchicalPathfinder",)
+
+# The runs of free border tiles at least this long get an entrance
+# at both ends instead of one in the middle.
+_LONG_ENTRANCE = 6
+
+
+class HierarchicalPathfinder:  # pylint: disable=too-many-instance-attributes
+    """Represents a pathfinder over the clusters of the map.
+
+    The tiles are indexed as `y * width + x` internally,
+    the public methods take and return `(x, y)` positions.
+
+    Parameters
+    ----------
+    walls: Sequence[Sequence[:class:`bool`]]
+        The wall grid indexed as `walls[y][x]`.
+    cluster_size: :class:`int`
+        The width and the height of a cluster.
+
+    Attributes
+    ----------
+    width: :class:`int`
+        The width of the map.
+    height: :class:`int`
+        The height of the map.
+    cluster_size: :class:`int`
+        The width and the height of a cluster.
+    obstacles: frozenset[tuple[:class:`int`, :class:`int`]]
+        The positions of the dynamic obstacles.
+    """
+
+    __slots__ = (
+        "width",
+        "height",
+        "cluster_size",
+        "obstacles",
+        "_columns",
+        "_clusters",
+        "_neighbors",
+        "_nodes",
+        "_inter",
+        "_intra",
+        "_trees",
+        "_dirty",
+        "_blocked",
+        "_runs",
+        "_run_of",
+        "_placed",
+    )
+
+    def __init__(self, walls: Sequence[Sequence[bool]], cluster_size: int = 8) -> None:
+        if cluster_size < 1:
+            raise ValueError("cluster_size must be positive")
+
+        self.height = height = len(walls)
+        self.width = width = len(walls[0]) if height else 0
+        self.cluster_size = cluster_size
+        self.obstacles: frozenset[tuple[int, int]] = frozenset()
+        self._columns = columns = -(-width // cluster_size)
+        self._blocked: set[int] = set()
+
+        cells = bytes(bool(wall) for row in walls for wall in row)
+        self._clusters = [
+            (y // cluster_size) * columns + x // cluster_size
+            for y in range(height)
+            for x in range(width)
+        ]
+
+        # The free tiles next to each free tile.
+        neighbors: list[tuple[int, ...]] = [()] * (width * height)
+        for y in range(height):
+            for x in range(width):
+                tile = y * width + x
+                if cells[tile]:
+                    continue
+                neighbors[tile] = tuple(
+                    ny * width + nx
+                    for nx, ny in ((x, y - 1), (x + 1, y), (x, y + 1), (x - 1, y))
+                    if 0 <= nx < width
+                    and 0 <= ny < height
+                    and not cells[ny * width + nx]
+                )
+        self._neighbors = neighbors
+
+        self._nodes: dict[int, set[int]] = {}
+        self._inter: dict[int, list[int]] = {}
+        self._runs: list[list[tuple[int, int]]] = []
+        self._run_of: dict[int, list[int]] = {}
+        self._placed: list[list[tuple[int, int]]] = []
+        self._find_runs(cells)
+        for run in range(len(self._runs)):
+            self._place(run)
+
+        self._intra: dict[int, dict[int, dict[int, int]]] = {}
+        self._trees: dict[int, dict[int, dict[int, int]]] = {}
+        self._dirty: set[int] = set()
+        for cluster in self._nodes:
+            self._connect(cluster)
+
+    def _find_runs(self, cells: bytes) -> None:
+        # The runs of free tile pairs along the borders of the clusters,
+        # first between the clusters in a row, then in a column.
+        width = self.width
+        size = self.cluster_size
+        borders = [
+            [(y * width + border - 1, y * width + border) for y in range(self.height)]
+            for border in range(size, width, size)
+        ] + [
+            [((border - 1) * width + x, border * width + x) for x in range(width)]
+            for border in range(size, self.height, size)
+        ]
+
+        for pairs in borders:
+            run = []
+            for offset, (first, second) in enumerate(pairs):
+                if cells[first] or cells[second] or (run and offset % size == 0):
+                    if run:
+                        self._runs.append(run)
+                    run = []
+                if not cells[first] and not cells[second]:
+                    run.append((first, second))
+            if run:
+                self._runs.append(run)
+
+        for index, run in enumerate(self._runs):
+            self._placed.append([])
+            for pair in run:
+                for tile in pair:
+                    self._run_of.setdefault(tile, []).append(index)
+
+    def _place(self, index: int) -> set[int]:
+        # Places the entrances of a run, skipping the blocked pairs,
+        # so that every free part of the run has an entrance.
+        # Returns the clusters with changed entrances.
+        clusters = self._clusters
+        nodes = self._nodes
+        inter = self._inter
+        blocked = self._blocked
+        changed = set()
+
+        for first, second in self._placed[index]:
+            for tile, other in ((first, second), (second, first)):
+                inter[tile].remove(other)
+                if not inter[tile]:
+                    del inter[tile]
+                    nodes[clusters[tile]].discard(tile)
+                changed.add(clusters[tile])
+
+        placed = []
+        part = []
+        for pair in self._runs[index] + [None]:
+            if pair is not None and pair[0] not in blocked and pair[1] not in blocked:
+                part.append(pair)
+                continue
+            if len(part) >= _LONG_ENTRANCE:
+                placed += (part[0], part[-1])
+            elif part:
+                placed.append(part[len(part) // 2])
+            part = []
+
+        for first, second in placed:
+            for tile, other in ((first, second), (second, first)):
+                nodes.setdefault(clusters[tile], set()).add(tile)
+                inter.setdefault(tile, []).append(other)
+                changed.add(clusters[tile])
+        self._placed[index] = placed
+        return changed
+
+    def _search(
+        self,
+        source: int,
+        target: int = -1,
+    ) -> tuple[dict[int, int], dict[int, int]]:
+        # A breadth-first search limited to the cluster of the source.
+        # The target can be entered even if it is an obstacle.
+        clusters = self._clusters
+        cluster = clusters[source]
+        neighbors = self._neighbors
+        blocked = self._blocked
+        distances = {source: 0}
+        parents = {source: -1}
+        queue = deque([source])
+        while queue:
+            tile = queue.popleft()
+            if tile == target:
+                continue
+            distance = distances[tile] + 1
+            for following in neighbors[tile]:
+                if (
+                    following not in distances
+                    and clusters[following] == cluster
+                    and (following not in blocked or following == target)
+                ):
+                    distances[following] = distance
+                    parents[following] = tile
+                    queue.append(following)
+        return distances, parents
+
+    def _connect(self, cluster: int) -> None:
+        # The distances between the entrances inside the cluster,
+        # with the search trees used to refine the abstract edges.
+        blocked = self._blocked
+        edges = {}
+        trees = {}
+        for node in self._nodes[cluster]:
+            if node in blocked:
+                edges[node] = {}
+                continue
+            distances, trees[node] = self._search(node)
+            edges[node] = {
+                other: distances[other]
+                for other in self._nodes[cluster]
+                if other != node and other in distances
+            }
+        self._intra[cluster] = edges
+        self._trees[cluster] = trees
+        self._dirty.discard(cluster)
+
+    def cluster_of(self, x: int, y: int) -> int:
+        """Returns the index of the cluster of the tile."""
+        return self._clusters[y * self.width + x]
+
+    @property
+    def entrances(self) -> list[tuple[int, int]]:
+        """The positions of the entrance tiles of all clusters."""
+
+        width = self.width
+        return sorted(
+            (tile % width, tile // width)
+            for nodes in self._nodes.values()
+            for tile in nodes
+        )
+
+    def update_obstacles(self, positions: Iterable[tuple[int, int]]) -> set[int]:
+        """Sets the dynamic obstacles, e.g. mines, lasers and tanks.
+
+        Parameters
+        ----------
+        positions: Iterable[tuple[:class:`int`, :class:`int`]]
+            The `(x, y)` positions of all current obstacles.
+
+        Returns
+        -------
+        set[int]
+            The indices of the clusters with changed tiles. Their
+            distances are recomputed when a path goes through them.
+        """
+
+        obstacles = frozenset(positions)
+        width = self.width
+        blocked = {y * width + x for x, y in obstacles}
+        changed = blocked ^ self._blocked
+        self.obstacles = obstacles
+        self._blocked = blocked
+
+        dirty = {self._clusters[tile] for tile in changed}
+        runs = {run for tile in changed for run in self._run_of.get(tile, ())}
+        for run in runs:
+            dirty |= self._place(run)
+        self._dirty |= dirty
+        return dirty
+
+    def find_path(  # pylint: disable=too-many-locals,too-many-branches
+        self,
+        start: tuple[int, int],
+        goal: tuple[int, int],
+    ) -> list[tuple[int, int]] | None:
+        """Returns a path from the start to the goal.
+
+        The start and the goal may be obstacles, e.g. the tank
+        of your agent and the enemy to approach.
+
+        Parameters
+        ----------
+        start: tuple[:class:`int`, :class:`int`]
+            The `(x, y)` position to start from.
+        goal: tuple[:class:`int`, :class:`int`]
+            The `(x, y)` position to reach.
+
+        Returns
+        -------
+        list[tuple[int, int]] | None
+            The positions of the path without the start,
+            empty if the start is the goal,
+            or `None` if the goal cannot be reached.
+        """
+
+        width = self.width
+        source = start[1] * width + start[0]
+        target = goal[1] * width + goal[0]
+        if source == target:
+            return []
+        if not self._neighbors[source] or not self._neighbors[target]:
+            return None
+
+        # An obstacle on a border hides the entrances of its run,
+        # so the start and the goal are lifted for the query.
+        lifted = {
+            position
+            for position, tile in ((start, source), (goal, target))
+            if tile in self._blocked and tile in self._run_of
+        }
+        if lifted:
+            obstacles = self.obstacles
+            self.update_obstacles(obstacles - lifted)
+            try:
+                return self.find_path(start, goal)
+            finally:
+                self.update_obstacles(obstacles)
+
+        clusters = self._clusters
+        blocked = self._blocked
+        intra = self._intra
+        inter = self._inter
+        trees = self._trees
+        dirty = self._dirty
+
+        # The temporary edges of the start and the goal to the entrances.
+        distances, start_tree = self._search(source, target)
+        start_nodes = self._nodes.get(clusters[source], ())
+        start_edges = {
+            node: distances[node]
+            for node in start_nodes
+            if node in distances and node != source
+        }
+        if target in distances:
+            start_edges[target] = distances[target]
+
+        distances, goal_tree = self._search(target, source)
+        goal_edges = {
+            node: distances[node]
+            for node in self._nodes.get(clusters[target], ())
+            if node in distances and node not in blocked
+        }
+
+        gx, gy = goal
+
+        def heuristic(tile: int) -> int:
+            return abs(tile % width - gx) + abs(tile // width - gy)
+
+        costs = {source: 0}
+        parents = {source: -1}
+        queue = [(heuristic(source), 0, source)]
+        while queue:
+            _, cost, tile = heapq.heappop(queue)
+            if tile == target:
+                break
+            if cost > costs[tile]:
+                continue
+
+            if tile == source:
+                edges = list(start_edges.items())
+            else:
+                cluster = clusters[tile]
+                if cluster in dirty:
+                    self._connect(cluster)
+                edges = list(intra[cluster].get(tile, {}).items())
+                if tile in goal_edges:
+                    edges.append((target, goal_edges[tile]))
+            edges += (
+                (other, 1)
+                for other in inter.get(tile, ())
+                if other not in blocked or other == target
+            )
+
+            for following, weight in edges:
+                following_cost = cost + weight
+                if following_cost < costs.get(following, following_cost + 1):
+                    costs[following] = following_cost
+                    parents[following] = tile
+                    heapq.heappush(
+                        queue,
+                        (
+                            following_cost + heuristic(following),
+                            following_cost,
+                            following,
+                        ),
+                    )
+        else:
+            return None
+
+        waypoints = []
+        tile = target
+        while tile != -1:
+            waypoints.append(tile)
+            tile = parents[tile]
+        waypoints.reverse()
+
+        # The refinement of the abstract edges inside the clusters.
+        path = []
+        for first, second in zip(waypoints, waypoints[1:]):
+            if clusters[first] != clusters[second]:
+                path.append(second)
+                continue
+            if first != source and second == target:
+                # The goal tree leads from the entrance to the goal.
+                tile = first
+                while tile != target:
+                    tile = goal_tree[tile]
+                    path.append(tile)
+                continue
+            tree = start_tree if first == source else trees[clusters[first]][first]
+            segment = []
+            tile = second
+            while tile != first:
+                segment.append(tile)
+                tile = tree[tile]
+            path += reversed(segment)
+
+        return [(tile % width, tile // width) for tile in path]
+
+    def distance(self, start: tuple[int, int], goal: tuple[int, int]) -> int | None:
+        """Returns the length of the path from the start to the goal.
+
+        Returns `None` if the goal cannot be reached.
+        """
+
+        path = self.find_path(start, goal)
+        return None if path is None else len(path)
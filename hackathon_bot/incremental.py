@@ -0,0 +1,346 @@
+"""This module contains the incremental pathfinding (D* Lite).
+
+Between two ticks the map changes only a little: a mine appears,
+a tank moves by one tile or the goal moves. Instead of a new search
+from scratch every tick, the incremental pathfinder keeps the distances
+to the goals between the ticks and repairs only the distances affected
+by the changes, so the cost of replanning grows with the size of the
+change, not with the size of the map.
+
+The search runs backward from a virtual node connected to all goals,
+so a path leads to the nearest goal. The start of the search (the tank
+of your agent) can move without invalidating the distances, but moving
+a goal starts the search over.
+
+Examples
+--------
+
+::
+
+    from hackathon_bot.incremental import IncrementalPathfinder
+
+    class MyBot(HackathonBot):
+
+        def next_move(self, game_state: GameState) -> ResponseAction:
+            if self.pathfinder is None:
+                walls = ...  # The wall grid, indexed as walls[y][x].
+                self.pathfinder = IncrementalPathfinder(walls)
+
+            index = game_state.index
+            self.pathfinder.update_obstacles(index.mines + index.lasers)
+            path = self.pathfinder.find_path(index.my_position, [target])
+            if path:
+                next_tile = path[0]
+                ...
+
+Classes
+-------
+IncrementalPathfinder
+    Represents a pathfinder repairing its paths when the map changes.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from typing import Iterable, Sequence
+
+__all__ = ("IncrementalPathfinder",)
+
+
+class IncrementalPathfinder:  # pylint: disable=too-many-instance-attributes
+    """Represents a pathfinder repairing its paths when the map changes.
+
+    The start and the goals are passable even if they are obstacles,
+    e.g. the tank of your agent and the enemy to approach.
+
+    Parameters
+    ----------
+    walls: Sequence[Sequence[:class:`bool`]]
+        The wall grid indexed as `walls[y][x]`.
+
+    Attributes
+    ----------
+    width: :class:`int`
+        The width of the map.
+    height: :class:`int`
+        The height of the map.
+    goals: frozenset[tuple[:class:`int`, :class:`int`]]
+        The positions of the current goals.
+    obstacles: frozenset[tuple[:class:`int`, :class:`int`]]
+        The positions of the dynamic obstacles.
+    expanded: :class:`int`
+        The number of tiles expanded by the last replanning.
+    """
+
+    __slots__ = (
+        "width",
+        "height",
+        "goals",
+        "obstacles",
+        "expanded",
+        "_neighbors",
+        "_walls",
+        "_blocked",
+        "_targets",
+        "_start",
+        "_km",
+        "_g",
+        "_rhs",
+        "_queue",
+        "_queued",
+    )
+
+    def __init__(self, walls: Sequence[Sequence[bool]]) -> None:
+        self.height = height = len(walls)
+        self.width = width = len(walls[0]) if height else 0
+        self.goals: frozenset[tuple[int, int]] = frozenset()
+        self.obstacles: frozenset[tuple[int, int]] = frozenset()
+        self.expanded = 0
+
+        cells = bytes(bool(wall) for row in walls for wall in row)
+        self._walls = cells
+        neighbors: list[tuple[int, ...]] = [()] * (width * height)
+        for y in range(height):
+            for x in range(width):
+                if cells[y * width + x]:
+                    continue
+                neighbors[y * width + x] = tuple(
+                    ny * width + nx
+                    for nx, ny in ((x, y - 1), (x + 1, y), (x, y + 1), (x - 1, y))
+                    if 0 <= nx < width
+                    and 0 <= ny < height
+                    and not cells[ny * width + nx]
+                )
+        self._neighbors = neighbors
+        self._blocked: set[int] = set()
+        self._targets: set[int] = set()
+        self._start = -1
+        self._km = 0
+
+        self._g: list[float] = []
+        self._rhs: list[float] = []
+        self._queue: list[tuple[float, float, int]] = []
+        self._queued: dict[int, tuple[float, float]] = {}
+        self._reset()
+
+    def _reset(self) -> None:
+        # The node after the tiles is the virtual goal connected to all goals.
+        size = len(self._neighbors)
+        self._g = [math.inf] * (size + 1)
+        self._rhs = [math.inf] * (size + 1)
+        self._rhs[size] = 0
+        self._queue = []
+        self._queued = {}
+        self._km = 0
+        self._push(size, (0, 0))
+
+    # The search
+
+    def _heuristic(self, node: int) -> int:
+        if node >= len(self._neighbors) or self._start < 0:
+            return 0
+        width = self.width
+        start = self._start
+        return abs(node % width - start % width) + abs(node // width - start // width)
+
+    def _key(self, node: int) -> tuple[float, float]:
+        best = min(self._g[node], self._rhs[node])
+        return best + self._heuristic(node) + self._km, best
+
+    def _push(self, node: int, key: tuple[float, float]) -> None:
+        self._queued[node] = key
+        heapq.heappush(self._queue, (key[0], key[1], node))
+
+    def _top(self) -> tuple[tuple[float, float], int] | None:
+        # The queue is lazy: the outdated entries are skipped.
+        queue = self._queue
+        queued = self._queued
+        while queue:
+            first, second, node = queue[0]
+            if queued.get(node) == (first, second):
+                return (first, second), node
+            heapq.heappop(queue)
+        return None
+
+    def _passable(self, tile: int) -> bool:
+        return not self._walls[tile] and (
+            tile not in self._blocked or tile in self._targets or tile == self._start
+        )
+
+    def _lookahead(self, tile: int) -> float:
+        # The best distance through the successors of the tile.
+        if not self._passable(tile):
+            return math.inf
+        if tile in self._targets:
+            return 0
+        g = self._g
+        best = math.inf
+        for following in self._neighbors[tile]:
+            if g[following] + 1 < best and self._passable(following):
+                best = g[following] + 1
+        return best
+
+    def _update(self, node: int) -> None:
+        if node < len(self._neighbors):
+            self._rhs[node] = self._lookahead(node)
+        if self._g[node] != self._rhs[node]:
+            self._push(node, self._key(node))
+        else:
+            self._queued.pop(node, None)
+
+    def _predecessors(self, node: int) -> Iterable[int]:
+        if node >= len(self._neighbors):
+            return self._targets
+        return self._neighbors[node]
+
+    def _compute(self) -> None:
+        start = self._start
+        g = self._g
+        rhs = self._rhs
+        expanded = 0
+        while True:
+            top = self._top()
+            if top is None:
+                break
+            key, node = top
+            if key >= self._key(start) and rhs[start] == g[start]:
+                break
+
+            expanded += 1
+            new_key = self._key(node)
+            if key < new_key:
+                self._push(node, new_key)
+            elif g[node] > rhs[node]:
+                g[node] = rhs[node]
+                del self._queued[node]
+                for previous in self._predecessors(node):
+                    self._update(previous)
+            else:
+                g[node] = math.inf
+                self._update(node)
+                for previous in self._predecessors(node):
+                    self._update(previous)
+        self.expanded = expanded
+
+    def _changed(self, tiles: Iterable[int]) -> None:
+        # The edges of the tiles have changed, so the tiles
+        # and their neighbours must be checked again.
+        for tile in tiles:
+            self._update(tile)
+            for neighbor in self._neighbors[tile]:
+                self._update(neighbor)
+
+    # The public interface
+
+    def set_goals(self, goals: Iterable[tuple[int, int]]) -> None:
+        """Sets the goals.
+
+        New goals only shorten the distances, so they are repaired.
+        A removed or moved goal lengthens the distances in most of
+        the map, so the search starts over, as repairing them
+        would cost more than a new search.
+        """
+
+        goals = frozenset(goals)
+        if goals == self.goals:
+            return
+        width = self.width
+        targets = {y * width + x for x, y in goals if not self._walls[y * width + x]}
+        added = targets - self._targets
+        if self._targets - targets:
+            self._reset()
+            added = targets
+        self.goals = goals
+        self._targets = targets
+        self._changed(added)
+
+    def update_obstacles(self, positions: Iterable[tuple[int, int]]) -> None:
+        """Sets the dynamic obstacles, e.g. mines, lasers and tanks.
+
+        Parameters
+        ----------
+        positions: Iterable[tuple[:class:`int`, :class:`int`]]
+            The `(x, y)` positions of all current obstacles.
+        """
+
+        obstacles = frozenset(positions)
+        if obstacles == self.obstacles:
+            return
+        width = self.width
+        blocked = {y * width + x for x, y in obstacles}
+        changed = blocked ^ self._blocked
+        self.obstacles = obstacles
+        self._blocked = blocked
+        self._changed(changed)
+
+    def _move_start(self, start: tuple[int, int]) -> None:
+        source = start[1] * self.width + start[0]
+        previous = self._start
+        if source == previous:
+            return
+
+        self._start = source
+        if previous >= 0:
+            # The keys in the queue stay valid lower bounds
+            # when the heuristic moves with the start.
+            self._km += self._heuristic(previous)
+        if previous in self._blocked:
+            self._changed((previous,))
+        if source in self._blocked:
+            self._changed((source,))
+
+    def distance(
+        self,
+        start: tuple[int, int],
+        goals: Iterable[tuple[int, int]] | None = None,
+    ) -> int | None:
+        """Returns the number of moves from the start to the nearest goal.
+
+        Returns `None` if no goal can be reached.
+        """
+
+        if goals is not None:
+            self.set_goals(goals)
+        self._move_start(start)
+        self._compute()
+        distance = self._g[self._start]
+        return None if distance == math.inf else int(distance)
+
+    def find_path(
+        self,
+        start: tuple[int, int],
+        goals: Iterable[tuple[int, int]] | None = None,
+    ) -> list[tuple[int, int]] | None:
+        """Returns a shortest path from the start to the nearest goal.
+
+        Parameters
+        ----------
+        start: tuple[:class:`int`, :class:`int`]
+            The `(x, y)` position to start from.
+        goals: Iterable[tuple[:class:`int`, :class:`int`]] | `None`
+            The `(x, y)` positions to reach.
+            If `None`, the goals of the previous query are used.
+
+        Returns
+        -------
+        list[tuple[int, int]] | None
+            The positions of the path without the start,
+            empty if the start is a goal,
+            or `None` if no goal can be reached.
+        """
+
+        if self.distance(start, goals) is None:
+            return None
+
+        width = self.width
+        g = self._g
+        tile = self._start
+        path = []
+        while tile not in self._targets:
+            best = math.inf
+            for following in self._neighbors[tile]:
+                if g[following] < best and self._passable(following):
+                    tile, best = following, g[following]
+            path.append((tile % width, tile // width))
+        return path
@@ -0,0 +1,359 @@
+"""This module contains the memoization helpers.
+
+The helpers let a bot reuse the results of its evaluations when the
+local situation repeats, e.g. the same pose of the tank with the same
+walls, bullets and enemies around it as in one of the previous ticks.
+
+- :class:`ZobristHasher` creates a 64-bit hash of a situation from
+  random keys of its features, so that a change of one feature updates
+  the hash with a single XOR.
+- :class:`TranspositionTable` stores the results by their hashes with
+  a bounded size, evicting the least recently used entries.
+- :func:`memoize` wraps a function or a bot method with a table.
+
+Examples
+--------
+
+::
+
+    from hackathon_bot.memo import ZobristHasher
+
+    class MyBot(HackathonBot):
+
+        def on_lobby_data_received(self, lobby_data: LobbyData) -> None:
+            dimension = lobby_data.server_settings.grid_dimension
+            self.hasher = ZobristHasher(dimension, dimension)
+
+        def situation(self, game_state: GameState) -> int:
+            index = game_state.index
+            tiles = game_state.map.tiles
+            # The bullets are hashed with their directions, as a bullet
+            # moving away from the tank is not a bullet moving towards it.
+            bullets = [
+                (bx, by, entity.direction)
+                for bx, by in index.bullets
+                for entity in tiles[by][bx].entities
+                if is_bullet(entity)
+            ]
+            x, y = index.my_position
+            return self.hasher.hash_local(
+                x,
+                y,
+                index.my_tank.direction,
+                index.my_tank.turret.direction,
+                {ZobristHasher.BULLET: bullets},
+                radius=3,
+            )
+
+        @memoize(key=lambda self, game_state: self.situation(game_state))
+        def dodge(self, game_state: GameState) -> ResponseAction:
+            ...
+
+Classes
+-------
+CacheStats
+    Represents the statistics of a transposition table.
+TranspositionTable
+    Represents a bounded table of results with LRU eviction.
+ZobristHasher
+    Represents a Zobrist hasher of map situations.
+
+Functions
+---------
+memoize
+    Caches the results of a function in a transposition table.
+"""
+
+from __future__ import annotations
+
+import functools
+import random
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Iterable, Mapping
+
+__all__ = (
+    "CacheStats",
+    "TranspositionTable",
+    "ZobristHasher",
+    "memoize",
+)
+
+_MISSING = object()
+_MASK = (1 << 64) - 1
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """Represents the statistics of a transposition table.
+
+    Attributes
+    ----------
+    hits: :class:`int`
+        The number of lookups that found a result.
+    misses: :class:`int`
+        The number of lookups that did not find a result.
+    evictions: :class:`int`
+        The number of results removed to respect the size limit.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups that found a result."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class TranspositionTable:
+    """Represents a bounded table of results with LRU eviction.
+
+    Parameters
+    ----------
+    maxsize: :class:`int`
+        The maximum number of stored results.
+
+    Attributes
+    ----------
+    stats: :class:`CacheStats`
+        The statistics of the lookups.
+    """
+
+    __slots__ = ("maxsize", "stats", "_entries")
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+
+        self.maxsize = maxsize
+        self.stats = CacheStats()
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the result stored for the key.
+
+        A found result becomes the most recently used one.
+        """
+
+        value = self._entries.get(key, _MISSING)
+        if value is _MISSING:
+            self.stats.misses += 1
+            return default
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Stores the result for the key.
+
+        If the table is full, the least recently used result is evicted.
+        """
+
+        entries = self._entries
+        entries[key] = value
+        entries.move_to_end(key)
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Removes all results and resets the statistics."""
+        self._entries.clear()
+        self.stats = CacheStats()
+
+
+class ZobristHasher:
+    """Represents a Zobrist hasher of map situations.
+
+    Every feature on every tile (e.g. a wall at `(3, 4)`), optionally
+    with a direction (e.g. a bullet at `(3, 4)` moving up), and every
+    pose of the tank has a random 64-bit key. The hash of a situation
+    is the XOR of the keys of its features. A feature repeated on
+    the same tile is mixed with its count, so the repeats do not
+    cancel out.
+
+    Parameters
+    ----------
+    width: :class:`int`
+        The width of the map.
+    height: :class:`int`
+        The height of the map.
+    features: :class:`int`
+        The number of tile features. The features
+        :attr:`WALL`, :attr:`BULLET`, :attr:`ENEMY`, :attr:`MINE`,
+        :attr:`LASER` and :attr:`ITEM` are predefined,
+        the next ones can be used by the bot.
+    seed: :class:`int`
+        The seed of the random keys.
+    """
+
+    WALL = 0
+    BULLET = 1
+    ENEMY = 2
+    MINE = 3
+    LASER = 4
+    ITEM = 5
+
+    __slots__ = ("width", "height", "features", "_tile_keys", "_pose_keys")
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        features: int = 8,
+        seed: int = 0,
+    ) -> None:
+        rng = random.Random(seed)
+        tiles = width * height
+        self.width = width
+        self.height = height
+        self.features = features
+        # A key for each tile without a direction and with each direction.
+        self._tile_keys = array(
+            "Q", [rng.getrandbits(64) for _ in range(features * tiles * 5)]
+        )
+        # A key for each position and each pair of tank and turret directions.
+        self._pose_keys = [rng.getrandbits(64) for _ in range(tiles * 16)]
+
+    def key(self, feature: int, x: int, y: int, direction: int | None = None) -> int:
+        """Returns the key of a feature on a tile,
+        optionally moving in a direction."""
+
+        tile = (feature * self.height + y) * self.width + x
+        return self._tile_keys[
+            tile * 5 + (0 if direction is None else int(direction) + 1)
+        ]
+
+    def pose_key(self, x: int, y: int, direction: int, turret_direction: int) -> int:
+        """Returns the key of a pose of the tank."""
+
+        tile = y * self.width + x
+        return self._pose_keys[tile * 16 + int(direction) * 4 + int(turret_direction)]
+
+    def hash_positions(self, feature: int, positions: Iterable[tuple[int, ...]]) -> int:
+        """Returns the hash of a feature on the tiles.
+
+        The positions are `(x, y)` or `(x, y, direction)` tuples.
+        """
+
+        keys = self._tile_keys
+        width = self.width
+        offset = feature * self.height * width * 5
+        counts: dict[int, int] = {}
+        repeated = False
+        value = 0
+        for position in positions:
+            index = offset + (position[1] * width + position[0]) * 5
+            if len(position) > 2:
+                index += int(position[2]) + 1
+            if index in counts:
+                counts[index] += 1
+                repeated = True
+            else:
+                counts[index] = 1
+                value ^= keys[index]
+
+        if repeated:
+            for index, count in counts.items():
+                if count > 1:
+                    # An odd factor never maps a repeated key to zero.
+                    value ^= keys[index] ^ (keys[index] * (2 * count - 1) & _MASK)
+        return value
+
+    def hash_local(  # pylint: disable=too-many-arguments
+        self,
+        x: int,
+        y: int,
+        direction: int,
+        turret_direction: int,
+        features: Mapping[int, Iterable[tuple[int, ...]]],
+        radius: int | None = None,
+    ) -> int:
+        """Returns the hash of the pose of the tank and the features around it.
+
+        Parameters
+        ----------
+        x: :class:`int`
+            The x-coordinate of the tank.
+        y: :class:`int`
+            The y-coordinate of the tank.
+        direction: :class:`int`
+            The direction of the tank.
+        turret_direction: :class:`int`
+            The direction of the turret.
+        features: Mapping[:class:`int`, Iterable[tuple[:class:`int`, ...]]]
+            The `(x, y)` or `(x, y, direction)` positions of each feature.
+        radius: :class:`int` | `None`
+            The maximum distance of the features from the tank on each axis.
+            If `None`, all features are hashed.
+        """
+
+        value = self.pose_key(x, y, direction, turret_direction)
+        for feature, positions in features.items():
+            if radius is not None:
+                positions = [
+                    position
+                    for position in positions
+                    if abs(position[0] - x) <= radius and abs(position[1] - y) <= radius
+                ]
+            value ^= self.hash_positions(feature, positions)
+        return value
+
+
+def memoize(
+    key: Callable[..., Hashable] | None = None,
+    maxsize: int = 4096,
+) -> Callable[[Callable], Callable]:
+    """Caches the results of a function in a transposition table.
+
+    Parameters
+    ----------
+    key: Callable[..., Hashable] | `None`
+        The function creating the key of the table from the arguments
+        of the decorated function, e.g. a Zobrist hash of the situation.
+        If `None`, the arguments themselves are the key,
+        so they must be hashable.
+    maxsize: :class:`int`
+        The maximum number of stored results.
+
+    Notes
+    -----
+    The table is available as the `table` attribute of the decorated
+    function. When a method is decorated, the table is shared by all
+    instances, so the key should not depend on the identity of `self`
+    if the results are meant to be shared.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        table = TranspositionTable(maxsize)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if key is not None:
+                cache_key = key(*args, **kwargs)
+            elif kwargs:
+                cache_key = (args, frozenset(kwargs.items()))
+            else:
+                cache_key = args
+
+            result = table.get(cache_key, _MISSING)
+            if result is _MISSING:
+                result = func(*args, **kwargs)
+                table.put(cache_key, result)
+            return result
+
+        wrapper.table = table
+        return wrapper
+
+    return decorator
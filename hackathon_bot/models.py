@@ -7,19 +7,38 @@ which serve as interfaces for these models with enhanced clarity.
 Some of the models contain weird attributes like __instancecheck_something__.
 These are used to distinguish between different classes that have the same
 data structure. This is necessary to allow using isinstance() with protocols.
+
+The tile entity models also have a `kind` class attribute with their
+:class:`EntityKind`, used by the fast predicates in the predicates module.
+
+New tile object types sent by the server can be added
+with :func:`register_tile_entity`.
 """
 
 from __future__ import annotations
 
 from abc import ABC
-from dataclasses import asdict, dataclass
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, ClassVar
 
 import humps
 
-from hackathon_bot.payloads import RawBullet, RawItem, RawLaser, RawMine
-
-from .enums import BulletType, Direction, ItemType, Orientation, ZoneStatus
+from hackathon_bot.payloads import (
+    RawBullet,
+    RawItem,
+    RawLaser,
+    RawMine,
+    RawTileObject,
+)
+
+from .enums import (
+    BulletType,
+    Direction,
+    EntityKind,
+    ItemType,
+    Orientation,
+    ZoneStatus,
+)
 
 if TYPE_CHECKING:
     from .payloads import (
@@ -29,6 +48,7 @@ if TYPE_CHECKING:
         RawMap,
         RawPlayer,
         RawTank,
+        RawTileEntity,
         RawTurret,
         RawZone,
         ServerSettings,
@@ -56,9 +76,16 @@ class PlayerModel:  # pylint: disable=too-many-instance-attributes
     @classmethod
     def from_raw(cls, raw: RawPlayer) -> PlayerModel:
         """Creates a player from a raw player payload."""
-        data = asdict(raw)
-        data["ticks_to_regenerate"] = data.pop("ticks_to_regen", None)
-        return cls(**data)
+        return cls(
+            raw.id,
+            raw.nickname,
+            raw.color,
+            raw.score,
+            raw.kills,
+            raw.ping,
+            raw.ticks_to_regen,
+            raw.is_using_radar,
+        )
 
 
 @dataclass(slots=True, frozen=True)
@@ -71,11 +98,22 @@ class TurretModel:
 
     @classmethod
     def from_raw(cls, raw: RawTurret) -> TurretModel:
-        """Creates a turret from a raw turret payload."""
-        data = asdict(raw)
-        data["direction"] = Direction(data["direction"])
-        data["ticks_to_regenerate_bullet"] = data.pop("ticks_to_regen_bullet", None)
-        return cls(**data)
+        """Creates a turret from a raw turret payload.
+
+        Turrets of other players carry only the direction,
+        so a shared instance is returned for each direction.
+        """
+        if raw.bullet_count is None and raw.ticks_to_regen_bullet is None:
+            return _PLAYER_TURRETS[raw.direction]
+
+        return cls(
+            Direction(raw.direction),
+            raw.bullet_count,
+            raw.ticks_to_regen_bullet,
+        )
+
+
+_PLAYER_TURRETS = {d: TurretModel(d) for d in Direction}
 
 
 @dataclass(slots=True, frozen=True)
@@ -83,6 +121,7 @@ class TankModel:
     """Represents a tank model."""
 
     __instancecheck_tank__ = True
+    kind: ClassVar[EntityKind] = EntityKind.TANK
 
     owner_id: str
     direction: Direction
@@ -93,12 +132,14 @@ class TankModel:
     @classmethod
     def from_raw(cls, raw: RawTank) -> TankModel:
         """Creates a tank from a raw tank payload."""
-        data = asdict(raw)
-        data["direction"] = Direction(data["direction"])
-        data["turret"] = TurretModel.from_raw(raw.turret)
-        if raw.secondary_item is not None:
-            data["secondary_item"] = ItemType(data["secondary_item"])
-        return cls(**data)
+        secondary_item = raw.secondary_item
+        return cls(
+            raw.owner_id,
+            Direction(raw.direction),
+            TurretModel.from_raw(raw.turret),
+            raw.health,
+            ItemType(secondary_item) if secondary_item is not None else None,
+        )
 
 
 @dataclass(slots=True, frozen=True)
@@ -106,6 +147,7 @@ class AgentTankModel(TankModel):
     """Represents an agent tank model."""
 
     __instancecheck_agenttank__ = True
+    kind: ClassVar[EntityKind] = EntityKind.AGENT_TANK
 
 
 @dataclass(slots=True, frozen=True)
@@ -113,6 +155,10 @@ class WallModel:
     """Represents a wall model."""
 
     __instancecheck_wall__ = True
+    kind: ClassVar[EntityKind] = EntityKind.WALL
+
+
+_WALL = WallModel()
 
 
 @dataclass(slots=True, frozen=True)
@@ -120,6 +166,7 @@ class BulletModel:
     """Represents a bullet model."""
 
     __instancecheck_bullet__ = True
+    kind: ClassVar[EntityKind] = EntityKind.BULLET
 
     id: int
     speed: float
@@ -133,10 +180,7 @@ class BulletModel:
         if raw.type == 1:  # Double
             return DoubleBulletModel.from_raw(raw)
 
-        data = asdict(raw)
-        data["direction"] = Direction(data["direction"])
-        data["type"] = BulletType.BASIC
-        return cls(**data)
+        return cls(raw.id, raw.speed, Direction(raw.direction), BulletType.BASIC)
 
 
 @dataclass(slots=True, frozen=True)
@@ -144,6 +188,7 @@ class LaserModel:
     """Represents a laser model."""
 
     __instancecheck_laser__ = True
+    kind: ClassVar[EntityKind] = EntityKind.LASER
 
     id: int
     orientation: Orientation
@@ -151,9 +196,7 @@ class LaserModel:
     @classmethod
     def from_raw(cls, raw: RawLaser) -> LaserModel:
         """Creates a laser from a raw laser payload."""
-        data = asdict(raw)
-        data["orientation"] = Orientation(data["orientation"])
-        return cls(**data)
+        return cls(raw.id, Orientation(raw.orientation))
 
 
 @dataclass(slots=True, frozen=True)
@@ -161,14 +204,12 @@ class DoubleBulletModel(BulletModel):
     """Represents a double bullet model."""
 
     __instancecheck_doublebullet__ = True
+    kind: ClassVar[EntityKind] = EntityKind.DOUBLE_BULLET
 
     @classmethod
     def from_raw(cls, raw: RawBullet) -> DoubleBulletModel:
         """Creates a double bullet from a raw double bullet payload."""
-        data = asdict(raw)
-        data["type"] = BulletType.DOUBLE
-        data["direction"] = Direction(data["direction"])
-        return cls(**data)
+        return cls(raw.id, raw.speed, Direction(raw.direction), BulletType.DOUBLE)
 
 
 @dataclass(slots=True, frozen=True)
@@ -176,6 +217,7 @@ class MineModel:
     """Represents a mine model."""
 
     __instancecheck_mine__ = True
+    kind: ClassVar[EntityKind] = EntityKind.MINE
 
     id: int
     explosion_remaining_ticks: int | None
@@ -188,7 +230,7 @@ class MineModel:
     @classmethod
     def from_raw(cls, raw: RawMine) -> MineModel:
         """Creates a mine from a raw mine payload."""
-        return cls(**asdict(raw))
+        return cls(raw.id, raw.explosion_remaining_ticks)
 
 
 @dataclass(slots=True, frozen=True)
@@ -196,13 +238,34 @@ class ItemModel:
     """Represents an item model."""
 
     __instancecheck_item__ = True
+    kind: ClassVar[EntityKind] = EntityKind.ITEM
 
     type: ItemType
 
     @classmethod
     def from_raw(cls, raw: RawItem) -> ItemModel:
-        """Creates an item from a raw item payload."""
-        return cls(**asdict(raw))
+        """Creates an item from a raw item payload.
+
+        Items of the same type are indistinguishable,
+        so a shared instance is returned for each type.
+        """
+        item = _ITEMS.get(raw.type)
+        return item if item is not None else cls(raw.type)
+
+
+_ITEMS = {t: ItemModel(t) for t in ItemType}
+
+
+_ZONE_STATUSES = {
+    "neutral": ZoneStatus.NEUTRAL,
+    "beingCaptured": ZoneStatus.BEING_CAPTURED,
+    "being_captured": ZoneStatus.BEING_CAPTURED,
+    "captured": ZoneStatus.CAPTURED,
+    "beingContested": ZoneStatus.BEING_CONTESTED,
+    "being_contested": ZoneStatus.BEING_CONTESTED,
+    "beingRetaken": ZoneStatus.BEING_RETAKEN,
+    "being_retaken": ZoneStatus.BEING_RETAKEN,
+}
 
 
 @dataclass(slots=True, frozen=True)
@@ -223,9 +286,9 @@ class ZoneModel(ABC):  # pylint: disable=too-many-instance-attributes
     @classmethod
     def from_raw(cls, raw: RawZone) -> ZoneModel:
         """Creates a zone from a raw zone payload."""
-        data = asdict(raw)
-        status = ZoneStatus(humps.decamelize(data["status"]).upper())
-        data["status"] = status
+        status = _ZONE_STATUSES.get(raw.status)
+        if status is None:
+            status = ZoneStatus(humps.decamelize(raw.status).upper())
 
         if status == ZoneStatus.NEUTRAL:
             zone = NeutralZoneModel
@@ -240,7 +303,18 @@ class ZoneModel(ABC):  # pylint: disable=too-many-instance-attributes
         else:
             raise ValueError(f"Unknown zone status: {status}")  # pragma: no cover
 
-        return zone(**data)
+        return zone(
+            raw.x,
+            raw.y,
+            raw.width,
+            raw.height,
+            raw.index,
+            status,
+            raw.player_id,
+            raw.captured_by_id,
+            raw.retaken_by_id,
+            raw.remaining_ticks,
+        )
 
 
 @dataclass(slots=True, frozen=True)
@@ -302,71 +376,318 @@ if TYPE_CHECKING:
     TileEntity = TankModel | WallModel | BulletModel
 
 
+def _tank_from_raw(raw: RawTank, agent_id: str) -> TankModel:
+    if raw.owner_id == agent_id:
+        return AgentTankModel.from_raw(raw)
+    return TankModel.from_raw(raw)
+
+
+_ENTITY_FACTORIES: dict[str, Callable[[RawTileEntity, str], TileEntity]] = {
+    "tank": _tank_from_raw,
+    "wall": lambda raw, agent_id: _WALL,
+    "bullet": lambda raw, agent_id: BulletModel.from_raw(raw),
+    "laser": lambda raw, agent_id: LaserModel.from_raw(raw),
+    "mine": lambda raw, agent_id: MineModel.from_raw(raw),
+    "item": lambda raw, agent_id: ItemModel.from_raw(raw),
+}
+
+
+# The kinds of the entities indexed by their raw type on the lazy tiles.
+_TYPE_KINDS: dict[str, EntityKind] = {
+    "wall": EntityKind.WALL,
+    "bullet": EntityKind.BULLET,
+    "laser": EntityKind.LASER,
+    "mine": EntityKind.MINE,
+    "item": EntityKind.ITEM,
+}
+
+
+def register_tile_entity(
+    obj_type: str,
+    raw_class: type[RawTileEntity],
+    factory: Callable[[RawTileEntity, str], TileEntity],
+    kind: EntityKind,
+) -> None:
+    """Registers a new tile object type sent by the server.
+
+    The raw entity class parses the payload of the tile object
+    and the factory creates its model. The models must have the given
+    `kind` class attribute, which is used by the predicates
+    and the entity index.
+
+    Parameters
+    ----------
+    obj_type: :class:`str`
+        The type of the tile object as sent by the server.
+    raw_class: type[:class:`RawTileEntity`]
+        The raw entity class created for this type.
+    factory: Callable[[:class:`RawTileEntity`, :class:`str`], TileEntity]
+        The function creating the model from the raw entity
+        and the identifier of your agent.
+    kind: :class:`EntityKind`
+        The kind of the created models.
+
+    Raises
+    ------
+    TypeError
+        If the raw class is not a :class:`RawTileEntity` subclass,
+        the kind is not an :class:`EntityKind` or a created model
+        does not have this kind.
+
+    Examples
+    --------
+
+    ::
+
+        @dataclass(slots=True, frozen=True)
+        class PortalModel:
+            kind: ClassVar[EntityKind] = EntityKind.WALL
+
+        register_tile_entity(
+            "portal", RawWall, lambda raw, agent_id: PortalModel(), EntityKind.WALL
+        )
+    """
+
+    if not isinstance(kind, EntityKind):
+        raise TypeError(f"{kind!r} is not an EntityKind")
+
+    RawTileObject.register(obj_type, raw_class)
+
+    def create(raw: RawTileEntity, agent_id: str) -> TileEntity:
+        entity = factory(raw, agent_id)
+        if getattr(entity, "kind", None) is not kind:
+            raise TypeError(f"The {obj_type!r} model does not have the kind {kind!r}")
+        return entity
+
+    _ENTITY_FACTORIES[obj_type] = create
+    _TYPE_KINDS[obj_type] = kind
+
+
+def _entity_from_raw(obj: RawTileObject, agent_id: str) -> TileEntity:
+    """Creates a tile entity model from a raw tile object."""
+
+    factory = _ENTITY_FACTORIES.get(obj.type)
+    if factory is None:
+        raise ValueError(f"Unknown tile type: {obj.type}")
+    return factory(obj.entity, agent_id)
+
+
+def _zones_by_position(zones: tuple[ZoneModel]) -> dict[tuple[int, int], ZoneModel]:
+    """Maps the (x, y) coordinates of every zone tile to its zone."""
+
+    positions = {}
+    for zone in reversed(zones):
+        for x in range(zone.x, zone.x + zone.width):
+            for y in range(zone.y, zone.y + zone.height):
+                positions[(x, y)] = zone
+    return positions
+
+
+_NO_ENTITIES: tuple[TileEntity, ...] = ()
+
+
 @dataclass(slots=True, frozen=True)
 class TileModel:
-    """Represents a tile model on the map."""
+    """Represents a tile model on the map.
+
+    Tiles without entities share the same empty entities tuple,
+    and equal empty tiles of a map share the same instance.
+    """
 
-    entities: list[TileEntity]
+    entities: tuple[TileEntity, ...]
     zone: ZoneModel | None
     is_visible: bool
 
 
+class LazyTileModel:
+    """Represents a tile model that creates its entities on first access.
+
+    The tile keeps a reference to its raw fragment (either the raw JSON
+    list, with the keys as sent by the server, or the parsed raw tile
+    objects) until the entities are requested.
+    """
+
+    __slots__ = ("_raw", "_agent_id", "_entities", "zone", "is_visible")
+
+    def __init__(
+        self,
+        raw: tuple[RawTileObject] | list[dict],
+        agent_id: str,
+        zone: ZoneModel | None,
+        is_visible: bool,
+    ) -> None:
+        self._raw = raw
+        self._agent_id = agent_id
+        self._entities = None
+        self.zone = zone
+        self.is_visible = is_visible
+
+    @property
+    def entities(self) -> tuple[TileEntity, ...]:
+        """The entities present on the tile."""
+
+        if self._entities is None:
+            self._entities = tuple(
+                _entity_from_raw(
+                    (
+                        obj
+                        if isinstance(obj, RawTileObject)
+                        else RawTileObject.from_json(humps.decamelize(obj))
+                    ),
+                    self._agent_id,
+                )
+                for obj in self._raw
+            )
+            self._raw = None
+        return self._entities
+
+    @property
+    def is_materialized(self) -> bool:
+        """Whether the entities of the tile have already been created."""
+        return self._entities is not None
+
+    def __repr__(self) -> str:
+        entities = self._entities if self._entities is not None else "<lazy>"
+        return (
+            f"LazyTileModel(entities={entities}, zone={self.zone}, "
+            f"is_visible={self.is_visible})"
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class EntityIndexModel:  # pylint: disable=too-many-instance-attributes
+    """Represents an index of the entity positions on the map.
+
+    The positions are `(x, y)` tuples.
+    """
+
+    my_tank: AgentTankModel | None = None
+    my_position: tuple[int, int] | None = None
+    enemy_tanks: dict[str, TankModel] = field(default_factory=dict)
+    enemy_positions: dict[str, tuple[int, int]] = field(default_factory=dict)
+    walls: list[tuple[int, int]] = field(default_factory=list)
+    bullets: list[tuple[int, int]] = field(default_factory=list)
+    lasers: list[tuple[int, int]] = field(default_factory=list)
+    mines: list[tuple[int, int]] = field(default_factory=list)
+    items: list[tuple[int, int]] = field(default_factory=list)
+
+
+class _EntityIndexBuilder:
+    """Collects the entity positions while the map tiles are created."""
+
+    __slots__ = ("my_tank", "my_position", "fields", "_by_kind")
+
+    def __init__(self) -> None:
+        self.my_tank = None
+        self.my_position = None
+        self.fields = fields = {
+            "enemy_tanks": {},
+            "enemy_positions": {},
+            "walls": [],
+            "bullets": [],
+            "lasers": [],
+            "mines": [],
+            "items": [],
+        }
+        self._by_kind = {
+            EntityKind.WALL: fields["walls"],
+            EntityKind.BULLET: fields["bullets"],
+            EntityKind.DOUBLE_BULLET: fields["bullets"],
+            EntityKind.LASER: fields["lasers"],
+            EntityKind.MINE: fields["mines"],
+            EntityKind.ITEM: fields["items"],
+        }
+
+    def add_entities(self, entities: tuple[TileEntity, ...], x: int, y: int) -> None:
+        """Adds the entities of a tile."""
+
+        for entity in entities:
+            kind = getattr(entity, "kind", None)
+            if kind is EntityKind.AGENT_TANK:
+                self.my_tank = entity
+                self.my_position = (x, y)
+            elif kind is EntityKind.TANK:
+                self.fields["enemy_tanks"][entity.owner_id] = entity
+                self.fields["enemy_positions"][entity.owner_id] = (x, y)
+            else:
+                positions = self._by_kind.get(kind)
+                if positions is not None:
+                    positions.append((x, y))
+
+    def add_lazy_tile(self, tile: LazyTileModel, x: int, y: int) -> None:
+        """Adds the entities of a lazy tile.
+
+        Only the tiles with a tank are materialized,
+        the other entities are indexed by their raw type.
+        """
+
+        types = tuple(
+            obj.type if isinstance(obj, RawTileObject) else obj["type"]
+            for obj in tile._raw  # pylint: disable=protected-access
+        )
+        if "tank" in types:
+            self.add_entities(tile.entities, x, y)
+            return
+
+        for obj_type in types:
+            positions = self._by_kind.get(_TYPE_KINDS.get(obj_type))
+            if positions is not None:
+                positions.append((x, y))
+
+    def build(self) -> EntityIndexModel:
+        """Creates the index from the collected positions."""
+        return EntityIndexModel(self.my_tank, self.my_position, **self.fields)
+
+
 @dataclass(slots=True, frozen=True)
 class MapModel:
     """Represents a map model."""
 
-    tiles: tuple[tuple[TileModel]]
+    tiles: tuple[tuple[TileModel | LazyTileModel]]
     zones: tuple[ZoneModel]
     visibility: tuple[str]
+    index: EntityIndexModel = field(default_factory=EntityIndexModel)
 
     @classmethod
-    def from_raw(  # pylint: disable=too-many-locals
-        cls, raw: RawMap, agent_id: str
-    ) -> MapModel:
-        """Creates a map from a raw map payload."""
+    def from_raw(cls, raw: RawMap, agent_id: str, lazy: bool = False) -> MapModel:
+        """Creates a map from a raw map payload.
+
+        If `lazy` is `True`, the entities of each tile
+        are created on the first access to the tile entities,
+        except for the tiles with a tank, which are needed by the index.
+        """
+
         zones = tuple(ZoneModel.from_raw(z) for z in raw.zones)
+        zones_by_position = _zones_by_position(zones)
 
+        index = _EntityIndexBuilder()
+        empty_tiles = {}
         tiles = []
         for x, row in enumerate(raw.tiles):
             tab = []
             for y, raw_tile in enumerate(row):
-                objects = []
-                for obj in raw_tile:
-                    if obj.type == "tank":
-                        raw_tank: RawTank = obj.entity
-                        owner_id = raw_tank.owner_id
-                        if owner_id == agent_id:
-                            objects.append(AgentTankModel.from_raw(obj.entity))
-                        else:
-                            objects.append(TankModel.from_raw(obj.entity))
-                    elif obj.type == "wall":
-                        objects.append(WallModel())
-                    elif obj.type == "bullet":
-                        objects.append(BulletModel.from_raw(obj.entity))
-                    elif obj.type == "laser":
-                        objects.append(LaserModel.from_raw(obj.entity))
-                    elif obj.type == "mine":
-                        objects.append(MineModel.from_raw(obj.entity))
-                    elif obj.type == "item":
-                        objects.append(ItemModel.from_raw(obj.entity))
-                    else:
-                        raise ValueError(f"Unknown tile type: {obj.type}")
-
                 is_visible = raw.visibility[y][x] == "1"
-                zone = next(
-                    (
-                        z
-                        for z in zones
-                        if z.x <= x < z.x + z.width and z.y <= y < z.y + z.height
-                    ),
-                    None,
-                )
-
-                tab.append(TileModel(objects, zone, is_visible))
+                zone = zones_by_position.get((x, y))
+
+                if not raw_tile:
+                    key = (id(zone), is_visible)
+                    tile = empty_tiles.get(key)
+                    if tile is None:
+                        tile = TileModel(_NO_ENTITIES, zone, is_visible)
+                        empty_tiles[key] = tile
+                    tab.append(tile)
+                elif lazy:
+                    tile = LazyTileModel(raw_tile, agent_id, zone, is_visible)
+                    index.add_lazy_tile(tile, x, y)
+                    tab.append(tile)
+                else:
+                    objects = tuple(_entity_from_raw(obj, agent_id) for obj in raw_tile)
+                    index.add_entities(objects, x, y)
+                    tab.append(TileModel(objects, zone, is_visible))
             tiles.append(tuple(tab))
         tiles = tuple(zip(*tiles))
 
-        return MapModel(tuple(tiles), tuple(zones), raw.visibility)
+        return MapModel(tuple(tiles), tuple(zones), raw.visibility, index.build())
 
 
 @dataclass(slots=True, frozen=True)
@@ -378,20 +699,34 @@ class GameStateModel:
     my_agent: PlayerModel
     players: tuple[PlayerModel]
     map: MapModel
+    players_by_id: dict[str, PlayerModel] = field(default_factory=dict)
+
+    @property
+    def index(self) -> EntityIndexModel:
+        """The index of the entity positions on the map."""
+        return self.map.index
 
     @classmethod
-    def from_payload(cls, payload: GameStatePayload, agent_id: str) -> GameStateModel:
-        """Creates a game state from a game state payload."""
+    def from_payload(
+        cls, payload: GameStatePayload, agent_id: str, lazy: bool = False
+    ) -> GameStateModel:
+        """Creates a game state from a game state payload.
+
+        If `lazy` is `True`, the entities of the map tiles
+        are created on the first access to them.
+        """
 
         players = [PlayerModel.from_raw(p) for p in payload.players]
-        agent = next(p for p in players if p.id == agent_id)
+        players_by_id = {p.id: p for p in players}
+        agent = players_by_id[agent_id]
 
         return cls(
             id=payload.id,
             tick=payload.tick,
             my_agent=agent,
             players=players,
-            map=MapModel.from_raw(payload.map, agent.id),
+            map=MapModel.from_raw(payload.map, agent.id, lazy),
+            players_by_id=players_by_id,
         )
 
 
@@ -0,0 +1,213 @@
+"""This module contains the occupancy grids of the enemy tanks.
+
+When an enemy tank leaves the view of your agent, its position is
+described by a probability grid over the tiles of the map. Every tick
+the probability of each tile is spread evenly over the tile and its
+neighbours without walls (a tank moves at most one tile per tick),
+and the tiles visible by your agent without the tank are zeroed.
+
+The grids are numpy arrays indexed as `grid[y][x]`,
+so one update takes a few array operations for the whole map.
+
+This module is not imported by the package, so the bots not using
+the occupancy grids do not need numpy. Import it directly.
+
+Examples
+--------
+
+::
+
+    from hackathon_bot.occupancy import OccupancyTracker
+
+    class MyBot(HackathonBot):
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.occupancy = OccupancyTracker()
+
+        def next_move(self, game_state: GameState) -> ResponseAction:
+            self.occupancy.update(game_state)
+            for owner_id, grid in self.occupancy.grids.items():
+                x, y = grid.most_likely()
+                ...
+
+Classes
+-------
+OccupancyGrid
+    Represents the probability grid of the position of one enemy tank.
+OccupancyTracker
+    Represents the occupancy grids of all enemy tanks in the game.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, Sequence
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .protocols import GameState
+
+
+__all__ = (
+    "OccupancyGrid",
+    "OccupancyTracker",
+)
+
+
+class OccupancyGrid:
+    """Represents the probability grid of the position of one enemy tank.
+
+    Parameters
+    ----------
+    walls: :class:`numpy.ndarray`
+        The boolean wall grid indexed as `walls[y][x]`.
+
+    Attributes
+    ----------
+    probabilities: :class:`numpy.ndarray`
+        The probability of the tank being on each tile,
+        indexed as `probabilities[y][x]`. The probabilities sum up to 1.
+    """
+
+    __slots__ = ("probabilities", "_passable", "_share")
+
+    def __init__(self, walls: np.ndarray) -> None:
+        passable = ~np.asarray(walls, dtype=bool)
+        degree = passable.astype(np.float64)
+        degree[1:, :] += passable[:-1, :]
+        degree[:-1, :] += passable[1:, :]
+        degree[:, 1:] += passable[:, :-1]
+        degree[:, :-1] += passable[:, 1:]
+
+        self._passable = passable
+        # The part of the probability a tile keeps and gives to each neighbour.
+        self._share = np.divide(1.0, degree, out=np.zeros_like(degree), where=passable)
+        self.probabilities = passable / passable.sum()
+
+    def observe(self, x: int, y: int) -> None:
+        """Sets the position of the tank seen by your agent."""
+
+        self.probabilities.fill(0.0)
+        self.probabilities[y, x] = 1.0
+
+    def reset(self, hidden: np.ndarray | None = None) -> None:
+        """Spreads the probability evenly over the tiles without walls.
+
+        If `hidden` is given, only the tiles set in it are considered.
+        """
+
+        grid = self._passable if hidden is None else self._passable & hidden
+        if not grid.any():
+            grid = self._passable
+        self.probabilities = grid / grid.sum()
+
+    def predict(self) -> None:
+        """Spreads the probability by the movement of the tank in one tick."""
+
+        share = self.probabilities * self._share
+        spread = share.copy()
+        spread[1:, :] += share[:-1, :]
+        spread[:-1, :] += share[1:, :]
+        spread[:, 1:] += share[:, :-1]
+        spread[:, :-1] += share[:, 1:]
+        spread *= self._passable
+        self.probabilities = spread
+
+    def exclude(self, visible: np.ndarray) -> None:
+        """Zeroes the visible tiles, where the tank has not been seen.
+
+        If the whole probability was on the visible tiles,
+        it is spread evenly over the hidden tiles.
+        """
+
+        probabilities = self.probabilities
+        probabilities[visible] = 0.0
+        total = probabilities.sum()
+        if total > 0.0:
+            probabilities /= total
+        else:
+            self.reset(~visible)
+
+    def update(self, visible: np.ndarray, position: tuple[int, int] | None) -> None:
+        """Updates the grid with the next tick.
+
+        Parameters
+        ----------
+        visible: :class:`numpy.ndarray`
+            The boolean grid of the tiles visible by your agent.
+        position: tuple[:class:`int`, :class:`int`] | `None`
+            The `(x, y)` position of the tank or `None` if it is not visible.
+        """
+
+        if position is not None:
+            self.observe(*position)
+        else:
+            self.predict()
+            self.exclude(visible)
+
+    def most_likely(self) -> tuple[int, int]:
+        """Returns the `(x, y)` position with the highest probability."""
+
+        y, x = np.unravel_index(np.argmax(self.probabilities), self.probabilities.shape)
+        return int(x), int(y)
+
+
+class OccupancyTracker:
+    """Represents the occupancy grids of all enemy tanks in the game.
+
+    The wall grid is created from the first game state,
+    as the walls do not change during the game.
+
+    Attributes
+    ----------
+    grids: dict[:class:`str`, :class:`OccupancyGrid`]
+        The occupancy grids of the alive enemy tanks by their owner identifiers.
+    """
+
+    __slots__ = ("grids", "_walls")
+
+    def __init__(self) -> None:
+        self.grids: dict[str, OccupancyGrid] = {}
+        self._walls: np.ndarray | None = None
+
+    @staticmethod
+    def visibility_grid(visibility: Sequence[str]) -> np.ndarray:
+        """Returns the boolean grid of the visible tiles."""
+
+        rows = np.frombuffer("".join(visibility).encode("ascii"), dtype=np.uint8)
+        return (rows == ord("1")).reshape(len(visibility), -1)
+
+    @staticmethod
+    def wall_grid(walls: Iterable[tuple[int, int]], dimension: int) -> np.ndarray:
+        """Returns the boolean wall grid from the `(x, y)` wall positions."""
+
+        grid = np.zeros((dimension, dimension), dtype=bool)
+        positions = np.array(list(walls), dtype=np.intp).reshape(-1, 2)
+        grid[positions[:, 1], positions[:, 0]] = True
+        return grid
+
+    def update(self, game_state: GameState) -> None:
+        """Updates the grids with the game state."""
+
+        visibility = game_state.map.visibility
+        index = game_state.index
+        if self._walls is None:
+            self._walls = self.wall_grid(index.walls, len(visibility))
+        visible = self.visibility_grid(visibility)
+
+        for player in game_state.players:
+            if player.id == game_state.my_agent.id:
+                continue
+            if player.is_dead:
+                self.grids.pop(player.id, None)
+                continue
+
+            grid = self.grids.get(player.id)
+            position = index.enemy_positions.get(player.id)
+            if grid is None:
+                grid = self.grids[player.id] = OccupancyGrid(self._walls)
+                if position is None:
+                    grid.reset(~visible)
+                    continue
+            grid.update(visible, position)
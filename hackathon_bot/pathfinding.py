@@ -0,0 +1,380 @@
+"""This module contains the orientation-aware pathfinding.
+
+The tank moves only forward or backward along its direction
+and every rotation takes a tick, so the fastest route is a shortest
+path over the states `(x, y, direction)`, not over the tiles.
+Every edge (moving forward, moving backward, rotating the tank left
+or right) takes exactly one tick, so a breadth-first search over the
+states gives the exact number of ticks.
+
+The transitions of the states are precomputed for the map once,
+and the reverse searches from the goals are cached, so asking for
+the next action towards a zone every tick costs only a table lookup.
+
+To avoid the projectiles, :meth:`OrientedPathfinder.find_safe_path`
+searches over the states in time, `(x, y, direction, tick)`,
+skipping the tiles predicted to be hit in a tick.
+
+Examples
+--------
+
+::
+
+    from hackathon_bot.pathfinding import OrientedPathfinder
+    from hackathon_bot.simulation import to_response_action
+
+    class MyBot(HackathonBot):
+
+        def next_move(self, game_state: GameState) -> ResponseAction:
+            if self.pathfinder is None:
+                walls = ...  # The wall grid, indexed as walls[y][x].
+                self.pathfinder = OrientedPathfinder(walls)
+
+            tank = game_state.index.my_tank
+            x, y = game_state.index.my_position
+            zone = game_state.map.zones[0]
+            goals = [
+                (zone.x + dx, zone.y + dy)
+                for dx in range(zone.width)
+                for dy in range(zone.height)
+            ]
+            actions = self.pathfinder.path_to((x, y, tank.direction), goals)
+            if actions:
+                return to_response_action(actions[0])
+            return Pass()
+
+Classes
+-------
+OrientedPathfinder
+    Represents a pathfinder over the positions and directions of a tank.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections import deque
+from typing import TYPE_CHECKING, Callable, Iterable, Sequence
+
+from .enums import ActionCode
+from .memo import TranspositionTable
+
+if TYPE_CHECKING:
+    from .prediction import ProjectilePrediction
+
+__all__ = ("OrientedPathfinder",)
+
+# The x and y steps of the directions: up, right, down, left.
+_DX = (0, 1, 0, -1)
+_DY = (-1, 0, 1, 0)
+
+# The actions tried by the searches, in the order of preference.
+_ACTIONS = (
+    ActionCode.FORWARD,
+    ActionCode.BACKWARD,
+    ActionCode.TANK_LEFT,
+    ActionCode.TANK_RIGHT,
+)
+_WAITING_ACTIONS = _ACTIONS + (ActionCode.PASS,)
+
+
+class OrientedPathfinder:
+    """Represents a pathfinder over the positions and directions of a tank.
+
+    A state is encoded as `(y * width + x) * 4 + direction`.
+
+    Parameters
+    ----------
+    walls: Sequence[Sequence[:class:`bool`]]
+        The wall grid indexed as `walls[y][x]`.
+    cache_size: :class:`int`
+        The number of goal sets with cached reverse searches.
+
+    Attributes
+    ----------
+    width: :class:`int`
+        The width of the map.
+    height: :class:`int`
+        The height of the map.
+    cache: :class:`TranspositionTable`
+        The cached distances to the goal sets.
+    """
+
+    __slots__ = ("width", "height", "cache", "_walls", "_forward", "_backward")
+
+    def __init__(self, walls: Sequence[Sequence[bool]], cache_size: int = 32) -> None:
+        self.height = height = len(walls)
+        self.width = width = len(walls[0]) if height else 0
+        self.cache = TranspositionTable(cache_size)
+        self._walls = bytes(bool(wall) for row in walls for wall in row)
+
+        # The states reached by moving forward and backward, -1 if blocked.
+        forward = [-1] * (width * height * 4)
+        backward = [-1] * (width * height * 4)
+        for y in range(height):
+            for x in range(width):
+                if self._walls[y * width + x]:
+                    continue
+                for direction in range(4):
+                    state = (y * width + x) * 4 + direction
+                    forward[state] = self._state(
+                        x + _DX[direction], y + _DY[direction], direction
+                    )
+                    backward[state] = self._state(
+                        x - _DX[direction], y - _DY[direction], direction
+                    )
+        self._forward = forward
+        self._backward = backward
+
+    def _state(self, x: int, y: int, direction: int) -> int:
+        if 0 <= x < self.width and 0 <= y < self.height:
+            tile = y * self.width + x
+            if not self._walls[tile]:
+                return tile * 4 + direction
+        return -1
+
+    def encode(self, x: int, y: int, direction: int) -> int:
+        """Returns the state of a position and a direction."""
+        return (y * self.width + x) * 4 + int(direction)
+
+    def decode(self, state: int) -> tuple[int, int, int]:
+        """Returns the `(x, y, direction)` of a state."""
+
+        tile, direction = divmod(state, 4)
+        y, x = divmod(tile, self.width)
+        return x, y, direction
+
+    def successor(self, state: int, action: ActionCode | int) -> int:
+        """Returns the state after the action, -1 if the move is blocked."""
+
+        if action == ActionCode.FORWARD:
+            return self._forward[state]
+        if action == ActionCode.BACKWARD:
+            return self._backward[state]
+        if action == ActionCode.TANK_LEFT:
+            return state - (state & 3) + ((state - 1) & 3)
+        if action == ActionCode.TANK_RIGHT:
+            return state - (state & 3) + ((state + 1) & 3)
+        return state
+
+    def distances_to(self, goals: Iterable[tuple[int, int]]) -> list[int]:
+        """Returns the number of ticks from each state to the nearest goal.
+
+        The goals are `(x, y)` positions reached in any direction.
+        The unreachable states and the walls have the distance -1.
+        The result is cached for the set of goals.
+        """
+
+        goals = frozenset(goals)
+        distances = self.cache.get(goals)
+        if distances is not None:
+            return distances
+
+        distances = [-1] * len(self._forward)
+        queue = deque()
+        for x, y in goals:
+            if self._state(x, y, 0) == -1:
+                continue
+            for direction in range(4):
+                state = self.encode(x, y, direction)
+                distances[state] = 0
+                queue.append(state)
+
+        forward = self._forward
+        backward = self._backward
+        while queue:
+            state = queue.popleft()
+            distance = distances[state] + 1
+            base = state - (state & 3)
+            # The states from which one action leads to this state.
+            for previous in (
+                backward[state],
+                forward[state],
+                base + ((state + 1) & 3),
+                base + ((state - 1) & 3),
+            ):
+                if previous != -1 and distances[previous] == -1:
+                    distances[previous] = distance
+                    queue.append(previous)
+
+        self.cache.put(goals, distances)
+        return distances
+
+    def distance(
+        self,
+        start: tuple[int, int, int],
+        goals: Iterable[tuple[int, int]],
+    ) -> int | None:
+        """Returns the number of ticks from the start to the nearest goal.
+
+        Returns `None` if no goal can be reached.
+        """
+
+        distance = self.distances_to(goals)[self.encode(*start)]
+        return None if distance == -1 else distance
+
+    def path_to(
+        self,
+        start: tuple[int, int, int],
+        goals: Iterable[tuple[int, int]],
+    ) -> list[ActionCode] | None:
+        """Returns the fastest actions from the start to the nearest goal.
+
+        The path follows the cached reverse search from the goals.
+
+        Parameters
+        ----------
+        start: tuple[:class:`int`, :class:`int`, :class:`int`]
+            The `(x, y, direction)` of the tank.
+        goals: Iterable[tuple[:class:`int`, :class:`int`]]
+            The `(x, y)` positions to reach in any direction.
+
+        Returns
+        -------
+        list[ActionCode] | None
+            The actions, empty if the tank is at a goal,
+            or `None` if no goal can be reached.
+        """
+
+        distances = self.distances_to(goals)
+        state = self.encode(*start)
+        if distances[state] == -1:
+            return None
+
+        actions = []
+        while distances[state] > 0:
+            for action in _ACTIONS:
+                following = self.successor(state, action)
+                if following != -1 and distances[following] == distances[state] - 1:
+                    actions.append(action)
+                    state = following
+                    break
+        return actions
+
+    def find_path(
+        self,
+        start: tuple[int, int, int],
+        is_goal: Callable[[int, int], bool],
+        max_ticks: int | None = None,
+    ) -> list[ActionCode] | None:
+        """Returns the fastest actions from the start to a tile
+        satisfying the goal condition.
+
+        Unlike :meth:`path_to`, the search is not cached,
+        which fits goals changing every tick.
+
+        Parameters
+        ----------
+        start: tuple[:class:`int`, :class:`int`, :class:`int`]
+            The `(x, y, direction)` of the tank.
+        is_goal: Callable[[:class:`int`, :class:`int`], :class:`bool`]
+            The function checking if the `(x, y)` tile is a goal.
+        max_ticks: :class:`int` | `None`
+            The maximum length of the path. If `None`, it is not limited.
+
+        Returns
+        -------
+        list[ActionCode] | None
+            The actions, empty if the tank is at a goal,
+            or `None` if no goal can be reached.
+        """
+
+        state = self.encode(*start)
+        parents = {state: None}
+        queue = deque([(state, 0)])
+        while queue:
+            state, ticks = queue.popleft()
+            x, y, _ = self.decode(state)
+            if is_goal(x, y):
+                actions = []
+                while parents[state] is not None:
+                    state, action = parents[state]
+                    actions.append(action)
+                actions.reverse()
+                return actions
+
+            if max_ticks is not None and ticks >= max_ticks:
+                continue
+            for action in _ACTIONS:
+                following = self.successor(state, action)
+                if following != -1 and following not in parents:
+                    parents[following] = (state, action)
+                    queue.append((following, ticks + 1))
+
+        return None
+
+    def find_safe_path(  # pylint: disable=too-many-locals
+        self,
+        start: tuple[int, int, int],
+        goals: Iterable[tuple[int, int]],
+        prediction: ProjectilePrediction,
+        horizon: int | None = None,
+    ) -> list[ActionCode] | None:
+        """Returns the fastest actions to the nearest goal
+        avoiding the predicted projectiles.
+
+        The space-time A* search uses the cached distances to the goals
+        as the heuristic. A move is allowed only if the tile entered
+        is not dangerous in the tick of the move, and the tank may wait
+        in place. If the search reaches the horizon, the rest of the path
+        ignores the projectiles.
+
+        Parameters
+        ----------
+        start: tuple[:class:`int`, :class:`int`, :class:`int`]
+            The `(x, y, direction)` of the tank.
+        goals: Iterable[tuple[:class:`int`, :class:`int`]]
+            The `(x, y)` positions to reach in any direction.
+        prediction: :class:`ProjectilePrediction`
+            The dangerous tiles of the next ticks.
+        horizon: :class:`int` | `None`
+            The number of ticks searched in time.
+            If `None`, the horizon of the prediction is used.
+
+        Returns
+        -------
+        list[ActionCode] | None
+            The actions, empty if the tank is at a goal,
+            or `None` if no goal can be reached safely.
+        """
+
+        goals = frozenset(goals)
+        distances = self.distances_to(goals)
+        if horizon is None:
+            horizon = prediction.horizon
+        danger = [prediction.danger_at(tick) for tick in range(horizon + 1)]
+
+        state = self.encode(*start)
+        if distances[state] == -1:
+            return None
+
+        parents = {(state, 0): None}
+        queue = [(distances[state], 0, state)]
+        while queue:
+            _, tick, state = heapq.heappop(queue)
+            distance = distances[state]
+            if distance == 0 or tick == horizon:
+                actions = []
+                node = (state, tick)
+                while parents[node] is not None:
+                    node, action = parents[node]
+                    actions.append(action)
+                actions.reverse()
+                if distance > 0:
+                    actions += self.path_to(self.decode(state), goals)
+                return actions
+
+            following_tick = tick + 1
+            hits = danger[following_tick]
+            for action in _WAITING_ACTIONS:
+                following = self.successor(state, action)
+                if following == -1 or distances[following] == -1:
+                    continue
+                if hits >> (following >> 2) & 1:
+                    continue
+                node = (following, following_tick)
+                if node not in parents:
+                    parents[node] = ((state, tick), action)
+                    priority = following_tick + distances[following]
+                    heapq.heappush(queue, (priority, following_tick, following))
+
+        return None
@@ -52,18 +52,28 @@ class RawPlayer:
 class RawMap:
     """Represents a raw map data."""
 
-    tiles: tuple[tuple[tuple[RawTileObject] | None]]
+    tiles: tuple[tuple[tuple[RawTileObject] | list[dict]]]
     zones: tuple[RawZone]
     visibility: tuple[str]
 
     @classmethod
-    def from_json(cls, json_data: dict) -> RawMap:
-        """Creates a RawMap from a JSON dictionary."""
-
-        json_data["tiles"] = tuple(
-            tuple(tuple(RawTileObject.from_json(obj) for obj in tile) for tile in row)
-            for row in json_data["tiles"]
-        )
+    def from_json(cls, json_data: dict, lazy: bool = False) -> RawMap:
+        """Creates a RawMap from a JSON dictionary.
+
+        If `lazy` is `True`, the tile objects are not parsed
+        and each tile is kept as its raw JSON list,
+        which may still have the camel case keys of the server.
+        """
+
+        if lazy:
+            json_data["tiles"] = tuple(tuple(row) for row in json_data["tiles"])
+        else:
+            json_data["tiles"] = tuple(
+                tuple(
+                    tuple(RawTileObject.from_json(obj) for obj in tile) for tile in row
+                )
+                for row in json_data["tiles"]
+            )
         json_data["zones"] = tuple(
             RawZone.from_json(zone) for zone in json_data["zones"]
         )
@@ -84,16 +94,51 @@ class RawTileObject:
 
         obj_type = json_data.pop("type")
 
-        payload_class_name = f"Raw{humps.pascalize(obj_type)}"
-        payload_class = globals().get(payload_class_name)
-
-        if payload_class is None or not issubclass(payload_class, RawTileEntity):
-            raise ValueError(f"Unknown tile object class: {payload_class_name}")
+        payload_class = _TILE_ENTITY_CLASSES.get(obj_type)
+        if payload_class is None:
+            payload_class = _resolve_tile_entity_class(obj_type)
 
         entity = payload_class.from_json(json_data.get("payload", {}))
 
         return cls(obj_type, entity)
 
+    @staticmethod
+    def register(obj_type: str, entity_class: type[RawTileEntity]) -> None:
+        """Registers the raw entity class of a tile object type.
+
+        Parameters
+        ----------
+        obj_type: :class:`str`
+            The type of the tile object as sent by the server.
+        entity_class: type[:class:`RawTileEntity`]
+            The raw entity class created for this type.
+        """
+
+        if not issubclass(entity_class, RawTileEntity):
+            raise TypeError(f"{entity_class!r} is not a RawTileEntity subclass")
+        _TILE_ENTITY_CLASSES[obj_type] = entity_class
+
+
+def _resolve_tile_entity_class(obj_type: str) -> type[RawTileEntity]:
+    """Resolves the raw entity class of an unregistered tile object type.
+
+    The class is looked up by its name (for example, `RawWall` for "wall")
+    and registered, so the lookup is done only once per type.
+    """
+
+    payload_class_name = f"Raw{humps.pascalize(obj_type)}"
+    payload_class = globals().get(payload_class_name)
+
+    if (
+        payload_class is None
+        or not isinstance(payload_class, type)
+        or not issubclass(payload_class, RawTileEntity)
+    ):
+        raise ValueError(f"Unknown tile object class: {payload_class_name}")
+
+    RawTileObject.register(obj_type, payload_class)
+    return payload_class
+
 
 @dataclass(slots=True, frozen=True)
 class RawTileEntity(ABC):
@@ -226,6 +271,16 @@ class RawZone:
         return cls(**json_data)
 
 
+_TILE_ENTITY_CLASSES: dict[str, type[RawTileEntity]] = {
+    "wall": RawWall,
+    "bullet": RawBullet,
+    "laser": RawLaser,
+    "mine": RawMine,
+    "item": RawItem,
+    "tank": RawTank,
+}
+
+
 class Payload(ABC):  # pylint: disable=too-few-public-methods
     """Represents a payload that can be attached to a packet."""
 
@@ -270,12 +325,15 @@ class GameStatePayload(Payload):
     map: RawMap
 
     @classmethod
-    def from_json(cls, json_data: dict) -> GameStatePayload:
-        """Creates a GameStatePayload from a JSON dictionary."""
+    def from_json(cls, json_data: dict, lazy: bool = False) -> GameStatePayload:
+        """Creates a GameStatePayload from a JSON dictionary.
+
+        If `lazy` is `True`, the tile objects of the map are not parsed.
+        """
         json_data["players"] = tuple(
             RawPlayer.from_json(player) for player in json_data["players"]
         )
-        json_data["map"] = RawMap.from_json(json_data["map"])
+        json_data["map"] = RawMap.from_json(json_data["map"], lazy)
         return cls(**json_data)
 
 
@@ -0,0 +1,296 @@
+"""This module contains the Monte Carlo tree search planner.
+
+The planner searches the actions of your agent's tank with the forward
+model of the simulation module until a per-tick time budget runs out
+and returns the most visited action. The search tree is kept between
+the ticks: if the new state of the tank is the state predicted for
+the chosen action, the subtree of that action becomes the new root,
+so the work from the previous tick is not lost.
+
+The longer the budget, the more rollouts are made,
+but the planner never runs past its deadline.
+
+Examples
+--------
+
+::
+
+    from hackathon_bot.planner import MCTSPlanner, tick_budget
+
+    class MyBot(HackathonBot):
+
+        def on_lobby_data_received(self, lobby_data: LobbyData) -> None:
+            budget = tick_budget(lobby_data.server_settings)
+            self.planner = MCTSPlanner(budget)
+
+        def next_move(self, game_state: GameState) -> ResponseAction:
+            return self.planner.next_action(game_state)
+
+Classes
+-------
+MCTSPlanner
+    Represents a Monte Carlo tree search planner.
+
+Functions
+---------
+tick_budget
+    Returns the planning time budget of a tick.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import time
+from typing import TYPE_CHECKING, Callable
+
+from .actions import Pass
+from .enums import ActionCode
+from .simulation import TankSimulation, to_response_action
+
+if TYPE_CHECKING:
+    from .actions import ResponseAction
+    from .protocols import GameState, ServerSettings
+
+
+__all__ = (
+    "MCTSPlanner",
+    "tick_budget",
+)
+
+
+def tick_budget(
+    server_settings: ServerSettings,
+    fraction: float = 0.5,
+    margin: float = 0.01,
+) -> float:
+    """Returns the planning time budget of a tick.
+
+    Parameters
+    ----------
+    server_settings: :class:`ServerSettings`
+        The server settings with the broadcast interval.
+    fraction: :class:`float`
+        The part of the broadcast interval used for planning,
+        the rest is left for the network and the other work of the bot.
+    margin: :class:`float`
+        The time in seconds subtracted from the budget.
+
+    Returns
+    -------
+    float
+        The budget in seconds, at least 1 ms.
+    """
+
+    interval = server_settings.broadcast_interval / 1000
+    return max(0.001, interval * fraction - margin)
+
+
+def _default_evaluation(simulation: TankSimulation) -> float:
+    if simulation.is_dead:
+        return 0.0
+    return simulation.health / 100 + 0.01 * simulation.bullet_count
+
+
+class _Node:  # pylint: disable=too-few-public-methods
+    __slots__ = ("action", "parent", "children", "untried", "visits", "value", "state")
+
+    def __init__(
+        self,
+        action: int | None,
+        parent: _Node | None,
+        simulation: TankSimulation,
+    ) -> None:
+        self.action = action
+        self.parent = parent
+        self.children: dict[int, _Node] = {}
+        self.untried = [] if simulation.is_dead else simulation.legal_actions()
+        self.visits = 0
+        self.value = 0.0
+        # The state of the tank without the tick counter.
+        self.state = simulation.snapshot()[:-1]
+
+
+class MCTSPlanner:  # pylint: disable=too-many-instance-attributes
+    """Represents a Monte Carlo tree search planner.
+
+    Parameters
+    ----------
+    budget: :class:`float`
+        The planning time budget of a tick in seconds (see :func:`tick_budget`).
+    evaluate: Callable[[:class:`TankSimulation`], :class:`float`] | `None`
+        The function scoring the state at the end of a rollout,
+        higher is better. If `None`, the health and the bullets
+        of the tank are scored.
+    rollout_depth: :class:`int`
+        The number of random actions of a rollout.
+    exploration: :class:`float`
+        The exploration constant of the UCT formula.
+    seed: :class:`int` | `None`
+        The seed of the random rollouts.
+    simulation_options: :class:`dict` | `None`
+        The rules passed to :meth:`TankSimulation.from_game_state`.
+
+    Attributes
+    ----------
+    iterations: :class:`int`
+        The number of iterations of the last search.
+    reused: :class:`bool`
+        Whether the last search reused the tree of the previous tick.
+    """
+
+    __slots__ = (
+        "budget",
+        "evaluate",
+        "rollout_depth",
+        "exploration",
+        "simulation_options",
+        "iterations",
+        "reused",
+        "_random",
+        "_root",
+    )
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        budget: float,
+        evaluate: Callable[[TankSimulation], float] | None = None,
+        rollout_depth: int = 8,
+        exploration: float = 1.4,
+        seed: int | None = None,
+        simulation_options: dict | None = None,
+    ) -> None:
+        self.budget = budget
+        self.evaluate = evaluate or _default_evaluation
+        self.rollout_depth = rollout_depth
+        self.exploration = exploration
+        self.simulation_options = simulation_options or {}
+        self.iterations = 0
+        self.reused = False
+        self._random = random.Random(seed)
+        self._root: _Node | None = None
+
+    def next_action(self, game_state: GameState) -> ResponseAction:
+        """Returns the best response action for the game state.
+
+        While the tank of your agent is dead, the search tree
+        is dropped and :class:`Pass` is returned.
+        """
+
+        if game_state.index.my_tank is None:
+            self._root = None
+            return Pass()
+
+        simulation = TankSimulation.from_game_state(
+            game_state, **self.simulation_options
+        )
+        return to_response_action(self.plan(simulation))
+
+    def plan(self, simulation: TankSimulation, budget: float | None = None) -> int:
+        """Searches the actions until the budget runs out.
+
+        Parameters
+        ----------
+        simulation: :class:`TankSimulation`
+            The current state of the tank. It is restored after the search.
+        budget: :class:`float` | `None`
+            The time budget in seconds. If `None`, the planner budget is used.
+
+        Returns
+        -------
+        ActionCode | int
+            The most visited action.
+        """
+
+        deadline = time.perf_counter() + (self.budget if budget is None else budget)
+        root = self._find_root(simulation)
+        start = simulation.snapshot()
+
+        iterations = 0
+        while True:
+            self._iterate(root, simulation)
+            simulation.restore(start)
+            iterations += 1
+            if time.perf_counter() >= deadline:
+                break
+
+        self.iterations = iterations
+        if not root.children:
+            self._root = None
+            return ActionCode.PASS
+
+        best = max(root.children.values(), key=lambda child: child.visits)
+        # The chosen subtree is the candidate root of the next tick.
+        self._root = best
+        return best.action
+
+    @property
+    def best_actions(self) -> list[ActionCode | int]:
+        """The most visited line of actions, starting with
+        the action chosen in the last search."""
+
+        actions = []
+        node = self._root
+        while node is not None and node.action is not None:
+            actions.append(node.action)
+            if not node.children:
+                break
+            node = max(node.children.values(), key=lambda child: child.visits)
+        return actions
+
+    def reset(self) -> None:
+        """Drops the search tree, e.g. after the tank has been destroyed."""
+        self._root = None
+
+    def _find_root(self, simulation: TankSimulation) -> _Node:
+        state = simulation.snapshot()[:-1]
+        root = self._root
+        self.reused = root is not None and root.state == state
+        if not self.reused:
+            root = _Node(None, None, simulation)
+        root.parent = None
+        return root
+
+    def _iterate(self, root: _Node, simulation: TankSimulation) -> None:
+        node = root
+
+        # Selection
+        while not node.untried and node.children:
+            node = self._select(node)
+            simulation.step(node.action)
+
+        # Expansion
+        if node.untried:
+            action = node.untried.pop(self._random.randrange(len(node.untried)))
+            simulation.step(action)
+            child = _Node(action, node, simulation)
+            node.children[action] = child
+            node = child
+
+        # Rollout
+        choice = self._random.choice
+        for _ in range(self.rollout_depth):
+            if simulation.is_dead:
+                break
+            simulation.step(choice(simulation.legal_actions()))
+        value = self.evaluate(simulation)
+
+        # Backpropagation
+        while node is not None:
+            node.visits += 1
+            node.value += value
+            node = node.parent
+
+    def _select(self, node: _Node) -> _Node:
+        log_visits = math.log(node.visits)
+        exploration = self.exploration
+        best = None
+        best_score = -math.inf
+        for child in node.children.values():
+            score = child.value / child.visits + exploration * math.sqrt(
+                log_visits / child.visits
+            )
+            if score > best_score:
+                best = child
+                best_score = score
+        return best
@@ -0,0 +1,137 @@
+"""This module contains fast predicates for tile entities.
+
+The predicates check the `kind` class attribute of the entity models,
+which is much cheaper than `isinstance` with the runtime checkable
+protocols, as those probe the attributes of the entity on every call.
+Use them in loops that scan many tiles, for example the whole map.
+
+Using `isinstance` with the protocols keeps working
+and gives the same results as the predicates.
+
+Examples
+--------
+
+::
+
+    for row in game_state.map.tiles:
+        for tile in row:
+            for entity in tile.entities:
+                if is_wall(entity):
+                    # The entity is a wall.
+                elif is_agent_tank(entity):
+                    # The entity is your agent's tank.
+                elif is_tank(entity):
+                    # The entity is another player's tank.
+
+Functions
+---------
+is_tank
+    Whether the entity is a tank (including your agent's tank).
+is_agent_tank
+    Whether the entity is your agent's tank.
+is_enemy_tank
+    Whether the entity is a tank of another player.
+is_wall
+    Whether the entity is a wall.
+is_bullet
+    Whether the entity is a bullet (including a double bullet).
+is_double_bullet
+    Whether the entity is a double bullet.
+is_laser
+    Whether the entity is a laser.
+is_mine
+    Whether the entity is a mine.
+is_item
+    Whether the entity is an item.
+is_obstacle_or_hazard
+    Whether the entity is a wall, a mine or a laser.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .enums import EntityKind
+
+if TYPE_CHECKING:
+    from .protocols import TileEntity
+
+__all__ = (
+    "is_tank",
+    "is_agent_tank",
+    "is_enemy_tank",
+    "is_wall",
+    "is_bullet",
+    "is_double_bullet",
+    "is_laser",
+    "is_mine",
+    "is_item",
+    "is_obstacle_or_hazard",
+)
+
+_TANK = EntityKind.TANK
+_AGENT_TANK = EntityKind.AGENT_TANK
+_WALL = EntityKind.WALL
+_BULLET = EntityKind.BULLET
+_DOUBLE_BULLET = EntityKind.DOUBLE_BULLET
+_LASER = EntityKind.LASER
+_MINE = EntityKind.MINE
+_ITEM = EntityKind.ITEM
+
+_TANK_KINDS = frozenset((_TANK, _AGENT_TANK))
+_BULLET_KINDS = frozenset((_BULLET, _DOUBLE_BULLET))
+_OBSTACLE_OR_HAZARD_KINDS = frozenset((_WALL, _MINE, _LASER))
+
+
+def is_tank(entity: TileEntity) -> bool:
+    """Whether the entity is a tank (including your agent's tank)."""
+    return entity.kind in _TANK_KINDS
+
+
+def is_agent_tank(entity: TileEntity) -> bool:
+    """Whether the entity is your agent's tank."""
+    return entity.kind is _AGENT_TANK
+
+
+def is_enemy_tank(entity: TileEntity) -> bool:
+    """Whether the entity is a tank of another player."""
+    return entity.kind is _TANK
+
+
+def is_wall(entity: TileEntity) -> bool:
+    """Whether the entity is a wall."""
+    return entity.kind is _WALL
+
+
+def is_bullet(entity: TileEntity) -> bool:
+    """Whether the entity is a bullet (including a double bullet)."""
+    return entity.kind in _BULLET_KINDS
+
+
+def is_double_bullet(entity: TileEntity) -> bool:
+    """Whether the entity is a double bullet."""
+    return entity.kind is _DOUBLE_BULLET
+
+
+def is_laser(entity: TileEntity) -> bool:
+    """Whether the entity is a laser."""
+    return entity.kind is _LASER
+
+
+def is_mine(entity: TileEntity) -> bool:
+    """Whether the entity is a mine."""
+    return entity.kind is _MINE
+
+
+def is_item(entity: TileEntity) -> bool:
+    """Whether the entity is an item."""
+    return entity.kind is _ITEM
+
+
+def is_obstacle_or_hazard(entity: TileEntity) -> bool:
+    """Whether the entity is a wall, a mine or a laser.
+
+    Only a wall blocks the movement, but entering a tile
+    with a mine or a laser damages the tank.
+    """
+    return entity.kind in _OBSTACLE_OR_HAZARD_KINDS
@@ -0,0 +1,144 @@
+"""This module contains the prediction of the projectiles.
+
+The prediction tells which tiles are dangerous in each of the next
+ticks: the tiles the visible bullets fly through, the tiles hit by
+the lasers and the tiles with mines that have not exploded yet.
+The dangerous tiles of each tick are stored as a bitboard,
+so the prediction doubles as a reservation table of a space-time
+search, where a tile can also be reserved manually.
+
+Examples
+--------
+
+::
+
+    from hackathon_bot.prediction import ProjectilePrediction
+
+    prediction = ProjectilePrediction.from_game_state(game_state, horizon=12)
+    if prediction.is_dangerous(x, y, 1):
+        # A projectile hits the tile in the next tick.
+
+Classes
+-------
+ProjectilePrediction
+    Represents the dangerous tiles of the next ticks.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .bitboard import BitboardGeometry, MapBitboards
+from .enums import Direction
+from .predicates import is_bullet, is_mine
+
+if TYPE_CHECKING:
+    from .protocols import GameState
+
+
+__all__ = ("ProjectilePrediction",)
+
+
+@dataclass(slots=True)
+class ProjectilePrediction:
+    """Represents the dangerous tiles of the next ticks.
+
+    Attributes
+    ----------
+    geometry: :class:`BitboardGeometry`
+        The geometry of the bitboards.
+    danger: list[:class:`int`]
+        The bitboards of the dangerous tiles, where the `t`-th one
+        contains the tiles hit during the `t`-th tick from now
+        (0 is the current state). The last one holds for all later ticks.
+    """
+
+    geometry: BitboardGeometry
+    danger: list[int]
+
+    @property
+    def horizon(self) -> int:
+        """The number of predicted ticks."""
+        return len(self.danger) - 1
+
+    @classmethod
+    def from_game_state(  # pylint: disable=too-many-locals
+        cls,
+        game_state: GameState,
+        horizon: int = 16,
+        bullet_speed: int = 2,
+        laser_ticks: int = 1,
+        layers: MapBitboards | None = None,
+    ) -> ProjectilePrediction:
+        """Predicts the dangerous tiles from a game state.
+
+        The bullets fly straight until they hit a wall, sweeping
+        the tile they start from and all tiles on their way in each tick.
+        The lasers are dangerous for `laser_ticks` ticks
+        and the mines that have not exploded yet are always dangerous.
+
+        Parameters
+        ----------
+        game_state: :class:`GameState`
+            The game state.
+        horizon: :class:`int`
+            The number of predicted ticks.
+        bullet_speed: :class:`int`
+            The number of tiles a bullet moves in a tick.
+        laser_ticks: :class:`int`
+            The number of ticks the current lasers stay dangerous.
+        layers: :class:`MapBitboards` | `None`
+            The bitboards of the map. If `None`, they are created.
+        """
+
+        if layers is None:
+            layers = MapBitboards.from_map(game_state.map)
+        geometry = layers.geometry
+        walls = layers.walls
+        index = game_state.index
+        tiles = game_state.map.tiles
+
+        bullets = {direction: 0 for direction in Direction}
+        for x, y in index.bullets:
+            for entity in tiles[y][x].entities:
+                if is_bullet(entity):
+                    bullets[entity.direction] |= geometry.bit(x, y)
+
+        mines = geometry.from_positions(
+            (x, y)
+            for x, y in index.mines
+            if any(is_mine(e) and not e.exploded for e in tiles[y][x].entities)
+        )
+        lasers = geometry.from_positions(index.lasers)
+
+        danger = [mines | lasers | geometry.from_positions(index.bullets)]
+        for tick in range(1, horizon + 1):
+            swept = 0
+            for direction, board in bullets.items():
+                # A tank entering the tile a bullet leaves is hit as well.
+                swept |= board
+                for _ in range(bullet_speed):
+                    board = geometry.shift(board, direction) & ~walls
+                    swept |= board
+                bullets[direction] = board
+            if tick <= laser_ticks:
+                swept |= lasers
+            danger.append(swept | mines)
+
+        return cls(geometry, danger)
+
+    def danger_at(self, tick: int) -> int:
+        """Returns the bitboard of the tiles dangerous in the tick."""
+        return self.danger[min(tick, len(self.danger) - 1)]
+
+    def is_dangerous(self, x: int, y: int, tick: int) -> bool:
+        """Whether the tile is dangerous in the tick."""
+        return self.geometry.contains(self.danger_at(tick), x, y)
+
+    def reserve(self, x: int, y: int, tick: int) -> None:
+        """Marks the tile as dangerous in the tick,
+        e.g. when it is taken by another tank."""
+
+        tick = min(tick, len(self.danger) - 1)
+        self.danger[tick] |= self.geometry.bit(x, y)
@@ -55,6 +55,7 @@ __all__ = (
     "BeingContestedZone",
     "BeingRetakenZone",
     "Map",
+    "EntityIndex",
     "GameState",
     "GameResult",
 )
@@ -864,7 +865,7 @@ class Tile(Protocol):
 
     Attributes
     ----------
-    entities: list[:class:`TileEntity`]
+    entities: tuple[:class:`TileEntity`, ...]
         The entities present on the tile.
     zone: :class:`Zone` | `None`
         The zone in the tile.
@@ -873,7 +874,7 @@ class Tile(Protocol):
     """
 
     @property
-    def entities(self) -> list[TileEntity]:
+    def entities(self) -> tuple[TileEntity, ...]:
         """The entities present on the tile.
 
         The entity can be one of the following types:
@@ -1013,6 +1014,75 @@ class Map(Protocol):
         """The zones on the map."""
 
 
+class EntityIndex(Protocol):
+    """Represents an index of the entity positions on the map.
+
+    The index is created together with the map,
+    so it does not require another pass over the tiles.
+    The positions are `(x, y)` tuples.
+
+    Attributes
+    ----------
+    my_tank: :class:`AgentTank` | `None`
+        The tank of your agent or `None` if your agent is dead.
+    my_position: tuple[:class:`int`, :class:`int`] | `None`
+        The position of your tank or `None` if your agent is dead.
+    enemy_tanks: dict[:class:`str`, :class:`PlayerTank`]
+        The visible tanks of the other players by their owner identifiers.
+    enemy_positions: dict[:class:`str`, tuple[:class:`int`, :class:`int`]]
+        The positions of the visible tanks of the other players
+        by their owner identifiers.
+    walls: list[tuple[:class:`int`, :class:`int`]]
+        The positions of the walls.
+    bullets: list[tuple[:class:`int`, :class:`int`]]
+        The positions of the visible bullets, including double bullets.
+    lasers: list[tuple[:class:`int`, :class:`int`]]
+        The positions of the visible lasers.
+    mines: list[tuple[:class:`int`, :class:`int`]]
+        The positions of the visible mines.
+    items: list[tuple[:class:`int`, :class:`int`]]
+        The positions of the visible items.
+    """
+
+    @property
+    def my_tank(self) -> AgentTank | None:
+        """The tank of your agent or `None` if your agent is dead."""
+
+    @property
+    def my_position(self) -> tuple[int, int] | None:
+        """The position of your tank or `None` if your agent is dead."""
+
+    @property
+    def enemy_tanks(self) -> dict[str, PlayerTank]:
+        """The visible tanks of the other players by their owner identifiers."""
+
+    @property
+    def enemy_positions(self) -> dict[str, tuple[int, int]]:
+        """The positions of the visible tanks of the other players
+        by their owner identifiers.
+        """
+
+    @property
+    def walls(self) -> list[tuple[int, int]]:
+        """The positions of the walls."""
+
+    @property
+    def bullets(self) -> list[tuple[int, int]]:
+        """The positions of the visible bullets, including double bullets."""
+
+    @property
+    def lasers(self) -> list[tuple[int, int]]:
+        """The positions of the visible lasers."""
+
+    @property
+    def mines(self) -> list[tuple[int, int]]:
+        """The positions of the visible mines."""
+
+    @property
+    def items(self) -> list[tuple[int, int]]:
+        """The positions of the visible items."""
+
+
 class GameState(Protocol):
     """Represents the game state.
 
@@ -1029,6 +1099,10 @@ class GameState(Protocol):
         including your agent.
     map: :class:`Map`
         The map of the game state.
+    players_by_id: dict[:class:`str`, :class:`GameStatePlayer`]
+        The players in the game state by their identifiers.
+    index: :class:`EntityIndex`
+        The index of the entity positions on the map.
     """
 
     @property
@@ -1063,6 +1137,14 @@ class GameState(Protocol):
     def map(self) -> Map:
         """The map of the game state."""
 
+    @property
+    def players_by_id(self) -> dict[str, GameStatePlayer]:
+        """The players in the game state by their identifiers."""
+
+    @property
+    def index(self) -> EntityIndex:
+        """The index of the entity positions on the map."""
+
 
 class GameResult(Protocol):
     """Represents the game result.
@@ -0,0 +1,172 @@
+"""This module contains the precomputed rays of the map.
+
+A bullet or a laser flies straight until it hits a wall, so whether
+a tile can be shot from another one depends only on the walls between
+them. The walls do not change during the game, so the distances from
+every tile to the first wall in each of the four directions are
+computed once, and the line-of-fire queries become table lookups
+instead of scans of the tiles in between.
+
+Examples
+--------
+
+::
+
+    from hackathon_bot.rays import RayTable
+
+    class MyBot(HackathonBot):
+
+        def next_move(self, game_state: GameState) -> ResponseAction:
+            if self.rays is None:
+                walls = ...  # The wall grid, indexed as walls[y][x].
+                self.rays = RayTable(walls)
+
+            x, y = game_state.index.my_position
+            for enemy_position in game_state.index.enemy_positions.values():
+                direction = self.rays.shot_direction((x, y), enemy_position)
+                if direction is not None:
+                    # The enemy can be shot by turning the turret.
+
+Classes
+-------
+RayTable
+    Represents the distances from the tiles to the walls in each direction.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from .enums import Direction
+
+__all__ = ("RayTable",)
+
+# The x and y steps of the directions: up, right, down, left.
+_DX = (0, 1, 0, -1)
+_DY = (-1, 0, 1, 0)
+
+
+class RayTable:
+    """Represents the distances from the tiles to the walls in each direction.
+
+    The reach of a tile in a direction is the number of free tiles
+    between the tile and the first wall or the edge of the map.
+    The reach of a wall is 0.
+
+    Parameters
+    ----------
+    walls: Sequence[Sequence[:class:`bool`]]
+        The wall grid indexed as `walls[y][x]`.
+
+    Attributes
+    ----------
+    width: :class:`int`
+        The width of the map.
+    height: :class:`int`
+        The height of the map.
+    """
+
+    __slots__ = ("width", "height", "_reach")
+
+    def __init__(self, walls: Sequence[Sequence[bool]]) -> None:
+        self.height = height = len(walls)
+        self.width = width = len(walls[0]) if height else 0
+        cells = bytes(bool(wall) for row in walls for wall in row)
+
+        # The reach is indexed as (y * width + x) * 4 + direction.
+        # Each direction is filled from the edge it points to,
+        # so the reach of the next tile is always known.
+        reach = [0] * (width * height * 4)
+        for direction in range(4):
+            dx = _DX[direction]
+            dy = _DY[direction]
+            xs = range(width - 1, -1, -1) if dx > 0 else range(width)
+            ys = range(height - 1, -1, -1) if dy > 0 else range(height)
+            for y in ys:
+                for x in xs:
+                    nx = x + dx
+                    ny = y + dy
+                    if cells[y * width + x] or not (
+                        0 <= nx < width and 0 <= ny < height
+                    ):
+                        continue
+                    following = ny * width + nx
+                    if not cells[following]:
+                        reach[(y * width + x) * 4 + direction] = (
+                            reach[following * 4 + direction] + 1
+                        )
+        self._reach = reach
+
+    def reach(self, x: int, y: int, direction: Direction | int) -> int:
+        """Returns the number of free tiles from the tile
+        to the first wall in the direction."""
+        return self._reach[(y * self.width + x) * 4 + int(direction)]
+
+    def ray(self, x: int, y: int, direction: Direction | int) -> list[tuple[int, int]]:
+        """Returns the free tiles from the tile to the first wall
+        in the direction, nearest first."""
+
+        direction = int(direction)
+        dx = _DX[direction]
+        dy = _DY[direction]
+        return [
+            (x + dx * step, y + dy * step)
+            for step in range(1, self.reach(x, y, direction) + 1)
+        ]
+
+    def shot_direction(
+        self,
+        source: tuple[int, int],
+        target: tuple[int, int],
+    ) -> Direction | None:
+        """Returns the direction of a shot from the source to the target.
+
+        Returns `None` if the tiles are not in one line, if there is a wall
+        between them or if they are the same tile.
+        """
+
+        sx, sy = source
+        tx, ty = target
+        if sx == tx and sy != ty:
+            direction = Direction.DOWN if ty > sy else Direction.UP
+            distance = abs(ty - sy)
+        elif sy == ty and sx != tx:
+            direction = Direction.RIGHT if tx > sx else Direction.LEFT
+            distance = abs(tx - sx)
+        else:
+            return None
+
+        if self._reach[(sy * self.width + sx) * 4 + direction] < distance:
+            return None
+        return direction
+
+    def can_shoot(self, source: tuple[int, int], target: tuple[int, int]) -> bool:
+        """Whether the target can be shot from the source.
+
+        A tile can always be shot from itself.
+        """
+
+        if source[0] == target[0] and source[1] == target[1]:
+            return True
+        return self.shot_direction(source, target) is not None
+
+    def shooting_positions(
+        self,
+        x: int,
+        y: int,
+    ) -> list[tuple[int, int, Direction]]:
+        """Returns the tiles with a clear shot at the tile.
+
+        Returns
+        -------
+        list[tuple[:class:`int`, :class:`int`, :class:`Direction`]]
+            The `(x, y, direction)` of the tiles, where the direction
+            is the one the turret must face to hit the tile.
+        """
+
+        positions = []
+        for direction in Direction:
+            # The shooters in the direction face the opposite way.
+            facing = Direction((direction + 2) & 3)
+            positions += ((px, py, facing) for px, py in self.ray(x, y, direction))
+        return positions
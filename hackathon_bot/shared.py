@@ -0,0 +1,312 @@
+"""This module contains the tables shared between the bot processes.
+
+Several bots started on one host (e.g. by `run.sh`) play on the same
+map, so each of them would compute and hold its own copy of the same
+distance, visibility or ray tables. With a shared store, the first
+process computing a table publishes it in a file of a memory-backed
+directory (`/dev/shm` if it exists) and the other processes map it
+read-only, so they share its pages without copying it and without
+computing it again.
+
+A table is written to a temporary file and linked under its name
+only after the whole table is written, so a process never maps
+a partly written table. The process computing a table claims it with
+its process id, so the other processes wait for it instead of computing
+it as well. A claim left by a dead process is taken over at once,
+and any claim older than the timeout is taken over as well.
+
+The tables outlive the processes, so that the bots of the next match
+map them as well. They are removed with :meth:`SharedTables.unlink`.
+
+Examples
+--------
+
+::
+
+    from hackathon_bot.cache import map_key
+    from hackathon_bot.shared import SharedTables
+
+    class MyBot(HackathonBot):
+
+        def on_lobby_data_received(self, lobby_data: LobbyData) -> None:
+            self.seed = lobby_data.server_settings.seed
+            self.shared = SharedTables()
+
+        def next_move(self, game_state: GameState) -> ResponseAction:
+            if self.distances is None:
+                walls = ...  # The wall grid, indexed as walls[y][x].
+                key = map_key(self.seed, len(walls), walls)
+                self.distances = self.shared.get_or_compute(
+                    key, "distances", lambda: compute_distances(walls)
+                )
+
+Classes
+-------
+SharedTables
+    Represents a host-wide store of read-only tables in shared memory.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import tempfile
+import time
+from array import array
+from typing import Callable
+
+from .cache import table_typecode
+
+__all__ = ("SharedTables",)
+
+# The header: the magic, the typecode and the item size of the table,
+# and the number of items. It is 16 bytes long to align the items.
+_HEADER = struct.Struct("<4scB2xQ")
+_MAGIC = b"HBS2"
+_SUFFIX = ".table"
+
+# The claim: the id of the claiming process and the time of the claim.
+_CLAIM = struct.Struct("<qd")
+_CLAIM_SUFFIX = ".claim"
+
+_Table = array | bytes | bytearray | memoryview
+
+
+def _default_directory() -> str:
+    # The files of /dev/shm are kept in memory on Linux,
+    # the other systems share the pages of the mapped files anyway.
+    root = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(root, "hackathon_bot")
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _is_running(pid: int) -> bool:
+    if os.name != "posix":
+        # Only the age of the claim is checked.
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _view(path: str) -> memoryview | None:
+    # Returns None for a missing or damaged table.
+    try:
+        with open(path, "rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # ValueError is raised for empty files.
+        return None
+
+    view = memoryview(mapped)
+    try:
+        magic, typecode, itemsize, count = _HEADER.unpack_from(view)
+        typecode = typecode.decode()
+        if (
+            magic != _MAGIC
+            or array(typecode).itemsize != itemsize
+            or len(view) != _HEADER.size + count * itemsize
+        ):
+            raise ValueError("damaged table")
+        return view[_HEADER.size :].cast(typecode)
+    except (struct.error, ValueError, UnicodeDecodeError):
+        view.release()
+        mapped.close()
+        return None
+
+
+class SharedTables:
+    """Represents a host-wide store of read-only tables in shared memory.
+
+    The tables are flat arrays of numbers, keyed like the tables
+    of :class:`PrecomputationCache`. A table stays mapped
+    in the process as long as any view of it exists.
+
+    Parameters
+    ----------
+    directory: :class:`str` | `None`
+        The directory of the tables, created if it does not exist.
+        If `None`, `hackathon_bot` in `/dev/shm` (or in the temporary
+        directory of the system) is used.
+    timeout: :class:`float`
+        The number of seconds to wait for a table computed
+        by another process before computing it.
+    """
+
+    __slots__ = ("directory", "timeout")
+
+    def __init__(self, directory: str | None = None, timeout: float = 5.0) -> None:
+        if directory is None:
+            directory = _default_directory()
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.timeout = timeout
+
+    def _path(self, key: str, name: str, suffix: str = _SUFFIX) -> str:
+        return os.path.join(self.directory, f"{key}.{name}{suffix}")
+
+    def attach(self, key: str, name: str) -> memoryview | None:
+        """Returns the table published by any process, `None` if there is none.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The key of the map, see :func:`map_key`.
+        name: :class:`str`
+            The name of the table, e.g. `"distances"`.
+
+        Returns
+        -------
+        :class:`memoryview` | `None`
+            The read-only table, cast to its typecode.
+        """
+
+        return _view(self._path(key, name))
+
+    def publish(self, key: str, name: str, table: _Table) -> memoryview | None:
+        """Publishes the table for the other processes.
+
+        Returns
+        -------
+        :class:`memoryview` | `None`
+            The read-only published table, or `None` if another process
+            has already published the table.
+        """
+
+        typecode = table_typecode(table)
+        itemsize = array(typecode).itemsize
+        data = memoryview(table).cast("B")
+        header = _HEADER.pack(
+            _MAGIC, typecode.encode(), itemsize, len(data) // itemsize
+        )
+
+        path = self._path(key, name)
+        descriptor, temporary = tempfile.mkstemp(
+            ".tmp", f"{key}.{name}.", self.directory
+        )
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(header)
+                file.write(data)
+            # Unlike a rename, the link fails if the table exists,
+            # so a published table is never replaced.
+            os.link(temporary, path)
+        except FileExistsError:
+            return None
+        finally:
+            _remove(temporary)
+        return _view(path)
+
+    def get_or_compute(
+        self,
+        key: str,
+        name: str,
+        compute: Callable[[], _Table],
+    ) -> memoryview:
+        """Returns the shared table, computing and publishing it
+        if no process has published it yet.
+
+        If the table is being computed by another process,
+        it is awaited for at most :attr:`timeout` seconds,
+        then computed and published again.
+
+        Returns
+        -------
+        :class:`memoryview`
+            The read-only table, cast to its typecode.
+        """
+
+        view = self.attach(key, name)
+        if view is not None:
+            return view
+
+        # The first process creating the claim computes the table,
+        # the others wait for it instead of computing it as well.
+        if not self._claim(key, name):
+            deadline = time.monotonic() + self.timeout
+            while True:
+                view = self.attach(key, name)
+                if view is not None:
+                    return view
+                if self._claim(key, name):
+                    break
+                if time.monotonic() >= deadline:
+                    # The claim is taken over, so the next processes
+                    # do not wait for it as well.
+                    self._claim(key, name, force=True)
+                    break
+                time.sleep(0.001)
+
+        try:
+            computed = compute()
+        except BaseException:
+            # The claim is released, so the other processes compute
+            # the table instead of waiting for it.
+            _remove(self._path(key, name, _CLAIM_SUFFIX))
+            raise
+        view = self.publish(key, name, computed)
+        if view is None:
+            # Another process has published the table in the meantime,
+            # or a damaged file is in its place. Such a file is replaced,
+            # so the next processes do not fail to map it as well.
+            view = self.attach(key, name)
+            if view is None:
+                _remove(self._path(key, name))
+                view = self.publish(key, name, computed)
+        if view is not None:
+            return view
+        return memoryview(computed).toreadonly()
+
+    def _claim(self, key: str, name: str, force: bool = False) -> bool:
+        # Creates the claim of the table, replacing a stale one.
+        # Returns whether the claim belongs to this process.
+        path = self._path(key, name, _CLAIM_SUFFIX)
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL
+        try:
+            descriptor = os.open(path, flags, 0o600)
+        except FileExistsError:
+            if not force and not self._is_stale(path):
+                return False
+            _remove(path)
+            try:
+                descriptor = os.open(path, flags, 0o600)
+            except FileExistsError:
+                # Another process has taken over the claim first.
+                return False
+
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(_CLAIM.pack(os.getpid(), time.time()))
+        return True
+
+    def _is_stale(self, path: str) -> bool:
+        try:
+            with open(path, "rb") as file:
+                claim = file.read(_CLAIM.size)
+        except FileNotFoundError:
+            return True
+        if len(claim) < _CLAIM.size:
+            # The claim is not written yet.
+            return False
+        pid, claimed = _CLAIM.unpack(claim)
+        return not _is_running(pid) or time.time() - claimed > self.timeout
+
+    def unlink(self, key: str, name: str) -> None:
+        """Removes the table from the host.
+
+        The processes attached to it keep their views,
+        the next ones compute and publish it again.
+        """
+
+        _remove(self._path(key, name))
+        _remove(self._path(key, name, _CLAIM_SUFFIX))
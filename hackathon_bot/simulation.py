@@ -0,0 +1,410 @@
+"""This module contains the forward model of your agent's tank.
+
+The forward model answers the question "what happens if my tank
+does these actions in the next ticks". It applies the actions,
+encoded as :class:`ActionCode`, to a small mutable state of the tank
+against the static walls of the map and moves the known bullets.
+
+Every applied action can be undone in constant time, and the state
+can be copied or saved in constant time, so a search can expand
+many nodes without creating a new state for each of them.
+
+The model is a simplification of the game: other tanks do not move,
+the bullets fired by your tank are not simulated (only the ammunition
+is consumed) and the secondary items are not used.
+
+Examples
+--------
+
+::
+
+    from hackathon_bot.simulation import TankSimulation, to_response_action
+
+    simulation = TankSimulation.from_game_state(game_state)
+
+    for action in simulation.legal_actions():
+        simulation.push(action)
+        if not simulation.is_dead:
+            # Evaluate the state after the action.
+        simulation.pop()
+
+    response = to_response_action(ActionCode.FORWARD)
+
+Classes
+-------
+TankSimulation
+    Represents the forward model of your agent's tank.
+
+Functions
+---------
+to_response_action
+    Returns the response action of an action code.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Sequence
+
+from .actions import AbilityUse, Movement, Pass, Rotation
+from .enums import (
+    Ability,
+    ActionCode,
+    MovementDirection,
+    RotationDirection,
+)
+from .predicates import is_bullet
+
+if TYPE_CHECKING:
+    from .actions import ResponseAction
+    from .protocols import GameState
+
+
+__all__ = (
+    "TankSimulation",
+    "to_response_action",
+)
+
+# The x and y steps of the directions: up, right, down, left.
+_DX = (0, 1, 0, -1)
+_DY = (-1, 0, 1, 0)
+
+_PASS = ActionCode.PASS.value
+_FORWARD = ActionCode.FORWARD.value
+_BACKWARD = ActionCode.BACKWARD.value
+_TANK_LEFT = ActionCode.TANK_LEFT.value
+_TANK_RIGHT = ActionCode.TANK_RIGHT.value
+_TURRET_LEFT = ActionCode.TURRET_LEFT.value
+_TURRET_RIGHT = ActionCode.TURRET_RIGHT.value
+_FIRE_BULLET = ActionCode.FIRE_BULLET.value
+
+_RESPONSE_ACTIONS: dict[int, ResponseAction] = {
+    ActionCode.PASS: Pass(),
+    ActionCode.FORWARD: Movement(MovementDirection.FORWARD),
+    ActionCode.BACKWARD: Movement(MovementDirection.BACKWARD),
+    ActionCode.TANK_LEFT: Rotation(RotationDirection.LEFT, None),
+    ActionCode.TANK_RIGHT: Rotation(RotationDirection.RIGHT, None),
+    ActionCode.TURRET_LEFT: Rotation(None, RotationDirection.LEFT),
+    ActionCode.TURRET_RIGHT: Rotation(None, RotationDirection.RIGHT),
+    ActionCode.FIRE_BULLET: AbilityUse(Ability.FIRE_BULLET),
+}
+
+
+def to_response_action(action: ActionCode | int) -> ResponseAction:
+    """Returns the response action of an action code.
+
+    The returned actions are shared, as they are immutable.
+    """
+    return _RESPONSE_ACTIONS[action]
+
+
+class TankSimulation:  # pylint: disable=too-many-instance-attributes
+    """Represents the forward model of your agent's tank.
+
+    Parameters
+    ----------
+    walls: Sequence[Sequence[:class:`bool`]]
+        The wall grid indexed as `walls[y][x]`.
+    x: :class:`int`
+        The x-coordinate of the tank.
+    y: :class:`int`
+        The y-coordinate of the tank.
+    direction: :class:`int`
+        The direction of the tank (see :class:`Direction`).
+    turret_direction: :class:`int`
+        The direction of the turret (see :class:`Direction`).
+    health: :class:`int`
+        The health of the tank.
+    bullet_count: :class:`int`
+        The number of bullets in the turret.
+    regen_ticks: :class:`int`
+        The number of ticks to regenerate the next bullet,
+        0 if the turret is full.
+    bullets: tuple[tuple[:class:`int`, :class:`int`, :class:`int`], ...]
+        The `(x, y, direction)` of the bullets that can hit the tank.
+    max_bullets: :class:`int`
+        The capacity of the turret.
+    regen_interval: :class:`int`
+        The number of ticks to regenerate a bullet.
+    bullet_speed: :class:`int`
+        The number of tiles a bullet moves in a tick.
+    bullet_damage: :class:`int`
+        The damage dealt by a bullet.
+
+    Attributes
+    ----------
+    tick: :class:`int`
+        The number of actions applied since the state was created.
+    """
+
+    __slots__ = (
+        "x",
+        "y",
+        "direction",
+        "turret_direction",
+        "health",
+        "bullet_count",
+        "regen_ticks",
+        "bullets",
+        "tick",
+        "max_bullets",
+        "regen_interval",
+        "bullet_speed",
+        "bullet_damage",
+        "_walls",
+        "_width",
+        "_height",
+        "_history",
+    )
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        walls: Sequence[Sequence[bool]],
+        x: int,
+        y: int,
+        direction: int,
+        turret_direction: int,
+        health: int = 100,
+        bullet_count: int = 3,
+        regen_ticks: int = 0,
+        bullets: tuple[tuple[int, int, int], ...] = (),
+        *,
+        max_bullets: int = 3,
+        regen_interval: int = 10,
+        bullet_speed: int = 2,
+        bullet_damage: int = 20,
+    ) -> None:
+        self.x = x
+        self.y = y
+        self.direction = int(direction)
+        self.turret_direction = int(turret_direction)
+        self.health = health
+        self.bullet_count = bullet_count
+        self.regen_ticks = regen_ticks
+        self.bullets = bullets
+        self.tick = 0
+        self.max_bullets = max_bullets
+        self.regen_interval = regen_interval
+        self.bullet_speed = bullet_speed
+        self.bullet_damage = bullet_damage
+        self._walls = bytes(bool(wall) for row in walls for wall in row)
+        self._height = len(walls)
+        self._width = len(self._walls) // self._height if self._height else 0
+        self._history = []
+
+    @classmethod
+    def from_game_state(
+        cls,
+        game_state: GameState,
+        walls: Sequence[Sequence[bool]] | None = None,
+        **kwargs,
+    ) -> TankSimulation:
+        """Creates the forward model from a game state.
+
+        Parameters
+        ----------
+        game_state: :class:`GameState`
+            The game state with the alive tank of your agent.
+        walls: Sequence[Sequence[:class:`bool`]] | `None`
+            The wall grid indexed as `walls[y][x]`.
+            If `None`, it is created from the game state.
+        **kwargs
+            The rules passed to the constructor,
+            e.g. `regen_interval` or `bullet_damage`.
+
+        Raises
+        ------
+        ValueError
+            If the tank of your agent is dead (not on the map).
+        """
+
+        index = game_state.index
+        tank = index.my_tank
+        if tank is None:
+            raise ValueError("the tank of the agent is dead")
+
+        tiles = game_state.map.tiles
+        if walls is None:
+            walls = [[False] * len(tiles[0]) for _ in tiles]
+            for x, y in index.walls:
+                walls[y][x] = True
+
+        bullets = tuple(
+            (x, y, int(entity.direction))
+            for x, y in index.bullets
+            for entity in tiles[y][x].entities
+            if is_bullet(entity)
+        )
+
+        x, y = index.my_position
+        return cls(
+            walls,
+            x,
+            y,
+            tank.direction,
+            tank.turret.direction,
+            tank.health,
+            tank.turret.bullet_count,
+            tank.turret.ticks_to_regenerate_bullet or 0,
+            bullets,
+            **kwargs,
+        )
+
+    @property
+    def is_dead(self) -> bool:
+        """Whether the tank has been destroyed."""
+        return self.health <= 0
+
+    def is_wall(self, x: int, y: int) -> bool:
+        """Whether the tile is a wall or outside of the map."""
+
+        if 0 <= x < self._width and 0 <= y < self._height:
+            return bool(self._walls[y * self._width + x])
+        return True
+
+    def snapshot(self) -> tuple:
+        """Returns the current state, which can be restored later."""
+
+        return (
+            self.x,
+            self.y,
+            self.direction,
+            self.turret_direction,
+            self.health,
+            self.bullet_count,
+            self.regen_ticks,
+            self.bullets,
+            self.tick,
+        )
+
+    def restore(self, snapshot: tuple) -> None:
+        """Restores a state returned by :meth:`snapshot`."""
+
+        (
+            self.x,
+            self.y,
+            self.direction,
+            self.turret_direction,
+            self.health,
+            self.bullet_count,
+            self.regen_ticks,
+            self.bullets,
+            self.tick,
+        ) = snapshot
+
+    def copy(self) -> TankSimulation:
+        """Returns a copy of the current state without the undo history.
+
+        The walls and the bullets are shared, as they are immutable.
+        """
+
+        other = object.__new__(TankSimulation)
+        other.restore(self.snapshot())
+        other.max_bullets = self.max_bullets
+        other.regen_interval = self.regen_interval
+        other.bullet_speed = self.bullet_speed
+        other.bullet_damage = self.bullet_damage
+        other._walls = self._walls
+        other._width = self._width
+        other._height = self._height
+        other._history = []
+        return other
+
+    def legal_actions(self) -> list[int]:
+        """Returns the actions that change the state of the tank.
+
+        Moves into walls and firing without bullets are excluded,
+        as they are equivalent to passing.
+        """
+
+        actions = [_PASS]
+        direction = self.direction
+        if not self.is_wall(self.x + _DX[direction], self.y + _DY[direction]):
+            actions.append(_FORWARD)
+        back = (direction + 2) & 3
+        if not self.is_wall(self.x + _DX[back], self.y + _DY[back]):
+            actions.append(_BACKWARD)
+        actions += (_TANK_LEFT, _TANK_RIGHT, _TURRET_LEFT, _TURRET_RIGHT)
+        if self.bullet_count > 0:
+            actions.append(_FIRE_BULLET)
+        return actions
+
+    def push(self, action: ActionCode | int) -> None:
+        """Applies the action for one tick, so that it can be undone."""
+
+        self._history.append(self.snapshot())
+        self.step(action)
+
+    def pop(self) -> None:
+        """Undoes the last action applied with :meth:`push`."""
+        self.restore(self._history.pop())
+
+    def step(self, action: ActionCode | int) -> None:
+        """Applies the action for one tick without saving the undo history."""
+
+        # pylint: disable=too-many-branches
+        x = self.x
+        y = self.y
+
+        if action == _FORWARD or action == _BACKWARD:
+            direction = self.direction
+            if action == _BACKWARD:
+                direction = (direction + 2) & 3
+            nx = x + _DX[direction]
+            ny = y + _DY[direction]
+            if not self.is_wall(nx, ny):
+                self.x = x = nx
+                self.y = y = ny
+        elif action == _TANK_LEFT:
+            self.direction = (self.direction - 1) & 3
+        elif action == _TANK_RIGHT:
+            self.direction = (self.direction + 1) & 3
+        elif action == _TURRET_LEFT:
+            self.turret_direction = (self.turret_direction - 1) & 3
+        elif action == _TURRET_RIGHT:
+            self.turret_direction = (self.turret_direction + 1) & 3
+        elif action == _FIRE_BULLET and self.bullet_count > 0:
+            if self.bullet_count == self.max_bullets:
+                self.regen_ticks = self.regen_interval + 1
+            self.bullet_count -= 1
+
+        if self.bullet_count < self.max_bullets:
+            self.regen_ticks -= 1
+            if self.regen_ticks <= 0:
+                self.bullet_count += 1
+                full = self.bullet_count >= self.max_bullets
+                self.regen_ticks = 0 if full else self.regen_interval
+
+        if self.bullets:
+            self._move_bullets(x, y)
+
+        self.tick += 1
+
+    def _move_bullets(self, x: int, y: int) -> None:
+        walls = self._walls
+        width = self._width
+        height = self._height
+        speed = self.bullet_speed
+        remaining = []
+
+        for bullet in self.bullets:
+            bx, by, direction = bullet
+            dx = _DX[direction]
+            dy = _DY[direction]
+            hit = bx == x and by == y
+            destroyed = hit
+            for _ in range(speed):
+                if destroyed:
+                    break
+                bx += dx
+                by += dy
+                if not (0 <= bx < width and 0 <= by < height) or walls[by * width + bx]:
+                    destroyed = True
+                elif bx == x and by == y:
+                    hit = destroyed = True
+
+            if hit:
+                self.health -= self.bullet_damage
+            elif not destroyed:
+                remaining.append((bx, by, direction))
+
+        self.bullets = tuple(remaining)
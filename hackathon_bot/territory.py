@@ -0,0 +1,260 @@
+"""This module contains the territory maps of the tanks.
+
+The territory of a tank is the set of tiles it reaches before any other
+tank (a Voronoi partition of the map by the path distances). A single
+breadth-first search started from all tanks at once labels every tile
+with the nearest tank and its distance, so the question "who reaches
+this zone first" becomes a lookup instead of a search per tank.
+
+When a tank moves, only the tiles of its old territory and the tiles
+it now reaches first are relabeled.
+
+Examples
+--------
+
+::
+
+    from hackathon_bot.territory import TerritoryMap
+
+    class MyBot(HackathonBot):
+
+        def next_move(self, game_state: GameState) -> ResponseAction:
+            if self.territory is None:
+                walls = ...  # The wall grid, indexed as walls[y][x].
+                self.territory = TerritoryMap(walls)
+
+            index = game_state.index
+            # The position of your agent is None while it is dead.
+            self.territory.update(
+                {"me": index.my_position, **index.enemy_positions}
+            )
+            for zone in game_state.map.zones:
+                tiles = [
+                    (zone.x + dx, zone.y + dy)
+                    for dx in range(zone.width)
+                    for dy in range(zone.height)
+                ]
+                winner, distance = self.territory.race(tiles)
+                if winner == "me":
+                    # The zone can be reached before the enemies.
+
+Classes
+-------
+TerritoryMap
+    Represents the nearest tank of every tile.
+"""
+
+from __future__ import annotations
+
+import heapq
+from array import array
+from typing import Hashable, Iterable, Mapping, Sequence
+
+__all__ = ("TerritoryMap",)
+
+_UNREACHED = -1
+
+
+class TerritoryMap:
+    """Represents the nearest tank of every tile.
+
+    The ties are broken by the order in which the tanks
+    were first passed to :meth:`update`, so pass the tank
+    of your agent first to win the ties.
+
+    Parameters
+    ----------
+    walls: Sequence[Sequence[:class:`bool`]]
+        The wall grid indexed as `walls[y][x]`.
+
+    Attributes
+    ----------
+    width: :class:`int`
+        The width of the map.
+    height: :class:`int`
+        The height of the map.
+    sources: dict[Hashable, tuple[:class:`int`, :class:`int`]]
+        The positions of the tanks of the last update.
+    distances: :class:`array.array`
+        The distances to the nearest tank indexed as `y * width + x`,
+        -1 for the unreachable tiles and the walls.
+    owners: :class:`array.array`
+        The ranks of the nearest tanks indexed as `y * width + x`,
+        -1 for the unreachable tiles and the walls.
+    relabeled: :class:`int`
+        The number of tiles relabeled by the last update.
+    """
+
+    __slots__ = (
+        "width",
+        "height",
+        "sources",
+        "distances",
+        "owners",
+        "relabeled",
+        "_neighbors",
+        "_ranks",
+        "_keys",
+    )
+
+    def __init__(self, walls: Sequence[Sequence[bool]]) -> None:
+        self.height = height = len(walls)
+        self.width = width = len(walls[0]) if height else 0
+        self.sources: dict[Hashable, tuple[int, int]] = {}
+        self.distances = array("i", [_UNREACHED]) * (width * height)
+        self.owners = array("i", [_UNREACHED]) * (width * height)
+        self.relabeled = 0
+        self._ranks: dict[Hashable, int] = {}
+        self._keys: list[Hashable] = []
+
+        cells = bytes(bool(wall) for row in walls for wall in row)
+        neighbors: list[tuple[int, ...]] = [()] * (width * height)
+        for y in range(height):
+            for x in range(width):
+                if cells[y * width + x]:
+                    continue
+                neighbors[y * width + x] = tuple(
+                    ny * width + nx
+                    for nx, ny in ((x, y - 1), (x + 1, y), (x, y + 1), (x - 1, y))
+                    if 0 <= nx < width
+                    and 0 <= ny < height
+                    and not cells[ny * width + nx]
+                )
+        self._neighbors = neighbors
+
+    def _rank(self, key: Hashable) -> int:
+        rank = self._ranks.get(key)
+        if rank is None:
+            rank = self._ranks[key] = len(self._keys)
+            self._keys.append(key)
+        return rank
+
+    def _release(self, rank: int, tile: int) -> list[int]:
+        # Unlabels the territory of a tank, which is connected
+        # and contains the tile of the tank.
+        distances = self.distances
+        owners = self.owners
+        neighbors = self._neighbors
+        released = []
+        if owners[tile] != rank:
+            return released
+        owners[tile] = _UNREACHED
+        distances[tile] = _UNREACHED
+        stack = [tile]
+        while stack:
+            current = stack.pop()
+            released.append(current)
+            for following in neighbors[current]:
+                if owners[following] == rank:
+                    owners[following] = _UNREACHED
+                    distances[following] = _UNREACHED
+                    stack.append(following)
+        return released
+
+    def update(self, sources: Mapping[Hashable, tuple[int, int]]) -> None:
+        """Updates the territories after the tanks have moved.
+
+        Parameters
+        ----------
+        sources: Mapping[Hashable, tuple[:class:`int`, :class:`int`]]
+            The `(x, y)` positions of the tanks by their keys,
+            e.g. the owner ids. The tanks not present or with
+            a `None` position (e.g. dead) are removed.
+        """
+
+        sources = {
+            key: position for key, position in sources.items() if position is not None
+        }
+        width = self.width
+        distances = self.distances
+        owners = self.owners
+        neighbors = self._neighbors
+        previous = self.sources
+
+        # The territories of the moved and removed tanks are released.
+        released = []
+        for key, (x, y) in previous.items():
+            if sources.get(key) != (x, y):
+                released += self._release(self._ranks[key], y * width + x)
+
+        # The released tiles are reached again from the territories
+        # around them and from the positions of the tanks.
+        queue = []
+        for tile in released:
+            for following in neighbors[tile]:
+                if owners[following] != _UNREACHED:
+                    label = (distances[following] + 1, owners[following], tile)
+                    queue.append(label)
+        # All tanks are queued, as a released tile may hold another tank.
+        for key, (x, y) in sources.items():
+            queue.append((0, self._rank(key), y * width + x))
+        heapq.heapify(queue)
+
+        relabeled = 0
+        while queue:
+            distance, owner, tile = heapq.heappop(queue)
+            current = distances[tile]
+            if current != _UNREACHED and (current, owners[tile]) <= (distance, owner):
+                continue
+            distances[tile] = distance
+            owners[tile] = owner
+            relabeled += 1
+            for following in neighbors[tile]:
+                current = distances[following]
+                if current == _UNREACHED or (current, owners[following]) > (
+                    distance + 1,
+                    owner,
+                ):
+                    heapq.heappush(queue, (distance + 1, owner, following))
+
+        self.sources = sources
+        self.relabeled = relabeled
+
+    def owner(self, x: int, y: int) -> Hashable | None:
+        """Returns the key of the tank reaching the tile first,
+        `None` if no tank reaches it."""
+
+        rank = self.owners[y * self.width + x]
+        return None if rank == _UNREACHED else self._keys[rank]
+
+    def distance(self, x: int, y: int) -> int | None:
+        """Returns the distance from the nearest tank to the tile,
+        `None` if no tank reaches it."""
+
+        distance = self.distances[y * self.width + x]
+        return None if distance == _UNREACHED else distance
+
+    def race(
+        self,
+        positions: Iterable[tuple[int, int]],
+    ) -> tuple[Hashable | None, int | None]:
+        """Returns the tank reaching any of the tiles first, e.g. a zone.
+
+        Returns
+        -------
+        tuple[Hashable | None, int | None]
+            The key of the tank and its distance,
+            or `(None, None)` if no tank reaches the tiles.
+        """
+
+        width = self.width
+        distances = self.distances
+        owners = self.owners
+        best = None
+        for x, y in positions:
+            tile = y * width + x
+            if distances[tile] != _UNREACHED:
+                label = (distances[tile], owners[tile])
+                if best is None or label < best:
+                    best = label
+        if best is None:
+            return None, None
+        return self._keys[best[1]], best[0]
+
+    def territory(self, key: Hashable) -> int:
+        """Returns the number of tiles the tank reaches first."""
+
+        rank = self._ranks.get(key)
+        if rank is None or key not in self.sources:
+            return 0
+        return self.owners.count(rank)
@@ -0,0 +1,173 @@
+"""Tests for belief.py module."""
+
+from hackathon_bot.belief import BeliefTracker, EnemyMemory, ItemMemory
+from hackathon_bot.enums import Direction, ItemType
+from hackathon_bot.models import GameStateModel
+from hackathon_bot.payloads import (
+    GameStatePayload,
+    RawItem,
+    RawMap,
+    RawPlayer,
+    RawTank,
+    RawTileObject,
+    RawTurret,
+)
+
+AGENT_ID = "agent"
+ENEMY_ID = "enemy"
+
+
+def _game_state(tick, tiles, visibility, enemy_regenerating=None):
+    """Creates a game state with a 3x3 map from tiles indexed as [x][y]."""
+
+    players = (
+        RawPlayer(AGENT_ID, "agent", 0, 0, 0, 0),
+        RawPlayer(ENEMY_ID, "enemy", 0, ticks_to_regen=enemy_regenerating),
+    )
+    payload = GameStatePayload("id", tick, players, RawMap(tiles, (), visibility))
+    return GameStateModel.from_payload(payload, AGENT_ID)
+
+
+def _tiles(**entities):
+    tiles = [[(), (), ()] for _ in range(3)]
+    for name, (x, y, obj) in entities.items():
+        tiles[x][y] = (RawTileObject(name, obj),)
+    return tuple(tuple(row) for row in tiles)
+
+
+def _tank(owner_id, direction=Direction.UP):
+    return RawTank(owner_id, direction, RawTurret(Direction.LEFT))
+
+
+def test_BeliefTracker_update():
+    """Test remembering the visible tiles, items and enemies."""
+
+    beliefs = BeliefTracker(3)
+    state = _game_state(
+        5,
+        _tiles(item=(2, 0, RawItem(ItemType.LASER)), tank=(1, 1, _tank(ENEMY_ID))),
+        ("111", "010", "000"),
+    )
+
+    beliefs.update(state)
+
+    assert beliefs.tick == 5
+    assert beliefs.last_seen(0, 0) == 5
+    assert beliefs.last_seen(1, 1) == 5
+    assert beliefs.last_seen(0, 1) is None
+    assert beliefs.age(2, 0) == 0
+    assert beliefs.items == {(2, 0): ItemMemory((2, 0), ItemType.LASER, 5)}
+    assert beliefs.enemies == {
+        ENEMY_ID: EnemyMemory(ENEMY_ID, (1, 1), Direction.UP, Direction.LEFT, 5)
+    }
+    assert len(beliefs.known_entities(1, 1)) == 1
+    assert beliefs.known_entities(0, 0) == ()
+
+
+def test_BeliefTracker_update__fog():
+    """Test keeping the memory of the tiles hidden by the fog of war."""
+
+    beliefs = BeliefTracker(3)
+    beliefs.update(
+        _game_state(
+            1,
+            _tiles(item=(2, 0, RawItem(ItemType.MINE)), tank=(1, 1, _tank(ENEMY_ID))),
+            ("111", "111", "111"),
+        )
+    )
+    beliefs.update(_game_state(2, _tiles(), ("000", "000", "001")))
+
+    assert beliefs.last_seen(2, 0) == 1
+    assert beliefs.last_seen(2, 2) == 2
+    assert beliefs.age(2, 0) == 1
+    assert beliefs.items[(2, 0)].tick == 1
+    assert beliefs.enemies[ENEMY_ID].position == (1, 1)
+    assert len(beliefs.known_entities(1, 1)) == 1
+
+    # The item disappears once its tile is visible and empty.
+    beliefs.update(_game_state(3, _tiles(), ("001", "000", "000")))
+    assert beliefs.items == {}
+
+
+def test_BeliefTracker_update__enemy_left():
+    """Test forgetting an enemy whose last known tile is visible without it."""
+
+    beliefs = BeliefTracker(3)
+    beliefs.update(
+        _game_state(1, _tiles(tank=(1, 1, _tank(ENEMY_ID))), ("111", "111", "111"))
+    )
+
+    # The tile of the enemy is hidden, so the enemy is kept.
+    beliefs.update(_game_state(2, _tiles(), ("111", "101", "111")))
+    assert beliefs.enemies[ENEMY_ID].position == (1, 1)
+
+    beliefs.update(_game_state(3, _tiles(), ("000", "010", "000")))
+    assert beliefs.enemies == {}
+
+
+def test_BeliefTracker_update__unknown_item_type():
+    """Test keeping the item type hidden by a tank on the tile."""
+
+    beliefs = BeliefTracker(3)
+    beliefs.update(
+        _game_state(
+            1, _tiles(item=(0, 0, RawItem(ItemType.RADAR))), ("100", "000", "000")
+        )
+    )
+    beliefs.update(
+        _game_state(
+            2, _tiles(item=(0, 0, RawItem(ItemType.UNKNOWN))), ("100", "000", "000")
+        )
+    )
+
+    assert beliefs.items[(0, 0)] == ItemMemory((0, 0), ItemType.RADAR, 2)
+
+
+def test_BeliefTracker_expiry():
+    """Test forgetting the items and enemies not seen for too long."""
+
+    beliefs = BeliefTracker(3, item_expiry=10, enemy_expiry=2)
+    beliefs.update(
+        _game_state(
+            1,
+            _tiles(item=(2, 0, RawItem(ItemType.LASER)), tank=(1, 1, _tank(ENEMY_ID))),
+            ("111", "111", "111"),
+        )
+    )
+
+    beliefs.update(_game_state(4, _tiles(), ("000", "000", "000")))
+    assert beliefs.enemies == {}
+    assert (2, 0) in beliefs.items
+
+    beliefs.update(_game_state(12, _tiles(), ("000", "000", "000")))
+    assert beliefs.items == {}
+
+
+def test_BeliefTracker_update__dead_enemy():
+    """Test forgetting the tanks of dead players."""
+
+    beliefs = BeliefTracker(3)
+    beliefs.update(
+        _game_state(1, _tiles(tank=(1, 1, _tank(ENEMY_ID))), ("111", "111", "111"))
+    )
+    beliefs.update(
+        _game_state(2, _tiles(), ("000", "000", "000"), enemy_regenerating=10)
+    )
+
+    assert beliefs.enemies == {}
+
+
+def test_BeliefTracker_nearest_item():
+    """Test finding the nearest remembered item."""
+
+    beliefs = BeliefTracker(3)
+    beliefs.items = {
+        (0, 0): ItemMemory((0, 0), ItemType.LASER, 1),
+        (2, 2): ItemMemory((2, 2), ItemType.LASER, 1),
+        (2, 1): ItemMemory((2, 1), ItemType.MINE, 1),
+    }
+
+    assert beliefs.nearest_item(2, 0).position == (2, 1)
+    assert beliefs.nearest_item(2, 0, ItemType.LASER).position == (0, 0)
+    assert beliefs.nearest_item(1, 2, ItemType.LASER).position == (2, 2)
+    assert beliefs.nearest_item(0, 0, ItemType.RADAR) is None
@@ -0,0 +1,152 @@
+"""Tests for bitboard.py module."""
+
+import pytest
+
+from hackathon_bot.bitboard import BitboardGeometry, MapBitboards
+from hackathon_bot.enums import Direction
+from hackathon_bot.models import MapModel
+from hackathon_bot.payloads import (
+    RawBullet,
+    RawMap,
+    RawTank,
+    RawTileObject,
+    RawTurret,
+    RawWall,
+)
+
+# The walls of the map used in the tests:
+#     ┌ ─ ┬ ─ ┬ ─ ┬ ─ ┐
+#     │   │   │   │ W │
+#     ├ ─ ┼ ─ ┼ ─ ┼ ─ ┤
+#     │ W │ W │   │ W │
+#     ├ ─ ┼ ─ ┼ ─ ┼ ─ ┤
+#     │   │ W │   │   │
+#     └ ─ ┴ ─ ┴ ─ ┴ ─ ┘
+wall_grid = (
+    (False, False, False, True),
+    (True, True, False, True),
+    (False, True, False, False),
+)
+geometry = BitboardGeometry.create(4, 3)
+walls = geometry.from_grid(wall_grid)
+
+
+def test_BitboardGeometry_grid_round_trip():
+    """Test converting a grid to a bitboard and back."""
+
+    assert geometry.to_grid(walls) == [list(row) for row in wall_grid]
+    assert set(geometry.to_positions(walls)) == {(3, 0), (0, 1), (1, 1), (3, 1), (1, 2)}
+    assert geometry.from_positions(geometry.to_positions(walls)) == walls
+
+
+def test_BitboardGeometry_from_rows():
+    """Test creating a bitboard from the map visibility rows."""
+
+    board = geometry.from_rows(("1001", "0000", "0110"))
+
+    assert set(geometry.to_positions(board)) == {(0, 0), (3, 0), (1, 2), (2, 2)}
+
+
+@pytest.mark.parametrize(
+    "direction, expected",
+    [
+        (Direction.UP, {(0, 0)}),
+        (Direction.DOWN, {(0, 2)}),
+        (Direction.LEFT, set()),
+        (Direction.RIGHT, {(1, 1)}),
+    ],
+)
+def test_BitboardGeometry_shift__edges(direction, expected):
+    """Test shifting a bitboard without wrapping around the edges."""
+
+    board = geometry.shift(geometry.bit(0, 1), direction)
+
+    assert set(geometry.to_positions(board)) == expected
+
+
+def test_BitboardGeometry_shift__last_column():
+    """Test shifting the last column to the right drops it."""
+
+    board = geometry.bit(3, 0) | geometry.bit(3, 2)
+
+    assert geometry.shift(board, Direction.RIGHT) == 0
+    assert geometry.shift(geometry.bit(0, 0), Direction.UP) == 0
+
+
+def test_BitboardGeometry_dilate():
+    """Test growing a bitboard in the four directions."""
+
+    board = geometry.dilate(geometry.bit(3, 1))
+
+    assert set(geometry.to_positions(board)) == {(3, 0), (2, 1), (3, 1), (3, 2)}
+
+
+def test_BitboardGeometry_ray():
+    """Test casting a ray until the first blocker."""
+
+    origin = geometry.bit(0, 0)
+
+    ray = geometry.ray(origin, Direction.RIGHT, walls)
+    assert set(geometry.to_positions(ray)) == {(1, 0), (2, 0)}
+
+    ray = geometry.ray(origin, Direction.RIGHT, walls, include_blockers=True)
+    assert set(geometry.to_positions(ray)) == {(1, 0), (2, 0), (3, 0)}
+
+    ray = geometry.ray(geometry.bit(2, 2), Direction.UP, walls)
+    assert set(geometry.to_positions(ray)) == {(2, 1), (2, 0)}
+
+
+def test_BitboardGeometry_flood_fill():
+    """Test filling the tiles connected to a seed."""
+
+    passable = ~walls
+    filled = geometry.flood_fill(geometry.bit(0, 0), passable)
+
+    assert set(geometry.to_positions(filled)) == {
+        (0, 0),
+        (1, 0),
+        (2, 0),
+        (2, 1),
+        (2, 2),
+        (3, 2),
+    }
+
+    # The tile (0, 2) is enclosed by the walls.
+    filled = geometry.flood_fill(geometry.bit(0, 2), passable)
+    assert set(geometry.to_positions(filled)) == {(0, 2)}
+
+
+def test_BitboardGeometry_distances():
+    """Test the breadth-first layers of the flood fill."""
+
+    layers = geometry.distances(geometry.bit(0, 0), ~walls)
+
+    assert [set(geometry.to_positions(layer)) for layer in layers] == [
+        {(0, 0)},
+        {(1, 0)},
+        {(2, 0)},
+        {(2, 1)},
+        {(2, 2)},
+        {(3, 2)},
+    ]
+
+
+def test_MapBitboards_from_map():
+    """Test creating the bitboards from a map model."""
+
+    tiles = (
+        ((RawTileObject("wall", RawWall()),), ()),
+        (
+            (RawTileObject("tank", RawTank("agent", 1, RawTurret(1, 1, 0))),),
+            (RawTileObject("bullet", RawBullet(1, 2, Direction.UP, 0)),),
+        ),
+    )
+    map_ = MapModel.from_raw(RawMap(tiles, (), ("11", "01")), "agent")
+
+    layers = MapBitboards.from_map(map_)
+    grid = layers.geometry
+
+    assert layers.walls == grid.bit(0, 0)
+    assert layers.occupied == grid.bit(1, 0)
+    assert layers.danger == grid.bit(1, 1)
+    assert layers.visible == grid.bit(0, 0) | grid.bit(1, 0) | grid.bit(1, 1)
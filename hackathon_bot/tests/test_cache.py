@@ -0,0 +1,158 @@
+"""Tests for cache.py module."""
+
+import ctypes
+import os
+import sys
+import threading
+from array import array
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from hackathon_bot.cache import PrecomputationCache, map_key
+
+walls = ((False, True, False), (False, False, False), (True, False, False))
+
+
+def test_map_key():
+    """Test keying the maps by the seed, the dimension and the walls."""
+
+    key = map_key(1234, 3, walls)
+
+    assert key == map_key(1234, 3, [list(row) for row in walls])
+    assert key != map_key(1235, 3, walls)
+    assert key != map_key(1234, 4, walls)
+    assert key != map_key(1234, 3, (walls[0], walls[2], walls[1]))
+    assert len(key) == 40
+
+
+def test_PrecomputationCache_get_or_compute(tmp_path):
+    """Test computing a table once and loading it afterwards."""
+
+    cache = PrecomputationCache(str(tmp_path))
+    key = map_key(1234, 3, walls)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return array("i", [-1, 0, 70000])
+
+    first = cache.get_or_compute(key, "distances", compute)
+    second = PrecomputationCache(str(tmp_path)).get_or_compute(
+        key, "distances", compute
+    )
+
+    assert list(first) == list(second) == [-1, 0, 70000]
+    assert second.format == "i"
+    assert second.readonly
+    assert len(calls) == 1
+    assert cache.stats.misses == 1
+
+
+def test_PrecomputationCache_load(tmp_path):
+    """Test loading the stored tables."""
+
+    cache = PrecomputationCache(str(tmp_path))
+    cache.store("map", "degrees", bytes([1, 2, 3]))
+    cache.store("map", "depths", array("H", [4, 5]))
+
+    assert list(cache.load("map", "degrees")) == [1, 2, 3]
+    assert list(cache.load("map", "depths")) == [4, 5]
+    assert cache.load("map", "areas") is None
+    assert cache.load("other", "degrees") is None
+    assert (cache.stats.hits, cache.stats.misses) == (2, 2)
+
+
+def test_PrecomputationCache_load__damaged(tmp_path):
+    """Test removing a damaged table."""
+
+    cache = PrecomputationCache(str(tmp_path))
+    cache.store("map", "degrees", array("i", [1, 2, 3]))
+    path = os.path.join(str(tmp_path), "map.degrees.table")
+    with open(path, "r+b") as file:
+        file.truncate(os.path.getsize(path) - 1)
+
+    assert cache.load("map", "degrees") is None
+    assert not os.path.exists(path)
+
+
+def test_PrecomputationCache_evict(tmp_path):
+    """Test removing the least recently used tables."""
+
+    cache = PrecomputationCache(str(tmp_path), max_bytes=2 * (16 + 100))
+    cache.store("first", "table", bytes(100))
+    cache.store("second", "table", bytes(100))
+    path = os.path.join(str(tmp_path), "first.table.table")
+    os.utime(path, ns=(0, 0))
+    cache.load("second", "table")
+    cache.store("third", "table", bytes(100))
+
+    assert cache.load("first", "table") is None
+    assert cache.load("second", "table") is not None
+    assert cache.load("third", "table") is not None
+    assert cache.stats.evictions == 1
+    assert cache.size() == 2 * (16 + 100)
+
+
+def test_PrecomputationCache_init__invalid():
+    """Test rejecting a non-positive size limit."""
+
+    with pytest.raises(ValueError):
+        PrecomputationCache(max_bytes=0)
+
+
+def test_PrecomputationCache_store__numpy(tmp_path):
+    """Test storing the memory views of numpy and ctypes arrays."""
+
+    cache = PrecomputationCache(str(tmp_path))
+    cache.store("map", "distances", memoryview(np.arange(3, dtype=np.int64)))
+    cache.store("map", "weights", memoryview(np.array([0.5, 2.0])))
+    cache.store("map", "walls", memoryview(np.array([True, False])))
+    cache.store("map", "ctypes", memoryview((ctypes.c_double * 2)(1.5, 3.0)))
+
+    assert list(cache.load("map", "distances")) == [0, 1, 2]
+    assert list(cache.load("map", "weights")) == [0.5, 2.0]
+    assert list(cache.load("map", "walls")) == [1, 0]
+    assert list(cache.load("map", "ctypes")) == [1.5, 3.0]
+
+
+def test_PrecomputationCache_store__invalid(tmp_path):
+    """Test rejecting the tables that are not of native numbers."""
+
+    cache = PrecomputationCache(str(tmp_path))
+    swapped = ">i" if sys.byteorder == "little" else "<i"
+
+    with pytest.raises(ValueError):
+        cache.store("map", "swapped", memoryview(np.zeros(2, dtype=swapped)))
+    with pytest.raises(ValueError):
+        cache.store("map", "half", memoryview(np.zeros(2, dtype=np.float16)))
+
+
+def test_PrecomputationCache_store__failed(tmp_path):
+    """Test removing the temporary file of a table that was not stored."""
+
+    cache = PrecomputationCache(str(tmp_path))
+
+    with patch("os.replace", side_effect=OSError), pytest.raises(OSError):
+        cache.store("map", "distances", array("i", [1, 2]))
+
+    assert not os.listdir(tmp_path)
+
+
+def test_PrecomputationCache_store__threads(tmp_path):
+    """Test storing the same table from several threads at once."""
+
+    cache = PrecomputationCache(str(tmp_path))
+    table = array("i", range(10_000))
+    threads = [
+        threading.Thread(target=cache.store, args=("map", "distances", table))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert os.listdir(tmp_path) == ["map.distances.table"]
+    assert list(cache.load("map", "distances")) == list(table)
@@ -0,0 +1,73 @@
+"""Tests for the connection module."""
+
+from unittest.mock import patch
+
+from hackathon_bot.connection import ExponentialBackoff, RoundTripStats, SendStats
+
+
+def test_ExponentialBackoff_next_delay():
+    """Test ExponentialBackoff.next_delay method.
+
+    The delays should grow exponentially up to the maximum delay
+    and stay in the upper half of the nominal delay.
+    """
+
+    backoff = ExponentialBackoff(base_delay=1, max_delay=4, max_attempts=None)
+
+    with patch("random.uniform", lambda a, b: b):
+        delays = [backoff.next_delay() for _ in range(5)]
+
+    assert delays == [1, 2, 4, 4, 4]
+
+    with patch("random.uniform", lambda a, b: a):
+        assert backoff.next_delay() == 2
+
+
+def test_ExponentialBackoff_exhausted():
+    """Test ExponentialBackoff exhausting and resetting."""
+
+    backoff = ExponentialBackoff(max_attempts=2)
+
+    assert backoff.next_delay() is not None
+    assert backoff.next_delay() is not None
+    assert backoff.exhausted
+    assert backoff.next_delay() is None
+
+    backoff.reset()
+
+    assert not backoff.exhausted
+    assert backoff.next_delay() is not None
+
+
+def test_RoundTripStats_add():
+    """Test RoundTripStats.add method."""
+
+    stats = RoundTripStats()
+    stats.add(0.1)
+
+    assert stats.last == stats.smoothed == stats.minimum == stats.maximum == 0.1
+    assert stats.variation == 0.05
+
+    stats.add(0.3)
+
+    assert stats.last == 0.3
+    assert stats.minimum == 0.1
+    assert stats.maximum == 0.3
+    assert abs(stats.smoothed - 0.125) < 1e-9
+    assert stats.samples == 2
+
+
+def test_SendStats_add():
+    """Test adding the latencies of the sent packets."""
+
+    stats = SendStats()
+
+    assert stats.mean is None
+
+    stats.add(0.002)
+    stats.add(0.004)
+
+    assert stats.last == 0.004
+    assert stats.maximum == 0.004
+    assert abs(stats.mean - 0.003) < 1e-12
+    assert stats.sent == 2
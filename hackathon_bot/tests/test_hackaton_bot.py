@@ -95,7 +95,7 @@ async def test_send_packet() -> None:
 class BaseTestWebsocket:
     """Represents a test websocket."""
 
-    def __init__(self, url) -> None:
+    def __init__(self, url, **kwargs) -> None:
         pass
 
     async def __aenter__(self) -> BaseTestWebsocket:
@@ -170,20 +170,208 @@ async def test_start_loop_connection_closed_ok() -> None:
 
 @pytest.mark.asyncio
 async def test_start_loop_connection_closed_error() -> None:
-    """Test _start_loop method with ConnectionClosedError exception."""
+    """Test _start_loop method with ConnectionClosedError exception.
+
+    The bot should try to reconnect until the reconnect attempts are exhausted.
+    """
 
     bot = TestBot()
+    bot.reconnect_attempts = 3
     bot._handle_messages = Mock()
 
     server_url = "ws://localhost:8080"
+    connect = Mock(side_effect=_TestWebsocketConnectionClosedError)
 
-    with patch("websockets.connect", _TestWebsocketConnectionClosedError):
+    with patch("websockets.connect", connect), patch(
+        "asyncio.sleep", AsyncMock()
+    ) as mock_sleep:
         try:
             await asyncio.wait_for(bot._start_loop(server_url), timeout=0.1)
         except asyncio.TimeoutError:  # pragma: no cover
-            # Loop should exit after receiving a ConnectionClosedError exception.
+            # Loop should exit after exhausting the reconnect attempts.
             assert False  # pragma: no cover
 
+    assert connect.call_count == 4
+    assert mock_sleep.await_count == 3
+
+
+class _TestWebsocketReconnect(BaseTestWebsocket):
+
+    connections = 0
+
+    def __init__(self, url, **kwargs) -> None:
+        super().__init__(url, **kwargs)
+        _TestWebsocketReconnect.connections += 1
+        self.received = False
+
+    async def recv(self) -> str:
+        """Fail the first connection, then close the second one gracefully."""
+
+        if _TestWebsocketReconnect.connections == 1:
+            raise websockets.exceptions.ConnectionClosedError(
+                websockets.frames.Close(1011, "test"), None
+            )
+        if not self.received:
+            self.received = True
+            return json.dumps({"type": int(PacketType.UNKNOWN)})
+        raise websockets.exceptions.ConnectionClosedOK(
+            websockets.frames.Close(1000, "test"), None
+        )
+
+
+@pytest.mark.asyncio
+async def test_start_loop_reconnect() -> None:
+    """Test _start_loop method reconnecting after a ConnectionClosedError.
+
+    The bot instance (and its caches) should be kept across the reconnect.
+    """
+
+    bot = TestBot()
+    bot.cache = object()
+    bot.on_reconnected = Mock()
+    bot._handle_messages = Mock()
+    bot._is_processing = True
+    cache = bot.cache
+
+    with patch("websockets.connect", _TestWebsocketReconnect), patch(
+        "asyncio.sleep", AsyncMock()
+    ):
+        await asyncio.wait_for(bot._start_loop("ws://localhost:8080"), timeout=0.1)
+
+    assert _TestWebsocketReconnect.connections == 2
+    bot.on_reconnected.assert_called_once()
+    bot._handle_messages.assert_called_once()
+    assert bot.connection_stats.reconnects == 1
+    assert bot.cache is cache
+    assert bot._is_processing is False
+    assert bot._generation == 2
+
+
+def _receive(*packet_types: PacketType) -> AsyncMock:
+    messages = [json.dumps({"type": int(packet_type)}) for packet_type in packet_types]
+    closed = websockets.exceptions.ConnectionClosedError(
+        websockets.frames.Close(1011, "test"), None
+    )
+    return AsyncMock(side_effect=[*messages, closed])
+
+
+@pytest.mark.asyncio
+async def test_receive_messages__resumed() -> None:
+    """Test _receive_messages method resetting the backoff
+    after the server has answered the resume requests."""
+
+    bot = TestBot()
+    bot._handle_messages = Mock()
+    websocket = Mock()
+    websocket.recv = _receive(
+        PacketType.CONNECTION_ACCEPTED,
+        PacketType.GAME_IN_PROGRESS,
+        PacketType.LOBBY_DATA,
+    )
+    backoff = Mock()
+
+    with pytest.raises(websockets.exceptions.ConnectionClosedError):
+        await bot._receive_messages(websocket, backoff)
+
+    backoff.reset.assert_called_once()
+    assert bot._handle_messages.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_receive_messages__rejected() -> None:
+    """Test _receive_messages method keeping the backoff
+    when the server accepts and then rejects the connection."""
+
+    bot = TestBot()
+    bot._handle_messages = Mock()
+    websocket = Mock()
+    websocket.recv = _receive(
+        PacketType.CONNECTION_ACCEPTED, PacketType.CONNECTION_REJECTED
+    )
+    backoff = Mock()
+
+    with pytest.raises(websockets.exceptions.ConnectionClosedError):
+        await bot._receive_messages(websocket, backoff)
+
+    backoff.reset.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_monitor_connection() -> None:
+    """Test _monitor_connection method recording the round-trip time."""
+
+    bot = TestBot()
+    bot.health_check_interval = 0
+
+    pong_waiter = asyncio.get_running_loop().create_future()
+    pong_waiter.set_result(None)
+    websocket = Mock()
+    websocket.ping = AsyncMock(return_value=pong_waiter)
+
+    task = asyncio.create_task(bot._monitor_connection(websocket))
+    await asyncio.sleep(0.01)
+    task.cancel()
+
+    assert bot.connection_stats.samples > 0
+    assert bot.connection_stats.last >= 0
+
+
+@pytest.mark.asyncio
+async def test_monitor_connection__timeout() -> None:
+    """Test _monitor_connection method closing an unresponsive connection."""
+
+    bot = TestBot()
+    bot.health_check_interval = 0
+    bot.health_check_timeout = 0.01
+
+    websocket = Mock()
+    websocket.ping = AsyncMock(
+        return_value=asyncio.get_running_loop().create_future()
+    )
+    websocket.close = AsyncMock()
+
+    with patch("builtins.print"):
+        await asyncio.wait_for(bot._monitor_connection(websocket), timeout=0.1)
+
+    websocket.close.assert_awaited_once()
+    assert bot.connection_stats.timeouts == 1
+
+
+@pytest.mark.asyncio
+async def test_monitor_connection__closed() -> None:
+    """Test _monitor_connection method stopping when the connection is closed."""
+
+    bot = TestBot()
+    bot.health_check_interval = 0
+
+    websocket = Mock()
+    websocket.ping = AsyncMock(
+        side_effect=websockets.exceptions.ConnectionClosedError(None, None)
+    )
+
+    await asyncio.wait_for(bot._monitor_connection(websocket), timeout=0.1)
+
+    assert bot.connection_stats.samples == 0
+
+
+@pytest.mark.parametrize(
+    "health_check_interval, ping_interval", [(5.0, None), (None, 20)]
+)
+def test_start_loop__ping_interval(health_check_interval, ping_interval) -> None:
+    """Test _start_loop method disabling the keepalive pings
+    of the websockets library when the health checks are enabled.
+    """
+
+    bot = TestBot()
+    bot.health_check_interval = health_check_interval
+    bot._handle_messages = Mock()
+    connect = Mock(side_effect=_TestWebsocketConnectionClosedOK)
+
+    with patch("websockets.connect", connect), patch("builtins.print"):
+        asyncio.run(bot._start_loop("ws://localhost:8080"))
+
+    assert connect.call_args.kwargs["ping_interval"] == ping_interval
+
 
 def test_run(monkeypatch):
     """Test run method."""
@@ -221,26 +409,128 @@ def test_handle_messages__ping() -> None:
 
 
 def test_handle_messages__game_state(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Test _handle_messages method with a game state packet."""
+    """Test _handle_messages method with a game state packet.
+
+    The game state should be decoded in the worker thread.
+    """
 
     ws = Mock()
     bot = TestBot()
     bot._lobby_data = Mock()
-    bot._handle_next_move = Mock()
 
     game_state = Mock()
 
     monkeypatch.setattr(GameStatePayload, "from_json", Mock())
     monkeypatch.setattr(GameStateModel, "from_payload", Mock(return_value=game_state))
 
-    # Check if the _handle_next_move method was called with the game state
+    message = json.dumps({"type": PacketType.GAME_STATE, "payload": {}})
+
+    # Check if the worker thread was started with the undecoded message
+    with patch("threading.Thread") as mock_thread:
+        bot._handle_messages(ws, message)
+        mock_thread.assert_called_once_with(
+            target=bot._handle_game_state, args=(ws, message, 0)
+        )
+        mock_thread.return_value.start.assert_called_once()
+        GameStatePayload.from_json.assert_not_called()
+        assert bot._is_processing is True
+
+    # Check if the worker decodes the game state and makes the next move
     with patch.object(
-        bot, "_handle_next_move", new_callable=Mock
-    ) as mock_handle_game_state:
+        bot, "_make_next_move", new_callable=Mock
+    ) as mock_make_next_move:
+        bot._handle_game_state(ws, message, 0)
+        mock_make_next_move.assert_called_once_with(ws, game_state, 0)
+
+
+def test_handle_game_state__lazy(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test _handle_game_state method with a lazy game state.
+
+    The keys of the map tiles should be left for the lazy tiles to convert.
+    """
+
+    ws = Mock()
+    bot = TestBot()
+    bot.lazy_game_state = True
+    bot._lobby_data = Mock()
+    bot._make_next_move = Mock()
+
+    monkeypatch.setattr(GameStatePayload, "from_json", Mock())
+    monkeypatch.setattr(GameStateModel, "from_payload", Mock())
+
+    tank = {"type": "tank", "payload": {"ownerId": "id"}}
+    message = json.dumps(
+        {
+            "type": PacketType.GAME_STATE,
+            "payload": {"map": {"tiles": [[[tank]]], "zoneList": []}},
+        }
+    )
+
+    bot._handle_game_state(ws, message, 0)
+
+    data, lazy = GameStatePayload.from_json.call_args.args
+    assert lazy is True
+    assert data["map"]["tiles"] == [[[tank]]]
+    assert "zone_list" in data["map"]
+
+
+def test_handle_messages__game_state__is_processing(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test _handle_messages method with a game state packet
+    when the bot is processing.
+
+    The game state should be skipped without decoding it.
+    """
+
+    ws = Mock()
+    bot = TestBot()
+    bot._is_processing = True
+
+    monkeypatch.setattr(json, "loads", Mock())
+
+    with patch("threading.Thread") as mock_thread:
         bot._handle_messages(
             ws, json.dumps({"type": PacketType.GAME_STATE, "payload": {}})
         )
-        mock_handle_game_state.assert_called_once_with(ws, game_state)
+        mock_thread.assert_not_called()
+        json.loads.assert_not_called()
+
+
+def test_handle_messages__game_state__type_not_first() -> None:
+    """Test _handle_messages method with a game state packet
+    whose type is not the first key."""
+
+    ws = Mock()
+    bot = TestBot()
+
+    message = json.dumps({"payload": {}, "type": PacketType.GAME_STATE})
+
+    with patch("threading.Thread") as mock_thread:
+        bot._handle_messages(ws, message)
+        mock_thread.assert_called_once_with(
+            target=bot._handle_game_state, args=(ws, message, 0)
+        )
+
+
+def test_handle_game_state__decoding_failed() -> None:
+    """Test _handle_game_state method when the game state is invalid.
+
+    The method should print the error and
+    set the _is_processing flag to False.
+    """
+
+    ws = Mock()
+    bot = TestBot()
+    bot._is_processing = True
+    bot._make_next_move = Mock()
+
+    with patch("builtins.print") as mock_print:
+        bot._handle_game_state(ws, "not a json", 0)
+        mock_print.assert_called()
+
+    bot._make_next_move.assert_not_called()
+    assert bot._is_processing is False
 
 
 def test_handle_messages__lobby_data(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -268,6 +558,32 @@ def test_handle_messages__lobby_data(monkeypatch: pytest.MonkeyPatch) -> None:
     assert bot._lobby_data == lobby_data
 
 
+def test_handle_messages__lobby_data__warm_up(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test starting the warm-up once per server settings."""
+
+    ws = Mock()
+    bot = TestBot()
+    bot.on_warm_up = Mock()
+
+    lobby_data = Mock()
+    lobby_data.server_settings.seed = 1234
+    lobby_data.server_settings.grid_dimension = 24
+
+    monkeypatch.setattr(LobbyDataPayload, "from_json", Mock(return_value=TestPayload()))
+    monkeypatch.setattr(LobbyDataModel, "from_payload", Mock(return_value=lobby_data))
+
+    packet = json.dumps({"type": PacketType.LOBBY_DATA, "payload": {}})
+    bot._handle_messages(ws, packet)
+    bot._handle_messages(ws, packet)
+    bot.on_warm_up.assert_called_once_with(lobby_data, bot.warm_up)
+
+    lobby_data.server_settings.seed = 4321
+    bot._handle_messages(ws, packet)
+    assert bot.on_warm_up.call_count == 2
+
+
 @pytest.mark.parametrize(
     "packet_type, message",
     [
@@ -437,19 +753,17 @@ def test_handle_ping_packet() -> None:
 
     ws = Mock()
     bot = TestBot()
-    bot._send_packet = Mock()
+    bot._enqueue_packet = Mock()
 
-    with patch("asyncio.run_coroutine_threadsafe") as mock_run_coroutine_threadsafe:
-        bot._handle_ping_packet(ws)
+    bot._handle_ping_packet(ws)
 
-        bot._send_packet.assert_called_once_with(ws, PacketType.PONG)
-        mock_run_coroutine_threadsafe.assert_called_once()
+    bot._enqueue_packet.assert_called_once_with(ws, PacketType.PONG)
 
 
-def test_handle_next_move__is_processing():
-    """Test _handle_next_move method when the bot is processing.
+def test_start_game_state__is_processing():
+    """Test _start_game_state method when the bot is processing.
 
-    The method should not call the next_move method.
+    The method should neither start the worker nor call the next_move method.
     """
 
     bot = TestBot()
@@ -458,13 +772,15 @@ def test_handle_next_move__is_processing():
 
     bot.next_move = Mock()
 
-    bot._handle_next_move(ws, TestPayload())
+    with patch("threading.Thread") as mock_thread, patch("builtins.print"):
+        bot._start_game_state(ws, json.dumps({"type": PacketType.GAME_STATE}))
 
+    mock_thread.assert_not_called()
     bot.next_move.assert_not_called()
 
 
-def test_handle_next_move__is_not_processing():
-    """Test _handle_next_move method when the bot is not processing.
+def test_make_next_move():
+    """Test _make_next_move method.
 
     The method should call the next_move method.
     After receiving the response action, the method
@@ -472,47 +788,47 @@ def test_handle_next_move__is_not_processing():
     """
 
     bot = TestBot()
-    bot._is_processing = False
+    bot._is_processing = True
     ws = Mock()
     game_state = Mock()
     test_response_action = TestResponseAction()
 
     bot.next_move = Mock(return_value=test_response_action)
-    bot._send_packet = Mock()
+    bot._enqueue_packet = Mock()
 
-    with patch("asyncio.run_coroutine_threadsafe") as mock_run_coroutine_threadsafe:
-        bot._handle_next_move(ws, game_state)
+    bot._make_next_move(ws, game_state, 0)
 
-        # Check if the next_move method was called
-        bot.next_move.assert_called_once_with(game_state)
+    # Check if the next_move method was called
+    bot.next_move.assert_called_once_with(game_state)
 
-        # Check if the _is_processing flag was set to False
-        assert bot._is_processing is False
+    # Check if the _is_processing flag was set to False
+    assert bot._is_processing is False
 
-        # Check if the packet was sent
-        mock_run_coroutine_threadsafe.assert_called_once()
-        bot._send_packet.assert_called_once_with(
-            ws,
-            test_response_action.packet_type,
-            test_response_action.to_payload(game_state.id),
-        )
+    # Check if the packet was queued
+    bot._enqueue_packet.assert_called_once_with(
+        ws,
+        test_response_action.packet_type,
+        test_response_action.to_payload(game_state.id),
+    )
 
 
-def test_handle_next_move__keyboard_interrupt():
-    """Test _handle_next_move method when a KeyboardInterrupt is raised."""
+def test_make_next_move__keyboard_interrupt():
+    """Test _make_next_move method when a KeyboardInterrupt is raised."""
 
     bot = TestBot()
-    bot._is_processing = False
+    bot._is_processing = True
     ws = Mock()
 
     bot.next_move = Mock(side_effect=KeyboardInterrupt)
 
     with pytest.raises(KeyboardInterrupt):
-        bot._handle_next_move(ws, Mock())
+        bot._make_next_move(ws, Mock(), 0)
 
+    assert bot._is_processing is False
 
-def test_handle_next_move__next_move_failed():
-    """Test _handle_next_move method when
+
+def test_make_next_move__next_move_failed():
+    """Test _make_next_move method when
     the next_move method raises an exception.
 
     The method should print the error and
@@ -520,14 +836,15 @@ def test_handle_next_move__next_move_failed():
     """
 
     bot = TestBot()
-    bot._is_processing = False
+    bot._is_processing = True
     ws = Mock()
 
     bot.next_move = Mock(side_effect=Exception)
+    bot._enqueue_packet = Mock()
 
     # Check if the error is printed
     with patch("builtins.print") as mock_print:
-        bot._handle_next_move(ws, TestPayload())
+        bot._make_next_move(ws, Mock(), 0)
         mock_print.assert_called()
 
     # Check if the next_move method was called
@@ -535,32 +852,49 @@ def test_handle_next_move__next_move_failed():
 
     # Check if the _is_processing flag was set to False
     assert bot._is_processing is False
+    bot._enqueue_packet.assert_not_called()
 
 
-def test_handle_next_move_pass():
-    """Test _handle_next_move method when the next move returns `None`."""
+def test_make_next_move__pass():
+    """Test _make_next_move method when the next move returns `None`."""
 
     ws = AsyncMock()
     game_state = Mock()
 
     bot = TestBot()
-    bot._is_processing = False
+    bot._is_processing = True
     bot.next_move = Mock(return_value=None)
-    bot._send_packet = Mock()
+    bot._enqueue_packet = Mock()
 
-    with patch("asyncio.run_coroutine_threadsafe") as mock_run_coroutine_threadsafe:
-        bot._handle_next_move(ws, game_state)
+    bot._make_next_move(ws, game_state, 0)
 
-        # Check if the next_move method was called
-        bot.next_move.assert_called_once_with(game_state)
+    # Check if the next_move method was called
+    bot.next_move.assert_called_once_with(game_state)
+
+    # Check if the _is_processing flag was set to False
+    assert bot._is_processing is False
+
+    # Check if the packet was queued
+    payload = Pass().to_payload(game_state.id)
+    bot._enqueue_packet.assert_called_once_with(ws, Pass().packet_type, payload)
 
-        # Check if the _is_processing flag was set to False
-        assert bot._is_processing is False
 
-        # Check if the packet was sent
-        mock_run_coroutine_threadsafe.assert_called_once()
-        payload = Pass().to_payload(game_state.id)
-        bot._send_packet.assert_called_once_with(ws, Pass().packet_type, payload)
+def test_make_next_move__stale_generation():
+    """Test _make_next_move method when the connection was replaced.
+
+    A worker of a lost connection should not reset
+    the _is_processing flag set for the new connection.
+    """
+
+    bot = TestBot()
+    bot._generation = 2
+    bot._is_processing = True
+    bot.next_move = Mock(return_value=None)
+    bot._enqueue_packet = Mock()
+
+    bot._make_next_move(Mock(), Mock(), 1)
+
+    assert bot._is_processing is True
 
 
 def test_send_ready_to_receive_game_state() -> None:
@@ -568,15 +902,13 @@ def test_send_ready_to_receive_game_state() -> None:
 
     ws = Mock()
     bot = TestBot()
-    bot._send_packet = Mock()
+    bot._enqueue_packet = Mock()
 
-    with patch("asyncio.run_coroutine_threadsafe") as mock_run_coroutine_threadsafe:
-        bot._send_ready_to_receive_game_state(ws)
+    bot._send_ready_to_receive_game_state(ws)
 
-        bot._send_packet.assert_called_once_with(
-            ws, PacketType.READY_TO_RECEIVE_GAME_STATE
-        )
-        mock_run_coroutine_threadsafe.assert_called_once()
+    bot._enqueue_packet.assert_called_once_with(
+        ws, PacketType.READY_TO_RECEIVE_GAME_STATE
+    )
 
 
 def test_send_lobby_data_request() -> None:
@@ -584,13 +916,11 @@ def test_send_lobby_data_request() -> None:
 
     ws = Mock()
     bot = TestBot()
-    bot._send_packet = Mock()
+    bot._enqueue_packet = Mock()
 
-    with patch("asyncio.run_coroutine_threadsafe") as mock_run_coroutine_threadsafe:
-        bot.send_lobby_data_request(ws)
+    bot.send_lobby_data_request(ws)
 
-        bot._send_packet.assert_called_once_with(ws, PacketType.LOBBY_DATA_REQUEST)
-        mock_run_coroutine_threadsafe.assert_called_once()
+    bot._enqueue_packet.assert_called_once_with(ws, PacketType.LOBBY_DATA_REQUEST)
 
 
 def test_send_game_status_request() -> None:
@@ -598,10 +928,89 @@ def test_send_game_status_request() -> None:
 
     ws = Mock()
     bot = TestBot()
-    bot._send_packet = Mock()
+    bot._enqueue_packet = Mock()
+
+    bot._send_game_status_request(ws)
+
+    bot._enqueue_packet.assert_called_once_with(ws, PacketType.GAME_STATUS_REQUEST)
+
+
+def test_enqueue_packet() -> None:
+    """Test _enqueue_packet method handing the packet over to the event loop."""
+
+    ws = Mock()
+    bot = TestBot()
+    bot._loop = Mock()
+
+    bot._enqueue_packet(ws, PacketType.PONG)
+
+    bot._loop.call_soon_threadsafe.assert_called_once()
+    callback, websocket, message, _ = bot._loop.call_soon_threadsafe.call_args.args
+    assert callback == bot._push_packet
+    assert websocket is ws
+    assert json.loads(message) == {"type": PacketType.PONG}
+
+
+def test_enqueue_packet__loop_closed() -> None:
+    """Test _enqueue_packet method dropping the packet after the loop is closed."""
+
+    bot = TestBot()
+    bot._loop = asyncio.new_event_loop()
+    bot._loop.close()
+
+    bot._enqueue_packet(Mock(), PacketType.PONG)
+
+    assert bot.send_stats.dropped == 1
+
+
+@pytest.mark.asyncio
+async def test_write_packets() -> None:
+    """Test _write_packets method sending the queued packets in order."""
+
+    ws = AsyncMock()
+    closed = Mock()
+    bot = TestBot()
+    bot._loop = asyncio.get_running_loop()
+
+    bot._enqueue_packet(ws, PacketType.PONG)
+    bot._enqueue_packet(closed, PacketType.PONG)
+    bot._enqueue_packet(ws, PacketType.LOBBY_DATA_REQUEST)
+    writer = asyncio.create_task(bot._write_packets(ws))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    # Check if the packets queued after the start are sent as well
+    bot._enqueue_packet(ws, PacketType.GAME_STATUS_REQUEST)
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    writer.cancel()
+
+    sent = [json.loads(call.args[0])["type"] for call in ws.send.await_args_list]
+    assert sent == [
+        PacketType.PONG,
+        PacketType.LOBBY_DATA_REQUEST,
+        PacketType.GAME_STATUS_REQUEST,
+    ]
+    assert bot.send_stats.sent == 3
+    assert bot.send_stats.dropped == 1
+    assert bot.send_stats.max_pending == 3
+
+
+@pytest.mark.asyncio
+async def test_write_packets__connection_closed() -> None:
+    """Test _write_packets method stopping when the connection is closed."""
+
+    ws = AsyncMock()
+    ws.send.side_effect = websockets.exceptions.ConnectionClosedError(
+        websockets.frames.Close(1011, "test"), None
+    )
+    bot = TestBot()
+    bot._loop = asyncio.get_running_loop()
 
-    with patch("asyncio.run_coroutine_threadsafe") as mock_run_coroutine_threadsafe:
-        bot._send_game_status_request(ws)
+    bot._enqueue_packet(ws, PacketType.PONG)
+    await asyncio.sleep(0)
+    await asyncio.wait_for(bot._write_packets(ws), timeout=0.1)
 
-        bot._send_packet.assert_called_once_with(ws, PacketType.GAME_STATUS_REQUEST)
-        mock_run_coroutine_threadsafe.assert_called_once()
+    assert bot.send_stats.sent == 0
+    # The packet being sent is lost with the connection.
+    assert bot.send_stats.dropped == 1
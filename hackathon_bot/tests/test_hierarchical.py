@@ -0,0 +1,156 @@
+"""Tests for hierarchical.py module."""
+
+import random
+from collections import deque
+
+import pytest
+
+from hackathon_bot.hierarchical import HierarchicalPathfinder
+
+# The walls of the map used in the tests, split into four clusters:
+#     ┌ ─ ┬ ─ ┬ ─ ┬ ─ ┐
+#     │   │   │ W │   │
+#     ├ ─ ┼ ─ ┼ ─ ┼ ─ ┤
+#     │ W │   │   │   │
+#     ├ ─ ┼ ─ ┼ ─ ┼ ─ ┤
+#     │   │   │ W │   │
+#     ├ ─ ┼ ─ ┼ ─ ┼ ─ ┤
+#     │   │ W │   │   │
+#     └ ─ ┴ ─ ┴ ─ ┴ ─ ┘
+walls = (
+    (False, False, True, False),
+    (True, False, False, False),
+    (False, False, True, False),
+    (False, True, False, False),
+)
+
+
+def _shortest(walls_, start, goal, obstacles=frozenset()):
+    height = len(walls_)
+    width = len(walls_[0])
+    distances = {start: 0}
+    queue = deque([start])
+    while queue:
+        x, y = queue.popleft()
+        if (x, y) == goal:
+            return distances[goal]
+        for nx, ny in ((x, y - 1), (x + 1, y), (x, y + 1), (x - 1, y)):
+            if (
+                0 <= nx < width
+                and 0 <= ny < height
+                and not walls_[ny][nx]
+                and (nx, ny) not in distances
+                and ((nx, ny) not in obstacles or (nx, ny) == goal)
+            ):
+                distances[(nx, ny)] = distances[(x, y)] + 1
+                queue.append((nx, ny))
+    return None
+
+
+def _assert_valid(walls_, start, goal, path, obstacles=frozenset()):
+    previous = start
+    for x, y in path:
+        assert abs(x - previous[0]) + abs(y - previous[1]) == 1
+        assert not walls_[y][x]
+        assert (x, y) not in obstacles or (x, y) == goal
+        previous = (x, y)
+    assert previous == goal
+
+
+def test_HierarchicalPathfinder_invalid_cluster_size():
+    """Test creating a pathfinder with an invalid cluster size."""
+
+    with pytest.raises(ValueError):
+        HierarchicalPathfinder(walls, 0)
+
+
+def test_HierarchicalPathfinder_entrances():
+    """Test finding the entrances between the clusters."""
+
+    pathfinder = HierarchicalPathfinder(walls, 2)
+
+    assert pathfinder.cluster_of(3, 0) == 1
+    assert pathfinder.cluster_of(0, 3) == 2
+    assert pathfinder.entrances == [(1, 1), (1, 2), (2, 1), (3, 1), (3, 2)]
+
+
+def test_HierarchicalPathfinder_find_path():
+    """Test finding a path through the clusters."""
+
+    pathfinder = HierarchicalPathfinder(walls, 2)
+
+    path = pathfinder.find_path((0, 0), (3, 3))
+
+    assert len(path) == 6
+    _assert_valid(walls, (0, 0), (3, 3), path)
+    assert pathfinder.find_path((0, 0), (0, 0)) == []
+    assert pathfinder.distance((0, 2), (3, 0)) == 5
+
+
+def test_HierarchicalPathfinder_find_path__unreachable():
+    """Test finding a path to a wall or a closed area."""
+
+    closed = (
+        (False, True, False),
+        (True, False, False),
+        (False, False, False),
+    )
+    pathfinder = HierarchicalPathfinder(closed, 2)
+
+    assert pathfinder.find_path((0, 0), (2, 2)) is None
+    assert pathfinder.find_path((2, 2), (1, 0)) is None
+
+
+def test_HierarchicalPathfinder_update_obstacles():
+    """Test recomputing only the clusters with changed obstacles."""
+
+    pathfinder = HierarchicalPathfinder(walls, 2)
+
+    assert pathfinder.update_obstacles([(1, 2)]) == {0, 2}
+    assert pathfinder.obstacles == {(1, 2)}
+    assert pathfinder.find_path((1, 1), (0, 2)) is None
+    assert pathfinder.find_path((1, 1), (3, 1)) == [(2, 1), (3, 1)]
+
+    assert pathfinder.update_obstacles([(1, 2)]) == set()
+    assert pathfinder.update_obstacles([]) == {0, 2}
+    assert pathfinder.find_path((1, 1), (0, 2)) == [(1, 2), (0, 2)]
+
+
+def test_HierarchicalPathfinder_find_path__obstacle_ends():
+    """Test finding a path from and to obstacles on the borders."""
+
+    pathfinder = HierarchicalPathfinder(walls, 2)
+    pathfinder.update_obstacles([(1, 1)])
+
+    assert pathfinder.find_path((0, 0), (3, 3)) is None
+    assert pathfinder.find_path((1, 0), (1, 1)) == [(1, 1)]
+    assert pathfinder.find_path((1, 1), (3, 1)) == [(2, 1), (3, 1)]
+    assert pathfinder.obstacles == {(1, 1)}
+    assert pathfinder.find_path((0, 0), (3, 3)) is None
+
+
+def test_HierarchicalPathfinder_random_maps():
+    """Test that the paths are valid and almost the shortest ones."""
+
+    rng = random.Random(0)
+    for _ in range(10):
+        dimension = rng.choice((9, 16, 24))
+        grid = [
+            [rng.random() < 0.25 for _ in range(dimension)] for _ in range(dimension)
+        ]
+        free = [
+            (x, y) for y in range(dimension) for x in range(dimension) if not grid[y][x]
+        ]
+        obstacles = set(rng.sample(free, 10))
+        pathfinder = HierarchicalPathfinder(grid, rng.choice((3, 4, 8)))
+        pathfinder.update_obstacles(obstacles)
+
+        for _ in range(20):
+            start, goal = rng.sample(free, 2)
+            shortest = _shortest(grid, start, goal, obstacles - {start})
+            path = pathfinder.find_path(start, goal)
+            if shortest is None:
+                assert path is None
+                continue
+            _assert_valid(grid, start, goal, path, obstacles - {start})
+            assert shortest <= len(path) <= shortest * 2
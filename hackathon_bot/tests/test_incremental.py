@@ -0,0 +1,153 @@
+"""Tests for incremental.py module."""
+
+import random
+from collections import deque
+
+from hackathon_bot.incremental import IncrementalPathfinder
+
+# The walls of the map used in the tests:
+#     ┌ ─ ┬ ─ ┬ ─ ┬ ─ ┐
+#     │   │   │   │   │
+#     ├ ─ ┼ ─ ┼ ─ ┼ ─ ┤
+#     │   │ W │ W │   │
+#     ├ ─ ┼ ─ ┼ ─ ┼ ─ ┤
+#     │   │   │   │ W │
+#     └ ─ ┴ ─ ┴ ─ ┴ ─ ┘
+walls = (
+    (False, False, False, False),
+    (False, True, True, False),
+    (False, False, False, True),
+)
+
+
+def _shortest(walls_, start, goals, obstacles):
+    height = len(walls_)
+    width = len(walls_[0])
+    distances = {start: 0}
+    queue = deque([start])
+    while queue:
+        x, y = queue.popleft()
+        if (x, y) in goals:
+            return distances[(x, y)]
+        for nx, ny in ((x, y - 1), (x + 1, y), (x, y + 1), (x - 1, y)):
+            if (
+                0 <= nx < width
+                and 0 <= ny < height
+                and not walls_[ny][nx]
+                and (nx, ny) not in distances
+                and ((nx, ny) not in obstacles or (nx, ny) in goals)
+            ):
+                distances[(nx, ny)] = distances[(x, y)] + 1
+                queue.append((nx, ny))
+    return None
+
+
+def test_IncrementalPathfinder_find_path():
+    """Test finding a path to the nearest goal."""
+
+    pathfinder = IncrementalPathfinder(walls)
+
+    assert pathfinder.find_path((0, 2), [(3, 1)]) == [
+        (0, 1),
+        (0, 0),
+        (1, 0),
+        (2, 0),
+        (3, 0),
+        (3, 1),
+    ]
+    assert pathfinder.find_path((0, 2), [(3, 1), (2, 2)]) == [(1, 2), (2, 2)]
+    assert pathfinder.find_path((2, 2), None) == []
+    assert pathfinder.goals == {(3, 1), (2, 2)}
+
+
+def test_IncrementalPathfinder_find_path__unreachable():
+    """Test finding a path to a goal closed by obstacles."""
+
+    pathfinder = IncrementalPathfinder(walls)
+    pathfinder.update_obstacles([(1, 2), (0, 1)])
+
+    assert pathfinder.find_path((0, 2), [(3, 0)]) is None
+    assert pathfinder.distance((0, 2)) is None
+    assert pathfinder.find_path((0, 2), [(3, 2)]) is None
+
+
+def test_IncrementalPathfinder_update_obstacles():
+    """Test repairing the path when an obstacle appears and disappears."""
+
+    pathfinder = IncrementalPathfinder(walls)
+    assert pathfinder.distance((0, 2), [(2, 2)]) == 2
+
+    pathfinder.update_obstacles([(1, 2)])
+    assert pathfinder.obstacles == {(1, 2)}
+    assert pathfinder.distance((0, 2)) is None
+    assert pathfinder.distance((3, 0), [(0, 2)]) == 5
+
+    pathfinder.update_obstacles([])
+    assert pathfinder.find_path((0, 2), [(2, 2)]) == [(1, 2), (2, 2)]
+
+
+def test_IncrementalPathfinder_obstacle_ends():
+    """Test that the start and the goals are passable."""
+
+    pathfinder = IncrementalPathfinder(walls)
+    pathfinder.update_obstacles([(0, 0), (3, 1)])
+
+    assert pathfinder.find_path((0, 0), [(3, 1)]) == [
+        (1, 0),
+        (2, 0),
+        (3, 0),
+        (3, 1),
+    ]
+    assert pathfinder.distance((1, 0), [(0, 2)]) is None
+    assert pathfinder.distance((1, 0), [(0, 0)]) == 1
+
+
+def test_IncrementalPathfinder_repair_cost():
+    """Test that a small change expands fewer tiles than the first search."""
+
+    open_map = [[False] * 20 for _ in range(20)]
+    pathfinder = IncrementalPathfinder(open_map)
+
+    pathfinder.distance((0, 0), [(19, 19)])
+    first = pathfinder.expanded
+    pathfinder.distance((1, 0))
+    moved = pathfinder.expanded
+    pathfinder.update_obstacles([(15, 3)])
+    pathfinder.distance((1, 0))
+    blocked = pathfinder.expanded
+
+    assert pathfinder.distance((1, 0)) == 37
+    assert moved < first
+    assert blocked < first
+
+
+def test_IncrementalPathfinder_random_changes():
+    """Test the distances after random changes against a new search."""
+
+    rng = random.Random(0)
+    for _ in range(10):
+        dimension = rng.choice((6, 12, 20))
+        grid = [
+            [rng.random() < 0.25 for _ in range(dimension)] for _ in range(dimension)
+        ]
+        free = [
+            (x, y) for y in range(dimension) for x in range(dimension) if not grid[y][x]
+        ]
+        pathfinder = IncrementalPathfinder(grid)
+        obstacles = set()
+        goals = {rng.choice(free)}
+        start = rng.choice(free)
+
+        for _ in range(30):
+            change = rng.random()
+            if change < 0.4:
+                obstacles ^= {rng.choice(free)}
+            elif change < 0.6:
+                goals = set(rng.sample(free, rng.randint(1, 3)))
+            else:
+                start = rng.choice(free)
+
+            pathfinder.update_obstacles(obstacles)
+            path = pathfinder.find_path(start, goals)
+            shortest = _shortest(grid, start, goals, obstacles)
+            assert (None if path is None else len(path)) == shortest
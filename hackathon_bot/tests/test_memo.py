@@ -0,0 +1,145 @@
+"""Tests for memo.py module."""
+
+import pytest
+
+from hackathon_bot.enums import Direction
+from hackathon_bot.memo import CacheStats, TranspositionTable, ZobristHasher, memoize
+
+
+def test_TranspositionTable_get_put():
+    """Test storing and finding the results."""
+
+    table = TranspositionTable(2)
+    table.put(1, "a")
+
+    assert table.get(1) == "a"
+    assert table.get(2) is None
+    assert table.get(2, "default") == "default"
+    assert table.stats == CacheStats(hits=1, misses=2, evictions=0)
+    assert table.stats.hit_rate == pytest.approx(1 / 3)
+
+
+def test_TranspositionTable_eviction():
+    """Test evicting the least recently used result."""
+
+    table = TranspositionTable(2)
+    table.put(1, "a")
+    table.put(2, "b")
+    table.get(1)
+    table.put(3, "c")
+
+    assert 1 in table
+    assert 2 not in table
+    assert 3 in table
+    assert len(table) == 2
+    assert table.stats.evictions == 1
+
+    table.clear()
+    assert len(table) == 0
+    assert table.stats == CacheStats()
+
+
+def test_TranspositionTable_maxsize():
+    """Test rejecting a table without space."""
+
+    with pytest.raises(ValueError):
+        TranspositionTable(0)
+
+
+def test_ZobristHasher_hash_positions():
+    """Test hashing the positions independently of their order."""
+
+    hasher = ZobristHasher(4, 4)
+    positions = [(0, 0), (1, 2), (3, 3)]
+
+    value = hasher.hash_positions(ZobristHasher.WALL, positions)
+
+    assert value == hasher.hash_positions(ZobristHasher.WALL, positions[::-1])
+    assert value != hasher.hash_positions(ZobristHasher.BULLET, positions)
+    # Adding and removing a feature is a single XOR.
+    assert value ^ hasher.key(ZobristHasher.WALL, 3, 3) == hasher.hash_positions(
+        ZobristHasher.WALL, positions[:2]
+    )
+
+
+def test_ZobristHasher_hash_positions__directions():
+    """Test hashing the directions of the features."""
+
+    hasher = ZobristHasher(4, 4)
+    up = (1, 2, Direction.UP)
+    down = (1, 2, Direction.DOWN)
+
+    assert hasher.hash_positions(ZobristHasher.BULLET, [up]) != hasher.hash_positions(
+        ZobristHasher.BULLET, [down]
+    )
+    assert hasher.hash_positions(ZobristHasher.BULLET, [up]) == hasher.key(
+        ZobristHasher.BULLET, 1, 2, Direction.UP
+    )
+    # Swapping the directions of two bullets changes the hash.
+    assert hasher.hash_positions(
+        ZobristHasher.BULLET, [up, (3, 3, Direction.DOWN)]
+    ) != hasher.hash_positions(ZobristHasher.BULLET, [down, (3, 3, Direction.UP)])
+
+
+def test_ZobristHasher_hash_positions__repeated():
+    """Test that repeated features do not cancel out."""
+
+    hasher = ZobristHasher(4, 4)
+    single = hasher.hash_positions(ZobristHasher.BULLET, [(1, 2)])
+    double = hasher.hash_positions(ZobristHasher.BULLET, [(1, 2), (1, 2)])
+
+    assert double != 0
+    assert double != single
+
+
+def test_ZobristHasher_hash_local():
+    """Test hashing only the features near the tank."""
+
+    hasher = ZobristHasher(8, 8)
+    pose = (2, 2, Direction.UP, Direction.LEFT)
+
+    near = hasher.hash_local(*pose, {ZobristHasher.BULLET: [(3, 3)]}, radius=2)
+    far = hasher.hash_local(*pose, {ZobristHasher.BULLET: [(3, 3), (7, 7)]}, radius=2)
+
+    assert near == far
+    assert near != hasher.hash_local(*pose, {ZobristHasher.BULLET: [(3, 3), (7, 7)]})
+    assert near != hasher.hash_local(
+        2, 2, Direction.DOWN, Direction.LEFT, {ZobristHasher.BULLET: [(3, 3)]}
+    )
+
+
+def test_memoize():
+    """Test caching the results of a function."""
+
+    calls = []
+
+    @memoize(maxsize=8)
+    def square(value, offset=0):
+        calls.append(value)
+        return value * value + offset
+
+    assert square(3) == 9
+    assert square(3) == 9
+    assert square(3, offset=1) == 10
+    assert calls == [3, 3]
+    assert square.table.stats.hits == 1
+
+
+def test_memoize__method_key():
+    """Test caching the results of a method with a custom key."""
+
+    class Bot:
+        def __init__(self):
+            self.calls = 0
+
+        @memoize(key=lambda self, position, tick: position)
+        def evaluate(self, position, tick):
+            self.calls += 1
+            return position[0] + position[1]
+
+    bot = Bot()
+
+    assert bot.evaluate((1, 2), 1) == 3
+    assert bot.evaluate((1, 2), 2) == 3
+    assert bot.calls == 1
+    assert Bot.evaluate.table.stats.misses == 1
@@ -1,9 +1,21 @@
 """Tests for models.py module."""
 
+from unittest.mock import patch
+
 import pytest
 
-from hackathon_bot.enums import BulletType, Direction, Orientation, ZoneStatus
+from hackathon_bot import models
+
+from hackathon_bot import payloads
+from hackathon_bot.enums import (
+    BulletType,
+    Direction,
+    EntityKind,
+    Orientation,
+    ZoneStatus,
+)
 from hackathon_bot.models import (
+    AgentTankModel,
     BulletModel,
     ItemModel,
     LaserModel,
@@ -15,9 +27,11 @@ from hackathon_bot.models import (
     ZoneModel,
     GameResultModel,
     GameStateModel,
+    LazyTileModel,
     LobbyDataModel,
     MapModel,
     TileModel,
+    register_tile_entity,
 )
 from hackathon_bot.payloads import (
     GameEndPayload,
@@ -680,6 +694,254 @@ def test_Map_from_raw():
     assert all(isinstance(v, str) for v in map_.visibility)
 
 
+def test_Map_from_raw__lazy():
+    """Test MapModel.from_raw method in lazy mode.
+
+    The entities should be created only for the accessed tiles,
+    both from the raw JSON and from the parsed raw tile objects.
+    """
+
+    agent_id = "7ed26efb-135d-4cd7-8bc7-c867a0b36d77"
+    tiles = (
+        (
+            [{"type": "wall"}],
+            [
+                {
+                    "type": "tank",
+                    "payload": {
+                        "owner_id": agent_id,
+                        "direction": 0,
+                        "turret": {"direction": 1},
+                    },
+                }
+            ],
+        ),
+        (
+            (RawTileObject("item", RawItem(2)),),
+            [],
+        ),
+    )
+    zones = (RawZone(**zone_json_data_without_status, status="neutral"),)
+    raw_map = RawMap(tiles, zones, ("10", "11"))
+
+    map_ = MapModel.from_raw(raw_map, agent_id, lazy=True)
+
+    lazy_tiles = (map_.tiles[0][0], map_.tiles[0][1], map_.tiles[1][0])
+    assert all(isinstance(tile, LazyTileModel) for tile in lazy_tiles)
+    assert not any(tile.is_materialized for tile in lazy_tiles[:2])
+
+    # The tiles with a tank are created for the entity index.
+    assert map_.tiles[1][0].is_materialized
+
+    # Empty tiles do not need to be created lazily.
+    assert isinstance(map_.tiles[1][1], TileModel)
+
+    # The visibility and zones should be available without creating entities.
+    assert map_.tiles[0][0].is_visible is True
+    assert map_.tiles[0][1].is_visible is False
+    assert isinstance(map_.tiles[0][0].zone, ZoneModel)
+
+    assert isinstance(map_.tiles[0][0].entities[0], WallModel)
+    assert map_.tiles[0][0].is_materialized
+    assert not map_.tiles[0][1].is_materialized
+
+    assert isinstance(map_.tiles[1][0].entities[0], AgentTankModel)
+    assert isinstance(map_.tiles[0][1].entities[0], ItemModel)
+    assert map_.tiles[1][1].entities == ()
+
+    # The entities should be created only once.
+    assert map_.tiles[0][0].entities is map_.tiles[0][0].entities
+
+
+def test_Map_from_raw__index():
+    """Test MapModel.from_raw method creating the entity index.
+
+    The map has the following tiles:
+        ┌ ─ ┬ ─ ┬ ─ ┐
+        │ W │ A │ L │
+        ├ ─ ┼ ─ ┼ ─ ┤
+        │ B │M_T│ I │
+        └ ─ ┴ ─ ┴ ─ ┘
+    """
+
+    tiles = (
+        (
+            (RawTileObject("wall", RawWall()),),
+            (RawTileObject("bullet", RawBullet(1, 2, Direction.UP, 0)),),
+        ),
+        (
+            (RawTileObject("tank", RawTank("agent", 3, RawTurret(3, 2, 10), 100)),),
+            (
+                RawTileObject("tank", RawTank("enemy", 2, RawTurret(2))),
+                RawTileObject("mine", RawMine(4, None)),
+            ),
+        ),
+        (
+            (RawTileObject("laser", RawLaser(555, 1)),),
+            (RawTileObject("item", RawItem(2)),),
+        ),
+    )
+    raw_map = RawMap(tiles, (), ("111", "111"))
+
+    for lazy in (False, True):
+        index = MapModel.from_raw(raw_map, "agent", lazy).index
+
+        assert isinstance(index.my_tank, AgentTankModel)
+        assert index.my_position == (1, 0)
+        assert list(index.enemy_tanks) == ["enemy"]
+        assert isinstance(index.enemy_tanks["enemy"], TankModel)
+        assert index.enemy_positions == {"enemy": (1, 1)}
+        assert index.walls == [(0, 0)]
+        assert index.bullets == [(0, 1)]
+        assert index.lasers == [(2, 0)]
+        assert index.mines == [(1, 1)]
+        assert index.items == [(2, 1)]
+
+
+def test_LazyTileModel__camel_case_json():
+    """Test LazyTileModel converting the keys of the raw JSON as sent by the server."""
+
+    agent_id = "7ed26efb-135d-4cd7-8bc7-c867a0b36d77"
+    raw = [
+        {
+            "type": "tank",
+            "payload": {
+                "ownerId": "enemy",
+                "direction": 0,
+                "turret": {"direction": 1},
+            },
+        }
+    ]
+
+    tile = LazyTileModel(raw, agent_id, None, True)
+
+    assert not tile.is_materialized
+    assert tile.entities[0].owner_id == "enemy"
+
+
+def test_Map_from_raw__index_lazy_json():
+    """Test MapModel.from_raw method indexing raw JSON tiles in lazy mode.
+
+    Only the tiles with a tank should be created.
+    """
+
+    tiles = (
+        ([{"type": "wall"}], [{"type": "mine", "payload": {"id": 1}}]),
+        ([{"type": "item", "payload": {"type": 1}}], []),
+    )
+    raw_map = RawMap(tiles, (), ("11", "11"))
+
+    map_ = MapModel.from_raw(raw_map, "agent", lazy=True)
+
+    assert map_.index.my_tank is None
+    assert map_.index.my_position is None
+    assert map_.index.walls == [(0, 0)]
+    assert map_.index.mines == [(0, 1)]
+    assert map_.index.items == [(1, 0)]
+    assert not map_.tiles[0][0].is_materialized
+
+
+def test_Map_from_raw__shared_instances():
+    """Test MapModel.from_raw method sharing immutable instances.
+
+    Walls, items of the same type, other players' turrets and equal
+    empty tiles should be shared instead of created for every tile.
+    """
+
+    tiles = (
+        (
+            (RawTileObject("wall", RawWall()),),
+            (RawTileObject("item", RawItem(2)),),
+            (),
+        ),
+        (
+            (RawTileObject("wall", RawWall()),),
+            (RawTileObject("item", RawItem(2)),),
+            (),
+        ),
+        (
+            (RawTileObject("tank", RawTank("a", 1, RawTurret(1))),),
+            (RawTileObject("tank", RawTank("b", 2, RawTurret(1))),),
+            (),
+        ),
+    )
+    raw_map = RawMap(tiles, (), ("111", "111", "111"))
+
+    map_ = MapModel.from_raw(raw_map, "id")
+
+    assert map_.tiles[0][0].entities[0] is map_.tiles[0][1].entities[0]
+    assert map_.tiles[1][0].entities[0] is map_.tiles[1][1].entities[0]
+    assert (
+        map_.tiles[0][2].entities[0].turret is map_.tiles[1][2].entities[0].turret
+    )
+    assert map_.tiles[2][0] is map_.tiles[2][1]
+    assert map_.tiles[2][0].entities == ()
+
+
+@pytest.fixture(name="registry")
+def fixture_registry():
+    """Restores the tile object registries after the test."""
+
+    # pylint: disable=protected-access
+    with patch.dict(models._ENTITY_FACTORIES), patch.dict(
+        models._TYPE_KINDS
+    ), patch.dict(payloads._TILE_ENTITY_CLASSES):
+        yield
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_register_tile_entity(registry, lazy):
+    """Test register_tile_entity function with a new tile object type.
+
+    The entities should be parsed, created and indexed by their kind.
+    """
+
+    # pylint: disable=unused-argument
+    register_tile_entity(
+        "portal", RawWall, lambda raw, agent_id: WallModel(), EntityKind.WALL
+    )
+    payload = GameStatePayload.from_json(
+        {
+            "id": "id",
+            "tick": 1,
+            "players": [],
+            "map": {
+                "tiles": [[[{"type": "portal"}]]],
+                "zones": [],
+                "visibility": ["1"],
+            },
+        },
+        lazy,
+    )
+    map_ = MapModel.from_raw(payload.map, "id", lazy)
+
+    assert map_.tiles[0][0].entities == (WallModel(),)
+    assert list(map_.index.walls) == [(0, 0)]
+
+
+def test_register_tile_entity__wrong_kind(registry):
+    """Test register_tile_entity function with a model of another kind.
+
+    The function should raise TypeError for a kind that is not an EntityKind
+    and the creation of a model without the registered kind should too.
+    """
+
+    # pylint: disable=unused-argument
+    with pytest.raises(TypeError):
+        register_tile_entity("portal", RawWall, lambda raw, agent_id: None, "wall")
+
+    register_tile_entity(
+        "portal", RawWall, lambda raw, agent_id: WallModel(), EntityKind.MINE
+    )
+    raw_map = RawMap(
+        (((RawTileObject("portal", RawWall()),),),),
+        (()),
+        ("1",),
+    )
+    with pytest.raises(TypeError):
+        MapModel.from_raw(raw_map, "id")
+
+
 def test_Map_from_raw__unknown_tile_type():
     """Test MapModel.from_raw method with an unknown tile type.
 
@@ -745,6 +1007,12 @@ def test_GameState_from_payload():
     # Check if the map attribute is an instance of MapModel.
     assert isinstance(game_state.map, MapModel)
 
+    # Check if the players can be looked up by their identifiers.
+    assert game_state.players_by_id[
+        "e149e7a5-c849-4765-81be-c4538db33ecd"
+    ] is game_state.players[1]
+    assert game_state.index is game_state.map.index
+
 
 def test_GameResult_from_payload():
     """Test GameResultModel.from_payload method."""
@@ -0,0 +1,157 @@
+"""Tests for occupancy.py module."""
+
+import subprocess
+import sys
+
+import numpy as np
+
+from hackathon_bot.enums import Direction
+from hackathon_bot.models import GameStateModel
+from hackathon_bot.occupancy import OccupancyGrid, OccupancyTracker
+from hackathon_bot.payloads import (
+    GameStatePayload,
+    RawMap,
+    RawPlayer,
+    RawTank,
+    RawTileObject,
+    RawTurret,
+    RawWall,
+)
+
+# The walls of the map used in the tests:
+#     ┌ ─ ┬ ─ ┬ ─ ┐
+#     │   │ W │   │
+#     ├ ─ ┼ ─ ┼ ─ ┤
+#     │   │ W │   │
+#     ├ ─ ┼ ─ ┼ ─ ┤
+#     │   │   │   │
+#     └ ─ ┴ ─ ┴ ─ ┘
+walls = np.array(
+    [
+        [False, True, False],
+        [False, True, False],
+        [False, False, False],
+    ]
+)
+nothing_visible = np.zeros((3, 3), dtype=bool)
+
+
+def test_OccupancyGrid_init():
+    """Test spreading the initial probability over the tiles without walls."""
+
+    grid = OccupancyGrid(walls)
+
+    assert np.isclose(grid.probabilities.sum(), 1.0)
+    assert grid.probabilities[0, 1] == 0.0
+    assert np.isclose(grid.probabilities[0, 0], 1 / 7)
+
+
+def test_OccupancyGrid_predict():
+    """Test spreading the probability by one move of the tank."""
+
+    grid = OccupancyGrid(walls)
+    grid.observe(0, 0)
+
+    grid.predict()
+
+    # The tile (0, 0) has one neighbour without a wall.
+    assert np.isclose(grid.probabilities[0, 0], 0.5)
+    assert np.isclose(grid.probabilities[1, 0], 0.5)
+    assert grid.probabilities[0, 1] == 0.0
+    assert np.isclose(grid.probabilities.sum(), 1.0)
+
+    grid.predict()
+
+    # The tile (0, 1) keeps 1/3 and gives 1/3 to (0, 0) and (0, 2).
+    assert np.isclose(grid.probabilities[0, 0], 0.25 + 0.5 / 3)
+    assert np.isclose(grid.probabilities[2, 0], 0.5 / 3)
+    assert np.isclose(grid.probabilities.sum(), 1.0)
+
+
+def test_OccupancyGrid_update__visible():
+    """Test zeroing the visible tiles without the tank."""
+
+    grid = OccupancyGrid(walls)
+    grid.observe(0, 0)
+    visible = np.zeros((3, 3), dtype=bool)
+    visible[1, 0] = True
+
+    grid.update(visible, None)
+
+    assert grid.probabilities[1, 0] == 0.0
+    assert np.isclose(grid.probabilities[0, 0], 1.0)
+    assert grid.most_likely() == (0, 0)
+
+
+def test_OccupancyGrid_update__all_visible():
+    """Test spreading the probability over the hidden tiles
+    when the tank is not where it could be.
+    """
+
+    grid = OccupancyGrid(walls)
+    grid.observe(0, 0)
+    visible = np.ones((3, 3), dtype=bool)
+    visible[2, 2] = False
+
+    grid.update(visible, None)
+
+    assert grid.probabilities[2, 2] == 1.0
+
+
+def test_OccupancyGrid_update__seen():
+    """Test setting the position of the seen tank."""
+
+    grid = OccupancyGrid(walls)
+
+    grid.update(nothing_visible, (2, 1))
+
+    assert grid.probabilities[1, 2] == 1.0
+    assert grid.most_likely() == (2, 1)
+
+
+def test_OccupancyTracker_update():
+    """Test updating the grids of the enemies with the game states."""
+
+    def game_state(tiles, visibility, enemy_regen=None):
+        players = (
+            RawPlayer("agent", "agent", 0, 0, 0, 0),
+            RawPlayer("enemy", "enemy", 0, ticks_to_regen=enemy_regen),
+        )
+        raw_map = RawMap(tiles, (), visibility)
+        payload = GameStatePayload("id", 1, players, raw_map)
+        return GameStateModel.from_payload(payload, "agent")
+
+    wall = (RawTileObject("wall", RawWall()),)
+    tank = (RawTileObject("tank", RawTank("enemy", Direction.UP, RawTurret(0))),)
+    tiles = (((), (), ()), (wall, wall, tank), ((), (), ()))
+
+    tracker = OccupancyTracker()
+    tracker.update(game_state(tiles, ("111", "111", "111")))
+
+    assert list(tracker.grids) == ["enemy"]
+    assert tracker.grids["enemy"].most_likely() == (1, 2)
+
+    empty = (((), (), ()), (wall, wall, ()), ((), (), ()))
+    tracker.update(game_state(empty, ("000", "000", "010")))
+
+    assert tracker.grids["enemy"].probabilities[2, 1] == 0.0
+    assert np.isclose(tracker.grids["enemy"].probabilities[2, 0], 0.5)
+
+    tracker.update(game_state(empty, ("000", "000", "000"), enemy_regen=5))
+
+    assert tracker.grids == {}
+
+
+def test_OccupancyTracker_visibility_grid():
+    """Test creating the visibility grid from the visibility rows."""
+
+    grid = OccupancyTracker.visibility_grid(("100", "010", "001"))
+
+    assert (grid == np.eye(3, dtype=bool)).all()
+
+
+def test_package_import_without_numpy():
+    """Test that importing the package does not import numpy."""
+
+    code = "import sys, hackathon_bot; sys.exit('numpy' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code], check=False).returncode == 0
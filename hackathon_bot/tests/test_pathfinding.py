@@ -0,0 +1,171 @@
+"""Tests for pathfinding.py module."""
+
+from hackathon_bot.bitboard import BitboardGeometry
+from hackathon_bot.enums import ActionCode, Direction
+from hackathon_bot.pathfinding import OrientedPathfinder
+from hackathon_bot.prediction import ProjectilePrediction
+from hackathon_bot.simulation import TankSimulation
+
+# The walls of the map used in the tests:
+#     ┌ ─ ┬ ─ ┬ ─ ┬ ─ ┐
+#     │   │   │   │   │
+#     ├ ─ ┼ ─ ┼ ─ ┼ ─ ┤
+#     │   │ W │ W │   │
+#     ├ ─ ┼ ─ ┼ ─ ┼ ─ ┤
+#     │   │   │   │ W │
+#     └ ─ ┴ ─ ┴ ─ ┴ ─ ┘
+walls = (
+    (False, False, False, False),
+    (False, True, True, False),
+    (False, False, False, True),
+)
+
+
+def _follow(start, actions):
+    simulation = TankSimulation(walls, *start, Direction.UP)
+    for action in actions:
+        simulation.step(action)
+    return simulation.x, simulation.y
+
+
+def test_OrientedPathfinder_encode_decode():
+    """Test encoding the states."""
+
+    pathfinder = OrientedPathfinder(walls)
+    state = pathfinder.encode(3, 2, Direction.LEFT)
+
+    assert pathfinder.decode(state) == (3, 2, Direction.LEFT)
+
+
+def test_OrientedPathfinder_successor():
+    """Test the transitions of the states."""
+
+    pathfinder = OrientedPathfinder(walls)
+    state = pathfinder.encode(0, 0, Direction.UP)
+
+    assert pathfinder.successor(state, ActionCode.FORWARD) == -1
+    assert pathfinder.decode(pathfinder.successor(state, ActionCode.BACKWARD)) == (
+        0,
+        1,
+        Direction.UP,
+    )
+    assert pathfinder.decode(pathfinder.successor(state, ActionCode.TANK_LEFT)) == (
+        0,
+        0,
+        Direction.LEFT,
+    )
+    assert pathfinder.decode(pathfinder.successor(state, ActionCode.TANK_RIGHT)) == (
+        0,
+        0,
+        Direction.RIGHT,
+    )
+
+
+def test_OrientedPathfinder_path_to__backward():
+    """Test preferring to move backward instead of turning around."""
+
+    pathfinder = OrientedPathfinder(walls)
+
+    actions = pathfinder.path_to((0, 0, Direction.UP), [(0, 2)])
+
+    assert actions == [ActionCode.BACKWARD, ActionCode.BACKWARD]
+
+
+def test_OrientedPathfinder_path_to__rotation():
+    """Test counting the rotations as ticks."""
+
+    pathfinder = OrientedPathfinder(walls)
+    start = (0, 0, Direction.UP)
+
+    actions = pathfinder.path_to(start, [(3, 0)])
+
+    # One rotation and three moves.
+    assert len(actions) == 4
+    assert pathfinder.distance(start, [(3, 0)]) == 4
+    assert _follow(start, actions) == (3, 0)
+
+
+def test_OrientedPathfinder_path_to__at_goal_and_unreachable():
+    """Test the path at the goal and to an unreachable goal."""
+
+    pathfinder = OrientedPathfinder(walls)
+
+    assert pathfinder.path_to((0, 0, Direction.UP), [(0, 0)]) == []
+    assert pathfinder.path_to((0, 0, Direction.UP), [(1, 1)]) is None
+    assert pathfinder.distance((0, 0, Direction.UP), [(1, 1)]) is None
+
+
+def test_OrientedPathfinder_distances_to__cache():
+    """Test caching the reverse searches by the goal set."""
+
+    pathfinder = OrientedPathfinder(walls)
+
+    first = pathfinder.distances_to([(3, 0), (2, 2)])
+    second = pathfinder.distances_to([(2, 2), (3, 0)])
+
+    assert first is second
+    assert pathfinder.cache.stats.hits == 1
+
+
+def test_OrientedPathfinder_find_path():
+    """Test the uncached search with a goal condition."""
+
+    pathfinder = OrientedPathfinder(walls)
+    start = (0, 2, Direction.RIGHT)
+
+    actions = pathfinder.find_path(start, lambda x, y: (x, y) == (2, 2))
+
+    assert actions == [ActionCode.FORWARD, ActionCode.FORWARD]
+    assert pathfinder.find_path(start, lambda x, y: (x, y) == (3, 0), 3) is None
+    assert len(pathfinder.find_path(start, lambda x, y: (x, y) == (3, 0))) == len(
+        pathfinder.path_to(start, [(3, 0)])
+    )
+
+
+def test_OrientedPathfinder_find_safe_path__wait():
+    """Test waiting for a projectile to pass before moving on."""
+
+    pathfinder = OrientedPathfinder(walls)
+    geometry = BitboardGeometry.create(4, 3)
+    # The tile (1, 0) is hit in the first tick.
+    prediction = ProjectilePrediction(geometry, [0, geometry.bit(1, 0), 0])
+
+    start = (0, 0, Direction.RIGHT)
+    actions = pathfinder.find_safe_path(start, [(3, 0)], prediction)
+
+    assert actions[0] == ActionCode.PASS
+    assert actions[1:] == [ActionCode.FORWARD] * 3
+    assert pathfinder.path_to(start, [(3, 0)]) == [ActionCode.FORWARD] * 3
+
+
+def test_OrientedPathfinder_find_safe_path__detour():
+    """Test taking a longer route around a tile dangerous for long."""
+
+    ring = (
+        (False, False, False),
+        (False, True, False),
+        (False, False, False),
+    )
+    pathfinder = OrientedPathfinder(ring)
+    geometry = BitboardGeometry.create(3, 3)
+    prediction = ProjectilePrediction(geometry, [0] + [geometry.bit(1, 0)] * 20)
+
+    start = (0, 0, Direction.RIGHT)
+    actions = pathfinder.find_safe_path(start, [(2, 0)], prediction)
+
+    assert len(actions) > len(pathfinder.path_to(start, [(2, 0)]))
+    simulation = TankSimulation(ring, *start, Direction.UP)
+    for tick, action in enumerate(actions, 1):
+        simulation.step(action)
+        assert not prediction.is_dangerous(simulation.x, simulation.y, tick)
+    assert (simulation.x, simulation.y) == (2, 0)
+
+
+def test_OrientedPathfinder_find_safe_path__unsafe():
+    """Test returning None when every move is hit."""
+
+    pathfinder = OrientedPathfinder(walls)
+    geometry = BitboardGeometry.create(4, 3)
+    prediction = ProjectilePrediction(geometry, [0, geometry.full])
+
+    assert pathfinder.find_safe_path((0, 0, Direction.UP), [(3, 0)], prediction) is None
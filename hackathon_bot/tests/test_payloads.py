@@ -1,7 +1,11 @@
 """Tests for payloads module."""
 
+from dataclasses import dataclass
+from unittest.mock import patch
+
 import pytest
 
+from hackathon_bot import payloads
 from hackathon_bot.payloads import (
     ConnectionRejectedPayload,
     GameEndPayload,
@@ -14,6 +18,7 @@ from hackathon_bot.payloads import (
     RawMine,
     RawPlayer,
     RawTank,
+    RawTileEntity,
     RawTileObject,
     RawTurret,
     RawWall,
@@ -477,6 +482,37 @@ def test_RawTileObject_from_json__unknown_type():
         RawTileObject.from_json({"type": "unknown"})
 
 
+def test_RawTileObject_register():
+    """Test RawTileObject.register method with a new tile object type."""
+
+    @dataclass(slots=True, frozen=True)
+    class RawPortal(RawTileEntity):
+        """Represents a raw portal data."""
+
+        id: int
+
+        @classmethod
+        def from_json(cls, json_data: dict):
+            return cls(**json_data)
+
+    with patch.dict(payloads._TILE_ENTITY_CLASSES):  # pylint: disable=protected-access
+        RawTileObject.register("portal", RawPortal)
+        obj = RawTileObject.from_json({"type": "portal", "payload": {"id": 3}})
+
+    assert obj.type == "portal"
+    assert obj.entity == RawPortal(3)
+
+
+def test_RawTileObject_register__not_entity():
+    """Test RawTileObject.register method with a class that is not an entity.
+
+    The method should raise TypeError.
+    """
+
+    with pytest.raises(TypeError):
+        RawTileObject.register("player", RawPlayer)
+
+
 def test_RawMap_from_json():
     """Test RawMap.from_json method."""
 
@@ -540,6 +576,28 @@ def test_RawMap_from_json():
     assert raw_map.visibility[0] == "110", "Probably x and y coordinates are swapped"
 
 
+def test_RawMap_from_json__lazy():
+    """Test RawMap.from_json method in lazy mode.
+
+    The tiles should be kept as raw JSON lists.
+    """
+
+    wall = {"type": "wall"}
+    raw_map = RawMap.from_json(
+        {
+            "tiles": [[[wall], []], [[], []]],
+            "zones": [],
+            "visibility": ["10", "00"],
+        },
+        lazy=True,
+    )
+
+    assert isinstance(raw_map.tiles, tuple)
+    assert all(isinstance(row, tuple) for row in raw_map.tiles)
+    assert raw_map.tiles[0][0] == [wall]
+    assert raw_map.tiles[0][0][0] is wall
+
+
 def test_ConnectionRejectedPayload():
     """Test ConnectionRejectedPayload.from_json method."""
 
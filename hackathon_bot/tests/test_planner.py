@@ -0,0 +1,131 @@
+"""Tests for planner.py module."""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from hackathon_bot.actions import Movement, Pass
+from hackathon_bot.enums import ActionCode, Direction
+from hackathon_bot.models import GameStateModel
+from hackathon_bot.payloads import (
+    GameStatePayload,
+    RawBullet,
+    RawMap,
+    RawPlayer,
+    RawTank,
+    RawTileObject,
+    RawTurret,
+)
+from hackathon_bot.planner import MCTSPlanner, tick_budget
+from hackathon_bot.simulation import TankSimulation
+
+walls = tuple((False,) * 5 for _ in range(5))
+
+
+def test_tick_budget():
+    """Test deriving the planning budget from the broadcast interval."""
+
+    settings = MagicMock(broadcast_interval=100)
+
+    assert tick_budget(settings) == pytest.approx(0.04)
+    assert tick_budget(settings, fraction=0.8, margin=0.0) == pytest.approx(0.08)
+    assert tick_budget(MagicMock(broadcast_interval=1)) == 0.001
+
+
+def test_MCTSPlanner_plan__dodge():
+    """Test dodging a bullet coming from behind the tank.
+
+    The tank faces right, so moving forward or backward
+    leaves the column of the bullet.
+    """
+
+    simulation = TankSimulation(
+        walls, 2, 2, Direction.RIGHT, Direction.UP, bullets=((2, 4, Direction.UP),)
+    )
+    planner = MCTSPlanner(0.05, seed=0)
+
+    action = planner.plan(simulation)
+
+    assert action in (ActionCode.FORWARD, ActionCode.BACKWARD)
+    assert planner.iterations > 0
+    assert planner.best_actions[0] == action
+    # The state of the simulation is restored after the search.
+    assert (simulation.x, simulation.y, simulation.tick) == (2, 2, 0)
+
+
+def test_MCTSPlanner_plan__deadline():
+    """Test respecting the time budget."""
+
+    simulation = TankSimulation(walls, 2, 2, Direction.RIGHT, Direction.UP)
+    planner = MCTSPlanner(0.02, seed=0)
+
+    start = time.perf_counter()
+    planner.plan(simulation)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.02 + 0.01
+
+
+def test_MCTSPlanner_plan__tree_reuse():
+    """Test reusing the tree when the state matches the prediction."""
+
+    simulation = TankSimulation(walls, 2, 2, Direction.RIGHT, Direction.UP)
+    planner = MCTSPlanner(0.01, seed=0)
+
+    action = planner.plan(simulation)
+    assert planner.reused is False
+
+    simulation.step(action)
+    planner.plan(simulation)
+    assert planner.reused is True
+
+    # The tank has been moved differently than predicted.
+    planner.plan(TankSimulation(walls, 0, 0, Direction.UP, Direction.UP))
+    assert planner.reused is False
+
+
+def test_MCTSPlanner_plan__dead():
+    """Test passing when the tank cannot act."""
+
+    simulation = TankSimulation(walls, 2, 2, Direction.RIGHT, Direction.UP, health=0)
+    planner = MCTSPlanner(0.001)
+
+    assert planner.plan(simulation) == ActionCode.PASS
+
+
+def test_MCTSPlanner_next_action():
+    """Test planning the response action for a game state."""
+
+    tiles = (
+        ((), (), ()),
+        (
+            (),
+            (RawTileObject("tank", RawTank("agent", 1, RawTurret(0, 3, None), 20)),),
+            (RawTileObject("bullet", RawBullet(1, 2, Direction.UP, 0)),),
+        ),
+        ((), (), ()),
+    )
+    players = (RawPlayer("agent", "agent", 0, 0, 0, 0),)
+    payload = GameStatePayload("id", 1, players, RawMap(tiles, (), ("111",) * 3))
+    game_state = GameStateModel.from_payload(payload, "agent")
+    planner = MCTSPlanner(0.05, seed=0)
+
+    action = planner.next_action(game_state)
+
+    # The bullet would destroy the tank, so it has to move out of the column.
+    assert isinstance(action, Movement)
+
+
+def test_MCTSPlanner_next_action__dead():
+    """Test passing and dropping the tree while the agent is dead."""
+
+    tiles = (((), (), ()), ((), (), ()), ((), (), ()))
+    players = (RawPlayer("agent", "agent", 0, 0, 0, 0),)
+    payload = GameStatePayload("id", 1, players, RawMap(tiles, (), ("111",) * 3))
+    game_state = GameStateModel.from_payload(payload, "agent")
+    planner = MCTSPlanner(0.001, seed=0)
+    planner.plan(TankSimulation(walls, 2, 2, Direction.RIGHT, Direction.UP))
+
+    assert planner.next_action(game_state) == Pass()
+    assert planner._root is None  # pylint: disable=protected-access
@@ -0,0 +1,67 @@
+"""Tests for the predicates module.
+
+The predicates should give the same results
+as `isinstance` with the corresponding protocols.
+"""
+
+import pytest
+
+from hackathon_bot import models, predicates
+from hackathon_bot.enums import BulletType, Direction
+from hackathon_bot.protocols import (
+    AgentTank,
+    Bullet,
+    DoubleBullet,
+    Item,
+    Laser,
+    Mine,
+    PlayerTank,
+    Wall,
+)
+
+turret = models.TurretModel(Direction.LEFT)
+entities = (
+    models.WallModel(),
+    models.TankModel("id", Direction.LEFT, turret),
+    models.AgentTankModel("id", Direction.LEFT, turret),
+    models.BulletModel(1, 1.0, Direction.LEFT, BulletType.BASIC),
+    models.DoubleBulletModel(1, 1.0, Direction.LEFT, BulletType.DOUBLE),
+    models.LaserModel(1, Direction.LEFT),
+    models.MineModel(1, None),
+    models.ItemModel(1),
+)
+
+
+@pytest.mark.parametrize(
+    "predicate, protocol",
+    [
+        (predicates.is_wall, Wall),
+        (predicates.is_tank, PlayerTank),
+        (predicates.is_agent_tank, AgentTank),
+        (predicates.is_bullet, Bullet),
+        (predicates.is_double_bullet, DoubleBullet),
+        (predicates.is_laser, Laser),
+        (predicates.is_mine, Mine),
+        (predicates.is_item, Item),
+    ],
+)
+@pytest.mark.parametrize("entity", entities)
+def test_predicate_matches_isinstance(predicate, protocol, entity):
+    """Test if the predicate agrees with isinstance() and the protocol."""
+    assert predicate(entity) == isinstance(entity, protocol)
+
+
+@pytest.mark.parametrize("entity", entities)
+def test_is_enemy_tank(entity):
+    """Test is_enemy_tank predicate."""
+
+    expected = isinstance(entity, PlayerTank) and not isinstance(entity, AgentTank)
+    assert predicates.is_enemy_tank(entity) == expected
+
+
+@pytest.mark.parametrize("entity", entities)
+def test_is_obstacle_or_hazard(entity):
+    """Test is_obstacle_or_hazard predicate."""
+
+    expected = isinstance(entity, (models.WallModel, models.MineModel, models.LaserModel))
+    assert predicates.is_obstacle_or_hazard(entity) == expected
@@ -0,0 +1,75 @@
+"""Tests for prediction.py module."""
+
+from hackathon_bot.enums import Direction
+from hackathon_bot.models import GameStateModel
+from hackathon_bot.payloads import (
+    GameStatePayload,
+    RawBullet,
+    RawLaser,
+    RawMap,
+    RawMine,
+    RawPlayer,
+    RawTileObject,
+    RawWall,
+)
+from hackathon_bot.prediction import ProjectilePrediction
+
+
+def _game_state(tiles):
+    players = (RawPlayer("agent", "agent", 0, 0, 0, 0),)
+    visibility = ("1" * len(tiles),) * len(tiles[0])
+    payload = GameStatePayload("id", 1, players, RawMap(tiles, (), visibility))
+    return GameStateModel.from_payload(payload, "agent")
+
+
+def test_ProjectilePrediction_from_game_state__bullet():
+    """Test predicting the tiles swept by a bullet until a wall.
+
+    The map is a single row of five tiles with a wall at x = 4
+    and a bullet at x = 0 flying right.
+    """
+
+    bullet = (RawTileObject("bullet", RawBullet(1, 2, Direction.RIGHT, 0)),)
+    wall = (RawTileObject("wall", RawWall()),)
+    prediction = ProjectilePrediction.from_game_state(
+        _game_state(((bullet,), ((),), ((),), ((),), (wall,))), horizon=3
+    )
+
+    assert prediction.horizon == 3
+    assert [x for x in range(5) if prediction.is_dangerous(x, 0, 0)] == [0]
+    assert [x for x in range(5) if prediction.is_dangerous(x, 0, 1)] == [0, 1, 2]
+    assert [x for x in range(5) if prediction.is_dangerous(x, 0, 2)] == [2, 3]
+    assert [x for x in range(5) if prediction.is_dangerous(x, 0, 3)] == []
+    # The last tick holds for the later ticks.
+    assert not prediction.is_dangerous(3, 0, 10)
+
+
+def test_ProjectilePrediction_from_game_state__lasers_and_mines():
+    """Test predicting the lasers and the mines."""
+
+    laser = (RawTileObject("laser", RawLaser(1, 0)),)
+    mine = (RawTileObject("mine", RawMine(1, None)),)
+    exploded = (RawTileObject("mine", RawMine(2, 3)),)
+    prediction = ProjectilePrediction.from_game_state(
+        _game_state(((laser,), (mine,), (exploded,))), horizon=3, laser_ticks=1
+    )
+
+    assert prediction.is_dangerous(0, 0, 1)
+    assert not prediction.is_dangerous(0, 0, 2)
+    assert all(prediction.is_dangerous(1, 0, tick) for tick in range(5))
+    assert not any(prediction.is_dangerous(2, 0, tick) for tick in range(5))
+
+
+def test_ProjectilePrediction_reserve():
+    """Test reserving a tile in a tick."""
+
+    prediction = ProjectilePrediction.from_game_state(
+        _game_state((((),), ((),))), horizon=2
+    )
+
+    prediction.reserve(1, 0, 1)
+    prediction.reserve(0, 0, 7)
+
+    assert prediction.is_dangerous(1, 0, 1)
+    assert not prediction.is_dangerous(1, 0, 2)
+    assert prediction.is_dangerous(0, 0, 2)
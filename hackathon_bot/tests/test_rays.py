@@ -0,0 +1,80 @@
+"""Tests for rays.py module."""
+
+from hackathon_bot.enums import Direction
+from hackathon_bot.rays import RayTable
+
+# The walls of the map used in the tests:
+#     ┌ ─ ┬ ─ ┬ ─ ┬ ─ ┐
+#     │   │   │   │   │
+#     ├ ─ ┼ ─ ┼ ─ ┼ ─ ┤
+#     │   │ W │ W │   │
+#     ├ ─ ┼ ─ ┼ ─ ┼ ─ ┤
+#     │   │   │   │ W │
+#     └ ─ ┴ ─ ┴ ─ ┴ ─ ┘
+walls = (
+    (False, False, False, False),
+    (False, True, True, False),
+    (False, False, False, True),
+)
+
+
+def test_RayTable_reach():
+    """Test the distances to the walls."""
+
+    rays = RayTable(walls)
+
+    assert rays.reach(0, 0, Direction.RIGHT) == 3
+    assert rays.reach(0, 0, Direction.DOWN) == 2
+    assert rays.reach(0, 0, Direction.UP) == 0
+    assert rays.reach(0, 1, Direction.RIGHT) == 0
+    assert rays.reach(3, 0, Direction.DOWN) == 1
+    assert rays.reach(2, 2, Direction.LEFT) == 2
+    assert rays.reach(1, 1, Direction.LEFT) == 0
+
+
+def test_RayTable_ray():
+    """Test the tiles of a ray."""
+
+    rays = RayTable(walls)
+
+    assert rays.ray(2, 2, Direction.LEFT) == [(1, 2), (0, 2)]
+    assert rays.ray(2, 2, Direction.UP) == []
+
+
+def test_RayTable_shot_direction():
+    """Test the directions of the shots."""
+
+    rays = RayTable(walls)
+
+    assert rays.shot_direction((0, 0), (3, 0)) == Direction.RIGHT
+    assert rays.shot_direction((0, 2), (0, 0)) == Direction.UP
+    assert rays.shot_direction((1, 0), (1, 2)) is None
+    assert rays.shot_direction((0, 0), (1, 2)) is None
+    assert rays.shot_direction((0, 0), (0, 0)) is None
+
+
+def test_RayTable_can_shoot():
+    """Test checking the line of fire."""
+
+    rays = RayTable(walls)
+
+    assert rays.can_shoot((3, 1), (3, 0))
+    assert rays.can_shoot((2, 2), (2, 2))
+    assert not rays.can_shoot((0, 1), (3, 1))
+
+
+def test_RayTable_shooting_positions():
+    """Test finding the tiles with a clear shot."""
+
+    rays = RayTable(walls)
+
+    positions = rays.shooting_positions(0, 0)
+
+    assert sorted(positions) == [
+        (0, 1, Direction.UP),
+        (0, 2, Direction.UP),
+        (1, 0, Direction.LEFT),
+        (2, 0, Direction.LEFT),
+        (3, 0, Direction.LEFT),
+    ]
+    assert all(rays.shot_direction((x, y), (0, 0)) == d for x, y, d in positions)
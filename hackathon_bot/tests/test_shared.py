@@ -0,0 +1,172 @@
+"""Tests for shared.py module."""
+
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+from array import array
+
+import pytest
+
+from hackathon_bot.shared import _CLAIM, SharedTables
+
+
+def _publish(directory: str, queue) -> None:
+    store = SharedTables(directory)
+    view = store.get_or_compute("map", "distances", lambda: array("i", [7, 8, 9]))
+    queue.put(list(view))
+    del view
+
+
+def test_SharedTables_get_or_compute(tmp_path):
+    """Test computing a table once and attaching to it afterwards."""
+
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return array("i", [-1, 0, 70000])
+
+    first = SharedTables(str(tmp_path)).get_or_compute("map", "distances", compute)
+    second = SharedTables(str(tmp_path)).get_or_compute("map", "distances", compute)
+
+    assert list(first) == list(second) == [-1, 0, 70000]
+    assert second.format == "i"
+    assert second.readonly
+    assert len(calls) == 1
+    # The claim is kept until the table is removed.
+    assert sorted(os.listdir(tmp_path)) == [
+        "map.distances.claim",
+        "map.distances.table",
+    ]
+
+
+def test_SharedTables_attach(tmp_path):
+    """Test attaching only to the published tables."""
+
+    store = SharedTables(str(tmp_path))
+
+    assert store.attach("map", "degrees") is None
+
+    store.publish("map", "degrees", bytes([1, 2, 3]))
+
+    assert list(SharedTables(str(tmp_path)).attach("map", "degrees")) == [1, 2, 3]
+    assert store.publish("map", "degrees", bytes([4])) is None
+    assert os.listdir(tmp_path) == ["map.degrees.table"]
+
+
+def test_SharedTables_get_or_compute__damaged(tmp_path):
+    """Test replacing a damaged table."""
+
+    (tmp_path / "map.distances.table").write_bytes(b"HBS2")
+    store = SharedTables(str(tmp_path), timeout=0.01)
+
+    assert store.attach("map", "distances") is None
+
+    view = store.get_or_compute("map", "distances", lambda: array("i", [3, 4]))
+
+    assert list(view) == [3, 4]
+    assert list(store.attach("map", "distances")) == [3, 4]
+
+
+def test_SharedTables_unlink(tmp_path):
+    """Test keeping the views of a removed table."""
+
+    store = SharedTables(str(tmp_path))
+    view = store.get_or_compute("map", "distances", lambda: array("i", [1, 2]))
+
+    store.unlink("map", "distances")
+
+    assert not os.listdir(tmp_path)
+    assert list(view) == [1, 2]
+
+
+def test_SharedTables_processes(tmp_path):
+    """Test attaching to a table published by another process."""
+
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=_publish, args=(str(tmp_path), queue))
+    process.start()
+    published = queue.get(timeout=30)
+    process.join(timeout=30)
+
+    # The table outlives the process which published it.
+    view = SharedTables(str(tmp_path)).attach("map", "distances")
+
+    assert published == list(view) == [7, 8, 9]
+
+
+def _claim(directory, pid: int, claimed: float) -> None:
+    (directory / "map.distances.claim").write_bytes(_CLAIM.pack(pid, claimed))
+
+
+def _dead_pid() -> int:
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+@pytest.mark.parametrize(
+    "owner",
+    [
+        pytest.param(
+            lambda: (_dead_pid(), time.time()),
+            id="dead",
+            marks=pytest.mark.skipif(os.name != "posix", reason="POSIX only"),
+        ),
+        pytest.param(lambda: (os.getpid(), time.time() - 60), id="old"),
+    ],
+)
+def test_SharedTables_get_or_compute__stale_claim(tmp_path, owner):
+    """Test taking over a claim left by a crashed process without waiting."""
+
+    _claim(tmp_path, *owner())
+
+    start = time.monotonic()
+    view = SharedTables(str(tmp_path), timeout=5.0).get_or_compute(
+        "map", "distances", lambda: array("i", [1, 2])
+    )
+
+    assert list(view) == [1, 2]
+    assert time.monotonic() - start < 1.0
+
+
+def test_SharedTables_get_or_compute__claim_timeout(tmp_path):
+    """Test taking over a live claim after the timeout."""
+
+    claimed = time.time()
+    _claim(tmp_path, os.getpid(), claimed)
+
+    start = time.monotonic()
+    view = SharedTables(str(tmp_path), timeout=0.05).get_or_compute(
+        "map", "distances", lambda: array("i", [1, 2])
+    )
+
+    assert list(view) == [1, 2]
+    assert time.monotonic() - start >= 0.05
+    # The claim is renewed, so the next processes do not wait for it.
+    claim = (tmp_path / "map.distances.claim").read_bytes()
+    assert _CLAIM.unpack(claim)[1] > claimed
+
+
+def test_SharedTables_get_or_compute__failed(tmp_path):
+    """Test releasing the claim when the computation fails."""
+
+    def compute():
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        SharedTables(str(tmp_path), timeout=5.0).get_or_compute(
+            "map", "distances", compute
+        )
+
+    assert not os.listdir(tmp_path)
+
+    start = time.monotonic()
+    view = SharedTables(str(tmp_path), timeout=5.0).get_or_compute(
+        "map", "distances", lambda: array("i", [1])
+    )
+    assert list(view) == [1]
+    assert time.monotonic() - start < 1.0
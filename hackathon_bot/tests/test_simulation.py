@@ -0,0 +1,214 @@
+"""Tests for simulation.py module."""
+
+import pytest
+
+from hackathon_bot.actions import AbilityUse, Movement, Pass, Rotation
+from hackathon_bot.enums import (
+    Ability,
+    ActionCode,
+    BulletType,
+    Direction,
+    MovementDirection,
+    RotationDirection,
+)
+from hackathon_bot.models import GameStateModel
+from hackathon_bot.payloads import (
+    GameStatePayload,
+    RawBullet,
+    RawMap,
+    RawPlayer,
+    RawTank,
+    RawTileObject,
+    RawTurret,
+    RawWall,
+)
+from hackathon_bot.simulation import TankSimulation, to_response_action
+
+# The walls of the map used in the tests:
+#     ┌ ─ ┬ ─ ┬ ─ ┬ ─ ┐
+#     │   │   │   │   │
+#     ├ ─ ┼ ─ ┼ ─ ┼ ─ ┤
+#     │   │ W │   │   │
+#     ├ ─ ┼ ─ ┼ ─ ┼ ─ ┤
+#     │   │   │   │   │
+#     └ ─ ┴ ─ ┴ ─ ┴ ─ ┘
+walls = (
+    (False, False, False, False),
+    (False, True, False, False),
+    (False, False, False, False),
+)
+
+
+def test_TankSimulation_step__movement():
+    """Test moving the tank forward and backward."""
+
+    simulation = TankSimulation(walls, 0, 1, Direction.UP, Direction.UP)
+
+    simulation.step(ActionCode.FORWARD)
+    assert (simulation.x, simulation.y) == (0, 0)
+
+    # The tank cannot leave the map.
+    simulation.step(ActionCode.FORWARD)
+    assert (simulation.x, simulation.y) == (0, 0)
+
+    simulation.step(ActionCode.BACKWARD)
+    simulation.step(ActionCode.BACKWARD)
+    assert (simulation.x, simulation.y) == (0, 2)
+    assert simulation.tick == 4
+
+
+def test_TankSimulation_step__wall():
+    """Test the tank not moving into a wall."""
+
+    simulation = TankSimulation(walls, 0, 1, Direction.RIGHT, Direction.UP)
+
+    simulation.step(ActionCode.FORWARD)
+
+    assert (simulation.x, simulation.y) == (0, 1)
+    assert ActionCode.FORWARD not in simulation.legal_actions()
+
+
+@pytest.mark.parametrize(
+    "action, direction, turret_direction",
+    [
+        (ActionCode.TANK_LEFT, Direction.LEFT, Direction.RIGHT),
+        (ActionCode.TANK_RIGHT, Direction.RIGHT, Direction.RIGHT),
+        (ActionCode.TURRET_LEFT, Direction.UP, Direction.UP),
+        (ActionCode.TURRET_RIGHT, Direction.UP, Direction.DOWN),
+    ],
+)
+def test_TankSimulation_step__rotation(action, direction, turret_direction):
+    """Test rotating the tank and the turret."""
+
+    simulation = TankSimulation(walls, 0, 0, Direction.UP, Direction.RIGHT)
+
+    simulation.step(action)
+
+    assert simulation.direction == direction
+    assert simulation.turret_direction == turret_direction
+
+
+def test_TankSimulation_step__fire_and_regenerate():
+    """Test consuming and regenerating the bullets."""
+
+    simulation = TankSimulation(
+        walls, 0, 0, Direction.UP, Direction.UP, regen_interval=2
+    )
+
+    simulation.step(ActionCode.FIRE_BULLET)
+    assert simulation.bullet_count == 2
+    assert simulation.regen_ticks == 2
+
+    simulation.step(ActionCode.PASS)
+    simulation.step(ActionCode.PASS)
+    assert simulation.bullet_count == 3
+    assert simulation.regen_ticks == 0
+
+    simulation = TankSimulation(walls, 0, 0, Direction.UP, Direction.UP, 100, 0, 5)
+    simulation.step(ActionCode.FIRE_BULLET)
+    assert simulation.bullet_count == 0
+    assert ActionCode.FIRE_BULLET not in simulation.legal_actions()
+
+
+def test_TankSimulation_step__bullets():
+    """Test moving the bullets and hitting the tank."""
+
+    bullets = (
+        (3, 0, Direction.LEFT),  # Hits the tank in the first tick.
+        (0, 2, Direction.UP),  # Passes next to the tank.
+        (1, 2, Direction.UP),  # Destroyed by the wall.
+    )
+    simulation = TankSimulation(
+        walls, 1, 0, Direction.UP, Direction.UP, bullets=bullets
+    )
+
+    simulation.step(ActionCode.PASS)
+
+    assert simulation.health == 80
+    assert simulation.bullets == ((0, 0, Direction.UP),)
+
+    simulation.step(ActionCode.PASS)
+
+    assert simulation.bullets == ()
+    assert not simulation.is_dead
+
+
+def test_TankSimulation_push_pop():
+    """Test undoing the applied actions."""
+
+    bullets = ((3, 0, Direction.LEFT),)
+    simulation = TankSimulation(
+        walls, 0, 0, Direction.RIGHT, Direction.UP, bullets=bullets
+    )
+    snapshot = simulation.snapshot()
+
+    simulation.push(ActionCode.FORWARD)
+    simulation.push(ActionCode.FIRE_BULLET)
+    assert simulation.health == 80
+    assert simulation.tick == 2
+
+    simulation.pop()
+    simulation.pop()
+    assert simulation.snapshot() == snapshot
+
+
+def test_TankSimulation_copy():
+    """Test copying the state without sharing the changes."""
+
+    simulation = TankSimulation(walls, 0, 0, Direction.RIGHT, Direction.UP)
+
+    copy = simulation.copy()
+    copy.step(ActionCode.FORWARD)
+
+    assert (simulation.x, copy.x) == (0, 1)
+    assert copy.is_wall(1, 1)
+
+
+def test_TankSimulation_from_game_state():
+    """Test creating the forward model from a game state."""
+
+    bullet = RawBullet(1, 2, Direction.LEFT, BulletType.BASIC)
+    tiles = (
+        ((), (RawTileObject("wall", RawWall()),)),
+        (
+            (RawTileObject("tank", RawTank("agent", 1, RawTurret(2, 1, 4), 60)),),
+            (RawTileObject("bullet", bullet),),
+        ),
+    )
+    players = (RawPlayer("agent", "agent", 0, 0, 0, 0),)
+    payload = GameStatePayload("id", 1, players, RawMap(tiles, (), ("11", "11")))
+    game_state = GameStateModel.from_payload(payload, "agent")
+
+    simulation = TankSimulation.from_game_state(game_state, regen_interval=5)
+
+    assert simulation.snapshot() == (1, 0, 1, 2, 60, 1, 4, ((1, 1, 3),), 0)
+    assert simulation.regen_interval == 5
+    assert simulation.is_wall(0, 1)
+
+
+def test_TankSimulation_from_game_state__dead():
+    """Test creating the forward model when the tank of the agent is dead."""
+
+    tiles = (((), (RawTileObject("wall", RawWall()),)), ((), ()))
+    players = (RawPlayer("agent", "agent", 0, 0, 0, 0),)
+    payload = GameStatePayload("id", 1, players, RawMap(tiles, (), ("11", "11")))
+    game_state = GameStateModel.from_payload(payload, "agent")
+
+    with pytest.raises(ValueError):
+        TankSimulation.from_game_state(game_state)
+
+
+@pytest.mark.parametrize(
+    "action, expected",
+    [
+        (ActionCode.PASS, Pass()),
+        (ActionCode.FORWARD, Movement(MovementDirection.FORWARD)),
+        (ActionCode.BACKWARD, Movement(MovementDirection.BACKWARD)),
+        (ActionCode.TANK_LEFT, Rotation(RotationDirection.LEFT, None)),
+        (ActionCode.TURRET_RIGHT, Rotation(None, RotationDirection.RIGHT)),
+        (ActionCode.FIRE_BULLET, AbilityUse(Ability.FIRE_BULLET)),
+    ],
+)
+def test_to_response_action(action, expected):
+    """Test converting the action codes to the response actions."""
+    assert to_response_action(action) == expected
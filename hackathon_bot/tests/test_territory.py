@@ -0,0 +1,178 @@
+"""Tests for territory.py module."""
+
+import random
+from collections import deque
+
+from hackathon_bot.territory import TerritoryMap
+
+# The walls of the map used in the tests:
+#     ┌ ─ ┬ ─ ┬ ─ ┬ ─ ┬ ─ ┐
+#     │   │   │   │   │   │
+#     ├ ─ ┼ ─ ┼ ─ ┼ ─ ┼ ─ ┤
+#     │   │ W │ W │ W │   │
+#     ├ ─ ┼ ─ ┼ ─ ┼ ─ ┼ ─ ┤
+#     │   │   │   │ W │   │
+#     ├ ─ ┼ ─ ┼ ─ ┼ ─ ┼ ─ ┤
+#     │ W │ W │   │ W │   │
+#     ├ ─ ┼ ─ ┼ ─ ┼ ─ ┼ ─ ┤
+#     │ W │   │   │   │   │
+#     └ ─ ┴ ─ ┴ ─ ┴ ─ ┴ ─ ┘
+walls = tuple(
+    tuple(char == "W" for char in row)
+    for row in (".....", ".WWW.", "...W.", "WW.W.", "W....")
+)
+
+
+def _expected(walls_, sources):
+    # The labels computed with a breadth-first search per tank.
+    height = len(walls_)
+    width = len(walls_[0])
+    labels = {}
+    for rank, (x, y) in enumerate(sources):
+        distances = {(x, y): 0}
+        queue = deque([(x, y)])
+        while queue:
+            tx, ty = queue.popleft()
+            for nx, ny in ((tx, ty - 1), (tx + 1, ty), (tx, ty + 1), (tx - 1, ty)):
+                if (
+                    0 <= nx < width
+                    and 0 <= ny < height
+                    and not walls_[ny][nx]
+                    and (nx, ny) not in distances
+                ):
+                    distances[(nx, ny)] = distances[(tx, ty)] + 1
+                    queue.append((nx, ny))
+        for tile, distance in distances.items():
+            if tile not in labels or (distance, rank) < labels[tile]:
+                labels[tile] = (distance, rank)
+    return labels
+
+
+def _labels(territory):
+    return {
+        (x, y): (territory.distance(x, y), territory.owner(x, y))
+        for y in range(territory.height)
+        for x in range(territory.width)
+        if territory.owner(x, y) is not None
+    }
+
+
+def test_TerritoryMap_update():
+    """Test labeling the tiles with the nearest tank."""
+
+    territory = TerritoryMap(walls)
+    territory.update({"me": (0, 0), "enemy": (4, 4)})
+
+    assert territory.owner(0, 0) == "me"
+    assert territory.distance(0, 0) == 0
+    assert territory.owner(4, 1) == "enemy"
+    assert territory.distance(4, 1) == 3
+    assert territory.owner(2, 4) == "enemy"
+    assert territory.owner(1, 2) == "me"
+    assert territory.distance(1, 2) == 3
+    assert territory.owner(1, 1) is None
+    assert territory.distance(1, 1) is None
+
+
+def test_TerritoryMap_update__ties():
+    """Test breaking the ties by the first tank."""
+
+    territory = TerritoryMap(walls)
+    territory.update({"me": (0, 0), "enemy": (4, 4)})
+
+    assert territory.distance(2, 2) == 4
+    assert territory.owner(2, 2) == "me"
+
+    territory = TerritoryMap(walls)
+    territory.update({"enemy": (4, 4), "me": (0, 0)})
+
+    assert territory.owner(2, 2) == "enemy"
+
+
+def test_TerritoryMap_update__moved():
+    """Test relabeling only the tiles around a moved tank."""
+
+    territory = TerritoryMap(walls)
+    territory.update({"me": (0, 0), "enemy": (4, 4)})
+    territory.update({"me": (0, 0), "enemy": (4, 3)})
+
+    assert territory.owner(4, 0) == "enemy"
+    assert territory.distance(4, 0) == 3
+    assert territory.owner(0, 0) == "me"
+    assert 0 < territory.relabeled < 19
+
+    territory.update({"me": (0, 0), "enemy": (4, 3)})
+
+    assert territory.relabeled == 0
+
+
+def test_TerritoryMap_update__removed():
+    """Test removing a tank."""
+
+    territory = TerritoryMap(walls)
+    territory.update({"me": (0, 0), "enemy": (4, 4)})
+    territory.update({"me": (0, 0)})
+
+    assert territory.owner(4, 4) == "me"
+    assert territory.distance(4, 4) == 8
+    assert territory.territory("enemy") == 0
+    assert territory.territory("me") == 17
+
+
+def test_TerritoryMap_update__dead():
+    """Test skipping a tank without a position, e.g. a dead agent."""
+
+    territory = TerritoryMap(walls)
+    territory.update({"me": None, "enemy": (4, 4)})
+    territory.update({"me": (0, 0), "enemy": (4, 4)})
+    territory.update({"me": None, "enemy": (4, 4)})
+
+    assert territory.owner(0, 0) == "enemy"
+    assert territory.territory("me") == 0
+    assert "me" not in territory.sources
+
+
+def test_TerritoryMap_update__random():
+    """Test the incremental updates against a search per tank."""
+
+    rng = random.Random(0)
+    grid = [[rng.random() < 0.25 for _ in range(12)] for _ in range(12)]
+    free = [(x, y) for y in range(12) for x in range(12) if not grid[y][x]]
+    sources = {key: rng.choice(free) for key in range(4)}
+    territory = TerritoryMap(grid)
+
+    for _ in range(100):
+        key = rng.randrange(5)
+        if key == 4:
+            sources.pop(rng.choice(list(sources)), None)
+            sources[rng.randrange(4)] = rng.choice(free)
+        else:
+            x, y = sources.get(key, rng.choice(free))
+            steps = [
+                (x + dx, y + dy)
+                for dx, dy in ((0, 1), (1, 0), (0, -1), (-1, 0))
+                if (x + dx, y + dy) in free
+            ]
+            sources[key] = rng.choice(steps or [(x, y)])
+        territory.update(sources)
+
+        # The ranks follow the first keys, which are 0 to 3.
+        keys = sorted(sources)
+        expected = {
+            tile: (distance, keys[rank])
+            for tile, (distance, rank) in _expected(
+                grid, [sources[key] for key in keys]
+            ).items()
+        }
+        assert _labels(territory) == expected
+
+
+def test_TerritoryMap_race():
+    """Test finding the tank reaching a zone first."""
+
+    territory = TerritoryMap(walls)
+    territory.update({"me": (0, 2), "enemy": (4, 0)})
+
+    assert territory.race([(2, 3), (2, 4)]) == ("me", 3)
+    assert territory.race([(4, 3), (4, 4)]) == ("enemy", 3)
+    assert territory.race([(1, 1)]) == (None, None)
@@ -0,0 +1,141 @@
+"""Tests for topology.py module."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from hackathon_bot.cache import PrecomputationCache
+from hackathon_bot.shared import SharedTables
+from hackathon_bot.topology import MapTopology, analyze_async
+
+# The walls of the map used in the tests, a ring with a dead end:
+#     ┌ ─ ┬ ─ ┬ ─ ┬ ─ ┬ ─ ┐
+#     │   │   │   │ W │ W │
+#     ├ ─ ┼ ─ ┼ ─ ┼ ─ ┼ ─ ┤
+#     │   │ W │   │ W │ W │
+#     ├ ─ ┼ ─ ┼ ─ ┼ ─ ┼ ─ ┤
+#     │   │   │   │   │   │
+#     ├ ─ ┼ ─ ┼ ─ ┼ ─ ┼ ─ ┤
+#     │ W │ W │ W │ W │   │
+#     ├ ─ ┼ ─ ┼ ─ ┼ ─ ┼ ─ ┤
+#     │ W │ W │ W │ W │   │
+#     └ ─ ┴ ─ ┴ ─ ┴ ─ ┴ ─ ┘
+walls = tuple(
+    tuple(char == "W" for char in row)
+    for row in ("...WW", ".W.WW", ".....", "WWWW.", "WWWW.")
+)
+
+
+def test_MapTopology_degree():
+    """Test counting the free neighbours."""
+
+    topology = MapTopology.from_walls(walls)
+
+    assert topology.degree(2, 2) == 3
+    assert topology.degree(0, 0) == 2
+    assert topology.degree(4, 4) == 1
+    assert topology.degree(1, 1) == 0
+
+
+def test_MapTopology_articulation_points():
+    """Test finding the chokepoints."""
+
+    topology = MapTopology.from_walls(walls)
+
+    points = [
+        (x, y)
+        for y in range(5)
+        for x in range(5)
+        if topology.is_articulation_point(x, y)
+    ]
+    assert points == [(2, 2), (3, 2), (4, 2), (4, 3)]
+
+
+def test_MapTopology_corridors():
+    """Test finding the corridors and the open areas."""
+
+    topology = MapTopology.from_walls(walls)
+
+    assert topology.corridor(0, 0) == topology.corridor(1, 2)
+    assert topology.corridor(3, 2) == topology.corridor(4, 4)
+    assert topology.corridor(0, 0) != topology.corridor(4, 4)
+    assert sorted(topology.corridor_lengths) == [4, 7]
+    assert not topology.is_corridor(2, 2)
+    assert not topology.is_corridor(1, 1)
+    assert topology.area(2, 2) == 1
+    assert topology.area(0, 0) == 0
+
+
+def test_MapTopology_dead_end_depth():
+    """Test measuring the depth of the dead ends."""
+
+    topology = MapTopology.from_walls(walls)
+
+    assert [
+        topology.dead_end_depth(x, y) for x, y in ((3, 2), (4, 2), (4, 3), (4, 4))
+    ] == [
+        1,
+        2,
+        3,
+        4,
+    ]
+    assert topology.dead_end_depth(0, 0) == 0
+    assert topology.dead_end_depth(2, 2) == 0
+
+
+def test_MapTopology_long_corridor():
+    """Test analyzing a corridor longer than the recursion limit."""
+
+    topology = MapTopology.from_walls([[False] * 3000])
+
+    assert topology.is_articulation_point(1500, 0)
+    assert not topology.is_articulation_point(0, 0)
+    assert topology.corridor_lengths == (3000,)
+
+
+def test_analyze_async():
+    """Test analyzing the map in a thread and in an executor."""
+
+    future = analyze_async(walls)
+    assert future.result(timeout=5) == MapTopology.from_walls(walls)
+
+    with ThreadPoolExecutor(1) as executor:
+        future = analyze_async(walls, executor)
+        assert future.result(timeout=5).degree(2, 2) == 3
+
+
+def test_MapTopology_to_table():
+    """Test creating the same topology from its table."""
+
+    topology = MapTopology.from_walls(walls)
+
+    assert MapTopology.from_table(topology.to_table()) == topology
+    assert MapTopology.from_table(memoryview(topology.to_table())) == topology
+
+
+def test_analyze_async__cache(tmp_path):
+    """Test storing the topology in the cache and loading it."""
+
+    cache = PrecomputationCache(str(tmp_path))
+
+    future = analyze_async(walls, cache=cache, key="map")
+    assert future.result(timeout=5) == MapTopology.from_walls(walls)
+    assert cache.stats.misses == 1
+
+    with ThreadPoolExecutor(1) as executor:
+        future = analyze_async(walls, executor, cache, "map")
+        assert future.result(timeout=5) == MapTopology.from_walls(walls)
+    assert cache.stats.hits == 1
+
+    with pytest.raises(ValueError):
+        analyze_async(walls, cache=cache)
+
+
+def test_analyze_async__shared(tmp_path):
+    """Test sharing the topology with the shared tables."""
+
+    future = analyze_async(walls, cache=SharedTables(str(tmp_path)), key="map")
+    assert future.result(timeout=5) == MapTopology.from_walls(walls)
+
+    table = SharedTables(str(tmp_path)).attach("map", "topology")
+    assert MapTopology.from_table(table) == MapTopology.from_walls(walls)
@@ -0,0 +1,87 @@
+"""Tests for warmup.py module."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from hackathon_bot.warmup import WarmUp
+
+
+def test_WarmUp_submit():
+    """Test running the tasks in the background."""
+
+    warm_up = WarmUp()
+    warm_up.submit("sum", sum, [1, 2, 3])
+    warm_up.submit("max", max, 4, 5, key=lambda value: -value)
+
+    assert warm_up.result("sum", timeout=5) == 6
+    assert warm_up.result("max", timeout=5) == 4
+    assert warm_up.names == ("sum", "max")
+    assert "sum" in warm_up
+    assert warm_up.ready()
+
+
+def test_WarmUp_submit__executor():
+    """Test running the tasks in an executor."""
+
+    with ThreadPoolExecutor(1) as executor:
+        warm_up = WarmUp(executor)
+        future = warm_up.submit("sum", sum, [1, 2])
+
+        assert future.result(5) == 3
+        assert warm_up.future("sum") is future
+
+
+def test_WarmUp_result__not_ready():
+    """Test waiting for a task that is not done."""
+
+    release = threading.Event()
+    warm_up = WarmUp()
+    warm_up.submit("slow", release.wait)
+
+    assert not warm_up.ready("slow")
+    assert warm_up.result("slow", timeout=0.01, default=None) is None
+    with pytest.raises(TimeoutError):
+        warm_up.result("slow", timeout=0.01)
+
+    release.set()
+
+    assert warm_up.result("slow", timeout=5) is True
+    assert warm_up.ready("slow")
+
+
+def test_WarmUp_result__missing():
+    """Test getting the result of a task that was not submitted."""
+
+    warm_up = WarmUp()
+
+    assert not warm_up.ready("missing")
+    assert warm_up.result("missing", default=0) == 0
+    with pytest.raises(KeyError):
+        warm_up.result("missing")
+
+
+def test_WarmUp_result__exception():
+    """Test raising the exception of a failed task."""
+
+    warm_up = WarmUp()
+    warm_up.submit("failed", int, "not a number")
+
+    with pytest.raises(ValueError):
+        warm_up.result("failed", timeout=5)
+
+
+def test_WarmUp_cancel():
+    """Test forgetting the tasks."""
+
+    with ThreadPoolExecutor(1) as executor:
+        release = threading.Event()
+        warm_up = WarmUp(executor)
+        warm_up.submit("slow", release.wait)
+        pending = warm_up.submit("pending", sum, [1])
+        warm_up.cancel()
+        release.set()
+
+        assert pending.cancelled()
+        assert warm_up.names == ()
@@ -0,0 +1,405 @@
+"""This module contains the static analysis of the map topology.
+
+The walls do not change during the game, so the shape of the map
+can be analyzed once: which tiles are chokepoints, which ones form
+corridors and dead ends, and how large the open areas are.
+The results are stored in compact arrays indexed by the tiles,
+so every question is a constant-time lookup.
+
+The analysis takes a few milliseconds, so it can be run in the
+background after the first game state with :func:`analyze_async`.
+Given a :class:`PrecomputationCache`, it stores the topology on disk,
+so the next matches on the same map load it instead.
+
+Examples
+--------
+
+::
+
+    from hackathon_bot.topology import analyze_async
+
+    class MyBot(HackathonBot):
+
+        def next_move(self, game_state: GameState) -> ResponseAction:
+            if self.topology_future is None:
+                walls = ...  # The wall grid, indexed as walls[y][x].
+                self.topology_future = analyze_async(walls)
+
+            if self.topology_future.done():
+                topology = self.topology_future.result()
+                x, y = game_state.index.my_position
+                if topology.is_corridor(x, y):
+                    # A good place to drop a mine.
+
+Classes
+-------
+MapTopology
+    Represents the topology of the free tiles of a map.
+
+Functions
+---------
+analyze_async
+    Analyzes the topology of a map in the background.
+"""
+
+from __future__ import annotations
+
+import threading
+from array import array
+from collections import deque
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass
+from itertools import chain
+from typing import TYPE_CHECKING, Sequence
+
+if TYPE_CHECKING:
+    from .cache import PrecomputationCache
+    from .shared import SharedTables
+
+__all__ = (
+    "MapTopology",
+    "analyze_async",
+)
+
+
+def _neighbors(cells: bytes, width: int, height: int) -> list[tuple[int, ...]]:
+    neighbors: list[tuple[int, ...]] = [()] * (width * height)
+    for y in range(height):
+        for x in range(width):
+            if cells[y * width + x]:
+                continue
+            neighbors[y * width + x] = tuple(
+                ny * width + nx
+                for nx, ny in ((x, y - 1), (x + 1, y), (x, y + 1), (x - 1, y))
+                if 0 <= nx < width and 0 <= ny < height and not cells[ny * width + nx]
+            )
+    return neighbors
+
+
+def _articulation_points(cells: bytes, neighbors: list[tuple[int, ...]]) -> bytearray:
+    # Tarjan's algorithm with an explicit stack, as the recursion
+    # would be too deep for long corridors.
+    size = len(cells)
+    points = bytearray(size)
+    order = [-1] * size
+    low = [0] * size
+    counter = 0
+
+    for root in range(size):
+        if cells[root] or order[root] != -1:
+            continue
+        order[root] = low[root] = counter
+        counter += 1
+        root_children = 0
+        stack = [(root, -1, iter(neighbors[root]))]
+        while stack:
+            tile, parent, remaining = stack[-1]
+            for following in remaining:
+                if order[following] == -1:
+                    order[following] = low[following] = counter
+                    counter += 1
+                    stack.append((following, tile, iter(neighbors[following])))
+                    break
+                if following != parent:
+                    low[tile] = min(low[tile], order[following])
+            else:
+                stack.pop()
+                if parent == -1:
+                    continue
+                low[parent] = min(low[parent], low[tile])
+                if parent == root:
+                    root_children += 1
+                elif low[tile] >= order[parent]:
+                    points[parent] = 1
+        if root_children > 1:
+            points[root] = 1
+
+    return points
+
+
+def _components(
+    tiles: Sequence[bool],
+    neighbors: list[tuple[int, ...]],
+) -> tuple[array, list[int]]:
+    # The connected components of the selected tiles.
+    labels = array("i", [-1]) * len(tiles)
+    sizes = []
+    for seed, selected in enumerate(tiles):
+        if not selected or labels[seed] != -1:
+            continue
+        label = len(sizes)
+        labels[seed] = label
+        queue = deque([seed])
+        count = 0
+        while queue:
+            tile = queue.popleft()
+            count += 1
+            for following in neighbors[tile]:
+                if tiles[following] and labels[following] == -1:
+                    labels[following] = label
+                    queue.append(following)
+        sizes.append(count)
+    return labels, sizes
+
+
+def _dead_end_depths(cells: bytes, neighbors: list[tuple[int, ...]]) -> array:
+    # The dead ends are the tiles removed by peeling the tiles
+    # with one remaining neighbour. Their depth is the distance
+    # to the nearest tile that remains.
+    size = len(cells)
+    degrees = [len(tiles) for tiles in neighbors]
+    peeled = bytearray(size)
+    queue = deque(
+        tile for tile in range(size) if not cells[tile] and degrees[tile] <= 1
+    )
+    order = []
+    while queue:
+        tile = queue.popleft()
+        if peeled[tile]:
+            continue
+        peeled[tile] = 1
+        for following in neighbors[tile]:
+            if not peeled[following]:
+                degrees[following] -= 1
+                if degrees[following] <= 1:
+                    queue.append(following)
+        order.append(tile)
+
+    depths = array("H", [0]) * size
+    seen = bytearray(size)
+    queue = deque()
+    for tile in range(size):
+        if not cells[tile] and not peeled[tile]:
+            seen[tile] = 1
+            queue.append(tile)
+
+    # The whole components without cycles are measured from
+    # the tile peeled last, which is one of their centres.
+    labels, _ = _components([not cell for cell in cells], neighbors)
+    anchored = {labels[tile] for tile in queue}
+    for tile in reversed(order):
+        if labels[tile] not in anchored:
+            anchored.add(labels[tile])
+            seen[tile] = 1
+            queue.append(tile)
+
+    while queue:
+        tile = queue.popleft()
+        for following in neighbors[tile]:
+            if not seen[following]:
+                seen[following] = 1
+                depths[following] = depths[tile] + 1
+                queue.append(following)
+    return depths
+
+
+@dataclass(slots=True, frozen=True)
+class MapTopology:  # pylint: disable=too-many-instance-attributes
+    """Represents the topology of the free tiles of a map.
+
+    The arrays are indexed as `y * width + x`, the walls have zeros
+    (or -1 as a corridor index).
+
+    Attributes
+    ----------
+    width: :class:`int`
+        The width of the map.
+    height: :class:`int`
+        The height of the map.
+    degrees: :class:`bytes`
+        The number of free neighbours of the tiles.
+    articulation_points: :class:`bytes`
+        1 for the tiles whose blocking disconnects the free tiles
+        around them (the chokepoints), 0 otherwise.
+    corridors: :class:`array.array`
+        The index of the corridor of the tiles, -1 if not in a corridor.
+        A corridor is a connected group of tiles with one or two
+        free neighbours.
+    corridor_lengths: tuple[:class:`int`, ...]
+        The number of tiles of each corridor.
+    dead_end_depths: :class:`array.array`
+        The number of moves from the tiles in dead ends to the tiles
+        from which there is more than one way out, 0 for the others.
+    areas: :class:`array.array`
+        The number of tiles of the open area (a connected group
+        of tiles not in corridors) of the tiles, 0 in corridors.
+    """
+
+    width: int
+    height: int
+    degrees: bytes
+    articulation_points: bytes
+    corridors: array
+    corridor_lengths: tuple[int, ...]
+    dead_end_depths: array
+    areas: array
+
+    @classmethod
+    def from_walls(cls, walls: Sequence[Sequence[bool]]) -> MapTopology:
+        """Analyzes the topology of the map.
+
+        Parameters
+        ----------
+        walls: Sequence[Sequence[:class:`bool`]]
+            The wall grid indexed as `walls[y][x]`.
+        """
+
+        height = len(walls)
+        width = len(walls[0]) if height else 0
+        cells = bytes(bool(wall) for row in walls for wall in row)
+        neighbors = _neighbors(cells, width, height)
+        degrees = bytes(len(tiles) for tiles in neighbors)
+
+        in_corridor = [
+            not cell and 1 <= degree <= 2 for cell, degree in zip(cells, degrees)
+        ]
+        corridors, corridor_lengths = _components(in_corridor, neighbors)
+        in_area = [
+            not cell and not corridor for cell, corridor in zip(cells, in_corridor)
+        ]
+        area_labels, area_sizes = _components(in_area, neighbors)
+        areas = array("H", [0]) * len(cells)
+        for tile, label in enumerate(area_labels):
+            if label != -1:
+                areas[tile] = area_sizes[label]
+
+        return cls(
+            width,
+            height,
+            degrees,
+            bytes(_articulation_points(cells, neighbors)),
+            corridors,
+            tuple(corridor_lengths),
+            _dead_end_depths(cells, neighbors),
+            areas,
+        )
+
+    def to_table(self) -> array:
+        """Returns the topology as one flat table of integers,
+        which can be stored in a :class:`PrecomputationCache`.
+
+        The table holds the width, the height and the number of corridors,
+        followed by the arrays of the topology.
+        """
+
+        return array(
+            "i",
+            chain(
+                (self.width, self.height, len(self.corridor_lengths)),
+                self.degrees,
+                self.articulation_points,
+                self.corridors,
+                self.corridor_lengths,
+                self.dead_end_depths,
+                self.areas,
+            ),
+        )
+
+    @classmethod
+    def from_table(cls, table: Sequence[int]) -> MapTopology:
+        """Creates the topology from a table returned by :meth:`to_table`.
+
+        Parameters
+        ----------
+        table: Sequence[:class:`int`]
+            The table, e.g. a memory view loaded from the cache.
+        """
+
+        values = table.tolist() if isinstance(table, memoryview) else list(table)
+        width, height, count = values[:3]
+        size = width * height
+        bounds = (3, 3 + size, 3 + 2 * size, 3 + 3 * size)
+        lengths_end = bounds[-1] + count
+        return cls(
+            width,
+            height,
+            bytes(values[bounds[0] : bounds[1]]),
+            bytes(values[bounds[1] : bounds[2]]),
+            array("i", values[bounds[2] : bounds[3]]),
+            tuple(values[bounds[3] : lengths_end]),
+            array("H", values[lengths_end : lengths_end + size]),
+            array("H", values[lengths_end + size : lengths_end + 2 * size]),
+        )
+
+    def degree(self, x: int, y: int) -> int:
+        """Returns the number of free neighbours of the tile."""
+        return self.degrees[y * self.width + x]
+
+    def is_articulation_point(self, x: int, y: int) -> bool:
+        """Whether blocking the tile disconnects the tiles around it."""
+        return bool(self.articulation_points[y * self.width + x])
+
+    def corridor(self, x: int, y: int) -> int:
+        """Returns the index of the corridor of the tile, -1 if none."""
+        return self.corridors[y * self.width + x]
+
+    def is_corridor(self, x: int, y: int) -> bool:
+        """Whether the tile is in a corridor."""
+        return self.corridors[y * self.width + x] != -1
+
+    def dead_end_depth(self, x: int, y: int) -> int:
+        """Returns the number of moves from the tile out of its dead end,
+        0 if it is not in a dead end."""
+        return self.dead_end_depths[y * self.width + x]
+
+    def area(self, x: int, y: int) -> int:
+        """Returns the size of the open area of the tile, 0 in corridors."""
+        return self.areas[y * self.width + x]
+
+
+def analyze_async(
+    walls: Sequence[Sequence[bool]],
+    executor: Executor | None = None,
+    cache: PrecomputationCache | SharedTables | None = None,
+    key: str | None = None,
+) -> Future[MapTopology]:
+    """Analyzes the topology of a map in the background.
+
+    Parameters
+    ----------
+    walls: Sequence[Sequence[:class:`bool`]]
+        The wall grid indexed as `walls[y][x]`.
+    executor: :class:`concurrent.futures.Executor` | `None`
+        The executor running the analysis.
+        If `None`, a new daemon thread is started.
+    cache: :class:`PrecomputationCache` | :class:`SharedTables` | `None`
+        The store in which the topology of the map is kept, so it is
+        loaded instead of analyzed in the next matches (or, with the
+        shared tables, by the other bots on the host).
+    key: :class:`str` | `None`
+        The key of the map in the cache, see :func:`map_key`.
+        Required if the cache is given.
+
+    Returns
+    -------
+    Future[MapTopology]
+        The future result of the analysis.
+    """
+
+    if cache is None:
+        analyze = MapTopology.from_walls
+    elif key is None:
+        raise ValueError("the key of the map is required with a cache")
+    else:
+
+        def analyze(walls: Sequence[Sequence[bool]]) -> MapTopology:
+            table = cache.get_or_compute(
+                key, "topology", lambda: MapTopology.from_walls(walls).to_table()
+            )
+            return MapTopology.from_table(table)
+
+    if executor is not None:
+        return executor.submit(analyze, walls)
+
+    future: Future[MapTopology] = Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(analyze(walls))
+        except BaseException as exception:  # pylint: disable=broad-except
+            future.set_exception(exception)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
@@ -0,0 +1,179 @@
+"""This module contains the warm-up of the bot before the game.
+
+The lobby data (with the grid dimension and the seed) arrives before
+the game starts, but the first game state comes only after the start,
+so the time in between is usually wasted. The warm-up runs the heavy
+precomputations in the background during that time: the tasks are
+submitted by name and :meth:`HackathonBot.next_move` checks whether
+their results are ready, or waits for them with a timeout.
+
+The warm-up of :class:`HackathonBot` is started from
+:meth:`HackathonBot.on_warm_up`, see its documentation.
+
+Examples
+--------
+
+::
+
+    from hackathon_bot.warmup import WarmUp
+
+    warm_up = WarmUp()
+    warm_up.submit("distances", compute_distances, dimension, seed)
+    ...
+    distances = warm_up.result("distances", timeout=0.01, default=None)
+    if distances is None:
+        # Not ready yet, the next tick will check again.
+
+Classes
+-------
+WarmUp
+    Represents the named background tasks of the warm-up.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Executor, Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable
+
+__all__ = ("WarmUp",)
+
+_MISSING = object()
+
+
+class WarmUp:
+    """Represents the named background tasks of the warm-up.
+
+    Parameters
+    ----------
+    executor: :class:`concurrent.futures.Executor` | `None`
+        The executor running the tasks.
+        If `None`, each task runs in a new daemon thread,
+        so an unfinished task never delays the exit of the bot.
+    """
+
+    __slots__ = ("executor", "_futures", "_lock")
+
+    def __init__(self, executor: Executor | None = None) -> None:
+        self.executor = executor
+        self._futures: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._futures
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """The names of the submitted tasks."""
+        return tuple(self._futures)
+
+    def submit(
+        self, name: str, function: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Future:
+        """Starts a task in the background.
+
+        A task with the same name is replaced (and cancelled
+        if it has not started yet).
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the task.
+        function: Callable[..., Any]
+            The function to run with the arguments.
+
+        Returns
+        -------
+        :class:`concurrent.futures.Future`
+            The future result of the task.
+        """
+
+        if self.executor is not None:
+            future = self.executor.submit(function, *args, **kwargs)
+        else:
+            future = Future()
+
+            def run() -> None:
+                if not future.set_running_or_notify_cancel():
+                    return
+                try:
+                    future.set_result(function(*args, **kwargs))
+                except BaseException as exception:  # pylint: disable=broad-except
+                    future.set_exception(exception)
+
+            threading.Thread(target=run, name=f"warm-up {name}", daemon=True).start()
+
+        with self._lock:
+            previous = self._futures.get(name)
+            self._futures[name] = future
+        if previous is not None:
+            previous.cancel()
+        return future
+
+    def future(self, name: str) -> Future | None:
+        """Returns the future of the task, `None` if it was not submitted."""
+        return self._futures.get(name)
+
+    def ready(self, name: str | None = None) -> bool:
+        """Whether the task (or every task, if `name` is `None`) is done.
+
+        A task that was not submitted is not ready.
+        """
+
+        if name is None:
+            return all(future.done() for future in self._futures.values())
+        future = self._futures.get(name)
+        return future is not None and future.done()
+
+    def result(
+        self,
+        name: str,
+        timeout: float | None = None,
+        default: Any = _MISSING,
+    ) -> Any:
+        """Returns the result of the task, waiting for it if needed.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the task.
+        timeout: :class:`float` | `None`
+            The maximum number of seconds to wait,
+            `None` to wait until the task is done.
+        default: Any
+            The value returned if the task was not submitted
+            or is not done within the timeout.
+
+        Raises
+        ------
+        KeyError
+            If the task was not submitted and there is no default.
+        TimeoutError
+            If the task is not done within the timeout and there is no default.
+        Exception
+            The exception raised by the task.
+        """
+
+        future = self._futures.get(name)
+        if future is None:
+            if default is _MISSING:
+                raise KeyError(name)
+            return default
+
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            if default is _MISSING:
+                raise
+            return default
+
+    def cancel(self) -> None:
+        """Cancels the tasks that have not started yet
+        and forgets all tasks."""
+
+        with self._lock:
+            futures = list(self._futures.values())
+            self._futures.clear()
+        for future in futures:
+            future.cancel()